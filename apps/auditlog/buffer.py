@@ -0,0 +1,128 @@
+"""
+Buffered sink for asynchronous audit records.
+
+Loggers hand serializable audit records to the sink instead of dispatching one
+Celery task per record. A record is only collected once the surrounding
+transaction commits, so audits for rolled-back work are never written. Within
+a request (see ``apps.auditlog.middleware``) collected records are held until the
+response is ready and then flushed as a single ``audit_create_batch_async``
+task; outside a request each committed record is flushed straight away.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List
+
+from django.db import transaction
+
+from .config import AuditConfig
+
+logger = logging.getLogger(__name__)
+
+
+class AuditBuffer:
+    """Per-thread buffer that batches audit records into a single task."""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    # Scope handling
+
+    def begin(self) -> None:
+        """Start holding committed records until ``end`` is called."""
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+
+    def end(self) -> None:
+        """Close the innermost scope, flushing when the outermost one closes."""
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = max(depth - 1, 0)
+        if self._local.depth == 0:
+            self.flush()
+
+    @property
+    def is_buffering(self) -> bool:
+        return getattr(self._local, "depth", 0) > 0
+
+    # Record handling
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Queue ``record`` to be collected when the current transaction commits."""
+        transaction.on_commit(lambda: self._collect(record))
+
+    def _pending(self) -> List[Dict[str, Any]]:
+        if not hasattr(self._local, "records"):
+            self._local.records = []
+        return self._local.records
+
+    def _collect(self, record: Dict[str, Any]) -> None:
+        records = self._pending()
+        if not records:
+            self._local.first_collected_at = time.monotonic()
+        records.append(record)
+
+        if not self.is_buffering or len(records) >= AuditConfig.BUFFER_MAX_RECORDS:
+            self.flush()
+
+    def flush(self) -> int:
+        """Dispatch all collected records as one batch. Returns the batch size."""
+        records = self._pending()
+        if not records:
+            return 0
+
+        self._local.records = []
+        first_collected_at = getattr(self._local, "first_collected_at", None)
+
+        # Imported here to keep the buffer importable from tasks and services
+        from .tasks import audit_create_batch_async
+
+        try:
+            audit_create_batch_async.delay(records)
+        except Exception as e:
+            logger.error(f"Failed to dispatch {len(records)} audit records: {e}")
+            self.record_dropped(len(records))
+            return 0
+
+        latency_ms = (
+            (time.monotonic() - first_collected_at) * 1000
+            if first_collected_at is not None
+            else 0.0
+        )
+        self._record_flush(len(records), latency_ms)
+        return len(records)
+
+    # Metrics
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._stats = {
+                "flush_count": 0,
+                "flushed_records": 0,
+                "dropped_records": 0,
+                "last_flush_latency_ms": 0.0,
+                "max_flush_latency_ms": 0.0,
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _record_flush(self, count: int, latency_ms: float) -> None:
+        with self._stats_lock:
+            self._stats["flush_count"] += 1
+            self._stats["flushed_records"] += count
+            self._stats["last_flush_latency_ms"] = latency_ms
+            self._stats["max_flush_latency_ms"] = max(
+                self._stats["max_flush_latency_ms"], latency_ms
+            )
+        logger.debug(f"Flushed {count} audit records in {latency_ms:.1f}ms")
+
+    def record_dropped(self, count: int) -> None:
+        """Count records that were lost before they reached the database."""
+        with self._stats_lock:
+            self._stats["dropped_records"] += count
+
+
+audit_buffer = AuditBuffer()
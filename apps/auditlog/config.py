@@ -25,6 +25,13 @@ class AuditConfig:
     )
     BULK_SAMPLE_SIZE = 10  # Number of sample IDs to log for large bulk operations
 
+    # Buffered write settings
+    BUFFER_MAX_RECORDS = 200  # Flush a request's buffer early once it holds this many
+    BATCH_WRITE_SIZE = 500  # Rows per INSERT when writing a batch of audit records
+
+    # Context resolution settings
+    CONTEXT_CACHE_SIZE = 4096  # Cached workspace/organization lookups per process
+
     # Security settings
     SENSITIVE_FIELDS = {
         "password",
@@ -49,6 +56,14 @@ class AuditConfig:
     CLEANUP_DRY_RUN = (
         False  # Set to True to see what would be deleted without actually deleting
     )
+    CLEANUP_CHECKPOINT_CACHE_KEY = "auditlog:cleanup:checkpoint"
+    CLEANUP_CHECKPOINT_TIMEOUT = 7 * 24 * 60 * 60  # Seconds a checkpoint is kept
+
+    # Search settings
+    SEARCH_BACKFILL_BATCH_SIZE = 1000  # Records updated per batch when backfilling
+
+    # Partitioning settings (PostgreSQL only, see apps.auditlog.partitioning)
+    PARTITION_PREMAKE_MONTHS = 3  # Monthly partitions created ahead of time
 
     # Workspace context settings
     # Models that should not have workspace context in audit logs
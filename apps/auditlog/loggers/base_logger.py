@@ -7,8 +7,9 @@ from typing import Any, Dict, Optional, Union
 from django.contrib.auth.models import User
 from django.http import HttpRequest
 
+from apps.auditlog.buffer import audit_buffer
 from apps.auditlog.services import make_json_serializable
-from apps.auditlog.tasks import audit_create_async, audit_create_security_event_async
+from apps.auditlog.tasks import audit_create_security_event_async
 from apps.organizations.models import OrganizationMember
 
 logger = logging.getLogger(__name__)
@@ -122,12 +123,14 @@ class BaseAuditLogger(ABC):
                 metadata=serializable_metadata,
             )
         else:
-            audit_create_async.delay(
-                user_id=user_id,
-                action_type=action_type,
-                target_entity=target_entity_dict,
-                workspace=workspace_dict,
-                metadata=serializable_metadata,
+            audit_buffer.add(
+                {
+                    "user_id": user_id,
+                    "action_type": action_type,
+                    "target_entity": target_entity_dict,
+                    "workspace": workspace_dict,
+                    "metadata": serializable_metadata,
+                }
             )
 
     @abstractmethod
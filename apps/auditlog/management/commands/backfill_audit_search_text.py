@@ -0,0 +1,64 @@
+"""
+Management command to fill in the search text of existing audit logs.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.auditlog.config import AuditConfig
+from apps.auditlog.models import AuditTrail
+from apps.auditlog.search import create_search_index
+
+
+class Command(BaseCommand):
+    help = "Build the search text of audit logs written before search indexing"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=AuditConfig.SEARCH_BACKFILL_BATCH_SIZE,
+            help=f"Number of records to update in each batch (default: {AuditConfig.SEARCH_BACKFILL_BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Rebuild the search text of every record, not only missing ones",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        queryset = AuditTrail.objects.select_related("user").order_by("audit_id")
+        if not options["all"]:
+            queryset = queryset.filter(search_text="")
+
+        started_at = time.monotonic()
+        updated = 0
+        last_id = None
+
+        while True:
+            batch_queryset = (
+                queryset if last_id is None else queryset.filter(audit_id__gt=last_id)
+            )
+            batch = list(batch_queryset[:batch_size])
+            if not batch:
+                break
+
+            for audit in batch:
+                audit.search_text = audit.build_search_text()
+            AuditTrail.objects.bulk_update(batch, ["search_text"])
+
+            updated += len(batch)
+            last_id = batch[-1].audit_id
+            self.stdout.write(f"  Updated {updated} records")
+
+        create_search_index()
+
+        elapsed = time.monotonic() - started_at
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Backfilled search text for {updated} records in {elapsed:.1f}s"
+            )
+        )
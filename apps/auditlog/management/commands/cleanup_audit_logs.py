@@ -33,8 +33,14 @@ class Command(BaseCommand):
             type=str,
             help="Clean up only specific action type",
         )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue from the checkpoint left by an interrupted run",
+        )
 
     def handle(self, *args, **options):
+        self.verbosity = options["verbosity"]
         dry_run = options["dry_run"] or AuditConfig.CLEANUP_DRY_RUN
         batch_size = options["batch_size"]
         override_days = options["days"]
@@ -54,6 +60,8 @@ class Command(BaseCommand):
             batch_size=batch_size,
             action_type=specific_action,
             override_days=override_days,
+            resume=options["resume"],
+            progress_callback=self.report_progress,
         )
 
         total_deleted = stats.get("total_deleted", 0)
@@ -68,9 +76,16 @@ class Command(BaseCommand):
         else:
             self.stdout.write(
                 self.style.SUCCESS(
-                    f"\nCLEANUP COMPLETE: Deleted {total_deleted} total records"
+                    f"\nCLEANUP COMPLETE: Deleted {total_deleted} total records "
+                    f"in {stats['elapsed_seconds']:.1f}s "
+                    f"({stats['rows_per_second']:.0f} rows/s)"
                 )
             )
+            if stats["partitions_dropped"]:
+                self.stdout.write(
+                    f"  Dropped {stats['partitions_dropped']} expired partitions "
+                    f"({stats['partition_rows_deleted']} records)"
+                )
 
         # Show current retention settings
         self.stdout.write("\nCurrent retention settings:")
@@ -81,3 +96,16 @@ class Command(BaseCommand):
         self.stdout.write(
             f"  Critical actions: {AuditConfig.CRITICAL_RETENTION_DAYS} days"
         )
+
+    def report_progress(self, progress):
+        """Print the running totals after each deleted batch."""
+        if self.verbosity < 1:
+            return
+
+        checkpoint = progress["checkpoint"] or "done"
+        self.stdout.write(
+            f"  [{progress['category']}] deleted {progress['deleted']} "
+            f"(+{progress['batch_deleted']}, "
+            f"{progress['rows_per_second']:.0f} rows/s), "
+            f"checkpoint: {checkpoint}"
+        )
@@ -0,0 +1,48 @@
+"""
+Management command to manage monthly partitions of the audit trail table.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.auditlog import partitioning
+from apps.auditlog.config import AuditConfig
+
+
+class Command(BaseCommand):
+    help = "Convert the audit trail to monthly partitions and create upcoming ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--convert",
+            action="store_true",
+            help="Rebuild the audit trail table as a partitioned table (locks the table)",
+        )
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=AuditConfig.PARTITION_PREMAKE_MONTHS,
+            help=f"Monthly partitions to create ahead of time (default: {AuditConfig.PARTITION_PREMAKE_MONTHS})",
+        )
+
+    def handle(self, *args, **options):
+        if not partitioning.is_supported():
+            raise CommandError("Audit trail partitioning requires PostgreSQL.")
+
+        months_ahead = options["months_ahead"]
+
+        if options["convert"]:
+            partitions = partitioning.convert_to_partitioned(months_ahead=months_ahead)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Audit trail is partitioned ({len(partitions)} monthly partitions)"
+                )
+            )
+        elif not partitioning.is_partitioned():
+            raise CommandError(
+                "The audit trail table is not partitioned. Run with --convert first."
+            )
+        else:
+            partitioning.ensure_partitions(months_ahead=months_ahead)
+
+        for name, month in partitioning.list_partitions():
+            self.stdout.write(f"  {name} ({month:%Y-%m})")
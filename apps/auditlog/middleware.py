@@ -0,0 +1,17 @@
+"""Middleware for the audit log app."""
+
+from .buffer import audit_buffer
+
+
+class AuditBufferMiddleware:
+    """Collect a request's audit records and flush them as one batch."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        audit_buffer.begin()
+        try:
+            return self.get_response(request)
+        finally:
+            audit_buffer.end()
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.1 on 2026-10-16 19:44
+
+from django.db import migrations, models
+
+SEARCH_INDEX_NAME = "auditlog_search_text_trgm_idx"
+
+
+def create_search_index(apps, schema_editor):
+    # Trigram GIN index for substring search; PostgreSQL only. Existing rows
+    # are filled in with the backfill_audit_search_text command.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS "{SEARCH_INDEX_NAME}" '
+        'ON "auditlog_audittrail" USING gin ("search_text" gin_trgm_ops)'
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS "{SEARCH_INDEX_NAME}"')
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("auditlog", "0003_alter_audittrail_action_type"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="audittrail",
+            name="search_text",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
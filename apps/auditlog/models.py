@@ -45,6 +45,31 @@ class AuditTrail(models.Model):
         blank=True,
         related_name="audit_trails",
     )
+    # Lowercased action, user identity and metadata text matched by audit
+    # search; see apps.auditlog.search for the index that backs it.
+    search_text = models.TextField(blank=True, default="", editable=False)
+
+    def build_search_text(self) -> str:
+        """
+        Build the text indexed for search: the action type and its display
+        name, the user's username and email, and the serialized metadata.
+        """
+        parts = [self.action_type, self.get_action_type_display()]
+        if self.user_id:
+            parts += [self.user.username, self.user.email]
+        if self.metadata:
+            if isinstance(self.metadata, str):
+                parts.append(self.metadata)
+            else:
+                parts.append(json.dumps(self.metadata, ensure_ascii=False, default=str))
+        return " ".join(str(part) for part in parts if part).lower()
+
+    def save(self, *args, **kwargs):
+        self.search_text = self.build_search_text()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "search_text" not in update_fields:
+            kwargs["update_fields"] = [*update_fields, "search_text"]
+        super().save(*args, **kwargs)
 
     def _parse_metadata(self):
         """Parse metadata ensuring it's a dictionary."""
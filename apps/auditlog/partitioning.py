@@ -0,0 +1,224 @@
+"""
+Optional monthly range partitioning of the audit trail table (PostgreSQL).
+
+``convert_to_partitioned`` swaps ``auditlog_audittrail`` for a table declared
+``PARTITION BY RANGE ("timestamp")`` with one partition per calendar month
+plus a default partition, after which retention cleanup can drop whole
+expired months instead of deleting their rows. PostgreSQL requires the
+primary key of a partitioned table to include the partition key, so the
+database key becomes ``(audit_id, timestamp)``; ``audit_id`` stays the
+model's primary key and remains unique since it is a UUID.
+
+Every function here is a no-op on other database backends and on an
+unpartitioned table.
+"""
+
+import logging
+import re
+from datetime import date, datetime, timezone as dt_timezone
+from typing import List, Optional, Tuple
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .config import AuditConfig
+from .models import AuditTrail
+from .search import create_search_index
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = AuditTrail._meta.db_table
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+_PARTITION_NAME_RE = re.compile(rf"^{PARENT_TABLE}_p(\d{{4}})_(\d{{2}})$")
+
+
+def is_supported() -> bool:
+    return connection.vendor == "postgresql"
+
+
+def is_partitioned() -> bool:
+    """Whether the audit trail table is a declaratively partitioned table."""
+    if not is_supported():
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT 1
+            FROM pg_partitioned_table pt
+            JOIN pg_class c ON c.oid = pt.partrelid
+            WHERE c.relname = %s
+            """,
+            [PARENT_TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def _month_start(value) -> date:
+    return date(value.year, value.month, 1)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _month_bounds(month: date) -> Tuple[datetime, datetime]:
+    """Partition bounds are whole UTC months."""
+    upper_month = _add_months(month, 1)
+    return (
+        datetime(month.year, month.month, 1, tzinfo=dt_timezone.utc),
+        datetime(upper_month.year, upper_month.month, 1, tzinfo=dt_timezone.utc),
+    )
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_p{month:%Y_%m}"
+
+
+def list_partitions() -> List[Tuple[str, date]]:
+    """Return ``(table_name, month)`` for every monthly partition, oldest first."""
+    if not is_partitioned():
+        return []
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s
+            """,
+            [PARENT_TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = []
+    for name in names:
+        match = _PARTITION_NAME_RE.match(name)
+        if match:
+            partitions.append((name, date(int(match[1]), int(match[2]), 1)))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def _create_partition(cursor, month: date) -> None:
+    lower, upper = _month_bounds(month)
+    cursor.execute(
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(month)}" '
+        f'PARTITION OF "{PARENT_TABLE}" FOR VALUES FROM (%s) TO (%s)',
+        [lower, upper],
+    )
+
+
+def ensure_partitions(
+    *, months_ahead: Optional[int] = None, start: Optional[date] = None
+) -> List[str]:
+    """
+    Create the monthly partitions from ``start`` (default: the current month)
+    up to ``months_ahead`` months in the future. Returns the partitions that
+    exist for that range afterwards.
+    """
+    if not is_partitioned():
+        return []
+
+    if months_ahead is None:
+        months_ahead = AuditConfig.PARTITION_PREMAKE_MONTHS
+
+    current = _month_start(timezone.now())
+    month = _month_start(start) if start else current
+    last = _add_months(current, months_ahead)
+
+    created = []
+    with transaction.atomic(), connection.cursor() as cursor:
+        while month <= last:
+            _create_partition(cursor, month)
+            created.append(partition_name(month))
+            month = _add_months(month, 1)
+    return created
+
+
+def drop_partitions_before(cutoff: datetime) -> List[Tuple[str, int]]:
+    """
+    Drop every monthly partition whose whole range lies before ``cutoff``.
+    Returns ``(table_name, row_count)`` for each dropped partition.
+    """
+    dropped = []
+    for name, month in list_partitions():
+        _, upper = _month_bounds(month)
+        if upper > cutoff:
+            break
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f'SELECT COUNT(*) FROM "{name}"')
+            row_count = cursor.fetchone()[0]
+            cursor.execute(f'DROP TABLE "{name}"')
+
+        logger.info(f"Dropped audit partition {name} ({row_count} rows)")
+        dropped.append((name, row_count))
+    return dropped
+
+
+def convert_to_partitioned(*, months_ahead: Optional[int] = None) -> List[str]:
+    """
+    Rebuild the audit trail table as a monthly partitioned table, copying the
+    existing rows over. Runs in a single transaction and holds an exclusive
+    lock on the table for its duration.
+    """
+    if not is_supported():
+        raise RuntimeError("Audit trail partitioning requires PostgreSQL.")
+    if is_partitioned():
+        return [name for name, _ in list_partitions()]
+
+    legacy_table = f"{PARENT_TABLE}_legacy"
+    timestamp = AuditTrail._meta.get_field("timestamp").column
+    pk = AuditTrail._meta.pk.column
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" RENAME TO "{legacy_table}"')
+            cursor.execute(
+                f'CREATE TABLE "{PARENT_TABLE}" '
+                f'(LIKE "{legacy_table}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+                f'PARTITION BY RANGE ("{timestamp}")'
+            )
+            cursor.execute(
+                f'CREATE TABLE "{DEFAULT_PARTITION}" PARTITION OF "{PARENT_TABLE}" DEFAULT'
+            )
+
+            cursor.execute(f'SELECT MIN("{timestamp}") FROM "{legacy_table}"')
+            oldest = cursor.fetchone()[0]
+
+        ensure_partitions(
+            months_ahead=months_ahead, start=oldest.date() if oldest else None
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO "{PARENT_TABLE}" SELECT * FROM "{legacy_table}"'
+            )
+            cursor.execute(f'DROP TABLE "{legacy_table}"')
+            cursor.execute(
+                f'ALTER TABLE "{PARENT_TABLE}" ADD PRIMARY KEY ("{pk}", "{timestamp}")'
+            )
+
+        # Recreate the indexes and foreign keys Django created for the original
+        # table, under the same names now that the legacy table is gone.
+        with connection.schema_editor() as schema_editor:
+            for sql in schema_editor._model_indexes_sql(AuditTrail):
+                schema_editor.execute(sql)
+            for field in AuditTrail._meta.local_fields:
+                if field.remote_field and field.db_constraint:
+                    schema_editor.execute(
+                        schema_editor._create_fk_sql(
+                            AuditTrail, field, "_fk_%(to_table)s_%(to_column)s"
+                        )
+                    )
+        create_search_index()
+
+    partitions = [name for name, _ in list_partitions()]
+    logger.info(
+        f"Converted {PARENT_TABLE} to a partitioned table "
+        f"with {len(partitions)} monthly partitions"
+    )
+    return partitions
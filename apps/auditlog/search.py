@@ -0,0 +1,58 @@
+"""
+Audit log search.
+
+Searches match against ``AuditTrail.search_text``, a lowercased copy of the
+action type and display name, the user's username and email and the
+serialized metadata, kept up to date on every write. On PostgreSQL the
+column carries a ``pg_trgm`` GIN index, so substring matches are answered
+from the index instead of casting every row's metadata to text, and results
+can be ranked by trigram word similarity. Other backends fall back to a
+plain ``LIKE`` scan of the same column.
+"""
+
+from django.db import connection
+from django.db.models import Q
+
+from .models import AuditTrail
+
+SEARCH_INDEX_NAME = "auditlog_search_text_trgm_idx"
+
+
+def is_indexed_search_supported() -> bool:
+    return connection.vendor == "postgresql"
+
+
+def normalize_search_query(search_query: str) -> str:
+    return " ".join(search_query.split()).lower()
+
+
+def search_filter(search_query: str) -> Q:
+    """Rows whose search text contains ``search_query`` (case-insensitively)."""
+    return Q(search_text__contains=normalize_search_query(search_query))
+
+
+def search_rank(search_query: str):
+    """
+    Relevance expression for ranking matches, or ``None`` when the database
+    cannot compute one.
+    """
+    if not is_indexed_search_supported():
+        return None
+
+    from django.contrib.postgres.search import TrigramWordSimilarity
+
+    return TrigramWordSimilarity(normalize_search_query(search_query), "search_text")
+
+
+def create_search_index() -> None:
+    """Create the trigram index on ``search_text`` (PostgreSQL only)."""
+    if not is_indexed_search_supported():
+        return
+
+    table = AuditTrail._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        cursor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{SEARCH_INDEX_NAME}" '
+            f'ON "{table}" USING gin ("search_text" gin_trgm_ops)'
+        )
@@ -3,12 +3,13 @@ from typing import Dict, List, Optional, Union
 
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Q, QuerySet
+from django.db.models import Count, Q, QuerySet
 from django.utils import timezone
 
 from .config import AuditConfig
 from .constants import AuditActionType, is_critical_action
 from .models import AuditTrail
+from .search import search_filter, search_rank
 from .utils import is_security_related
 from uuid import UUID
 
@@ -24,22 +25,11 @@ class AuditLogSelector:
     def _apply_search_filters(search_query):
         """
         Apply search filters to audit logs based on search query.
-        """
-        search_conditions = Q()
-        search_conditions |= Q(metadata__icontains=search_query)
-        search_conditions |= Q(user__username__icontains=search_query)
-        search_conditions |= Q(user__email__icontains=search_query)
-
-        # Search in action type display names by checking each action type
-        matching_action_types = []
-        for action_type, display_name in AuditActionType.choices:
-            if search_query.lower() in display_name.lower():
-                matching_action_types.append(action_type)
-
-        if matching_action_types:
-            search_conditions |= Q(action_type__in=matching_action_types)
 
-        return search_conditions
+        Matches the indexed ``search_text`` column, which covers metadata,
+        action type display names, usernames and emails.
+        """
+        return search_filter(search_query)
 
     @staticmethod
     def get_audit_logs_with_filters(
@@ -61,6 +51,10 @@ class AuditLogSelector:
     ) -> QuerySet[AuditTrail]:
         """
         Get audit logs with comprehensive filtering options.
+
+        ``order_by="relevance"`` ranks search matches by similarity to
+        ``search_query`` (newest first among equals) where the database
+        supports it, and falls back to newest first otherwise.
         """
         qs = AuditTrail.objects.select_related("user", "target_entity_type").all()
 
@@ -128,6 +122,12 @@ class AuditLogSelector:
         if exclude_system_actions:
             qs = qs.exclude(user__isnull=True)
 
+        if order_by == "relevance":
+            rank = search_rank(search_query) if search_query else None
+            if rank is None:
+                return qs.order_by("-timestamp")
+            return qs.annotate(search_rank=rank).order_by("-search_rank", "-timestamp")
+
         return qs.order_by(order_by)
 
     @staticmethod
@@ -225,67 +225,56 @@ def get_retention_summary() -> Dict[str, int]:
     """
     Get a summary of audit logs by retention category.
     Read-only operation for retention statistics.
+
+    Runs a single ``GROUP BY action_type`` query with one conditional count
+    per retention period; categories are resolved per action type here.
     """
     now = timezone.now()
     summary = {
-        "total_logs": AuditTrail.objects.count(),
+        "total_logs": 0,
         "authentication_logs": 0,
         "critical_logs": 0,
         "default_logs": 0,
         "expired_logs": 0,
     }
 
-    # Count by retention categories
     auth_actions = [
         AuditActionType.LOGIN_SUCCESS,
         AuditActionType.LOGIN_FAILED,
         AuditActionType.LOGOUT,
     ]
+    retention_periods = {
+        AuditConfig.AUTHENTICATION_RETENTION_DAYS,
+        AuditConfig.CRITICAL_RETENTION_DAYS,
+        AuditConfig.DEFAULT_RETENTION_DAYS,
+    }
 
-    # Count authentication logs
-    summary["authentication_logs"] = AuditTrail.objects.filter(
-        action_type__in=auth_actions
-    ).count()
-
-    # Count critical logs
-    all_action_types = AuditTrail.objects.values_list(
-        "action_type", flat=True
-    ).distinct()
-    critical_actions = [
-        action for action in all_action_types if is_critical_action(action)
-    ]
-    summary["critical_logs"] = AuditTrail.objects.filter(
-        action_type__in=critical_actions
-    ).count()
-
-    # Count default logs (non-auth, non-critical)
-    summary["default_logs"] = (
-        AuditTrail.objects.exclude(action_type__in=auth_actions)
-        .exclude(action_type__in=critical_actions)
-        .count()
+    rows = (
+        AuditTrail.objects.order_by()
+        .values("action_type")
+        .annotate(
+            total=Count("pk"),
+            **{
+                f"expired_{days}": Count(
+                    "pk", filter=Q(timestamp__lt=now - timedelta(days=days))
+                )
+                for days in retention_periods
+            },
+        )
     )
 
-    # Count expired logs by category
-    auth_cutoff = now - timedelta(days=AuditConfig.AUTHENTICATION_RETENTION_DAYS)
-    critical_cutoff = now - timedelta(days=AuditConfig.CRITICAL_RETENTION_DAYS)
-    default_cutoff = now - timedelta(days=AuditConfig.DEFAULT_RETENTION_DAYS)
-
-    expired_auth = AuditTrail.objects.filter(
-        action_type__in=auth_actions, timestamp__lt=auth_cutoff
-    ).count()
-
-    expired_critical = AuditTrail.objects.filter(
-        action_type__in=critical_actions, timestamp__lt=critical_cutoff
-    ).count()
-
-    expired_default = (
-        AuditTrail.objects.exclude(action_type__in=auth_actions)
-        .exclude(action_type__in=critical_actions)
-        .filter(timestamp__lt=default_cutoff)
-        .count()
-    )
+    for row in rows:
+        action_type = row["action_type"]
+        if action_type in auth_actions:
+            summary["authentication_logs"] += row["total"]
+        elif is_critical_action(action_type):
+            summary["critical_logs"] += row["total"]
+        else:
+            summary["default_logs"] += row["total"]
 
-    summary["expired_logs"] = expired_auth + expired_critical + expired_default
+        retention_days = AuditConfig.get_retention_days_for_action(action_type)
+        summary["expired_logs"] += row[f"expired_{retention_days}"]
+        summary["total_logs"] += row["total"]
 
     return summary
 
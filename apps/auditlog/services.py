@@ -1,16 +1,22 @@
 import logging
+import time
 import uuid
 from decimal import Decimal
-from datetime import datetime, date, timezone
-from typing import Dict, Optional
+from datetime import datetime, date, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
 
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
 from django.db import transaction
+from django.utils import timezone as django_timezone
 
 from apps.core.utils import model_update
 from apps.workspaces.models import Workspace
 
+from . import partitioning
 from .models import AuditTrail
 from .config import AuditConfig
 from .constants import AuditActionType
@@ -44,11 +50,155 @@ def make_json_serializable(obj):
         return str(obj)
 
 
+def _get_foreign_key_id(instance, field_name):
+    """
+    Return the id stored in ``instance``'s foreign key ``field_name``
+    without loading the related object, or None when there is no such key.
+    """
+    try:
+        field = instance._meta.get_field(field_name)
+    except (AttributeError, FieldDoesNotExist):
+        return None
+    if not (field.concrete and field.is_relation):
+        return None
+    return getattr(instance, field.attname, None)
+
+
+# The foreign keys below never change once a row exists, so their lookups can
+# be cached for the lifetime of the process.
+
+
+@lru_cache(maxsize=AuditConfig.CONTEXT_CACHE_SIZE)
+def _get_workspace_organization_id(workspace_id):
+    return (
+        Workspace.objects.filter(pk=workspace_id)
+        .values_list("organization_id", flat=True)
+        .first()
+    )
+
+
+@lru_cache(maxsize=AuditConfig.CONTEXT_CACHE_SIZE)
+def _get_workspace_team_context(workspace_team_id):
+    from apps.workspaces.models import WorkspaceTeam
+
+    return WorkspaceTeam.objects.filter(pk=workspace_team_id).values_list(
+        "workspace_id", "workspace__organization_id"
+    ).first() or (None, None)
+
+
+@lru_cache(maxsize=AuditConfig.CONTEXT_CACHE_SIZE)
+def _get_team_organization_id(team_id):
+    from apps.teams.models import Team
+
+    return (
+        Team.all_objects.filter(pk=team_id)
+        .values_list("organization_id", flat=True)
+        .first()
+    )
+
+
+@lru_cache(maxsize=AuditConfig.CONTEXT_CACHE_SIZE)
+def _get_entry_context(entry_id):
+    from apps.entries.models import Entry
+
+    return Entry.all_objects.filter(pk=entry_id).values_list(
+        "workspace_id", "organization_id"
+    ).first() or (None, None)
+
+
+def clear_audit_context_cache():
+    """Clear the cached foreign key lookups of ``resolve_audit_context``."""
+    for lookup in (
+        _get_workspace_organization_id,
+        _get_workspace_team_context,
+        _get_team_organization_id,
+        _get_entry_context,
+    ):
+        lookup.cache_clear()
+
+
+def _resolve_target_context(target_entity):
+    """Return the ``(workspace_id, organization_id)`` ``target_entity`` belongs to."""
+    if isinstance(target_entity, Workspace):
+        return target_entity.pk, target_entity.organization_id
+    if target_entity._meta.label == "organizations.Organization":
+        return None, target_entity.pk
+
+    workspace_id = _get_foreign_key_id(target_entity, "workspace")
+    organization_id = _get_foreign_key_id(target_entity, "organization")
+
+    if workspace_id is None:
+        workspace_team_id = _get_foreign_key_id(target_entity, "workspace_team")
+        entry_id = _get_foreign_key_id(target_entity, "entry")
+        if workspace_team_id is not None:
+            workspace_id, team_organization_id = _get_workspace_team_context(
+                workspace_team_id
+            )
+            organization_id = organization_id or team_organization_id
+        elif entry_id is not None:
+            workspace_id, entry_organization_id = _get_entry_context(entry_id)
+            organization_id = organization_id or entry_organization_id
+
+    if organization_id is None:
+        if workspace_id is not None:
+            organization_id = _get_workspace_organization_id(workspace_id)
+        else:
+            team_id = _get_foreign_key_id(target_entity, "team")
+            if team_id is not None:
+                organization_id = _get_team_organization_id(team_id)
+
+    return workspace_id, organization_id
+
+
+def resolve_audit_context(*, user, target_entity=None, workspace=None):
+    """
+    Resolve the workspace and organization an audit entry belongs to.
+
+    They are derived from the foreign key ids already on ``target_entity``
+    (its workspace, workspace team, entry, organization or team), using
+    cached lookups where a hop through the database is needed. Without a
+    target entity the user's first active organization is used. Passing
+    ``workspace=False`` leaves the workspace empty.
+
+    Returns a ``(workspace_id, organization_id)`` tuple.
+    """
+    workspace_id = organization_id = None
+
+    if workspace:
+        workspace_id = workspace.pk
+        organization_id = workspace.organization_id
+    elif target_entity is not None and hasattr(target_entity, "_meta"):
+        workspace_id, organization_id = _resolve_target_context(target_entity)
+        if workspace is False:
+            workspace_id = None
+
+    if organization_id is None and user and hasattr(user, "organization_memberships"):
+        organization_id = (
+            user.organization_memberships.filter(
+                is_active=True, organization__status="active"
+            )
+            .values_list("organization_id", flat=True)
+            .first()
+        )
+
+    return workspace_id, organization_id
+
+
 def audit_create(
-    *, user, action_type, target_entity=None, workspace=None, metadata=None
+    *,
+    user,
+    action_type,
+    target_entity=None,
+    workspace=None,
+    metadata=None,
+    validate=True,
 ):
     """
     Service to create an audit log entry.
+
+    Trusted internal writers (such as the model signal handlers) pass
+    ``validate=False`` to skip ``full_clean``, whose foreign key checks cost a
+    query each, so the entry is written with a single INSERT.
     """
     try:
         if target_entity:
@@ -59,131 +209,158 @@ def audit_create(
             target_entity_type = None
             target_entity_id = None
 
-        audit = AuditTrail()
-
-        # Auto-detect workspace if not provided (but not if explicitly disabled with False)
-        if workspace is None and target_entity:
-            # Priority 1: Target entity is a workspace
-            if isinstance(target_entity, Workspace):
-                workspace = target_entity
-
-            # Priority 2: Target entity has direct workspace relationship
-            elif hasattr(target_entity, "workspace") and target_entity.workspace:
-                workspace = target_entity.workspace
-
-            # Priority 3: Target entity has workspace through team relationship
-            elif (
-                hasattr(target_entity, "workspace_team")
-                and target_entity.workspace_team
-            ):
-                workspace = target_entity.workspace_team.workspace
-
-            # Priority 4: Target entity has workspace through team (direct team relationship)
-            elif hasattr(target_entity, "team") and target_entity.team:
-                # Check if team has workspace relationships
-                if hasattr(target_entity.team, "workspace_teams"):
-                    workspace_team = target_entity.team.workspace_teams.first()
-                    if workspace_team:
-                        workspace = workspace_team.workspace
-
-            # Priority 5: Target entity is an organization member, get their primary workspace
-            elif hasattr(target_entity, "administered_workspaces"):
-                # If target is an organization member who administers workspaces
-                administered_workspace = target_entity.administered_workspaces.first()
-                if administered_workspace:
-                    workspace = administered_workspace
-
-            # Priority 6: Target entity is related to organization, get organization's first workspace
-            elif hasattr(target_entity, "organization") and target_entity.organization:
-                if hasattr(target_entity.organization, "workspaces"):
-                    org_workspace = target_entity.organization.workspaces.filter(
-                        status="active"
-                    ).first()
-                    if org_workspace:
-                        workspace = org_workspace
-
-        # Fallback: If still no workspace and user has organization memberships
-        if workspace is None and user and hasattr(user, "organization_memberships"):
-            active_membership = user.organization_memberships.filter(
-                is_active=True, organization__status="active"
-            ).first()
-            if active_membership and hasattr(
-                active_membership.organization, "workspaces"
-            ):
-                user_workspace = active_membership.organization.workspaces.filter(
-                    status="active"
-                ).first()
-                if user_workspace:
-                    workspace = user_workspace
-
-        # Auto-detect organization from workspace, target entity, or user
-        organization = None
-
-        # Priority 1: From workspace
-        if workspace and hasattr(workspace, "organization"):
-            organization = workspace.organization
-
-        # Priority 2: Target entity IS an organization
-        elif target_entity and target_entity.__class__.__name__ == "Organization":
-            organization = target_entity
-
-        # Priority 3: From target entity (direct organization relationship)
-        elif target_entity and hasattr(target_entity, "organization"):
-            organization = target_entity.organization
-
-        # Priority 3: From target entity's workspace (if target has workspace)
-        elif (
-            target_entity
-            and hasattr(target_entity, "workspace")
-            and target_entity.workspace
-        ):
-            if hasattr(target_entity.workspace, "organization"):
-                organization = target_entity.workspace.organization
-
-        # Priority 4: From target entity's team organization (if target is team-related)
-        elif target_entity and hasattr(target_entity, "team") and target_entity.team:
-            if hasattr(target_entity.team, "organization"):
-                organization = target_entity.team.organization
-
-        # Priority 5: From user's active organization memberships
-        elif user and hasattr(user, "organization_memberships"):
-            # Try to get user's primary/active organization
-            active_membership = user.organization_memberships.filter(
-                is_active=True, organization__status="active"
-            ).first()
-            if active_membership:
-                organization = active_membership.organization
-
-        # Priority 6: From user's any organization membership (fallback)
-        elif user and hasattr(user, "organization_memberships"):
-            any_membership = user.organization_memberships.filter(
-                organization__status="active"
-            ).first()
-            if any_membership:
-                organization = any_membership.organization
+        workspace_id, organization_id = resolve_audit_context(
+            user=user, target_entity=target_entity, workspace=workspace
+        )
 
         # Ensure metadata is JSON serializable
         serializable_metadata = (
             make_json_serializable(metadata) if metadata is not None else None
         )
 
+        audit = AuditTrail()
         data = {
             "user": user,
             "action_type": action_type,
             "target_entity_id": target_entity_id,
             "target_entity_type": target_entity_type,
-            "organization": organization,
-            "workspace": workspace if workspace else None,
+            "organization_id": organization_id,
+            "workspace_id": workspace_id,
             "metadata": serializable_metadata,
         }
 
-        return model_update(audit, data)
+        if validate:
+            return model_update(audit, data)
+
+        for field_name, value in data.items():
+            setattr(audit, field_name, value)
+        audit.save(force_insert=True)
+        return audit
 
     except Exception as e:
         logger.error(f"Failed to create audit log: {e}", exc_info=True)
         return None
 
 
+def audit_create_bulk(
+    *,
+    user,
+    action_type,
+    target_entities,
+    metadata_for: Optional[Callable[[Any], Dict[str, Any]]] = None,
+    summary_metadata: Optional[Dict[str, Any]] = None,
+) -> list[AuditTrail]:
+    """
+    Service to audit many entities of one model with a single bulk insert:
+    one ``action_type`` record per entity plus, when ``summary_metadata`` is
+    given, one BULK_OPERATION record summarising the batch that the per-entity
+    records reference through ``bulk_audit_id``.
+
+    The organization and workspace are read from each entity's own foreign key
+    ids instead of being resolved per record.
+    """
+    target_entities = list(target_entities)
+    if not target_entities:
+        return []
+
+    target_entity_type = ContentType.objects.get_for_model(target_entities[0])
+    audits = []
+    summary_id = None
+
+    if summary_metadata is not None:
+        organization_ids = {
+            getattr(entity, "organization_id", None) for entity in target_entities
+        }
+        workspace_ids = {
+            getattr(entity, "workspace_id", None) for entity in target_entities
+        }
+        summary = AuditTrail(
+            user=user,
+            action_type=AuditActionType.BULK_OPERATION,
+            organization_id=organization_ids.pop()
+            if len(organization_ids) == 1
+            else None,
+            workspace_id=workspace_ids.pop() if len(workspace_ids) == 1 else None,
+            metadata=make_json_serializable(
+                {
+                    "action": "bulk_operation",
+                    "target_entity_type": target_entity_type.model,
+                    "total_affected_count": len(target_entities),
+                    **summary_metadata,
+                }
+            ),
+        )
+        summary_id = str(summary.audit_id)
+        audits.append(summary)
+
+    for entity in target_entities:
+        metadata = metadata_for(entity) if metadata_for else {}
+        if summary_id:
+            metadata["bulk_audit_id"] = summary_id
+        audits.append(
+            AuditTrail(
+                user=user,
+                action_type=action_type,
+                target_entity_id=entity.pk,
+                target_entity_type=target_entity_type,
+                organization_id=getattr(entity, "organization_id", None),
+                workspace_id=getattr(entity, "workspace_id", None),
+                metadata=make_json_serializable(metadata),
+            )
+        )
+
+    for audit in audits:
+        # bulk_create bypasses save(), which fills this in for single writes
+        audit.search_text = audit.build_search_text()
+    return AuditTrail.objects.bulk_create(
+        audits, batch_size=AuditConfig.BATCH_WRITE_SIZE
+    )
+
+
+def audit_create_bulk_summary(
+    *,
+    user,
+    model_class,
+    affected_count,
+    affected_ids,
+    organization_id=None,
+    workspace_id=None,
+    metadata=None,
+) -> AuditTrail:
+    """
+    Service to audit a set-based operation on ``affected_count`` rows of
+    ``model_class`` with a single BULK_OPERATION record.
+
+    ``affected_ids`` lists the rows in full below
+    ``AuditConfig.BULK_OPERATION_THRESHOLD``; past it only the first
+    ``AuditConfig.BULK_SAMPLE_SIZE`` are kept as a sample.
+    """
+    affected_ids = [str(pk) for pk in affected_ids]
+    summary_metadata = {
+        "action": "bulk_operation",
+        "target_entity_type": model_class._meta.model_name,
+        "total_affected_count": affected_count,
+        **(metadata or {}),
+    }
+    if affected_count < AuditConfig.BULK_OPERATION_THRESHOLD:
+        summary_metadata["affected_ids"] = affected_ids
+    else:
+        summary_metadata["sampled_ids"] = affected_ids[: AuditConfig.BULK_SAMPLE_SIZE]
+        summary_metadata["sampling_note"] = (
+            f"Showing first {AuditConfig.BULK_SAMPLE_SIZE} of {affected_count} ids"
+        )
+
+    audit = AuditTrail(
+        user=user,
+        action_type=AuditActionType.BULK_OPERATION,
+        organization_id=organization_id,
+        workspace_id=workspace_id,
+        metadata=make_json_serializable(summary_metadata),
+    )
+    audit.save(force_insert=True)
+    return audit
+
+
 def audit_create_authentication_event(
     *, user, action_type, workspace=None, metadata=None
 ):
@@ -239,9 +416,18 @@ def audit_cleanup_expired_logs(
     batch_size: Optional[int] = None,
     action_type: Optional[str] = None,
     override_days: Optional[int] = None,
-) -> Dict[str, int]:
+    resume: bool = False,
+    progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
     """
     Clean up expired audit logs based on retention policies.
+
+    Expired rows are deleted in timestamp range chunks (see
+    ``_delete_in_batches``) and a checkpoint is saved after every chunk, so
+    a run interrupted part way can continue from it with ``resume=True``.
+    ``progress_callback`` receives the running totals after every chunk.
+    When the table is partitioned (see ``apps.auditlog.partitioning``),
+    months that have fully expired are dropped as whole partitions first.
     """
     if batch_size is None:
         batch_size = AuditConfig.CLEANUP_BATCH_SIZE
@@ -249,9 +435,24 @@ def audit_cleanup_expired_logs(
     stats = {
         "authentication_deleted": 0,
         "default_deleted": 0,
+        "partition_rows_deleted": 0,
+        "partitions_dropped": 0,
         "total_deleted": 0,
         "dry_run": dry_run,
+        "elapsed_seconds": 0.0,
+        "rows_per_second": 0.0,
     }
+    started_at = time.monotonic()
+
+    checkpoint = {"action_type": action_type, "override_days": override_days}
+    resume_from = {}
+    if resume and not dry_run:
+        saved = cache.get(AuditConfig.CLEANUP_CHECKPOINT_CACHE_KEY) or {}
+        if all(saved.get(key) == value for key, value in checkpoint.items()):
+            resume_from = saved.get("categories", {})
+
+    if not dry_run and not action_type:
+        _drop_expired_partitions(stats, override_days=override_days)
 
     # Get expired logs queryset
     expired_logs = get_expired_logs_queryset(
@@ -259,11 +460,7 @@ def audit_cleanup_expired_logs(
     )
 
     if action_type:
-        # Clean up specific action type
-        if dry_run:
-            stats["total_deleted"] = expired_logs.count()
-        else:
-            stats["total_deleted"] = _delete_in_batches(expired_logs, batch_size)
+        categories = [("total_deleted", expired_logs)]
     else:
         # Clean up by categories
         auth_actions = [
@@ -271,58 +468,145 @@ def audit_cleanup_expired_logs(
             AuditActionType.LOGIN_FAILED,
             AuditActionType.LOGOUT,
         ]
+        categories = [
+            (
+                "authentication_deleted",
+                expired_logs.filter(action_type__in=auth_actions),
+            ),
+            ("default_deleted", expired_logs.exclude(action_type__in=auth_actions)),
+        ]
 
-        # Authentication logs
-        auth_expired = expired_logs.filter(action_type__in=auth_actions)
+    for category, queryset in categories:
         if dry_run:
-            stats["authentication_deleted"] = auth_expired.count()
-        else:
-            stats["authentication_deleted"] = _delete_in_batches(
-                auth_expired, batch_size
-            )
+            stats[category] = queryset.count()
+            if category != "total_deleted":
+                stats["total_deleted"] += stats[category]
+            continue
+
+        def on_batch(deleted_count, boundary, category=category):
+            stats[category] += deleted_count
+            if category != "total_deleted":
+                stats["total_deleted"] += deleted_count
+            if boundary is not None:
+                resume_from[category] = boundary.isoformat()
+                cache.set(
+                    AuditConfig.CLEANUP_CHECKPOINT_CACHE_KEY,
+                    {**checkpoint, "categories": resume_from},
+                    AuditConfig.CLEANUP_CHECKPOINT_TIMEOUT,
+                )
+            if progress_callback:
+                progress_callback(
+                    {
+                        "category": category,
+                        "batch_deleted": deleted_count,
+                        "deleted": stats[category],
+                        "checkpoint": resume_from.get(category),
+                        **_cleanup_throughput(stats["total_deleted"], started_at),
+                    }
+                )
+
+        start_after = resume_from.get(category)
+        _delete_in_batches(
+            queryset,
+            batch_size,
+            start_after=datetime.fromisoformat(start_after) if start_after else None,
+            on_batch=on_batch,
+        )
 
-        # Default logs (non-auth)
-        default_expired = expired_logs.exclude(action_type__in=auth_actions)
-        if dry_run:
-            stats["default_deleted"] = default_expired.count()
-        else:
-            stats["default_deleted"] = _delete_in_batches(default_expired, batch_size)
+    stats.update(_cleanup_throughput(stats["total_deleted"], started_at))
 
-        stats["total_deleted"] = (
-            stats["authentication_deleted"] + stats["default_deleted"]
-        )
+    if not dry_run:
+        cache.delete(AuditConfig.CLEANUP_CHECKPOINT_CACHE_KEY)
 
     logger.info(
         f"Audit log cleanup completed. "
         f"Deleted: {stats['total_deleted']} logs "
         f"(Auth: {stats['authentication_deleted']}, "
-        f"Default: {stats['default_deleted']}) "
+        f"Default: {stats['default_deleted']}, "
+        f"Partitions dropped: {stats['partitions_dropped']}) "
+        f"in {stats['elapsed_seconds']:.1f}s "
         f"Dry run: {dry_run}"
     )
 
     return stats
 
 
-def _delete_in_batches(queryset, batch_size: int) -> int:
+def _cleanup_throughput(deleted: int, started_at: float) -> Dict[str, float]:
+    elapsed = time.monotonic() - started_at
+    return {
+        "elapsed_seconds": elapsed,
+        "rows_per_second": deleted / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def _drop_expired_partitions(stats: Dict[str, Any], *, override_days=None) -> None:
+    """Drop the monthly partitions in which every row has expired."""
+    if not partitioning.is_partitioned():
+        return
+
+    partitioning.ensure_partitions()
+
+    longest_retention_days = (
+        override_days
+        if override_days is not None
+        else max(
+            AuditConfig.AUTHENTICATION_RETENTION_DAYS,
+            AuditConfig.CRITICAL_RETENTION_DAYS,
+            AuditConfig.DEFAULT_RETENTION_DAYS,
+        )
+    )
+    cutoff = django_timezone.now() - timedelta(days=longest_retention_days)
+
+    dropped = partitioning.drop_partitions_before(cutoff)
+    stats["partitions_dropped"] = len(dropped)
+    stats["partition_rows_deleted"] = sum(row_count for _, row_count in dropped)
+    stats["total_deleted"] += stats["partition_rows_deleted"]
+
+
+def _delete_in_batches(
+    queryset,
+    batch_size: int,
+    *,
+    start_after: Optional[datetime] = None,
+    on_batch: Optional[Callable[[int, Optional[datetime]], None]] = None,
+) -> int:
     """
     Delete records in batches to avoid memory issues.
     Internal helper function for safe batch deletion.
+
+    Walks the ``timestamp`` index forward from ``start_after``: each batch
+    looks up the timestamp of the ``batch_size``-th remaining row and deletes
+    everything up to it as one range, so a batch never rescans rows earlier
+    batches already covered. Rows sharing the boundary timestamp land in the
+    same batch. ``on_batch(deleted_count, boundary)`` is called after each
+    committed batch, with ``boundary=None`` for the last one.
     """
     total_deleted = 0
+    lower = start_after
 
     while True:
-        with transaction.atomic():
-            # Get a batch of IDs
-            batch_ids = list(queryset.values_list("audit_id", flat=True)[:batch_size])
-
-            if not batch_ids:
-                break
-
-            # Delete the batch
-            deleted_count = AuditTrail.objects.filter(audit_id__in=batch_ids).delete()[
-                0
-            ]
+        remaining = queryset if lower is None else queryset.filter(timestamp__gt=lower)
+        boundary = next(
+            iter(
+                remaining.order_by("timestamp").values_list("timestamp", flat=True)[
+                    batch_size - 1 : batch_size
+                ]
+            ),
+            None,
+        )
 
-            total_deleted += deleted_count
+        with transaction.atomic():
+            if boundary is None:
+                deleted_count = remaining.delete()[0]
+            else:
+                deleted_count = remaining.filter(timestamp__lte=boundary).delete()[0]
+
+        total_deleted += deleted_count
+        if on_batch:
+            on_batch(deleted_count, boundary)
+
+        if boundary is None:
+            break
+        lower = boundary
 
     return total_deleted
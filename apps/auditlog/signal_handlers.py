@@ -9,7 +9,6 @@ from typing import Dict, List, Optional
 from uuid import UUID
 
 from django.apps import apps
-from django.core.exceptions import ObjectDoesNotExist
 from django.db.models.signals import post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
@@ -319,24 +318,41 @@ class GenericAuditSignalHandler(BaseAuditHandler):
 
         @receiver(pre_save, sender=model_class)
         @safe_audit_log
-        def capture_changes(sender, instance, **kwargs):
+        def capture_changes(sender, instance, update_fields=None, **kwargs):
             """Capture field changes before save for update tracking."""
-            if instance.pk:
+            instance._audit_old_values = {}
+            if instance._state.adding or not instance.pk:
+                return
+
+            fields = [field for field in tracked_fields if hasattr(instance, field)]
+            if update_fields is not None:
+                # Only the listed fields are written, the others cannot change
+                fields = [field for field in fields if field in update_fields]
+            if not fields:
+                return
+
+            # Diff against the values the instance was loaded with when known
+            # (see TrackedFieldsMixin), otherwise read them from the row
+            get_loaded_values = getattr(instance, "get_loaded_values", None)
+            old_values = get_loaded_values(fields) if get_loaded_values else None
+            if old_values is None:
                 try:
-                    old_instance = sender.objects.get(pk=instance.pk)
-                    instance._audit_old_values = {
-                        field: getattr(old_instance, field, None)
-                        for field in tracked_fields
-                        if hasattr(old_instance, field)
-                    }
-                except ObjectDoesNotExist:
-                    logger.debug(
-                        f"Old instance not found for {sender.__name__} with pk={instance.pk}"
+                    old_values = (
+                        sender._base_manager.filter(pk=instance.pk)
+                        .values(*fields)
+                        .first()
                     )
                 except Exception as e:
                     logger.warning(
                         f"Error capturing changes for {sender.__name__}: {e}"
                     )
+                    return
+                if old_values is None:
+                    logger.debug(
+                        f"Old instance not found for {sender.__name__} with pk={instance.pk}"
+                    )
+                    return
+            instance._audit_old_values = old_values
 
         @receiver(post_save, sender=model_class)
         @safe_audit_log
@@ -375,6 +391,7 @@ class GenericAuditSignalHandler(BaseAuditHandler):
                     action_type=action_types["created"],
                     target_entity=instance,
                     metadata=metadata,
+                    validate=False,
                     **workspace_param,
                 )
                 logger.debug(
@@ -479,6 +496,7 @@ class GenericAuditSignalHandler(BaseAuditHandler):
                             action_type=action_type,
                             target_entity=instance,
                             metadata=metadata,
+                            validate=False,
                             **workspace_param,
                         )
                         logger.debug(
@@ -520,6 +538,7 @@ class GenericAuditSignalHandler(BaseAuditHandler):
                 action_type=action_types["deleted"],
                 target_entity=instance,
                 metadata=metadata,
+                validate=False,
                 **workspace_param,
             )
             logger.debug(f"Logged deletion of {sender.__name__} with id={instance.pk}")
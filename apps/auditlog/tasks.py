@@ -1,26 +1,41 @@
 """
 Simplified Celery tasks for asynchronous audit logging.
 
-This module provides basic async wrappers for audit_create functions.
+This module provides basic async wrappers for audit_create functions, plus a
+batch task that writes many audit records with a single bulk insert.
 """
 
 import logging
+import uuid
+from collections import defaultdict
 from typing import Any, Dict, Optional
 
 from celery import shared_task
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import DatabaseError
 
+from .buffer import audit_buffer
+from .config import AuditConfig
+from .constants import AuditActionType
+from .models import AuditTrail
 from .services import (
     audit_create,
     audit_create_authentication_event,
     audit_create_security_event,
+    make_json_serializable,
+    resolve_audit_context,
 )
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
+# Transient failures on which a batch write is retried
+BATCH_RETRY_ERRORS = (ConnectionError, TimeoutError, DatabaseError)
+
 
 @shared_task(
     bind=True,
@@ -227,39 +242,178 @@ def audit_create_authentication_event_async(
         return None
 
 
-@shared_task(
-    bind=True,
-    autoretry_for=(ConnectionError, TimeoutError),
-    retry_kwargs={"max_retries": 2},
-)
-def audit_create_bulk_async(
-    self, audit_entries: list[Dict[str, Any]]
-) -> Dict[str, Any]:
-    """Simplified asynchronous bulk audit creation for batch operations."""
-    success_count = 0
+def _as_uuid(value) -> Optional[uuid.UUID]:
+    """Return ``value`` as a UUID, or None when it is not a valid one."""
+    if isinstance(value, uuid.UUID):
+        return value
+    try:
+        return uuid.UUID(str(value))
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def _get_model_from_path(model_path: str):
+    """Resolve 'apps.workspaces.models.Team' style paths to a model class."""
+    path_parts = model_path.split(".")
+    return apps.get_model(path_parts[1], path_parts[-1])
+
+
+def write_audit_batch(records: list[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Write ``records`` (audit_create_async keyword dicts) with one bulk insert.
+
+    Users, workspaces and target entities are loaded with one query per model
+    for the whole batch, and the workspace/organization context is resolved
+    once per distinct (user, target, workspace) combination.
+    """
+    valid_action_types = set(AuditActionType.values)
     failed_count = 0
-    audit_ids = []
 
-    for entry in audit_entries:
+    user_ids = set()
+    workspace_ids = set()
+    target_pks = defaultdict(set)
+    for record in records:
+        user_id = _as_uuid(record.get("user_id"))
+        if user_id:
+            user_ids.add(user_id)
+        workspace = record.get("workspace") or {}
+        workspace_id = _as_uuid(workspace.get("pk"))
+        if workspace_id:
+            workspace_ids.add(workspace_id)
+        target = record.get("target_entity") or {}
+        if target.get("model") and target.get("pk") is not None:
+            target_pks[target["model"]].add(target["pk"])
+
+    users = User.objects.in_bulk(list(user_ids)) if user_ids else {}
+
+    workspaces = {}
+    if workspace_ids:
+        from apps.workspaces.models import Workspace
+
+        workspaces = Workspace.objects.select_related("organization").in_bulk(
+            list(workspace_ids)
+        )
+
+    targets = {}
+    content_types = {}
+    for model_path, pks in target_pks.items():
         try:
-            audit_id = audit_create_async.apply_async(kwargs=entry).get(timeout=30)
+            model_class = _get_model_from_path(model_path)
+        except (IndexError, LookupError) as e:
+            logger.warning(f"Target model {model_path} not found: {e}")
+            continue
+        content_types[model_path] = ContentType.objects.get_for_model(model_class)
+        try:
+            instances = model_class.objects.in_bulk(list(pks))
+        except (ValidationError, ValueError) as e:
+            logger.warning(f"Could not load {model_path} targets: {e}")
+            continue
+        for pk, instance in instances.items():
+            targets[(model_path, str(pk))] = instance
+
+    contexts = {}
+    audits = []
+    for record in records:
+        action_type = record.get("action_type")
+        if action_type not in valid_action_types:
+            logger.warning(f"Dropping audit record with action type {action_type}")
+            failed_count += 1
+            continue
 
-            if audit_id:
-                audit_ids.append(audit_id)
-                success_count += 1
-            else:
-                failed_count += 1
+        user = users.get(_as_uuid(record.get("user_id")))
 
-        except Exception as e:
-            logger.error(f"Failed to process bulk audit entry: {e}")
-            failed_count += 1
+        target = record.get("target_entity") or {}
+        model_path = target.get("model")
+        target_key = (model_path, str(target.get("pk")))
+        target_instance = targets.get(target_key)
+        target_entity_type = content_types.get(model_path)
+        target_entity_id = _as_uuid(target.get("pk")) if target_entity_type else None
+        if target_entity_id is None:
+            target_entity_type = None
+
+        workspace_id = _as_uuid((record.get("workspace") or {}).get("pk"))
+        workspace = workspaces.get(workspace_id)
+
+        context_key = (user.pk if user else None, target_key, workspace_id)
+        if context_key not in contexts:
+            try:
+                contexts[context_key] = resolve_audit_context(
+                    user=user, target_entity=target_instance, workspace=workspace
+                )
+            except Exception as e:
+                logger.warning(f"Could not resolve audit context: {e}")
+                contexts[context_key] = (workspace.pk if workspace else None, None)
+        resolved_workspace_id, organization_id = contexts[context_key]
+
+        audit = AuditTrail(
+            user=user,
+            action_type=action_type,
+            target_entity_id=target_entity_id,
+            target_entity_type=target_entity_type,
+            organization_id=organization_id,
+            workspace_id=resolved_workspace_id,
+            metadata=make_json_serializable(record.get("metadata") or {}),
+        )
+        # bulk_create bypasses save(), which fills this in for single writes
+        audit.search_text = audit.build_search_text()
+        audits.append(audit)
+
+    AuditTrail.objects.bulk_create(audits, batch_size=AuditConfig.BATCH_WRITE_SIZE)
 
-    result = {
-        "success_count": success_count,
+    return {
+        "success_count": len(audits),
         "failed_count": failed_count,
-        "audit_ids": audit_ids,
-        "total_processed": len(audit_entries),
+        "audit_ids": [str(audit.audit_id) for audit in audits],
+        "total_processed": len(records),
     }
 
+
+@shared_task(
+    bind=True,
+    autoretry_for=BATCH_RETRY_ERRORS,
+    max_retries=2,
+)
+def audit_create_batch_async(self, records: list[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Write a batch of buffered audit records with a single bulk insert.
+
+    Database errors are retried; once the retries are exhausted the records
+    are counted as dropped in the audit buffer stats.
+    """
+    try:
+        result = write_audit_batch(records)
+    except BATCH_RETRY_ERRORS as e:
+        if self.request.retries >= self.max_retries:
+            logger.error(f"Dropping {len(records)} audit records: {e}")
+            audit_buffer.record_dropped(len(records))
+        raise
+    if result["failed_count"]:
+        logger.warning(
+            f"Audit batch dropped {result['failed_count']} of "
+            f"{result['total_processed']} records"
+        )
+    return result
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(ConnectionError, TimeoutError),
+    retry_kwargs={"max_retries": 2},
+)
+def audit_create_bulk_async(
+    self, audit_entries: list[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Asynchronous bulk audit creation for batch operations."""
+    try:
+        result = write_audit_batch(audit_entries)
+    except Exception as e:
+        logger.error(f"Failed to write audit batch: {e}")
+        result = {
+            "success_count": 0,
+            "failed_count": len(audit_entries),
+            "audit_ids": [],
+            "total_processed": len(audit_entries),
+        }
+
     logger.info(f"Bulk audit processing completed: {result}")
     return result
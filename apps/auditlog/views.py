@@ -101,6 +101,7 @@ def auditlog_list_view(request, organization_id):
             security_related_only=security_related_only,
             critical_actions_only=critical_actions_only,
             exclude_system_actions=exclude_system_actions,
+            order_by="relevance" if search_query else "-timestamp",
         )
 
         # Pagination
@@ -1,2 +1,7 @@
 PAGINATION_SIZE = 10
 PAGINATION_SIZE_GRID = 9
+TENANCY_CONTEXT_CACHE_TIMEOUT = 300
+
+# Background cascade deletion (see apps.core.services.deletion)
+DELETION_CHUNK_SIZE = 1000  # Rows deleted or archived per statement
+DELETION_JOB_TIMEOUT = 24 * 60 * 60  # Seconds a job's progress is kept
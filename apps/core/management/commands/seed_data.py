@@ -33,6 +33,7 @@ from apps.workspaces.permissions import (
     assign_workspace_team_permissions,
 )
 from apps.teams.permissions import assign_team_permissions
+from apps.core.management.scale_seeder import ScaleSeeder
 
 User = get_user_model()
 
@@ -88,6 +89,24 @@ class Command(BaseCommand):
             action="store_true",
             help="Clear existing data before seeding",
         )
+        parser.add_argument(
+            "--scale",
+            action="store_true",
+            help="Generate the data in memory and write it in bulk (COPY on "
+            "PostgreSQL) for production-sized datasets",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed used by --scale (default: 0)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows written per bulk insert with --scale (default: 5000)",
+        )
 
     def handle(self, *args, **options):
         try:
@@ -115,6 +134,10 @@ class Command(BaseCommand):
             # Create currencies first
             self.create_currencies()
 
+            if options.get("scale"):
+                self.seed_at_scale(options)
+                return
+
             # Create organizations and their members
             organizations = self.create_organizations(
                 count=options["organizations"], users_per_org=options["users_per_org"]
@@ -215,6 +238,27 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR(f"Error seeding data: {str(e)}"))
             raise
 
+    def seed_at_scale(self, options):
+        """Seed the database through ScaleSeeder's bulk writes."""
+        seeder = ScaleSeeder(
+            seed=options.get("seed", 0),
+            batch_size=options.get("batch_size", 5000),
+            stdout=self.stdout,
+        )
+        counts = seeder.run(
+            organizations=options["organizations"],
+            users_per_org=options["users_per_org"],
+            teams_per_org=options["teams_per_org"],
+            workspaces_per_org=options["workspaces_per_org"],
+            entries_per_workspace=options["entries_per_workspace"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Successfully seeded database with:\n"
+                + "\n".join(f"- {count} {label}" for label, count in counts.items())
+            )
+        )
+
     def clear_existing_data(self):
         """Clear existing data in the correct order to respect foreign key constraints."""
         self.stdout.write("  🗑️  Clearing database...")
@@ -0,0 +1,906 @@
+"""
+High-volume data generation for ``seed_data --scale``.
+
+The regular seeding path saves one object at a time, so every row runs the
+audit, ledger, remittance and permission signal handlers. ``ScaleSeeder``
+instead generates the whole dataset in memory from a seeded random generator
+and writes it in batches, with ``COPY`` on PostgreSQL and ``bulk_create``
+elsewhere. Bulk writes never call ``save()``, so no model signal fires; the
+rows those handlers would have produced are rebuilt in set-based passes once
+every entry is in place:
+
+- team ledger balances and one synced remittance per workspace team
+- the role groups, group memberships and object permissions granted by the
+  ``assign_*_permissions`` helpers
+- one creation audit record per seeded object
+
+The same seed always produces the same rows; dates are relative to today.
+"""
+
+import csv
+import io
+import json
+import random
+import time
+import uuid
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import CommandError
+from django.db import connection, models, transaction
+from django.utils import timezone
+from faker import Faker
+from guardian.models import GroupObjectPermission, UserObjectPermission
+
+from apps.accounts.constants import StatusChoices as UserStatusChoices
+from apps.accounts.models import CustomUser
+from apps.auditlog.models import AuditTrail
+from apps.auditlog.signal_handlers import AuditModelRegistry
+from apps.core.object_permissions import clear_cached_permissions
+from apps.core.permissions import (
+    OrganizationPermissions,
+    WorkspacePermissions,
+    WorkspaceTeamPermissions,
+)
+from apps.core.roles import get_permissions_for_role
+from apps.currencies.models import Currency
+from apps.entries.constants import EntryStatus, EntryType
+from apps.entries.models import Entry
+from apps.entries.services import EntryService, TeamLedgerService
+from apps.organizations.constants import StatusChoices as OrgStatusChoices
+from apps.organizations.models import (
+    Organization,
+    OrganizationExchangeRate,
+    OrganizationMember,
+)
+from apps.remittance.models import Remittance
+from apps.remittance.services import RemittanceService
+from apps.teams.constants import TeamMemberRole
+from apps.teams.models import Team, TeamMember
+from apps.workspaces.constants import StatusChoices as WorkspaceStatusChoices
+from apps.workspaces.models import Workspace, WorkspaceExchangeRate, WorkspaceTeam
+
+SEED_PASSWORD = "password123"
+
+ORGANIZATION_KINDS = [
+    "Foundation",
+    "Initiative",
+    "Alliance",
+    "Network",
+    "Coalition",
+    "Partnership",
+    "Trust",
+    "Society",
+    "Collective",
+    "Relief",
+]
+
+TEAM_KINDS = [
+    "Program Management",
+    "Field Operations",
+    "Monitoring & Evaluation",
+    "Finance & Administration",
+    "Community Engagement",
+    "Emergency Response",
+    "Health Services",
+    "Education Support",
+    "Food Security",
+    "Water & Sanitation",
+]
+
+PROJECT_KINDS = [
+    "Education Program",
+    "Healthcare Initiative",
+    "Community Development",
+    "Disaster Relief",
+    "Clean Water Project",
+    "Microfinance Program",
+    "Refugee Support",
+    "Rural Development",
+    "Skills Training",
+    "Climate Adaptation",
+]
+
+WORKSPACE_EXPENSE_DESCRIPTIONS = [
+    "Workspace management and administration costs",
+    "Workspace infrastructure and maintenance",
+    "Workspace-level training and development",
+    "Workspace communication and coordination",
+    "Workspace monitoring and evaluation",
+]
+
+ORGANIZATION_EXPENSE_DESCRIPTIONS = [
+    "Organization-wide program costs",
+    "Cross-workspace coordination expenses",
+    "Organization-level capacity building",
+    "Strategic planning and development",
+    "Organization-wide monitoring and evaluation",
+]
+
+TEAM_ENTRY_DESCRIPTIONS = [
+    "Community workshop materials and supplies",
+    "Field staff transportation and accommodation",
+    "Training program venue rental",
+    "Medical supplies for health clinic",
+    "School supplies for education program",
+    "Agricultural tools and seeds distribution",
+    "Emergency relief food distribution",
+    "Youth skills training materials",
+    "Microfinance loan disbursement",
+    "Rural infrastructure development",
+]
+
+
+class ScaleSeeder:
+    """Generates and bulk-writes a deterministic dataset of any size."""
+
+    def __init__(self, *, seed=0, batch_size=5000, stdout=None):
+        self.seed = seed
+        self.batch_size = batch_size
+        self.stdout = stdout
+        self.random = random.Random(seed)
+        self.faker = Faker()
+        self.faker.seed_instance(seed)
+        self.today = timezone.localdate()
+        self.use_copy = connection.vendor == "postgresql"
+        self.counts = defaultdict(int)
+
+        self.users = {}
+        self.members = defaultdict(list)
+        self.team_members = defaultdict(list)
+        self.organization_rates = defaultdict(list)
+        self.workspace_rates = defaultdict(list)
+
+        # Derived rows collected while generating and written at the end
+        self.group_users = defaultdict(set)
+        self.group_permissions = set()
+        self.user_permissions = set()
+        self.audited_objects = []
+
+    def log(self, message):
+        if self.stdout is not None:
+            self.stdout.write(message)
+
+    def make_uuid(self):
+        return uuid.UUID(int=self.random.getrandbits(128), version=4)
+
+    def run(
+        self,
+        *,
+        organizations,
+        users_per_org,
+        teams_per_org,
+        workspaces_per_org,
+        entries_per_workspace,
+    ) -> dict:
+        """Seed the dataset and return the number of rows written per table."""
+        prefix = f"seed{self.seed}"
+        if CustomUser.objects.filter(username__startswith=f"{prefix}_").exists():
+            raise CommandError(
+                f"Data for seed {self.seed} already exists. Use another --seed "
+                "or --clear-existing."
+            )
+
+        started_at = time.monotonic()
+        currencies = list(Currency.objects.order_by("code"))
+        if not currencies:
+            raise CommandError("No currencies found to create exchange rates with.")
+
+        with transaction.atomic():
+            orgs = self.create_organizations(organizations, users_per_org, prefix)
+            teams = self.create_teams(orgs, teams_per_org)
+            workspaces = self.create_workspaces(orgs, workspaces_per_org)
+            workspace_teams = self.create_workspace_teams(workspaces, teams)
+            self.create_exchange_rates(orgs, workspaces, currencies)
+            self.create_entries(workspaces, workspace_teams, entries_per_workspace)
+
+            organization_ids = [org.pk for org in orgs]
+            self.rebuild_remittances(workspace_teams)
+            self.write_permissions()
+            self.write_audit_trail(organization_ids)
+            EntryService.invalidate_entry_counts(organization_ids=organization_ids)
+
+        clear_cached_permissions()
+        self.log(f"  - Seeded in {time.monotonic() - started_at:.1f}s")
+        return dict(self.counts)
+
+    # --- Writers ---------------------------------------------------------
+
+    def insert(self, model, objects):
+        if not objects:
+            return
+        if self.use_copy:
+            self.copy(model, objects)
+        else:
+            model.objects.bulk_create(objects, batch_size=self.batch_size)
+        self.counts[model._meta.label] += len(objects)
+
+    @staticmethod
+    def copy_value(field, obj):
+        value = field.pre_save(obj, add=True)
+        if value is None:
+            return r"\N"
+        if isinstance(field, models.JSONField):
+            return json.dumps(value, cls=field.encoder)
+        value = field.get_db_prep_save(value, connection)
+        if isinstance(value, bool):
+            return "t" if value else "f"
+        return value
+
+    def copy(self, model, objects):
+        """Stream ``objects`` into the model's table with PostgreSQL COPY."""
+        fields = model._meta.concrete_fields
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for obj in objects:
+            writer.writerow([self.copy_value(field, obj) for field in fields])
+        buffer.seek(0)
+
+        quote_name = connection.ops.quote_name
+        columns = ", ".join(quote_name(field.column) for field in fields)
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {quote_name(model._meta.db_table)} ({columns}) "
+                "FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer,
+            )
+
+    def grant(self, group_name, permission, obj):
+        self.group_permissions.add((group_name, str(permission), obj))
+
+    # --- Generators ------------------------------------------------------
+
+    def create_organizations(self, count, users_per_org, prefix):
+        password = make_password(SEED_PASSWORD)
+        owner_permissions = [
+            perm
+            for perm in get_permissions_for_role("ORG_OWNER")
+            if "workspace_currency" not in perm
+        ]
+
+        users, orgs, members = [], [], []
+        for i in range(count):
+            org = Organization(
+                organization_id=self.make_uuid(),
+                title=f"{self.faker.word().title()} "
+                f"{self.random.choice(ORGANIZATION_KINDS)} {i + 1}",
+                description=self.faker.sentence(nb_words=12),
+                status=OrgStatusChoices.ACTIVE,
+            )
+            orgs.append(org)
+
+            for j in range(max(users_per_org, 1)):
+                role = "owner" if j == 0 else f"member_{j}"
+                user = CustomUser(
+                    user_id=self.make_uuid(),
+                    username=f"{prefix}_{i}_{role}",
+                    email=f"{prefix}.{i}.{role}@{self.faker.domain_name()}",
+                    password=password,
+                    status=UserStatusChoices.ACTIVE,
+                )
+                member = OrganizationMember(
+                    organization_member_id=self.make_uuid(),
+                    organization=org,
+                    user=user,
+                    is_active=True,
+                )
+                users.append(user)
+                members.append(member)
+                self.users[user.pk] = user
+                self.members[org.pk].append(member)
+
+            org.owner = self.members[org.pk][0]
+            group_name = f"Org Owner - {org.pk}"
+            for perm in owner_permissions:
+                self.grant(group_name, perm, org)
+            self.group_users[group_name].add(org.owner.user_id)
+
+        # Organizations are written first without their owner, which needs
+        # the member rows to exist
+        owners = {org.pk: org.owner for org in orgs}
+        for org in orgs:
+            org.owner = None
+        self.insert(CustomUser, users)
+        self.insert(Organization, orgs)
+        self.insert(OrganizationMember, members)
+        for org in orgs:
+            org.owner = owners[org.pk]
+        Organization.objects.bulk_update(orgs, ["owner"], batch_size=self.batch_size)
+
+        self.audited_objects += [
+            (user, user.pk, member.organization_id, None)
+            for user, member in zip(users, members)
+        ]
+        self.audited_objects += [(org, org.owner.user_id, org.pk, None) for org in orgs]
+        self.audited_objects += [
+            (
+                member,
+                owners[member.organization_id].user_id,
+                member.organization_id,
+                None,
+            )
+            for member in members
+        ]
+        self.log(f"  - Created {len(orgs)} organizations with {len(users)} users")
+        return orgs
+
+    def create_teams(self, orgs, teams_per_org):
+        coordinator_permissions = get_permissions_for_role("TEAM_COORDINATOR")
+
+        teams, team_members = [], []
+        for org in orgs:
+            candidates = self.members[org.pk][1:] or self.members[org.pk]
+            titles = set()
+            for _ in range(teams_per_org):
+                title = f"{self.faker.word().title()} {self.random.choice(TEAM_KINDS)}"
+                while title in titles:
+                    title = f"{title} {len(titles)}"
+                titles.add(title)
+
+                coordinator = self.random.choice(candidates)
+                team = Team(
+                    team_id=self.make_uuid(),
+                    organization=org,
+                    title=title,
+                    description=self.faker.sentence(nb_words=10),
+                    team_coordinator=coordinator,
+                    created_by=org.owner,
+                )
+                teams.append(team)
+
+                submitters = [m for m in candidates if m is not coordinator]
+                submitters = self.random.sample(submitters, min(4, len(submitters)))
+                for member, role in [(coordinator, TeamMemberRole.TEAM_COORDINATOR)] + [
+                    (member, TeamMemberRole.SUBMITTER) for member in submitters
+                ]:
+                    team_member = TeamMember(
+                        team_member_id=self.make_uuid(),
+                        team=team,
+                        organization_member=member,
+                        role=role,
+                    )
+                    team_members.append(team_member)
+                    self.team_members[team.pk].append(team_member)
+
+                group_name = f"Team Coordinator - {team.pk}"
+                for perm in coordinator_permissions:
+                    if perm == OrganizationPermissions.MANAGE_ORGANIZATION:
+                        self.grant(group_name, perm, org)
+                    else:
+                        self.grant(group_name, perm, team)
+                self.group_users[group_name] |= {
+                    coordinator.user_id,
+                    org.owner.user_id,
+                }
+
+        self.insert(Team, teams)
+        self.insert(TeamMember, team_members)
+
+        owners = {org.pk: org.owner.user_id for org in orgs}
+        self.audited_objects += [
+            (team, owners[team.organization_id], team.organization_id, None)
+            for team in teams
+        ]
+        self.audited_objects += [
+            (
+                member,
+                owners[member.team.organization_id],
+                member.team.organization_id,
+                None,
+            )
+            for member in team_members
+        ]
+        self.log(f"  - Created {len(teams)} teams")
+        return teams
+
+    def create_workspaces(self, orgs, workspaces_per_org):
+        admin_permissions = get_permissions_for_role("WORKSPACE_ADMIN")
+        reviewer_permissions = get_permissions_for_role("OPERATIONS_REVIEWER")
+        currency_permissions = [
+            perm
+            for perm in get_permissions_for_role("ORG_OWNER")
+            if "workspace_currency" in perm
+        ]
+
+        workspaces = []
+        for org in orgs:
+            candidates = self.members[org.pk][1:]
+            admins = self.random.sample(
+                candidates, min(workspaces_per_org, len(candidates))
+            )
+            titles = set()
+            for admin in admins:
+                reviewers = [m for m in candidates if m is not admin] or [org.owner]
+                reviewer = self.random.choice(reviewers)
+
+                title = (
+                    f"{self.faker.word().title()} {self.random.choice(PROJECT_KINDS)}"
+                )
+                while title in titles:
+                    title = f"{title} {len(titles)}"
+                titles.add(title)
+
+                workspace = Workspace(
+                    workspace_id=self.make_uuid(),
+                    organization=org,
+                    workspace_admin=admin,
+                    operations_reviewer=reviewer,
+                    title=title,
+                    description=self.faker.sentence(nb_words=12),
+                    created_by=org.owner,
+                    status=WorkspaceStatusChoices.ACTIVE,
+                    remittance_rate=Decimal(self.random.randint(80, 95)),
+                    start_date=self.today
+                    - timedelta(days=self.random.randint(180, 365)),
+                    end_date=self.today + timedelta(days=self.random.randint(1, 7)),
+                )
+                workspaces.append(workspace)
+
+                admins_group = f"Workspace Admins - {workspace.pk}"
+                reviewers_group = f"Operations Reviewer - {workspace.pk}"
+                for perm in admin_permissions:
+                    if perm in (
+                        OrganizationPermissions.ADD_TEAM,
+                        OrganizationPermissions.MANAGE_ORGANIZATION,
+                    ):
+                        self.grant(admins_group, perm, org)
+                    else:
+                        self.grant(admins_group, perm, workspace)
+                for perm in reviewer_permissions:
+                    if perm == OrganizationPermissions.MANAGE_ORGANIZATION:
+                        self.grant(reviewers_group, perm, org)
+                    else:
+                        self.grant(reviewers_group, perm, workspace)
+                for perm in currency_permissions:
+                    self.grant(f"Org Owner - {org.pk}", perm, workspace)
+                self.group_users[admins_group] |= {admin.user_id, org.owner.user_id}
+                self.group_users[reviewers_group].add(reviewer.user_id)
+
+        self.insert(Workspace, workspaces)
+        self.audited_objects += [
+            (ws, ws.organization.owner.user_id, ws.organization_id, ws.pk)
+            for ws in workspaces
+        ]
+        self.log(f"  - Created {len(workspaces)} workspaces")
+        return workspaces
+
+    def create_workspace_teams(self, workspaces, teams):
+        submitter_permissions = get_permissions_for_role("SUBMITTER")
+        teams_by_org = defaultdict(list)
+        for team in teams:
+            teams_by_org[team.organization_id].append(team)
+
+        workspace_teams = []
+        for workspace in workspaces:
+            org_teams = teams_by_org[workspace.organization_id]
+            selected = self.random.sample(
+                org_teams, min(self.random.randint(1, 3), len(org_teams))
+            )
+            for team in selected:
+                synced = self.random.choice([True, False])
+                workspace_team = WorkspaceTeam(
+                    workspace_team_id=self.make_uuid(),
+                    team=team,
+                    workspace=workspace,
+                    syned_with_workspace_remittance_rate=synced,
+                    custom_remittance_rate=None
+                    if synced
+                    else Decimal(self.random.randint(75, 100)),
+                )
+                workspace_teams.append(workspace_team)
+
+                group_name = f"Workspace Team - {workspace_team.pk}"
+                for perm in submitter_permissions:
+                    self.grant(group_name, perm, workspace_team)
+                    if perm == WorkspaceTeamPermissions.CHANGE_WORKSPACE_TEAM_ENTRY:
+                        for role_group in ("Workspace Admins", "Operations Reviewer"):
+                            self.grant(
+                                f"{role_group} - {workspace.pk}", perm, workspace_team
+                            )
+                self.group_users[group_name] |= {
+                    member.organization_member.user_id
+                    for member in self.team_members[team.pk]
+                }
+                self.group_users[group_name].add(workspace.organization.owner.user_id)
+                self.user_permissions.add(
+                    (
+                        team.team_coordinator.user_id,
+                        str(WorkspacePermissions.VIEW_WORKSPACE_TEAMS_UNDER_WORKSPACE),
+                        workspace,
+                    )
+                )
+
+        self.insert(WorkspaceTeam, workspace_teams)
+        self.audited_objects += [
+            (
+                wt,
+                wt.workspace.organization.owner.user_id,
+                wt.workspace.organization_id,
+                wt.workspace_id,
+            )
+            for wt in workspace_teams
+        ]
+        self.log(f"  - Linked {len(workspace_teams)} workspace teams")
+        return workspace_teams
+
+    def create_exchange_rates(self, orgs, workspaces, currencies):
+        organization_rates = []
+        for org in orgs:
+            for currency in currencies[:3]:
+                for days_ago in self.random.sample(range(30, 181), 3):
+                    rate = OrganizationExchangeRate(
+                        organization_exchange_rate_id=self.make_uuid(),
+                        organization=org,
+                        currency=currency,
+                        rate=Decimal(self.random.randint(80, 120)) / 100,
+                        effective_date=self.today - timedelta(days=days_ago),
+                        added_by=org.owner,
+                        note=f"Seed data exchange rate for {currency.code}",
+                    )
+                    organization_rates.append(rate)
+                    self.organization_rates[(org.pk, currency.pk)].append(rate)
+
+        workspace_rates = []
+        for workspace in workspaces:
+            span = min(180, (self.today - workspace.start_date).days)
+            for currency in currencies[:2]:
+                for offset in self.random.sample(range(span + 1), 2):
+                    is_approved = self.random.choice([True, False])
+                    rate = WorkspaceExchangeRate(
+                        workspace_exchange_rate_id=self.make_uuid(),
+                        workspace=workspace,
+                        currency=currency,
+                        rate=Decimal(self.random.randint(80, 120)) / 100,
+                        effective_date=workspace.start_date + timedelta(days=offset),
+                        added_by=workspace.workspace_admin,
+                        note=f"Seed data workspace exchange rate for {currency.code}",
+                        is_approved=is_approved,
+                        approved_by=workspace.operations_reviewer
+                        if is_approved
+                        else None,
+                    )
+                    workspace_rates.append(rate)
+                    if is_approved:
+                        self.workspace_rates[(workspace.pk, currency.pk)].append(rate)
+
+        for rates in (
+            *self.organization_rates.values(),
+            *self.workspace_rates.values(),
+        ):
+            rates.sort(key=lambda rate: rate.effective_date)
+
+        self.insert(OrganizationExchangeRate, organization_rates)
+        self.insert(WorkspaceExchangeRate, workspace_rates)
+        self.audited_objects += [
+            (rate, rate.added_by.user_id, rate.organization_id, None)
+            for rate in organization_rates
+        ]
+        self.audited_objects += [
+            (
+                rate,
+                rate.added_by.user_id,
+                rate.workspace.organization_id,
+                rate.workspace_id,
+            )
+            for rate in workspace_rates
+        ]
+        self.log(
+            f"  - Created {len(organization_rates) + len(workspace_rates)} "
+            "exchange rates"
+        )
+
+    @staticmethod
+    def latest_rate(rates, on_date):
+        dates = [rate.effective_date for rate in rates]
+        index = bisect_right(dates, on_date)
+        return rates[index - 1] if index else None
+
+    def find_rate(self, workspace, currency, on_date, use_workspace_rates):
+        """In-memory equivalent of Command.get_appropriate_exchange_rate."""
+        if use_workspace_rates:
+            ws_rate = self.latest_rate(
+                self.workspace_rates[(workspace.pk, currency.pk)], on_date
+            )
+            if ws_rate:
+                return ws_rate.rate, ws_rate, None
+        org_rate = self.latest_rate(
+            self.organization_rates[(workspace.organization_id, currency.pk)], on_date
+        )
+        if org_rate:
+            return org_rate.rate, None, org_rate
+        return None, None, None
+
+    def create_entries(self, workspaces, workspace_teams, entries_per_workspace):
+        statuses = list(EntryStatus.values)
+        teams_by_workspace = defaultdict(list)
+        for workspace_team in workspace_teams:
+            teams_by_workspace[workspace_team.workspace_id].append(workspace_team)
+
+        buffer = []
+        for workspace in workspaces:
+            org = workspace.organization
+            currencies = [
+                rates[0].currency
+                for (org_id, _), rates in self.organization_rates.items()
+                if org_id == org.pk and rates
+            ]
+            staff = {
+                workspace.workspace_admin.pk,
+                workspace.operations_reviewer.pk,
+                org.owner.pk,
+            }
+            submitters = [m for m in self.members[org.pk] if m.pk not in staff] or (
+                self.members[org.pk]
+            )
+            ws_teams = teams_by_workspace[workspace.pk]
+
+            workspace_expenses = entries_per_workspace // 4
+            org_expenses = entries_per_workspace // 8
+            for index in range(entries_per_workspace):
+                if index < workspace_expenses:
+                    entry_type = EntryType.WORKSPACE_EXP
+                elif index < workspace_expenses + org_expenses:
+                    entry_type = EntryType.ORG_EXP
+                elif ws_teams:
+                    entry_type = self.random.choice(
+                        [EntryType.INCOME, EntryType.DISBURSEMENT, EntryType.REMITTANCE]
+                    )
+                else:
+                    break
+
+                currency = self.random.choice(currencies)
+                # Start after the earliest rate so every entry finds one
+                earliest = self.organization_rates[(org.pk, currency.pk)][
+                    0
+                ].effective_date
+                first_day = max(workspace.start_date, earliest)
+                occurred_at = first_day + timedelta(
+                    days=self.random.randint(0, (workspace.end_date - first_day).days)
+                )
+
+                entry = Entry(
+                    entry_id=self.make_uuid(),
+                    entry_type=entry_type,
+                    organization=org,
+                    workspace=workspace,
+                    occurred_at=occurred_at,
+                    currency=currency,
+                    status=self.random.choice(statuses),
+                    is_flagged=True,
+                )
+                if entry_type == EntryType.WORKSPACE_EXP:
+                    entry.amount = Decimal(self.random.randint(1000, 25000)) / 100
+                    entry.description = self.random.choice(
+                        WORKSPACE_EXPENSE_DESCRIPTIONS
+                    )
+                    entry.submitted_by_org_member = workspace.workspace_admin
+                elif entry_type == EntryType.ORG_EXP:
+                    entry.amount = Decimal(self.random.randint(5000, 100000)) / 100
+                    entry.description = self.random.choice(
+                        ORGANIZATION_EXPENSE_DESCRIPTIONS
+                    )
+                    entry.submitted_by_org_member = org.owner
+                else:
+                    low, high = {
+                        EntryType.INCOME: (1000, 50000),
+                        EntryType.DISBURSEMENT: (500, 10000),
+                        EntryType.REMITTANCE: (100, 5000),
+                    }[entry_type]
+                    entry.amount = Decimal(self.random.randint(low, high)) / 100
+                    entry.description = self.random.choice(TEAM_ENTRY_DESCRIPTIONS)
+                    entry.workspace_team = self.random.choice(ws_teams)
+                    team_members = self.team_members[entry.workspace_team.team_id]
+                    if self.random.choice([True, False]) and team_members:
+                        regular = [
+                            tm
+                            for tm in team_members
+                            if tm.role != TeamMemberRole.TEAM_COORDINATOR
+                        ]
+                        entry.submitted_by_team_member = self.random.choice(
+                            regular or team_members
+                        )
+                    else:
+                        entry.submitted_by_org_member = self.random.choice(submitters)
+
+                (
+                    entry.exchange_rate_used,
+                    entry.workspace_exchange_rate_ref,
+                    entry.org_exchange_rate_ref,
+                ) = self.find_rate(
+                    workspace,
+                    currency,
+                    occurred_at,
+                    use_workspace_rates=entry_type != EntryType.ORG_EXP,
+                )
+                buffer.append(entry)
+                if len(buffer) >= self.batch_size:
+                    self.insert(Entry, buffer)
+                    buffer = []
+                    self.log(f"  - Inserted {self.counts[Entry._meta.label]} entries")
+
+        self.insert(Entry, buffer)
+        self.log(f"  - Created {self.counts[Entry._meta.label]} entries")
+
+    # --- Derived tables --------------------------------------------------
+
+    def rebuild_remittances(self, workspace_teams):
+        """Create the remittance of every workspace team and sync its amounts."""
+        remittances = [
+            Remittance(remittance_id=self.make_uuid(), workspace_team=wt)
+            for wt in workspace_teams
+        ]
+        self.insert(Remittance, remittances)
+        self.audited_objects += [
+            (
+                remittance,
+                remittance.workspace_team.workspace.organization.owner.user_id,
+                remittance.workspace_team.workspace.organization_id,
+                remittance.workspace_team.workspace_id,
+            )
+            for remittance in remittances
+        ]
+        workspace_team_ids = [wt.pk for wt in workspace_teams]
+        TeamLedgerService.rebuild(workspace_team_ids=workspace_team_ids)
+        RemittanceService.bulk_sync_remittance(
+            workspace_teams=WorkspaceTeam.objects.filter(pk__in=workspace_team_ids)
+        )
+        self.log("  - Rebuilt team ledgers and remittances")
+
+    def write_permissions(self):
+        """Write the collected role groups and object permissions in bulk."""
+        group_names = set(self.group_users) | {
+            name for name, _, _ in self.group_permissions
+        }
+        Group.objects.bulk_create(
+            [Group(name=name) for name in sorted(group_names)],
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+        group_ids = dict(
+            Group.objects.filter(name__in=group_names).values_list("name", "pk")
+        )
+
+        models_with_permissions = {
+            type(obj) for _, _, obj in self.group_permissions | self.user_permissions
+        }
+        content_types = ContentType.objects.get_for_models(*models_with_permissions)
+        permission_ids = {
+            (content_type_id, codename): pk
+            for pk, content_type_id, codename in Permission.objects.filter(
+                content_type__in=content_types.values()
+            ).values_list("pk", "content_type_id", "codename")
+        }
+
+        def permission_fields(codename, obj):
+            content_type = content_types[type(obj)]
+            return {
+                "permission_id": permission_ids[(content_type.pk, codename)],
+                "content_type": content_type,
+                "object_pk": str(obj.pk),
+            }
+
+        GroupObjectPermission.objects.bulk_create(
+            [
+                GroupObjectPermission(
+                    group_id=group_ids[name], **permission_fields(codename, obj)
+                )
+                for name, codename, obj in self.group_permissions
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+        UserObjectPermission.objects.bulk_create(
+            [
+                UserObjectPermission(
+                    user_id=user_id, **permission_fields(codename, obj)
+                )
+                for user_id, codename, obj in self.user_permissions
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+
+        membership = CustomUser.groups.through
+        user_column = f"{CustomUser._meta.model_name}_id"
+        membership.objects.bulk_create(
+            [
+                membership(group_id=group_ids[name], **{user_column: user_id})
+                for name, user_ids in self.group_users.items()
+                for user_id in user_ids
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+        self.counts[Group._meta.label] += len(group_names)
+        self.counts[GroupObjectPermission._meta.label] += len(self.group_permissions)
+        self.counts[UserObjectPermission._meta.label] += len(self.user_permissions)
+        self.log(f"  - Assigned permissions through {len(group_names)} groups")
+
+    def build_audit(self, model, pk, values, user_id, organization_id, workspace_id):
+        config = AuditModelRegistry.get_config(model._meta.label)
+        if config is None:
+            return None
+        metadata = {
+            "automatic_logging": True,
+            "operation_type": "create",
+            "seed_data": True,
+            **{
+                field: str(values[field]) if values[field] is not None else None
+                for field in config["tracked_fields"]
+                if field in values
+            },
+        }
+        audit = AuditTrail(
+            audit_id=self.make_uuid(),
+            user=self.users.get(user_id),
+            action_type=config["action_types"]["created"],
+            target_entity_id=pk,
+            target_entity_type=ContentType.objects.get_for_model(model),
+            organization_id=organization_id,
+            workspace_id=workspace_id,
+            metadata=metadata,
+        )
+        # Bulk writes bypass save(), which fills this in for single writes
+        audit.search_text = audit.build_search_text()
+        return audit
+
+    def write_audit_trail(self, organization_ids):
+        """
+        Write one creation audit record per seeded object. Entries are read
+        back from the table in keyset batches instead of being held in memory.
+        """
+        audits = []
+        for obj, user_id, organization_id, workspace_id in self.audited_objects:
+            values = {
+                field.name: getattr(obj, field.attname)
+                for field in obj._meta.concrete_fields
+            }
+            audit = self.build_audit(
+                type(obj), obj.pk, values, user_id, organization_id, workspace_id
+            )
+            if audit is not None:
+                audits.append(audit)
+        self.insert(AuditTrail, audits)
+
+        entries = (
+            Entry.objects.filter(organization_id__in=organization_ids)
+            .order_by("entry_id")
+            .values(
+                "entry_id",
+                "entry_type",
+                "amount",
+                "status",
+                "organization_id",
+                "workspace_id",
+                "submitted_by_org_member__user_id",
+                "submitted_by_team_member__organization_member__user_id",
+            )
+        )
+        last_id = None
+        while True:
+            batch_queryset = (
+                entries if last_id is None else entries.filter(entry_id__gt=last_id)
+            )
+            batch = list(batch_queryset[: self.batch_size])
+            if not batch:
+                break
+            audits = [
+                self.build_audit(
+                    Entry,
+                    row["entry_id"],
+                    row,
+                    row["submitted_by_org_member__user_id"]
+                    or row["submitted_by_team_member__organization_member__user_id"],
+                    row["organization_id"],
+                    row["workspace_id"],
+                )
+                for row in batch
+            ]
+            self.insert(AuditTrail, [audit for audit in audits if audit is not None])
+            last_id = batch[-1]["entry_id"]
+        self.log(f"  - Wrote {self.counts[AuditTrail._meta.label]} audit records")
@@ -0,0 +1,49 @@
+"""Middleware for the core app."""
+
+import logging
+
+from django.conf import settings
+from django.db import connection
+from django.utils.functional import SimpleLazyObject
+
+from .object_permissions import permission_scope
+
+logger = logging.getLogger(__name__)
+
+
+class QueryCounter:
+    """``execute_wrapper`` that counts the queries run through a connection."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class ObjectPermissionMiddleware:
+    """
+    Share one object permission checker per user across a request and report
+    the number of queries the request ran.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.permission_checker = SimpleLazyObject(
+            lambda: permission_scope.get_checker(request.user)
+        )
+        counter = QueryCounter()
+        permission_scope.begin()
+        try:
+            with connection.execute_wrapper(counter):
+                response = self.get_response(request)
+        finally:
+            permission_scope.end()
+
+        logger.debug(f"{request.method} {request.path} ran {counter.count} queries")
+        if settings.DEBUG:
+            response["X-Query-Count"] = str(counter.count)
+        return response
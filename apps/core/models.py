@@ -3,7 +3,80 @@ from django.utils import timezone
 from .managers import SoftDeleteManager, AllObjectsManager, DeletedObjectsManager
 
 
-class baseModel(models.Model):
+class TrackedFieldsMixin(models.Model):
+    """
+    Remembers the field values an instance was loaded from (or last saved to)
+    the database with, so a save can be diffed against the stored row in
+    memory instead of re-fetching it first.
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.snapshot_loaded_values()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        # Loading a deferred field refreshes just that field; the others may
+        # hold unsaved changes that must not be taken for the stored values
+        self.snapshot_loaded_values(update_fields=fields)
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.snapshot_loaded_values(update_fields=kwargs.get("update_fields"))
+
+    def snapshot_loaded_values(self, update_fields=None):
+        """
+        Store the current values as the database state. After an
+        ``update_fields`` save only the written fields are refreshed, as the
+        rest of the row was left untouched.
+        """
+        fields = [
+            field
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+        ]
+        if update_fields is not None:
+            if not self.has_loaded_values():
+                # The other fields may not match the row, keep them unknown
+                return
+            update_fields = set(update_fields)
+            fields = [
+                field
+                for field in fields
+                if field.name in update_fields or field.attname in update_fields
+            ]
+        else:
+            self._loaded_pk = self.pk
+            self._loaded_values = {}
+        for field in fields:
+            self._loaded_values[field.attname] = self.__dict__[field.attname]
+
+    def has_loaded_values(self) -> bool:
+        # A changed primary key points the instance at another row
+        return self.pk is not None and getattr(self, "_loaded_pk", None) == self.pk
+
+    def get_loaded_values(self, field_names):
+        """
+        Return the stored values of ``field_names``, or None when any of them
+        is unknown (deferred when loaded, or the instance was never saved).
+        """
+        if not self.has_loaded_values():
+            return None
+        values = {}
+        for name in field_names:
+            attname = self._meta.get_field(name).attname
+            if attname not in self._loaded_values:
+                return None
+            values[name] = self._loaded_values[attname]
+        return values
+
+
+class baseModel(TrackedFieldsMixin):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
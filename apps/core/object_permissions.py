@@ -0,0 +1,133 @@
+"""
+Request-scoped object permission checks.
+
+``user.has_perm(perm, obj)`` builds a fresh guardian ``ObjectPermissionChecker``
+for every call, so each check queries the user and group object permission
+tables again. Within a request (see ``apps.core.middleware``) checks made
+through ``has_object_perm`` share one checker per user instead: views prefetch
+the permissions of the organizations, workspaces and workspace teams they
+touch with ``prefetch_object_permissions`` and every later check on those
+objects is answered from the checker's cache. Outside a request, checks fall
+back to ``user.has_perm``.
+
+Granting or revoking object permissions, or changing a user's groups, clears
+the cached permissions of every open checker (see ``apps.core.signals``).
+"""
+
+import threading
+from itertools import groupby
+
+from django.db.models import QuerySet
+from guardian.core import ObjectPermissionChecker
+
+_permissions_version = 0
+
+
+class CachedObjectPermissionChecker(ObjectPermissionChecker):
+    """Checker whose cache is dropped once object permissions change."""
+
+    def __init__(self, user_or_group=None):
+        super().__init__(user_or_group)
+        self._version = _permissions_version
+
+    def _sync(self) -> None:
+        if self._version != _permissions_version:
+            self._obj_perms_cache = {}
+            self._version = _permissions_version
+
+    def get_perms(self, obj):
+        self._sync()
+        return super().get_perms(obj)
+
+    def prefetch_perms(self, objects):
+        self._sync()
+        return super().prefetch_perms(objects)
+
+
+class ObjectPermissionScope:
+    """Per-thread registry of the checkers used by the current request."""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def begin(self) -> None:
+        """Start sharing checkers until ``end`` is called."""
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+        if self._local.depth == 1:
+            self._local.checkers = {}
+
+    def end(self) -> None:
+        """Close the innermost scope, dropping the checkers with the outermost."""
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = max(depth - 1, 0)
+        if self._local.depth == 0:
+            self._local.checkers = {}
+
+    @property
+    def is_active(self) -> bool:
+        return getattr(self._local, "depth", 0) > 0
+
+    def get_checker(self, user):
+        """
+        Return the shared checker for ``user``, or ``None`` outside a scope or
+        for anonymous users.
+        """
+        if not self.is_active or not getattr(user, "is_authenticated", False):
+            return None
+
+        checker = self._local.checkers.get(user.pk)
+        if checker is None:
+            checker = CachedObjectPermissionChecker(user)
+            self._local.checkers[user.pk] = checker
+        return checker
+
+
+permission_scope = ObjectPermissionScope()
+
+
+def has_object_perm(user, perm, obj) -> bool:
+    """
+    Returns True if the user has ``perm`` on ``obj``, answered from the
+    request's permission checker when one is available.
+    """
+    checker = permission_scope.get_checker(user)
+    if checker is None:
+        return user.has_perm(perm, obj)
+    return checker.has_perm(perm, obj)
+
+
+def prefetch_object_permissions(user, *objects) -> None:
+    """
+    Load the user's object permissions (direct and through groups) for every
+    given object or queryset into the request's permission checker, with two
+    queries per model. Does nothing outside a request.
+    """
+    checker = permission_scope.get_checker(user)
+    if checker is None:
+        return
+    checker._sync()
+
+    instances = []
+    for obj in objects:
+        if obj is None:
+            continue
+        if isinstance(obj, QuerySet):
+            instances.extend(obj)
+        else:
+            instances.append(obj)
+
+    # The checker caches by (content type, pk); skip objects already loaded
+    pending = [
+        instance
+        for instance in instances
+        if checker.get_local_cache_key(instance) not in checker._obj_perms_cache
+    ]
+    pending.sort(key=lambda instance: instance._meta.label)
+    for _, group in groupby(pending, key=lambda instance: instance._meta.label):
+        checker.prefetch_perms(list(group))
+
+
+def clear_cached_permissions() -> None:
+    """Invalidate the cached permissions of every open checker."""
+    global _permissions_version
+    _permissions_version += 1
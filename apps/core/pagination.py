@@ -0,0 +1,158 @@
+"""
+Keyset (cursor) pagination.
+
+Instead of ``OFFSET n`` each page is fetched with a ``WHERE`` clause on the
+ordering columns of the last row seen, so deep pages cost the same as the
+first one. The ordering must be unique (end it with the primary key).
+"""
+
+import base64
+import json
+
+from django.db.models import Q
+
+
+CURSOR_PARAMS = ("after", "before", "page")
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def get_cursor_query_string(query_params) -> str:
+    """URL-encode ``query_params`` without any pagination parameters."""
+    params = query_params.copy()
+    for name in CURSOR_PARAMS:
+        params.pop(name, None)
+    return params.urlencode()
+
+
+class KeysetPage:
+    def __init__(
+        self,
+        object_list,
+        *,
+        paginator,
+        has_next,
+        has_previous,
+        next_cursor=None,
+        previous_cursor=None,
+    ):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.has_next = has_next
+        self.has_previous = has_previous
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_other_pages(self):
+        return self.has_next or self.has_previous
+
+
+class KeysetPaginator:
+    is_keyset = True
+
+    def __init__(self, queryset, per_page, ordering, count=None):
+        """
+        ``ordering`` is a sequence of field names, optionally prefixed with
+        "-", e.g. ``("-occurred_at", "-entry_id")``. ``count`` is an optional
+        precomputed (e.g. cached) total; the paginator never counts itself.
+        """
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+        self.count = count
+        self._fields = [
+            (name.lstrip("-"), name.startswith("-")) for name in self.ordering
+        ]
+
+    # Cursors
+
+    def encode_cursor(self, obj) -> str:
+        values = [
+            self._model_field(name).value_to_string(obj) for name, _ in self._fields
+        ]
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def decode_cursor(self, cursor: str) -> list:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if len(values) != len(self._fields):
+                raise InvalidCursor("Cursor does not match the ordering.")
+            return [
+                self._model_field(name).to_python(value)
+                for (name, _), value in zip(self._fields, values)
+            ]
+        except InvalidCursor:
+            raise
+        except Exception as e:
+            raise InvalidCursor(f"Invalid cursor: {e}") from e
+
+    def _model_field(self, name):
+        opts = self.queryset.model._meta
+        return opts.pk if name == "pk" else opts.get_field(name)
+
+    # Paging
+
+    def _seek_filter(self, values, forward: bool) -> Q:
+        """Rows strictly after (``forward``) or before ``values`` in the ordering."""
+        seek = Q()
+        for index, (name, descending) in enumerate(self._fields):
+            lookup = "lt" if descending == forward else "gt"
+            clause = Q(**{f"{name}__{lookup}": values[index]})
+            for (previous_name, _), value in zip(self._fields[:index], values):
+                clause &= Q(**{previous_name: value})
+            seek |= clause
+        return seek
+
+    def get_page(self, *, after: str = None, before: str = None) -> KeysetPage:
+        """
+        Return the first page, the page following the ``after`` cursor, or
+        the page preceding the ``before`` cursor. Invalid cursors fall back
+        to the first page.
+        """
+        try:
+            after_values = self.decode_cursor(after) if after else None
+            before_values = self.decode_cursor(before) if before else None
+        except InvalidCursor:
+            after_values = before_values = None
+
+        rows = []
+        if before_values is not None and after_values is None:
+            reversed_ordering = [
+                name[1:] if name.startswith("-") else f"-{name}"
+                for name in self.ordering
+            ]
+            rows = list(
+                self.queryset.filter(self._seek_filter(before_values, False)).order_by(
+                    *reversed_ordering
+                )[: self.per_page + 1]
+            )
+
+        if rows:
+            has_previous = len(rows) > self.per_page
+            object_list = rows[: self.per_page][::-1]
+            has_next = True
+        else:
+            queryset = self.queryset.order_by(*self.ordering)
+            if after_values is not None:
+                queryset = queryset.filter(self._seek_filter(after_values, True))
+            rows = list(queryset[: self.per_page + 1])
+            has_next = len(rows) > self.per_page
+            object_list = rows[: self.per_page]
+            has_previous = after_values is not None
+
+        return KeysetPage(
+            object_list,
+            paginator=self,
+            has_next=has_next and bool(object_list),
+            has_previous=has_previous and bool(object_list),
+            next_cursor=self.encode_cursor(object_list[-1]) if object_list else None,
+            previous_cursor=self.encode_cursor(object_list[0]) if object_list else None,
+        )
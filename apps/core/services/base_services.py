@@ -1,7 +1,11 @@
 class BaseFileExporter:
-    def __init__(self, filename_prefix: str, blocks: list[dict]):
+    def __init__(self, filename_prefix: str, blocks, streaming: bool = False):
+        # ``blocks`` and each table block's ``rows`` may be any iterable
+        # (generators, ``QuerySet.iterator()``), consumed once. Exporters that
+        # support it stream the response when ``streaming`` is set.
         self.filename_prefix = filename_prefix
         self.blocks = blocks
+        self.streaming = streaming
 
     def export(self):
         raise NotImplementedError("Subclasses must implement export()")
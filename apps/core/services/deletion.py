@@ -0,0 +1,477 @@
+"""
+Background cascade deletion of workspaces and archival of organizations.
+
+Deleting a workspace through the ORM makes Django's collector load every
+cascaded row and send ``pre_delete``/``post_delete`` for each of them, so the
+audit signal handlers write one record per workspace team, remittance, entry
+and exchange rate. The jobs here instead collect the affected rows with
+set-based queries and delete (or, for an organization, archive) them in
+chunks of primary keys without per-row signals. Each model then gets one
+summarized BULK_OPERATION audit record with its count and sample ids.
+
+Jobs run as Celery tasks (see ``apps.core.tasks``) and keep their progress in
+the cache, where ``get_deletion_job`` reads it for the UI to poll.
+"""
+
+import logging
+import uuid
+from typing import Callable, Optional
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.db import models, transaction
+from django.db.models import Q
+from django.utils import timezone
+from guardian.models import GroupObjectPermission, UserObjectPermission
+
+from apps.attachments.models import Attachment
+from apps.auditlog.config import AuditConfig
+from apps.auditlog.models import AuditTrail
+from apps.auditlog.services import audit_create_bulk_summary
+from apps.core.constants import DELETION_CHUNK_SIZE, DELETION_JOB_TIMEOUT
+from apps.core.tenancy import invalidate_tenancy_context
+from apps.entries.models import Entry, EntryImportJob, TeamLedgerBalance
+from apps.entries.services import EntryService
+from apps.organizations.models import Organization, OrganizationExchangeRate
+from apps.organizations.services import invalidate_organization_metrics
+from apps.remittance.models import Remittance
+from apps.remittance.services import RemittanceService
+from apps.teams.models import Team, TeamMember
+from apps.workspaces.constants import StatusChoices as WorkspaceStatus
+from apps.workspaces.models import Workspace, WorkspaceExchangeRate, WorkspaceTeam
+
+logger = logging.getLogger(__name__)
+User = get_user_model()
+
+
+class DeletionJobStatus(models.TextChoices):
+    PENDING = "pending", "Pending"
+    RUNNING = "running", "Running"
+    COMPLETED = "completed", "Completed"
+    FAILED = "failed", "Failed"
+
+
+def get_deletion_job_key(job_id) -> str:
+    return f"deletion:job:{job_id}"
+
+
+def _get_deletion_lock_key(kind, object_id) -> str:
+    return f"deletion:lock:{kind}:{object_id}"
+
+
+def get_deletion_job(job_id) -> Optional[dict]:
+    """
+    Return the progress of a deletion job, or None once it has expired.
+    """
+    return cache.get(get_deletion_job_key(job_id))
+
+
+def _save_job(job, **changes) -> dict:
+    job.update(changes)
+    cache.set(get_deletion_job_key(job["job_id"]), job, DELETION_JOB_TIMEOUT)
+    return job
+
+
+def _start_job(*, kind, object_id, label, user, task) -> dict:
+    """
+    Register a job for ``object_id`` and queue ``task`` once the current
+    transaction commits. A job already running for the object is returned
+    instead of starting a second one.
+    """
+    lock_key = _get_deletion_lock_key(kind, object_id)
+    job_id = uuid.uuid4().hex
+    if not cache.add(lock_key, job_id, DELETION_JOB_TIMEOUT):
+        running_job = get_deletion_job(cache.get(lock_key))
+        if running_job and running_job["status"] != DeletionJobStatus.FAILED:
+            return running_job
+        cache.set(lock_key, job_id, DELETION_JOB_TIMEOUT)
+
+    job = _save_job(
+        {
+            "job_id": job_id,
+            "kind": kind,
+            "object_id": str(object_id),
+            "label": label,
+            "user_id": str(user.pk) if user else None,
+            "status": DeletionJobStatus.PENDING,
+            "step": "",
+            "done": 0,
+            "total": 0,
+            "error": "",
+        }
+    )
+    transaction.on_commit(lambda: task.delay(job_id))
+    return job
+
+
+def _run_job(job_id, run: Callable) -> Optional[dict]:
+    job = get_deletion_job(job_id)
+    if job is None:
+        logger.warning(f"Deletion job {job_id} expired before it ran")
+        return None
+
+    user = User.objects.filter(pk=job["user_id"]).first() if job["user_id"] else None
+    _save_job(job, status=DeletionJobStatus.RUNNING)
+
+    def report_progress(step, done, total):
+        _save_job(job, step=step, done=done, total=total)
+
+    try:
+        counts = run(job["object_id"], user=user, on_progress=report_progress)
+    except Exception as e:
+        logger.error(f"Deletion job {job_id} failed: {e}", exc_info=True)
+        _save_job(job, status=DeletionJobStatus.FAILED, error=str(e))
+        raise
+    finally:
+        cache.delete(_get_deletion_lock_key(job["kind"], job["object_id"]))
+
+    return _save_job(job, status=DeletionJobStatus.COMPLETED, counts=counts)
+
+
+def _process_in_chunks(queryset, apply: Callable[[list], None], on_chunk=None):
+    """
+    Apply ``apply`` to the primary keys of ``queryset`` in chunks, each in its
+    own transaction, until the queryset is empty. ``apply`` must remove the
+    rows from ``queryset`` (by deleting or updating them).
+
+    Returns the number of rows processed and up to
+    ``AuditConfig.BULK_OPERATION_THRESHOLD`` of their ids.
+    """
+    processed, sample_ids = 0, []
+    while True:
+        ids = list(
+            queryset.order_by().values_list("pk", flat=True)[:DELETION_CHUNK_SIZE]
+        )
+        if not ids:
+            return processed, sample_ids
+        with transaction.atomic():
+            apply(ids)
+        processed += len(ids)
+        sample_ids.extend(ids[: AuditConfig.BULK_OPERATION_THRESHOLD - len(sample_ids)])
+        if on_chunk:
+            on_chunk(len(ids))
+
+
+def _raw_delete(model, ids):
+    # A plain DELETE: no collector, no cascades and no per-row signals
+    queryset = model._base_manager.filter(pk__in=ids)
+    queryset._raw_delete(queryset.db)
+
+
+def _delete_with_files(model, file_field):
+    """
+    Return a chunk deleter for ``model`` that also removes the stored files
+    of ``file_field`` once the chunk's transaction commits.
+    """
+
+    def delete(ids):
+        file_names = [
+            name
+            for name in model._base_manager.filter(pk__in=ids).values_list(
+                file_field, flat=True
+            )
+            if name
+        ]
+        _raw_delete(model, ids)
+
+        def delete_files():
+            for name in file_names:
+                try:
+                    default_storage.delete(name)
+                except Exception as e:
+                    logger.warning(f"Could not delete file {name}: {e}")
+
+        transaction.on_commit(delete_files)
+
+    return delete
+
+
+def _run_steps(steps, *, user, organization_id, on_progress, metadata) -> dict:
+    """
+    Run ``(model, queryset, apply)`` steps in order, reporting progress after
+    every chunk, and write one summarized audit record per model.
+    """
+    totals = [(model, queryset.count()) for model, queryset, _ in steps]
+    total = sum(count for _, count in totals)
+    done = 0
+    counts = {}
+
+    for model, queryset, apply in steps:
+        step = str(model._meta.verbose_name_plural)
+
+        def on_chunk(size, step=step):
+            nonlocal done
+            done += size
+            if on_progress:
+                on_progress(step, done, total)
+
+        processed, sample_ids = _process_in_chunks(queryset, apply, on_chunk)
+        counts[model._meta.label] = processed
+        if processed:
+            audit_create_bulk_summary(
+                user=user,
+                model_class=model,
+                affected_count=processed,
+                affected_ids=sample_ids,
+                organization_id=organization_id,
+                metadata=metadata,
+            )
+
+    if on_progress:
+        on_progress("", total, total)
+    return counts
+
+
+def _delete_object_permissions(model, object_ids):
+    content_type = ContentType.objects.get_for_model(model)
+    object_pks = [str(object_id) for object_id in object_ids]
+    for permission_model in (GroupObjectPermission, UserObjectPermission):
+        permission_model.objects.filter(
+            content_type=content_type, object_pk__in=object_pks
+        ).delete()
+
+
+def delete_workspace_cascade(workspace_id, *, user=None, on_progress=None) -> dict:
+    """
+    Hard delete a workspace with its workspace teams, remittances, ledger
+    balances, entries, attachments, entry imports and exchange rates.
+
+    Rows are deleted child first in chunks without per-row signals, and each
+    model is audited with one summary record. The workspace's permission
+    groups and object permissions are removed, and its existing audit
+    records are kept with their workspace cleared. Returns the number of
+    deleted rows per model label.
+    """
+    workspace = (
+        Workspace.objects.filter(pk=workspace_id)
+        .values("organization_id", "title")
+        .first()
+    )
+    if workspace is None:
+        return {}
+    organization_id = workspace["organization_id"]
+
+    workspace_team_ids = list(
+        WorkspaceTeam.objects.filter(workspace_id=workspace_id).values_list(
+            "pk", flat=True
+        )
+    )
+    entries = Entry._base_manager.filter(
+        Q(workspace_id=workspace_id) | Q(workspace_team_id__in=workspace_team_ids)
+    )
+    steps = [
+        (
+            Attachment,
+            Attachment._base_manager.filter(entry__in=entries.values("pk")),
+            _delete_with_files(Attachment, "file_url"),
+        ),
+        (Entry, entries, lambda ids: _raw_delete(Entry, ids)),
+        (
+            EntryImportJob,
+            EntryImportJob.objects.filter(
+                Q(workspace_id=workspace_id)
+                | Q(workspace_team_id__in=workspace_team_ids)
+            ),
+            _delete_with_files(EntryImportJob, "file"),
+        ),
+        (
+            TeamLedgerBalance,
+            TeamLedgerBalance.objects.filter(workspace_team_id__in=workspace_team_ids),
+            lambda ids: _raw_delete(TeamLedgerBalance, ids),
+        ),
+        (
+            Remittance,
+            Remittance.objects.filter(workspace_team_id__in=workspace_team_ids),
+            lambda ids: _raw_delete(Remittance, ids),
+        ),
+        (
+            WorkspaceExchangeRate,
+            WorkspaceExchangeRate._base_manager.filter(workspace_id=workspace_id),
+            lambda ids: _raw_delete(WorkspaceExchangeRate, ids),
+        ),
+        (
+            WorkspaceTeam,
+            WorkspaceTeam.objects.filter(pk__in=workspace_team_ids),
+            lambda ids: _raw_delete(WorkspaceTeam, ids),
+        ),
+    ]
+
+    Group.objects.filter(
+        name__in=[
+            f"Workspace Admins - {workspace_id}",
+            f"Operations Reviewer - {workspace_id}",
+            *(f"Workspace Team - {pk}" for pk in workspace_team_ids),
+        ]
+    ).delete()
+    _delete_object_permissions(Workspace, [workspace_id])
+    _delete_object_permissions(WorkspaceTeam, workspace_team_ids)
+
+    counts = _run_steps(
+        steps,
+        user=user,
+        organization_id=organization_id,
+        on_progress=on_progress,
+        metadata={
+            "operation_type": "workspace_cascade_delete",
+            "workspace_id": str(workspace_id),
+            "workspace_title": workspace["title"],
+        },
+    )
+
+    # Keep the workspace's audit history, which would otherwise cascade
+    _process_in_chunks(
+        AuditTrail.objects.filter(workspace_id=workspace_id),
+        lambda ids: AuditTrail.objects.filter(pk__in=ids).update(workspace=None),
+    )
+    _raw_delete(Workspace, [workspace_id])
+    counts[Workspace._meta.label] = 1
+    audit_create_bulk_summary(
+        user=user,
+        model_class=Workspace,
+        affected_count=1,
+        affected_ids=[workspace_id],
+        organization_id=organization_id,
+        metadata={
+            "operation_type": "workspace_cascade_delete",
+            "workspace_title": workspace["title"],
+            "cascaded_counts": counts,
+        },
+    )
+
+    invalidate_tenancy_context(organization_ids=[organization_id])
+    invalidate_organization_metrics(organization_ids=[organization_id])
+    EntryService.invalidate_entry_counts(organization_ids=[organization_id])
+    return counts
+
+
+def archive_organization_cascade(
+    organization_id, *, user=None, on_progress=None
+) -> dict:
+    """
+    Archive everything under a soft deleted organization: its teams, team
+    members, exchange rates, entries and attachments are soft deleted and
+    its workspaces are set to archived, in chunks without per-row signals.
+    Each model is audited with one summary record. The ledger balances and
+    remittances of its workspace teams are then rebuilt for the now empty
+    set of alive entries. Returns the number of archived rows per model label.
+    """
+    now = timezone.now()
+
+    def soft_delete(model):
+        return lambda ids: model._base_manager.filter(pk__in=ids).update(deleted_at=now)
+
+    entries = Entry._base_manager.filter(
+        organization_id=organization_id, deleted_at__isnull=True
+    )
+    steps = [
+        (
+            Attachment,
+            Attachment._base_manager.filter(
+                entry__organization_id=organization_id, deleted_at__isnull=True
+            ),
+            soft_delete(Attachment),
+        ),
+        (Entry, entries, soft_delete(Entry)),
+        (
+            WorkspaceExchangeRate,
+            WorkspaceExchangeRate._base_manager.filter(
+                workspace__organization_id=organization_id, deleted_at__isnull=True
+            ),
+            soft_delete(WorkspaceExchangeRate),
+        ),
+        (
+            OrganizationExchangeRate,
+            OrganizationExchangeRate._base_manager.filter(
+                organization_id=organization_id, deleted_at__isnull=True
+            ),
+            soft_delete(OrganizationExchangeRate),
+        ),
+        (
+            TeamMember,
+            TeamMember._base_manager.filter(
+                team__organization_id=organization_id, deleted_at__isnull=True
+            ),
+            soft_delete(TeamMember),
+        ),
+        (
+            Team,
+            Team._base_manager.filter(
+                organization_id=organization_id, deleted_at__isnull=True
+            ),
+            soft_delete(Team),
+        ),
+        (
+            Workspace,
+            Workspace.objects.filter(organization_id=organization_id).exclude(
+                status=WorkspaceStatus.ARCHIVED
+            ),
+            lambda ids: Workspace.objects.filter(pk__in=ids).update(
+                status=WorkspaceStatus.ARCHIVED
+            ),
+        ),
+    ]
+
+    counts = _run_steps(
+        steps,
+        user=user,
+        organization_id=organization_id,
+        on_progress=on_progress,
+        metadata={
+            "operation_type": "organization_cascade_archive",
+            "organization_id": str(organization_id),
+        },
+    )
+
+    workspace_teams = WorkspaceTeam.objects.filter(
+        workspace__organization_id=organization_id
+    )
+    with transaction.atomic():
+        TeamLedgerBalance.objects.filter(workspace_team__in=workspace_teams).delete()
+        RemittanceService.bulk_sync_remittance(workspace_teams=workspace_teams)
+
+    invalidate_tenancy_context(organization_ids=[organization_id])
+    invalidate_organization_metrics(organization_ids=[organization_id])
+    EntryService.invalidate_entry_counts(organization_ids=[organization_id])
+    return counts
+
+
+def start_workspace_deletion(*, workspace: Workspace, user=None) -> dict:
+    """
+    Queue the cascade deletion of ``workspace`` and return its job.
+    """
+    from apps.core.tasks import delete_workspace_task
+
+    return _start_job(
+        kind="workspace",
+        object_id=workspace.pk,
+        label=workspace.title,
+        user=user,
+        task=delete_workspace_task,
+    )
+
+
+def start_organization_archive(*, organization: Organization, user=None) -> dict:
+    """
+    Queue the archival of everything under ``organization`` and return its
+    job.
+    """
+    from apps.core.tasks import archive_organization_task
+
+    return _start_job(
+        kind="organization",
+        object_id=organization.pk,
+        label=organization.title,
+        user=user,
+        task=archive_organization_task,
+    )
+
+
+def run_workspace_deletion(job_id) -> Optional[dict]:
+    return _run_job(job_id, delete_workspace_cascade)
+
+
+def run_organization_archive(job_id) -> Optional[dict]:
+    return _run_job(job_id, archive_organization_cascade)
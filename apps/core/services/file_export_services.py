@@ -1,37 +1,54 @@
 import csv
 from datetime import datetime
+from itertools import chain, islice
 from fpdf import FPDF
 
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 
 from .base_services import BaseFileExporter
 
 
+class _Echo:
+    """File-like object whose ``write`` returns the value instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
 class CsvExporter(BaseFileExporter):
     def export(self):
         filename = f"{self.filename_prefix}-{datetime.now().date()}.csv"
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = f'attachment; filename="{filename}"'
 
-        writer = csv.writer(response)
+        if self.streaming:
+            writer = csv.writer(_Echo())
+            response = StreamingHttpResponse(
+                (writer.writerow(line) for line in self._iter_lines()),
+                content_type="text/csv",
+            )
+        else:
+            response = HttpResponse(content_type="text/csv")
+            csv.writer(response).writerows(self._iter_lines())
+
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
 
+    def _iter_lines(self):
         for block in self.blocks:
             if block["type"] == "table":
-                writer.writerow([header for _, header in block["columns"]])
-                for row in block["rows"]:
-                    writer.writerow([row.get(key, "") for key, _ in block["columns"]])
-                if "footer" in block:
-                    for footer_row in block["footer"]:
-                        writer.writerow(
-                            [footer_row.get(key, "") for key, _ in block["columns"]]
-                        )
+                keys = [key for key, _ in block["columns"]]
+                yield [header for _, header in block["columns"]]
+                for row in chain(block["rows"], block.get("footer", [])):
+                    yield [row.get(key, "") for key in keys]
             elif block["type"] == "paragraph":
-                writer.writerow([block["text"]])
-
-        return response
+                yield [block["text"]]
 
 
 class PdfExporter(BaseFileExporter):
+    # FPDF assembles the whole document in memory, so there is no streaming
+    # mode. Columns are sized from the first rows only, so single-pass rows
+    # are rendered as they are read instead of being copied into a list.
+    COL_WIDTH_SAMPLE_SIZE = 500
+
     def export(self):
         filename = f"{self.filename_prefix}-{datetime.now().date()}.pdf"
 
@@ -40,8 +57,11 @@ class PdfExporter(BaseFileExporter):
 
         for block in self.blocks:
             if block["type"] == "table":
+                rows = iter(block["rows"])
+                sample = list(islice(rows, self.COL_WIDTH_SAMPLE_SIZE))
+                footer_rows = list(block.get("footer", []))
                 col_widths = self._calculate_col_widths(
-                    pdf, block["columns"], block["rows"], block.get("footer", [])
+                    pdf, block["columns"], sample, footer_rows
                 )
 
                 pdf.set_font("Arial", "B", 5)
@@ -50,14 +70,14 @@ class PdfExporter(BaseFileExporter):
                 pdf.ln()
 
                 pdf.set_font("Arial", "", 5)
-                for row in block["rows"]:
+                for row in chain(sample, rows):
                     for (key, _), width in zip(block["columns"], col_widths):
                         pdf.cell(width, 8, str(row.get(key, "")), border=1, align="C")
                     pdf.ln()
 
-                if "footer" in block:
+                if footer_rows:
                     pdf.set_font("Arial", "B", 5)
-                    for footer_row in block["footer"]:
+                    for footer_row in footer_rows:
                         for (key, _), width in zip(block["columns"], col_widths):
                             pdf.cell(
                                 width,
@@ -75,18 +95,21 @@ class PdfExporter(BaseFileExporter):
                 pdf.multi_cell(0, 8, block["text"])
                 pdf.ln(5)
 
-        response = HttpResponse(content_type="application/pdf")
+        document = pdf.output(dest="S").encode("latin1")
+        # Release FPDF's str copy of the document (and its pages) before the
+        # response is built, so only the encoded bytes stay alive
+        del pdf
+        response = HttpResponse(document, content_type="application/pdf")
         response["Content-Disposition"] = f'attachment; filename="{filename}"'
-        response.write(pdf.output(dest="S").encode("latin1"))
         return response
 
     def _calculate_col_widths(self, pdf, columns, rows, footer_rows):
         pdf.set_font("Arial", "", 5)
         col_widths = []
-        all_rows = rows + footer_rows
+        sample = list(islice(rows, self.COL_WIDTH_SAMPLE_SIZE)) + list(footer_rows)
         for key, header in columns:
             max_width = pdf.get_string_width(str(header)) + 6
-            for row in all_rows:
+            for row in sample:
                 text_width = pdf.get_string_width(str(row.get(key, ""))) + 6
                 if text_width > max_width:
                     max_width = text_width
@@ -0,0 +1,80 @@
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from guardian.models import GroupObjectPermission, UserObjectPermission
+
+from apps.organizations.models import (
+    Organization,
+    OrganizationExchangeRate,
+    OrganizationMember,
+)
+from apps.organizations.services import invalidate_organization_metrics
+from apps.teams.models import Team, TeamMember
+from apps.workspaces.models import Workspace, WorkspaceTeam
+
+from .object_permissions import clear_cached_permissions
+from .tenancy import invalidate_tenancy_context
+
+
+@receiver(post_save, sender=UserObjectPermission)
+@receiver(post_delete, sender=UserObjectPermission)
+@receiver(post_save, sender=GroupObjectPermission)
+@receiver(post_delete, sender=GroupObjectPermission)
+@receiver(m2m_changed, sender=Group.user_set.through)
+def clear_cached_permissions_on_change(sender, **kwargs):
+    clear_cached_permissions()
+
+
+def _get_organization_id(instance):
+    if isinstance(instance, Organization):
+        return instance.pk
+    if isinstance(
+        instance, (OrganizationMember, OrganizationExchangeRate, Workspace, Team)
+    ):
+        return instance.organization_id
+    parent_field = (
+        "workspace" if isinstance(instance, WorkspaceTeam) else "organization_member"
+    )
+    field = instance._meta.get_field(parent_field)
+    if field.is_cached(instance):
+        return getattr(instance, parent_field).organization_id
+    # Looked up through the base manager since the parent row may already be
+    # soft deleted, or hard deleted by the cascade that is deleting ``instance``.
+    parents = field.related_model._base_manager.filter(
+        pk=getattr(instance, field.attname)
+    )
+    return parents.values_list("organization_id", flat=True).first()
+
+
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+@receiver(post_save, sender=OrganizationMember)
+@receiver(post_delete, sender=OrganizationMember)
+@receiver(post_save, sender=Workspace)
+@receiver(post_delete, sender=Workspace)
+@receiver(post_save, sender=WorkspaceTeam)
+@receiver(post_delete, sender=WorkspaceTeam)
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+@receiver(post_save, sender=TeamMember)
+@receiver(post_delete, sender=TeamMember)
+def invalidate_tenancy_context_on_change(sender, instance, **kwargs):
+    organization_id = _get_organization_id(instance)
+    if organization_id is not None:
+        invalidate_tenancy_context(organization_ids=[organization_id])
+
+
+@receiver(post_save, sender=OrganizationMember)
+@receiver(post_delete, sender=OrganizationMember)
+@receiver(post_save, sender=OrganizationExchangeRate)
+@receiver(post_delete, sender=OrganizationExchangeRate)
+@receiver(post_save, sender=Workspace)
+@receiver(post_delete, sender=Workspace)
+@receiver(post_save, sender=WorkspaceTeam)
+@receiver(post_delete, sender=WorkspaceTeam)
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+def invalidate_organization_metrics_on_change(sender, instance, **kwargs):
+    organization_id = _get_organization_id(instance)
+    if organization_id is not None:
+        invalidate_organization_metrics(organization_ids=[organization_id])
@@ -0,0 +1,36 @@
+import logging
+
+from celery import shared_task
+
+from apps.core.services.deletion import (
+    run_organization_archive,
+    run_workspace_deletion,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(ConnectionError, TimeoutError),
+    retry_kwargs={"max_retries": 2},
+)
+def delete_workspace_task(self, job_id: str):
+    """Run a queued workspace cascade deletion job."""
+    job = run_workspace_deletion(job_id)
+    if job:
+        logger.info(f"Workspace {job['object_id']} deleted: {job['counts']}")
+    return job_id
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(ConnectionError, TimeoutError),
+    retry_kwargs={"max_retries": 2},
+)
+def archive_organization_task(self, job_id: str):
+    """Run a queued organization archive job."""
+    job = run_organization_archive(job_id)
+    if job:
+        logger.info(f"Organization {job['object_id']} archived: {job['counts']}")
+    return job_id
@@ -0,0 +1,127 @@
+"""
+Tenancy context resolution for the organization, workspace and workspace team
+view mixins.
+
+Every organization scoped view starts by loading the organization, the user's
+membership and, further down the URL, the workspace, the workspace team and
+the user's team membership. ``resolve_tenancy_context`` loads that chain with
+one joined query per level (the membership rows are not reachable through
+foreign keys from the workspace side) and caches the result per
+``(user, organization, workspace, workspace team)``, so HTMX partial refreshes
+skip the lookups entirely.
+
+Cache keys embed the organization's tenancy version, which writes to any
+model in the chain bump (see ``apps.core.signals``), so every cached context of
+the organization is invalidated together.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from django.core.cache import cache
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+
+from apps.core.constants import TENANCY_CONTEXT_CACHE_TIMEOUT
+from apps.organizations.models import Organization, OrganizationMember
+from apps.teams.models import TeamMember
+from apps.workspaces.models import Workspace, WorkspaceTeam
+
+
+@dataclass
+class TenancyContext:
+    organization: Organization
+    org_member: OrganizationMember
+    workspace: Optional[Workspace] = None
+    workspace_team: Optional[WorkspaceTeam] = None
+    workspace_team_member: Optional[TeamMember] = None
+
+
+def get_tenancy_version_key(organization_id) -> str:
+    return f"tenancy:version:{organization_id}"
+
+
+def invalidate_tenancy_context(*, organization_ids) -> None:
+    """
+    Bump the tenancy version of each organization once the current
+    transaction commits, so cached tenancy contexts are reloaded.
+    """
+
+    def bump_versions():
+        version = time.time_ns()
+        for organization_id in set(organization_ids):
+            cache.set(get_tenancy_version_key(organization_id), version, None)
+
+    transaction.on_commit(bump_versions)
+
+
+def _load_tenancy_context(
+    *, user, organization_id, workspace_id=None, workspace_team_id=None
+) -> TenancyContext:
+    org_member = get_object_or_404(
+        OrganizationMember.objects.select_related("organization__owner"),
+        user=user,
+        organization_id=organization_id,
+        organization__deleted_at__isnull=True,
+    )
+    context = TenancyContext(
+        organization=org_member.organization, org_member=org_member
+    )
+    if workspace_id is None:
+        return context
+
+    workspace_related = (
+        "organization__owner",
+        "workspace_admin",
+        "operations_reviewer",
+    )
+    if workspace_team_id is None:
+        context.workspace = get_object_or_404(
+            Workspace.objects.select_related(*workspace_related),
+            pk=workspace_id,
+            organization_id=organization_id,
+        )
+        return context
+
+    workspace_team = get_object_or_404(
+        WorkspaceTeam.objects.select_related(
+            *(f"workspace__{related}" for related in workspace_related),
+            "team__team_coordinator",
+        ),
+        pk=workspace_team_id,
+        workspace_id=workspace_id,
+        workspace__organization_id=organization_id,
+    )
+    context.workspace = workspace_team.workspace
+    context.workspace_team = workspace_team
+    context.workspace_team_member = TeamMember.objects.filter(
+        organization_member=org_member, team_id=workspace_team.team_id
+    ).first()
+    return context
+
+
+def resolve_tenancy_context(
+    *, user, organization_id, workspace_id=None, workspace_team_id=None
+) -> TenancyContext:
+    """
+    Return the tenancy context of ``user`` for the given organization and,
+    optionally, workspace and workspace team. Raises ``Http404`` when any of
+    them does not exist or the user is not a member of the organization.
+    """
+    version = cache.get(get_tenancy_version_key(organization_id), 0)
+    cache_key = (
+        f"tenancy:context:{organization_id}:{version}:{user.pk}:"
+        f"{workspace_id}:{workspace_team_id}"
+    )
+
+    context = cache.get(cache_key)
+    if context is None:
+        context = _load_tenancy_context(
+            user=user,
+            organization_id=organization_id,
+            workspace_id=workspace_id,
+            workspace_team_id=workspace_team_id,
+        )
+        cache.set(cache_key, context, TENANCY_CONTEXT_CACHE_TIMEOUT)
+    return context
@@ -1,7 +1,12 @@
 from django.urls import path
-from .views.views import close_modal, permission_denied_view
+from .views.views import close_modal, deletion_progress_view, permission_denied_view
 
 urlpatterns = [
     path("close-modal/", close_modal, name="close_modal"),
     path("403/", permission_denied_view, name="permission_denied"),
+    path(
+        "deletion-jobs/<str:job_id>/",
+        deletion_progress_view,
+        name="deletion_progress",
+    ),
 ]
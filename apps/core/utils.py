@@ -9,6 +9,8 @@ from django.contrib.auth.models import Group
 
 from .constants import PAGINATION_SIZE
 from .exceptions import BaseServiceError
+from .object_permissions import has_object_perm
+from .pagination import KeysetPaginator, get_cursor_query_string
 from .permissions import OrganizationPermissions
 
 
@@ -40,6 +42,40 @@ def get_paginated_context(
     return context
 
 
+def get_keyset_paginated_context(
+    *,
+    queryset,
+    context=None,
+    object_name,
+    ordering,
+    page_size=PAGINATION_SIZE,
+    query_params=None,
+    count=None,
+):
+    """
+    Keyset counterpart of ``get_paginated_context``. Reads the ``after`` /
+    ``before`` cursors from ``query_params`` (usually ``request.GET``).
+    """
+    query_params = query_params or {}
+    paginator = KeysetPaginator(queryset, page_size, ordering, count=count)
+    page_obj = paginator.get_page(
+        after=query_params.get("after"), before=query_params.get("before")
+    )
+    context = {} if context is None else context
+    context.update(
+        {
+            "page_obj": page_obj,
+            "paginator": paginator,
+            object_name: page_obj.object_list,
+            "is_paginated": page_obj.has_other_pages(),
+            "pagination_query_string": get_cursor_query_string(query_params)
+            if query_params
+            else "",
+        }
+    )
+    return context
+
+
 def model_update(
     instance,
     data,
@@ -101,7 +137,9 @@ def can_manage_organization(user, organization):
     """
     Returns True if the user has the permission to manage the organization.
     """
-    return user.has_perm(OrganizationPermissions.MANAGE_ORGANIZATION, organization)
+    return has_object_perm(
+        user, OrganizationPermissions.MANAGE_ORGANIZATION, organization
+    )
 
 
 def revoke_workspace_admin_permission(user, workspace):
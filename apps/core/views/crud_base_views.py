@@ -28,12 +28,16 @@ class BaseListView(LoginRequiredMixin, ListView):
     table_template_name = None
     optional_htmx_template_name = None
     paginate_by = PAGINATION_SIZE
+    # Query params that mark a request for another page of the table
+    pagination_params = ("page",)
 
     def render_to_response(
         self, context: dict[str, Any], **response_kwargs: Any
     ) -> HttpResponse:
         if self.request.htmx:
-            page_param = self.request.GET.get("page")
+            page_param = any(
+                self.request.GET.get(param) for param in self.pagination_params
+            )
             # If page param exists and optional template is defined, render optional template
             if page_param and self.optional_htmx_template_name:
                 template_to_render = self.optional_htmx_template_name
@@ -1,14 +1,14 @@
 from typing import Any
 from django.http import HttpResponse
 from django.contrib import messages
-from django.shortcuts import get_object_or_404
-from apps.organizations.models import Organization, OrganizationMember
 from django.template.loader import render_to_string
-from apps.workspaces.models import Workspace, WorkspaceTeam
-from apps.core.permissions import WorkspacePermissions
-from apps.workspaces.selectors import (
-    get_workspace_team_member_by_workspace_team_and_org_member,
+from apps.core.object_permissions import (
+    has_object_perm,
+    prefetch_object_permissions,
 )
+from apps.core.pagination import KeysetPaginator, get_cursor_query_string
+from apps.core.tenancy import resolve_tenancy_context
+from apps.core.permissions import WorkspacePermissions
 
 
 class OrganizationRequiredMixin:
@@ -19,15 +19,21 @@ class OrganizationRequiredMixin:
     organization = None
     org_member = None
     is_org_admin = None
+    tenancy = None
+
+    def get_tenancy_lookup(self, **kwargs) -> dict[str, Any]:
+        """URL kwargs identifying the tenancy context this view requires."""
+        return {"organization_id": kwargs.get("organization_id")}
 
     def setup(self, request, *args, **kwargs):
         super().setup(request, *args, **kwargs)
-        organization_id = kwargs.get("organization_id")
-        self.organization = get_object_or_404(Organization, pk=organization_id)
-        self.org_member = get_object_or_404(
-            OrganizationMember, user=request.user, organization=self.organization
+        self.tenancy = resolve_tenancy_context(
+            user=request.user, **self.get_tenancy_lookup(**kwargs)
         )
+        self.organization = self.tenancy.organization
+        self.org_member = self.tenancy.org_member
         self.is_org_admin = self.org_member == self.organization.owner
+        prefetch_object_permissions(request.user, self.organization)
 
     def get_context_data(self, **kwargs) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
@@ -46,16 +52,19 @@ class WorkspaceRequiredMixin(OrganizationRequiredMixin):
     is_workspace_admin = None
     is_operation_reviewer = None
 
+    def get_tenancy_lookup(self, **kwargs) -> dict[str, Any]:
+        lookup = super().get_tenancy_lookup(**kwargs)
+        lookup["workspace_id"] = kwargs.get("workspace_id")
+        return lookup
+
     def setup(self, request, *args, **kwargs):
         super().setup(request, *args, **kwargs)
-        workspace_id = kwargs.get("workspace_id")
-        self.workspace = get_object_or_404(
-            Workspace, pk=workspace_id, organization=self.organization
-        )
+        self.workspace = self.tenancy.workspace
         self.is_workspace_admin = self.workspace.workspace_admin == self.org_member
         self.is_operation_reviewer = (
             self.workspace.operations_reviewer == self.org_member
         )
+        prefetch_object_permissions(request.user, self.workspace)
 
     def get_context_data(self, **kwargs) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
@@ -63,14 +72,20 @@ class WorkspaceRequiredMixin(OrganizationRequiredMixin):
         context["is_workspace_admin"] = self.is_workspace_admin
         context["is_operation_reviewer"] = self.is_operation_reviewer
         context["permissions"] = {
-            "can_add_workspace_exchange_rate": self.request.user.has_perm(
-                WorkspacePermissions.ADD_WORKSPACE_CURRENCY, self.workspace
+            "can_add_workspace_exchange_rate": has_object_perm(
+                self.request.user,
+                WorkspacePermissions.ADD_WORKSPACE_CURRENCY,
+                self.workspace,
             ),
-            "can_change_workspace_exchange_rate": self.request.user.has_perm(
-                WorkspacePermissions.CHANGE_WORKSPACE_CURRENCY, self.workspace
+            "can_change_workspace_exchange_rate": has_object_perm(
+                self.request.user,
+                WorkspacePermissions.CHANGE_WORKSPACE_CURRENCY,
+                self.workspace,
             ),
-            "can_delete_workspace_exchange_rate": self.request.user.has_perm(
-                WorkspacePermissions.DELETE_WORKSPACE_CURRENCY, self.workspace
+            "can_delete_workspace_exchange_rate": has_object_perm(
+                self.request.user,
+                WorkspacePermissions.DELETE_WORKSPACE_CURRENCY,
+                self.workspace,
             ),
         }
         return context
@@ -82,23 +97,22 @@ class WorkspaceTeamRequiredMixin(WorkspaceRequiredMixin):
     workspace_team_role = None
     is_team_coordinator = None
 
+    def get_tenancy_lookup(self, **kwargs) -> dict[str, Any]:
+        lookup = super().get_tenancy_lookup(**kwargs)
+        lookup["workspace_team_id"] = kwargs.get("workspace_team_id")
+        return lookup
+
     def setup(self, request, *args, **kwargs):
         super().setup(request, *args, **kwargs)
-        workspace_team_id = kwargs.get("workspace_team_id")
-        self.workspace_team = get_object_or_404(
-            WorkspaceTeam, pk=workspace_team_id, workspace=self.workspace
-        )
-        self.workspace_team_member = (
-            get_workspace_team_member_by_workspace_team_and_org_member(
-                workspace_team=self.workspace_team, org_member=self.org_member
-            )
-        )
+        self.workspace_team = self.tenancy.workspace_team
+        self.workspace_team_member = self.tenancy.workspace_team_member
         self.workspace_team_role = (
             self.workspace_team_member.role if self.workspace_team_member else None
         )
         self.is_team_coordinator = (
             self.org_member == self.workspace_team.team.team_coordinator
         )
+        prefetch_object_permissions(request.user, self.workspace_team)
 
     def get_context_data(self, **kwargs) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
@@ -168,3 +182,47 @@ class HtmxInvalidResponseMixin:
         )
 
         return HttpResponse(f"{message_html}")
+
+
+class KeysetPaginationMixin:
+    """
+    Mixin for list and table views that page with keyset cursors
+    (``?after=`` / ``?before=``) instead of ``?page=`` offsets.
+    """
+
+    keyset_ordering = None
+    pagination_params = ("after", "before")
+
+    def get_keyset_count(self, queryset):
+        """Return the total shown next to the pager, or None to omit it."""
+        return None
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = KeysetPaginator(
+            queryset,
+            page_size,
+            self.keyset_ordering,
+            count=self.get_keyset_count(queryset),
+        )
+        page = paginator.get_page(
+            after=self.request.GET.get("after"),
+            before=self.request.GET.get("before"),
+        )
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_table_context(self, *, queryset, context) -> dict:
+        from apps.core.utils import get_keyset_paginated_context
+
+        return get_keyset_paginated_context(
+            queryset=queryset,
+            context=context,
+            object_name=self.context_object_name,
+            ordering=self.keyset_ordering,
+            query_params=self.request.GET,
+            count=self.get_keyset_count(queryset),
+        )
+
+    def get_context_data(self, **kwargs) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context["pagination_query_string"] = get_cursor_query_string(self.request.GET)
+        return context
@@ -17,6 +17,16 @@ class HtmxTableServiceMixin:
         """
         raise NotImplementedError("perform_service() must be implemented")
 
+    def get_table_context(self, *, queryset, context) -> dict:
+        """Paginate ``queryset`` into ``context`` for the refreshed table."""
+        from apps.core.utils import get_paginated_context
+
+        return get_paginated_context(
+            queryset=queryset,
+            context=context,
+            object_name=self.context_object_name,
+        )
+
     def get_partial_templates(self, context) -> list[tuple[str, dict]]:
         """
         Optionally return additional templates to render as part of the success response.
@@ -44,14 +54,8 @@ class HtmxTableServiceMixin:
                 template_path, context=context, request=self.request
             )
 
-        from apps.core.utils import get_paginated_context
-
         queryset = self.get_queryset()
-        table_context = get_paginated_context(
-            queryset=queryset,
-            context=base_context,
-            object_name=self.context_object_name,
-        )
+        table_context = self.get_table_context(queryset=queryset, context=base_context)
 
         table_html = render_to_string(
             self.table_template_name, context=table_context, request=self.request
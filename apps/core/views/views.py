@@ -1,5 +1,9 @@
+from django.contrib.auth.decorators import login_required
+from django.http import Http404, HttpResponse
 from django.shortcuts import render
 
+from apps.core.services.deletion import DeletionJobStatus, get_deletion_job
+
 
 def close_modal(request):
     return render(request, "components/modal_placeholder.html")
@@ -7,3 +11,18 @@ def close_modal(request):
 
 def permission_denied_view(request):
     return render(request, "components/permission_error_page.html")
+
+
+@login_required
+def deletion_progress_view(request, job_id):
+    """
+    Polled by the deletion progress card. Once the job has completed the
+    card is swapped out with an empty response.
+    """
+    job = get_deletion_job(job_id)
+    if job is None or job["user_id"] != str(request.user.pk):
+        raise Http404("Deletion job not found")
+
+    if job["status"] == DeletionJobStatus.COMPLETED:
+        return HttpResponse("")
+    return render(request, "components/deletion_progress.html", {"job": job})
@@ -1,3 +1,8 @@
+from bisect import bisect_right
+from collections import defaultdict
+
+from django.db import models
+
 from apps.currencies.services import createCurrency
 from apps.organizations.models import Organization
 from .models import Currency
@@ -56,3 +61,83 @@ def get_closest_exchanged_rate(*, currency, occurred_at, organization, workspace
     if organization_exchange_rate:
         return organization_exchange_rate
     return None
+
+
+class RateResolver:
+    """
+    Resolve exchange rates for many (currency, date) pairs with preloaded rates.
+
+    All approved workspace rates and organization rates for the requested
+    currencies are loaded up front and kept as per-currency lists sorted by
+    effective date. Lookups then follow the same precedence as
+    ``get_closest_exchanged_rate`` using a bisect instead of a query.
+    Currencies that were not preloaded are loaded on first use.
+    """
+
+    def __init__(self, *, organization, workspace=None, currency_codes=None):
+        self.organization = organization
+        self.workspace = workspace
+        self._currencies = {}
+        # currency code -> (sorted effective dates, rates in the same order)
+        self._workspace_rates = {}
+        self._organization_rates = {}
+        if currency_codes:
+            self._load(currency_codes)
+
+    def _load(self, currency_codes):
+        codes = {code for code in currency_codes if code not in self._currencies}
+        if not codes:
+            return
+
+        for code in codes:
+            self._currencies[code] = None
+        for currency in Currency.objects.filter(code__in=codes):
+            self._currencies[currency.code] = currency
+
+        if self.workspace:
+            workspace_rates = WorkspaceExchangeRate.objects.filter(
+                workspace=self.workspace,
+                currency__code__in=codes,
+                is_approved=True,
+            )
+            self._workspace_rates.update(self._group_by_code(workspace_rates))
+
+        organization_rates = OrganizationExchangeRate.objects.filter(
+            organization=self.organization,
+            currency__code__in=codes,
+        )
+        self._organization_rates.update(self._group_by_code(organization_rates))
+
+    @staticmethod
+    def _group_by_code(queryset):
+        grouped = defaultdict(lambda: ([], []))
+        rates = queryset.annotate(currency_code=models.F("currency__code")).order_by(
+            "effective_date"
+        )
+        for rate in rates:
+            dates, values = grouped[rate.currency_code]
+            dates.append(rate.effective_date)
+            values.append(rate)
+        return grouped
+
+    @staticmethod
+    def _closest(rates, occurred_at):
+        if not rates:
+            return None
+        dates, values = rates
+        index = bisect_right(dates, occurred_at)
+        return values[index - 1] if index else None
+
+    def get_currency(self, code: str) -> Currency:
+        self._load([code])
+        return self._currencies[code]
+
+    def get_closest_rate(self, *, currency, occurred_at):
+        code = currency.code
+        self._load([code])
+        occurred_at = models.DateField().to_python(occurred_at)
+
+        rate = None
+        if self.workspace:
+            rate = self._closest(self._workspace_rates.get(code), occurred_at)
+        return rate or self._closest(self._organization_rates.get(code), occurred_at)
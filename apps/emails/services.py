@@ -3,12 +3,15 @@ import logging
 from django.conf import settings
 from django.contrib.sites.models import Site
 from django.template import TemplateDoesNotExist
-from django.template.loader import render_to_string
+from django.template.loader import get_template, render_to_string, select_template
 
-from .tasks import send_email_task
+from .tasks import send_email_batch_task, send_email_task
 
 logger = logging.getLogger("emails")
 
+# Emails handed to each batch task, sent over one SMTP session
+INVITATION_EMAIL_BATCH_SIZE = 50
+
 
 def send_signup_confirmation_email(user):
     """
@@ -32,11 +35,10 @@ def send_password_reset_email(user):
     )
 
 
-def send_invitation_email(invitation):
+def get_site_base_url():
     """
-    Sends an invitation email to the invited user.
+    Returns the ``protocol://domain`` prefix used for absolute links in emails.
     """
-    # Determine the domain and protocol for the invitation URL
     # Priority: DEBUG setting for development, then Sites framework, then ALLOWED_HOSTS
     if getattr(settings, "DEBUG", False):
         # In development, use localhost with port 8000
@@ -62,19 +64,25 @@ def send_invitation_email(invitation):
                 if domain != "localhost" and not domain.startswith("127.0.0.1")
                 else "http"
             )
+    return f"{protocol}://{domain}"
 
-    # Build the full acceptance URL
-    acceptance_path = invitation.get_acceptance_url()
-    acceptance_url = f"{protocol}://{domain}{acceptance_path}"
 
-    # Prepare context for template rendering
-    context = {
+def _get_invitation_context(invitation, base_url):
+    return {
         "invitation": invitation,
         "organization": invitation.organization,
         "invited_by": invitation.invited_by,
-        "acceptance_url": acceptance_url,
+        "acceptance_url": f"{base_url}{invitation.get_acceptance_url()}",
     }
 
+
+def send_invitation_email(invitation):
+    """
+    Sends an invitation email to the invited user.
+    """
+    # Prepare context for template rendering
+    context = _get_invitation_context(invitation, get_site_base_url())
+
     # Render subject
     subject = render_to_string("account/email/invitation_subject.txt", context)
     subject = "".join(subject.splitlines())  # Remove newlines from subject
@@ -101,3 +109,49 @@ def send_invitation_email(invitation):
     logger.info(
         f"Invitation email queued for {invitation.email} to join {invitation.organization.title}"
     )
+
+
+def send_invitation_emails(invitations):
+    """
+    Queues the invitation emails of many invitations at once, in batch tasks of
+    ``INVITATION_EMAIL_BATCH_SIZE`` emails. The site URL is resolved and the
+    templates are compiled once for the whole set. Returns the number of
+    emails queued.
+    """
+    if not invitations:
+        return 0
+
+    base_url = get_site_base_url()
+    subject_template = get_template("account/email/invitation_subject.txt")
+    try:
+        message_template = select_template(
+            [
+                "account/email/invitation_message.html",
+                "account/email/invitation_message.txt",
+            ]
+        )
+    except TemplateDoesNotExist:
+        logger.error(
+            f"No invitation email templates found for {len(invitations)} invitations"
+        )
+        return 0
+
+    messages = []
+    for invitation in invitations:
+        context = _get_invitation_context(invitation, base_url)
+        subject = "".join(subject_template.render(context).splitlines())
+        messages.append(
+            {
+                "to": invitation.email,
+                "subject": subject,
+                "contents": message_template.render(context),
+            }
+        )
+
+    for start in range(0, len(messages), INVITATION_EMAIL_BATCH_SIZE):
+        send_email_batch_task.delay(
+            messages[start : start + INVITATION_EMAIL_BATCH_SIZE]
+        )
+
+    logger.info(f"Queued {len(messages)} invitation emails in batches")
+    return len(messages)
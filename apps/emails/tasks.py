@@ -1,21 +1,25 @@
 import logging
 
-import yagmail
+import yagmail  # noqa: F401
 from celery import shared_task
+from celery.signals import worker_process_shutdown
 from django.conf import settings
 from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
 
+from .transport import MESSAGE_REJECTED_ERRORS, connection_pool
+
 logger = logging.getLogger("emails")
 
+ACCOUNT_INDEX_CACHE_KEY = "last_gmail_account_index"
+UNHEALTHY_ACCOUNT_TIMEOUT = 300
 
-@shared_task
-def send_email_task(to, subject, contents):
-    """
-    A Celery task to send an email using one of the configured Gmail accounts, rotating between them.
-    Includes fallback mechanism to skip problematic accounts.
-    Logs the outcome using Django's logging framework.
-    """
+
+def _account_health_key(account_index):
+    return f"gmail_account_healthy_{account_index}"
+
+
+def _get_accounts():
     accounts = getattr(settings, "GMAIL_ACCOUNTS")
     if not accounts:
         logger.critical(
@@ -24,27 +28,63 @@ def send_email_task(to, subject, contents):
         raise ImproperlyConfigured(
             "No Gmail accounts configured in settings.GMAIL_ACCOUNTS"
         )
+    return accounts
+
+
+def _select_account_index(accounts):
+    """
+    Pick the next account in round-robin order, skipping accounts that were
+    recently marked unhealthy. Falls back to the round-robin pick when every
+    account is unhealthy.
+    """
+    # Atomically increment a counter to get the next index.
+    try:
+        account_index = cache.incr(ACCOUNT_INDEX_CACHE_KEY)
+    except ValueError:
+        cache.set(ACCOUNT_INDEX_CACHE_KEY, 1)
+        account_index = 1
+
+    start = (account_index - 1) % len(accounts)
+    candidates = [(start + offset) % len(accounts) for offset in range(len(accounts))]
+    health = cache.get_many([_account_health_key(index) for index in candidates])
+    for index in candidates:
+        if health.get(_account_health_key(index)) is not False:
+            return index
+    return start
+
+
+def _mark_account_unhealthy(account_index, account):
+    cache.set(
+        _account_health_key(account_index), False, timeout=UNHEALTHY_ACCOUNT_TIMEOUT
+    )
+    connection_pool.discard(account)
+
+
+@worker_process_shutdown.connect
+def close_pooled_connections(**kwargs):
+    connection_pool.close_all()
+
+
+@shared_task
+def send_email_task(to, subject, contents):
+    """
+    A Celery task to send an email using one of the configured Gmail accounts, rotating between them.
+    Includes fallback mechanism to skip problematic accounts.
+    Logs the outcome using Django's logging framework.
+    """
+    accounts = _get_accounts()
 
     # Try up to len(accounts) times to find a working account
     max_attempts = len(accounts)
 
     for attempt in range(max_attempts):
-        # Atomically increment a counter to get the next index.
-        try:
-            account_index = cache.incr("last_gmail_account_index")
-        except ValueError:
-            cache.set("last_gmail_account_index", 1)
-            account_index = 1
-
-        # Perform round-robin selection.
-        selected_account_index = (account_index - 1) % len(accounts)
+        selected_account_index = _select_account_index(accounts)
         selected_account = accounts[selected_account_index]
         gmail_user = selected_account.get("user")
-        oauth2_file = selected_account.get("oauth2_file")
 
         try:
-            yag = yagmail.SMTP(gmail_user, oauth2_file=oauth2_file)
-            yag.send(
+            connection = connection_pool.get(selected_account)
+            connection.send(
                 to=to,
                 subject=subject,
                 contents=contents,
@@ -55,15 +95,17 @@ def send_email_task(to, subject, contents):
         except (ImportError, FileNotFoundError):
             # Re-raise critical errors that should not be silently handled
             raise
+        except MESSAGE_REJECTED_ERRORS as e:
+            # Another account would be refused too; the account is fine
+            logger.error(f"Email to {to} was rejected by the server: {e}")
+            return
         except Exception as e:
             logger.warning(
                 f"Failed to send email to {to} from {gmail_user} (attempt {attempt + 1}/{max_attempts}): {e}"
             )
 
-            # Mark account as potentially unhealthy
-            cache.set(
-                f"gmail_account_healthy_{selected_account_index}", False, timeout=300
-            )
+            # Mark account as unhealthy so selection skips it for a while
+            _mark_account_unhealthy(selected_account_index, selected_account)
 
             # If this is not the last attempt, continue to next account
             if attempt < max_attempts - 1:
@@ -72,3 +114,57 @@ def send_email_task(to, subject, contents):
     # If we get here, all accounts failed
     logger.exception(f"Failed to send email to {to} from {gmail_user}.")
     # Don't re-raise the exception, just log it
+
+
+@shared_task
+def send_email_batch_task(messages):
+    """
+    Send a batch of emails (dicts with ``to``, ``subject`` and ``contents``)
+    over one pooled SMTP session, moving the remaining messages on to the next
+    healthy account if the current one fails. Messages the server rejects
+    (e.g. an unknown recipient) are logged and skipped. Returns the number sent.
+    """
+    accounts = _get_accounts()
+    position = 0
+    sent = 0
+
+    for attempt in range(len(accounts)):
+        if position == len(messages):
+            break
+
+        selected_account_index = _select_account_index(accounts)
+        selected_account = accounts[selected_account_index]
+        gmail_user = selected_account.get("user")
+
+        try:
+            connection = connection_pool.get(selected_account)
+            while position < len(messages):
+                message = messages[position]
+                try:
+                    connection.send(
+                        to=message["to"],
+                        subject=message["subject"],
+                        contents=message["contents"],
+                    )
+                    sent += 1
+                except MESSAGE_REJECTED_ERRORS as e:
+                    logger.error(
+                        f"Email to {message['to']} was rejected by the server: {e}"
+                    )
+                position += 1
+        except (ImportError, FileNotFoundError):
+            raise
+        except Exception as e:
+            logger.warning(
+                f"Failed to send email to {messages[position]['to']} from {gmail_user} "
+                f"(attempt {attempt + 1}/{len(accounts)}): {e}"
+            )
+            _mark_account_unhealthy(selected_account_index, selected_account)
+
+    if sent < len(messages):
+        logger.error(
+            f"Failed to send {len(messages) - sent} of {len(messages)} emails."
+        )
+    else:
+        logger.info(f"Sent a batch of {sent} emails.")
+    return sent
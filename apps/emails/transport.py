@@ -0,0 +1,147 @@
+"""
+Pooled SMTP connections for the configured Gmail accounts.
+
+``yagmail.SMTP.send`` logs in again (connect, TLS and OAuth handshake) on every
+call. ``GmailConnectionPool`` instead keeps one client per account for the
+lifetime of the worker process: the first message on a connection logs in
+through ``send`` and later messages are written straight to the open session.
+The session is re-established when the server drops it or once it has been
+idle for longer than ``CONNECTION_MAX_IDLE_SECONDS``.
+"""
+
+import smtplib
+import threading
+import time
+
+import yagmail
+
+# Gmail closes idle SMTP sessions after a few minutes
+CONNECTION_MAX_IDLE_SECONDS = 60
+
+# Optional per-account settings passed through to ``yagmail.SMTP``
+CONNECTION_OPTIONS = ("host", "port", "smtp_ssl", "smtp_starttls", "smtp_skip_login")
+
+# Errors with which the server rejects one message (e.g. an unknown recipient)
+# while the session and the account stay usable
+MESSAGE_REJECTED_ERRORS = (smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError)
+
+
+class PooledConnection:
+    """A yagmail client whose SMTP session is reused between messages."""
+
+    def __init__(self, client):
+        self.client = client
+        self.last_used = None
+        # Tracked here because yagmail only sets ``is_closed`` for password
+        # logins; after an OAuth2 login it stays ``None``.
+        self.session_open = False
+        self._lock = threading.Lock()
+
+    def _has_open_session(self) -> bool:
+        if not self.session_open or self._session is None:
+            return False
+        idle = time.monotonic() - (self.last_used or 0)
+        if idle > CONNECTION_MAX_IDLE_SECONDS:
+            self._disconnect()
+            return False
+        return True
+
+    @property
+    def _session(self):
+        # yagmail only sets ``smtp`` once it has logged in
+        return getattr(self.client, "smtp", None)
+
+    def _disconnect(self):
+        self.session_open = False
+        if self._session is not None:
+            self.client.close()
+            self.client.smtp = None
+
+    def _login_and_send(self, *, to, subject, contents):
+        # ``send`` always opens a new session, so quit the previous one first
+        self._disconnect()
+        try:
+            result = self.client.send(to=to, subject=subject, contents=contents)
+        except MESSAGE_REJECTED_ERRORS:
+            self.session_open = True
+            raise
+        self.session_open = result is not False
+        return result
+
+    def send(self, *, to, subject, contents):
+        with self._lock:
+            if self._has_open_session():
+                recipients, message = self.client.prepare_send(to, subject, contents)
+                try:
+                    self.client.smtp.sendmail(self.client.user, recipients, message)
+                    result = None
+                except smtplib.SMTPServerDisconnected:
+                    result = self._login_and_send(
+                        to=to, subject=subject, contents=contents
+                    )
+            else:
+                result = self._login_and_send(to=to, subject=subject, contents=contents)
+
+            # yagmail returns False once its own reconnect attempts are exhausted
+            if result is False:
+                raise smtplib.SMTPServerDisconnected(f"Could not deliver email to {to}")
+            self.last_used = time.monotonic()
+
+    def close(self):
+        with self._lock:
+            self._disconnect()
+
+
+class GmailConnectionPool:
+    """Per-process pool holding one long-lived connection per Gmail account."""
+
+    def __init__(self):
+        self._connections = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(account):
+        return tuple(sorted(account.items()))
+
+    def get(self, account) -> PooledConnection:
+        """Return the pooled connection of ``account``, creating it if needed."""
+        key = self._key(account)
+        with self._lock:
+            connection = self._connections.get(key)
+            if connection is None:
+                options = {
+                    option: account[option]
+                    for option in CONNECTION_OPTIONS
+                    if option in account
+                }
+                client = yagmail.SMTP(
+                    account.get("user"),
+                    oauth2_file=account.get("oauth2_file"),
+                    **options,
+                )
+                connection = PooledConnection(client)
+                self._connections[key] = connection
+            return connection
+
+    def discard(self, account) -> None:
+        """Close and forget the connection of ``account`` after a failure."""
+        with self._lock:
+            connection = self._connections.pop(self._key(account), None)
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def close_all(self) -> None:
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections = {}
+        for connection in connections:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+
+connection_pool = GmailConnectionPool()
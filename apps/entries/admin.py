@@ -1,4 +1,6 @@
-from .models import Entry
+from .models import Entry, EntryImportJob, TeamLedgerBalance
 from django.contrib import admin
 
 admin.site.register(Entry)
+admin.site.register(TeamLedgerBalance)
+admin.site.register(EntryImportJob)
@@ -2,6 +2,16 @@ from django.db import models
 
 CONTEXT_OBJECT_NAME = "entries"
 DETAIL_CONTEXT_OBJECT_NAME = "entry"
+# Unique ordering of entry lists; also the keyset used to paginate them
+ENTRY_LIST_ORDERING = ("-occurred_at", "-entry_id")
+# Seconds a cached entry list total stays valid without writes
+ENTRY_COUNT_CACHE_TIMEOUT = 300
+# Rows per INSERT when importing entries in bulk
+ENTRY_IMPORT_BATCH_SIZE = 1000
+# CSV rows validated and inserted per transaction by a background import
+ENTRY_IMPORT_CHUNK_SIZE = 500
+# Row errors kept on an import job; later ones are only counted
+ENTRY_IMPORT_MAX_ERRORS = 200
 
 
 class EntryType(models.TextChoices):
@@ -17,3 +27,10 @@ class EntryStatus(models.TextChoices):
     REVIEWED = "reviewed", "Reviewed"
     APPROVED = "approved", "Approved"
     REJECTED = "rejected", "Rejected"
+
+
+class EntryImportJobStatus(models.TextChoices):
+    PENDING = "pending", "Pending"
+    RUNNING = "running", "Running"
+    COMPLETED = "completed", "Completed"
+    FAILED = "failed", "Failed"
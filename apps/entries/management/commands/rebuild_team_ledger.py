@@ -0,0 +1,55 @@
+"""
+Management command to rebuild TeamLedgerBalance from entries and check it for drift.
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.entries.services import TeamLedgerService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the materialized team ledger balances or check them for drift"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report drift between the ledger and entries, do not rebuild",
+        )
+        parser.add_argument(
+            "--workspace-team",
+            action="append",
+            dest="workspace_team_ids",
+            help="Limit to a workspace team id (can be given multiple times)",
+        )
+
+    def handle(self, *args, **options):
+        workspace_team_ids = options["workspace_team_ids"]
+
+        drift = TeamLedgerService.find_drift(workspace_team_ids=workspace_team_ids)
+        for row in drift:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Drift on {row['workspace_team_id']} "
+                    f"{row['entry_type']}/{row['status']}: "
+                    f"ledger={row['actual_total']} ({row['actual_count']}) "
+                    f"entries={row['expected_total']} ({row['expected_count']})"
+                )
+            )
+
+        if options["check"]:
+            if drift:
+                self.stdout.write(
+                    self.style.ERROR(f"\nCHECK FAILED: {len(drift)} drifted balances")
+                )
+            else:
+                self.stdout.write(self.style.SUCCESS("\nCHECK PASSED: No drift found"))
+            return
+
+        rebuilt = TeamLedgerService.rebuild(workspace_team_ids=workspace_team_ids)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\nREBUILD COMPLETE: {rebuilt} balances written, "
+                f"{len(drift)} drifted balances corrected"
+            )
+        )
@@ -0,0 +1,52 @@
+"""
+Management command to re-rate pending entries against the current exchange rates.
+"""
+
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from apps.entries.services import EntryRerateService
+
+
+class Command(BaseCommand):
+    help = "Re-rate pending entries whose closest exchange rate has changed"
+
+    def add_arguments(self, parser):
+        parser.add_argument("organization_id", help="Organization to re-rate")
+        parser.add_argument("currency_id", help="Currency of the entries")
+        parser.add_argument(
+            "--workspace",
+            dest="workspace_id",
+            help="Limit to the entries of a workspace",
+        )
+        parser.add_argument(
+            "--from",
+            dest="occurred_from",
+            type=date.fromisoformat,
+            help="Limit to entries that occurred on or after this date (YYYY-MM-DD)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the change, do not update entries",
+        )
+
+    def handle(self, *args, **options):
+        report = EntryRerateService.rerate_entries(
+            organization_id=options["organization_id"],
+            currency_id=options["currency_id"],
+            workspace_id=options["workspace_id"],
+            occurred_from=options["occurred_from"],
+            dry_run=options["dry_run"],
+        )
+
+        summary = (
+            f"{report['entry_count']} entries, converted total "
+            f"{report['converted_total_before']} -> {report['converted_total_after']} "
+            f"(delta {report['converted_total_delta']})"
+        )
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"\nDRY RUN: {summary}"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"\nRE-RATE COMPLETE: {summary}"))
@@ -0,0 +1,120 @@
+# Generated by Django 5.2.1 on 2026-10-16 19:01
+
+import django.db.models.deletion
+import uuid
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Count, DecimalField, ExpressionWrapper, F, Sum
+
+
+def backfill_team_ledger_balances(apps, schema_editor):
+    Entry = apps.get_model("entries", "Entry")
+    TeamLedgerBalance = apps.get_model("entries", "TeamLedgerBalance")
+
+    rows = (
+        Entry.objects.filter(workspace_team__isnull=False, deleted_at__isnull=True)
+        .values("workspace_team_id", "entry_type", "status")
+        .annotate(
+            total=Sum(
+                ExpressionWrapper(
+                    F("amount") * F("exchange_rate_used"),
+                    output_field=DecimalField(max_digits=24, decimal_places=4),
+                )
+            ),
+            count=Count("pk"),
+        )
+        .order_by()
+    )
+    TeamLedgerBalance.objects.bulk_create(
+        [
+            TeamLedgerBalance(
+                workspace_team_id=row["workspace_team_id"],
+                entry_type=row["entry_type"],
+                status=row["status"],
+                total_amount=row["total"] or Decimal("0.0000"),
+                entry_count=row["count"],
+            )
+            for row in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("entries", "0001_initial"),
+        (
+            "workspaces",
+            "0002_workspaceteam_syned_with_workspace_remittance_rate_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TeamLedgerBalance",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "team_ledger_balance_id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "entry_type",
+                    models.CharField(
+                        choices=[
+                            ("income", "Income"),
+                            ("disbursement", "Disbursement"),
+                            ("remittance", "Remittance"),
+                            ("workspace_exp", "Workspace Expense"),
+                            ("org_exp", "Organization Expense"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("reviewed", "Reviewed"),
+                            ("approved", "Approved"),
+                            ("rejected", "Rejected"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "total_amount",
+                    models.DecimalField(
+                        decimal_places=4, default=Decimal("0.0000"), max_digits=24
+                    ),
+                ),
+                ("entry_count", models.IntegerField(default=0)),
+                (
+                    "workspace_team",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ledger_balances",
+                        to="workspaces.workspaceteam",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "team ledger balance",
+                "verbose_name_plural": "team ledger balances",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("workspace_team", "entry_type", "status"),
+                        name="unique_team_ledger_balance",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_team_ledger_balances, migrations.RunPython.noop),
+    ]
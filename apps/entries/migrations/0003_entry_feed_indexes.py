@@ -0,0 +1,101 @@
+# Generated by Django 5.2.1 on 2026-10-16 19:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("currencies", "0001_initial"),
+        ("entries", "0002_team_ledger_balance"),
+        ("organizations", "0001_initial"),
+        ("teams", "0001_initial"),
+        (
+            "workspaces",
+            "0002_workspaceteam_syned_with_workspace_remittance_rate_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="entry",
+            name="entries_ent_organiz_e92370_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="entry",
+            name="entries_ent_workspa_31f650_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="entry",
+            name="entries_ent_workspa_33834f_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="entry",
+            name="entries_ent_occurre_e5fce9_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="entry",
+            name="entries_ent_status__59feaa_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="entry",
+            name="entries_ent_status_e7314c_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="entry",
+            name="entries_ent_submitt_56c38e_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="entry",
+            name="entries_ent_submitt_b9ecab_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="entry",
+            name="entries_ent_org_exc_56ca6e_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="entry",
+            name="entries_ent_workspa_33f8ba_idx",
+        ),
+        migrations.AddIndex(
+            model_name="entry",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=[
+                    "workspace_team",
+                    "entry_type",
+                    "status",
+                    "-occurred_at",
+                    "-entry_id",
+                ],
+                name="entry_team_feed_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="entry",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=[
+                    "workspace",
+                    "entry_type",
+                    "status",
+                    "-occurred_at",
+                    "-entry_id",
+                ],
+                name="entry_workspace_feed_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="entry",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=[
+                    "organization",
+                    "entry_type",
+                    "status",
+                    "-occurred_at",
+                    "-entry_id",
+                ],
+                name="entry_org_feed_idx",
+            ),
+        ),
+    ]
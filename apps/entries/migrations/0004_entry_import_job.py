@@ -0,0 +1,154 @@
+# Generated by Django 5.2.1 on 2026-10-16 21:12
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("entries", "0003_entry_feed_indexes"),
+        ("organizations", "0001_initial"),
+        ("teams", "0001_initial"),
+        (
+            "workspaces",
+            "0002_workspaceteam_syned_with_workspace_remittance_rate_and_more",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EntryImportJob",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "entry_import_job_id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("file", models.FileField(upload_to="entry_imports/")),
+                (
+                    "entry_type",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("income", "Income"),
+                            ("disbursement", "Disbursement"),
+                            ("remittance", "Remittance"),
+                            ("workspace_exp", "Workspace Expense"),
+                            ("org_exp", "Organization Expense"),
+                        ],
+                        max_length=20,
+                        null=True,
+                    ),
+                ),
+                (
+                    "entry_status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("reviewed", "Reviewed"),
+                            ("approved", "Approved"),
+                            ("rejected", "Rejected"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                ("status_note", models.TextField(blank=True, default="")),
+                (
+                    "backup_description",
+                    models.CharField(blank=True, default="", max_length=255),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("completed", "Completed"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                ("total_rows", models.IntegerField(blank=True, null=True)),
+                ("processed_rows", models.IntegerField(default=0)),
+                ("imported_count", models.IntegerField(default=0)),
+                ("error_count", models.IntegerField(default=0)),
+                ("errors", models.JSONField(blank=True, default=list)),
+                ("failure_reason", models.TextField(blank=True, default="")),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="entry_import_jobs",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="entry_import_jobs",
+                        to="organizations.organization",
+                    ),
+                ),
+                (
+                    "submitted_by_org_member",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="entry_import_jobs",
+                        to="organizations.organizationmember",
+                    ),
+                ),
+                (
+                    "submitted_by_team_member",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="entry_import_jobs",
+                        to="teams.teammember",
+                    ),
+                ),
+                (
+                    "workspace",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="entry_import_jobs",
+                        to="workspaces.workspace",
+                    ),
+                ),
+                (
+                    "workspace_team",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="entry_import_jobs",
+                        to="workspaces.workspaceteam",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "entry import job",
+                "verbose_name_plural": "entry import jobs",
+            },
+        ),
+    ]
@@ -1,12 +1,13 @@
 import uuid
 from decimal import Decimal
 
+from django.conf import settings
 from django.db import models
 from django.core.validators import MinValueValidator
 
 from apps.core.models import baseModel, SoftDeleteModel
 from apps.currencies.models import Currency
-from apps.entries.constants import EntryType, EntryStatus
+from apps.entries.constants import EntryImportJobStatus, EntryType, EntryStatus
 from apps.teams.models import TeamMember
 from apps.workspaces.models import Workspace, WorkspaceExchangeRate, WorkspaceTeam
 from apps.organizations.models import (
@@ -102,6 +103,39 @@ class Entry(baseModel, SoftDeleteModel):
     def converted_amount(self):
         return self.amount * self.exchange_rate_used
 
+    # Fields that decide what an entry contributes to TeamLedgerBalance
+    LEDGER_FIELDS = (
+        "workspace_team_id",
+        "entry_type",
+        "status",
+        "amount",
+        "exchange_rate_used",
+        "deleted_at",
+    )
+
+    def get_ledger_state(self, values=None):
+        """
+        Return the (workspace_team_id, entry_type, status, converted_amount)
+        this entry contributes to TeamLedgerBalance, or None if it does not
+        contribute (no workspace team or soft-deleted).
+
+        ``values`` maps ``LEDGER_FIELDS`` to the values to use instead of the
+        current ones, e.g. the stored ones from ``get_loaded_values()``.
+        """
+        if values is None:
+            values = {name: getattr(self, name) for name in self.LEDGER_FIELDS}
+        if not values["workspace_team_id"] or values["deleted_at"]:
+            return None
+        converted_amount = Decimal(str(values["amount"])) * Decimal(
+            str(values["exchange_rate_used"])
+        )
+        return (
+            values["workspace_team_id"],
+            values["entry_type"],
+            values["status"],
+            converted_amount,
+        )
+
     @property
     def submitter(self):
         """Return the submitter (either team member or organization member)."""
@@ -123,23 +157,181 @@ class Entry(baseModel, SoftDeleteModel):
                 "Can change other submitters entry",
             ),
         ]
+        # Composite, partial (alive rows only) indexes matching the
+        # get_entries / get_total_amount_of_entries predicates: context,
+        # entry type, status, then the keyset list ordering. Foreign keys
+        # keep their implicit single-column indexes for joins and cascades.
         indexes = [
-            # Context
-            models.Index(fields=["organization"]),
-            models.Index(fields=["workspace"]),
-            models.Index(fields=["workspace_team"]),
-            # Time
-            models.Index(fields=["occurred_at"]),
-            models.Index(fields=["status_last_updated_at"]),
-            # Status
-            models.Index(fields=["status"]),
-            # Submitters
-            models.Index(fields=["submitted_by_org_member"]),
-            models.Index(fields=["submitted_by_team_member"]),
-            # Exchange rate sources
-            models.Index(fields=["org_exchange_rate_ref"]),
-            models.Index(fields=["workspace_exchange_rate_ref"]),
+            models.Index(
+                fields=[
+                    "workspace_team",
+                    "entry_type",
+                    "status",
+                    "-occurred_at",
+                    "-entry_id",
+                ],
+                name="entry_team_feed_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            models.Index(
+                fields=[
+                    "workspace",
+                    "entry_type",
+                    "status",
+                    "-occurred_at",
+                    "-entry_id",
+                ],
+                name="entry_workspace_feed_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            models.Index(
+                fields=[
+                    "organization",
+                    "entry_type",
+                    "status",
+                    "-occurred_at",
+                    "-entry_id",
+                ],
+                name="entry_org_feed_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
         ]
 
     def __str__(self):
         return f"{self.pk} - {self.entry_type} - {self.amount} - {self.status}"
+
+
+class TeamLedgerBalance(baseModel):
+    """
+    Running converted totals (amount * exchange_rate_used) of the alive
+    entries of a workspace team, per entry type and status.
+
+    Maintained incrementally by TeamLedgerService on every entry write and
+    rebuilt from scratch with the ``rebuild_team_ledger`` command.
+    """
+
+    team_ledger_balance_id = models.UUIDField(
+        primary_key=True, default=uuid.uuid4, editable=False
+    )
+    workspace_team = models.ForeignKey(
+        WorkspaceTeam,
+        on_delete=models.CASCADE,
+        related_name="ledger_balances",
+    )
+    entry_type = models.CharField(max_length=20, choices=EntryType.choices)
+    status = models.CharField(max_length=20, choices=EntryStatus.choices)
+    total_amount = models.DecimalField(
+        max_digits=24, decimal_places=4, default=Decimal("0.0000")
+    )
+    entry_count = models.IntegerField(default=0)
+
+    class Meta:
+        verbose_name = "team ledger balance"
+        verbose_name_plural = "team ledger balances"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["workspace_team", "entry_type", "status"],
+                name="unique_team_ledger_balance",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.workspace_team_id} - {self.entry_type} - {self.status} - {self.total_amount}"
+
+
+class EntryImportJob(baseModel):
+    """
+    A CSV entry import run in the background by ``import_entries_task``.
+
+    The file is read in chunks; each chunk is inserted in its own
+    transaction together with the job's counters, so ``processed_rows``
+    always points at the first row not yet imported and a retried job
+    resumes from there.
+    """
+
+    entry_import_job_id = models.UUIDField(
+        primary_key=True, default=uuid.uuid4, editable=False
+    )
+    organization = models.ForeignKey(
+        Organization,
+        on_delete=models.CASCADE,
+        related_name="entry_import_jobs",
+    )
+    workspace = models.ForeignKey(
+        Workspace,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="entry_import_jobs",
+    )
+    workspace_team = models.ForeignKey(
+        WorkspaceTeam,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="entry_import_jobs",
+    )
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="entry_import_jobs",
+    )
+    submitted_by_org_member = models.ForeignKey(
+        OrganizationMember,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="entry_import_jobs",
+    )
+    submitted_by_team_member = models.ForeignKey(
+        TeamMember,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="entry_import_jobs",
+    )
+    file = models.FileField(upload_to="entry_imports/")
+    # Type of every imported entry; read from the file's "Type" column when empty
+    entry_type = models.CharField(
+        max_length=20, choices=EntryType.choices, null=True, blank=True
+    )
+    entry_status = models.CharField(
+        max_length=20, choices=EntryStatus.choices, default=EntryStatus.PENDING
+    )
+    status_note = models.TextField(blank=True, default="")
+    backup_description = models.CharField(max_length=255, blank=True, default="")
+    status = models.CharField(
+        max_length=20,
+        choices=EntryImportJobStatus.choices,
+        default=EntryImportJobStatus.PENDING,
+    )
+    total_rows = models.IntegerField(null=True, blank=True)
+    processed_rows = models.IntegerField(default=0)
+    imported_count = models.IntegerField(default=0)
+    error_count = models.IntegerField(default=0)
+    # [{"row": <line number>, "error": <message>}, ...]
+    errors = models.JSONField(default=list, blank=True)
+    failure_reason = models.TextField(blank=True, default="")
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "entry import job"
+        verbose_name_plural = "entry import jobs"
+
+    def __str__(self):
+        return f"{self.pk} - {self.status} - {self.processed_rows} rows"
+
+    @property
+    def is_finished(self):
+        return self.status in (
+            EntryImportJobStatus.COMPLETED,
+            EntryImportJobStatus.FAILED,
+        )
+
+    @property
+    def progress_percent(self):
+        if not self.total_rows:
+            return 100 if self.is_finished else 0
+        return min(100, self.processed_rows * 100 // self.total_rows)
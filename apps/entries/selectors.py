@@ -1,6 +1,9 @@
+import hashlib
 from typing import List
 from decimal import Decimal
 
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, ValidationError
 from django.db.models import Q, Count, QuerySet, F, Sum, DecimalField, ExpressionWrapper
 from django.shortcuts import get_object_or_404
 
@@ -9,8 +12,13 @@ from apps.organizations.models import (
 )
 from apps.workspaces.models import Workspace, WorkspaceTeam
 
-from .constants import EntryStatus, EntryType
-from .models import Entry
+from .constants import (
+    ENTRY_COUNT_CACHE_TIMEOUT,
+    ENTRY_LIST_ORDERING,
+    EntryStatus,
+    EntryType,
+)
+from .models import Entry, EntryImportJob, TeamLedgerBalance
 
 
 # Selectors for Services and Views
@@ -110,7 +118,35 @@ def get_entries(
         "last_status_modified_by__user",
     )
 
-    return queryset.order_by("-occurred_at")
+    return queryset.order_by(*ENTRY_LIST_ORDERING)
+
+
+def get_entry_count_version_key(organization_id) -> str:
+    return f"entries:count_version:{organization_id}"
+
+
+def get_cached_entry_count(*, queryset: QuerySet, organization_id) -> int:
+    """
+    Count ``queryset`` once and cache the total per distinct query.
+
+    Cache keys embed the organization's entry count version, which entry
+    writes bump, so every cached total for the organization is invalidated
+    together.
+    """
+    try:
+        sql = str(queryset.query)
+    except EmptyResultSet:
+        return 0
+
+    version = cache.get(get_entry_count_version_key(organization_id), 0)
+    digest = hashlib.md5(sql.encode()).hexdigest()
+    cache_key = f"entries:count:{organization_id}:{version}:{digest}"
+
+    count = cache.get(cache_key)
+    if count is None:
+        count = queryset.count()
+        cache.set(cache_key, count, ENTRY_COUNT_CACHE_TIMEOUT)
+    return count
 
 
 def get_total_amount_of_entries(
@@ -148,6 +184,92 @@ def get_total_amount_of_entries(
     return total or Decimal("0.00")
 
 
+def get_team_ledger_total(
+    *,
+    entry_type: EntryType,
+    entry_status: EntryStatus,
+    workspace_team: WorkspaceTeam,
+) -> Decimal:
+    """
+    Get the total converted amount of a workspace team's entries for an entry
+    type and status from the materialized TeamLedgerBalance row.
+    """
+    total = (
+        TeamLedgerBalance.objects.filter(
+            workspace_team=workspace_team, entry_type=entry_type, status=entry_status
+        )
+        .values_list("total_amount", flat=True)
+        .first()
+    )
+    return total or Decimal("0.00")
+
+
+def get_team_ledger_totals(
+    *,
+    entry_status: EntryStatus,
+    entry_types: List[str],
+    organization_id=None,
+    workspace_id=None,
+    workspace_team_ids=None,
+) -> dict:
+    """
+    Get materialized team totals keyed by (workspace_team_id, entry_type)
+    for every workspace team in the given scope.
+    """
+    queryset = TeamLedgerBalance.objects.filter(
+        status=entry_status, entry_type__in=entry_types
+    )
+    if organization_id:
+        queryset = queryset.filter(
+            workspace_team__workspace__organization_id=organization_id
+        )
+    if workspace_id:
+        queryset = queryset.filter(workspace_team__workspace_id=workspace_id)
+    if workspace_team_ids is not None:
+        queryset = queryset.filter(workspace_team_id__in=workspace_team_ids)
+
+    return {
+        (workspace_team_id, entry_type): total_amount
+        for workspace_team_id, entry_type, total_amount in queryset.values_list(
+            "workspace_team_id", "entry_type", "total_amount"
+        )
+    }
+
+
+def get_team_entry_totals(*, entries: QuerySet = None, workspace_team_ids=None) -> dict:
+    """
+    Aggregate alive team entries straight from the entry table, keyed by
+    (workspace_team_id, entry_type, status) -> (total_amount, entry_count).
+
+    This is the source of truth TeamLedgerBalance is rebuilt and checked from.
+    """
+    queryset = entries if entries is not None else Entry.objects.all()
+    queryset = queryset.filter(workspace_team__isnull=False)
+    if workspace_team_ids is not None:
+        queryset = queryset.filter(workspace_team_id__in=workspace_team_ids)
+
+    rows = (
+        queryset.values("workspace_team_id", "entry_type", "status")
+        .annotate(
+            total=Sum(
+                ExpressionWrapper(
+                    F("amount") * F("exchange_rate_used"),
+                    output_field=DecimalField(max_digits=24, decimal_places=4),
+                )
+            ),
+            count=Count("pk"),
+        )
+        .order_by()
+    )
+    return {
+        (row["workspace_team_id"], row["entry_type"], row["status"]): (
+            row["total"] or Decimal("0.00"),
+            row["count"],
+        )
+        for row in rows
+    }
+
+
 def get_entry(pk, required_attachment_count=False):
     queryset = Entry.objects.all()
     if required_attachment_count:
@@ -157,3 +279,16 @@ def get_entry(pk, required_attachment_count=False):
             )
         )
     return get_object_or_404(queryset, pk=pk)
+
+
+def get_entry_import_job(*, import_job_id, organization, user):
+    """
+    Return an import job started by ``user`` in ``organization``, or None
+    for unknown or malformed ids.
+    """
+    try:
+        return EntryImportJob.objects.filter(
+            pk=import_job_id, organization=organization, created_by=user
+        ).first()
+    except ValidationError:
+        return None
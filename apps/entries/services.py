@@ -1,20 +1,57 @@
-from datetime import date
+import csv
+import io
+import time
+from datetime import date, datetime
+from itertools import islice
+from decimal import Decimal
 
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models import (
+    BooleanField,
+    Case,
+    Count,
+    DecimalField,
+    Exists,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Sum,
+    UUIDField,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from apps.attachments.services import create_attachments, replace_or_append_attachments
 from apps.auditlog.business_logger import BusinessAuditLogger
+from apps.auditlog.config import AuditConfig
+from apps.auditlog.constants import AuditActionType
+from apps.auditlog.services import audit_create_bulk, audit_create_bulk_summary
 from apps.core.utils import handle_service_errors
 from apps.currencies.models import Currency
-from apps.currencies.selectors import get_closest_exchanged_rate, get_currency_by_code
+from apps.currencies.selectors import RateResolver
 from apps.entries.exceptions import EntryServiceError
+from apps.entries.validators import EntryCSVValidator
 from apps.organizations.models import Organization, OrganizationExchangeRate
+from apps.remittance.services import RemittanceService
 from apps.workspaces.models import Workspace, WorkspaceExchangeRate, WorkspaceTeam
 
-from .constants import EntryStatus, EntryType
-from .models import Entry
+from .constants import (
+    ENTRY_IMPORT_BATCH_SIZE,
+    ENTRY_IMPORT_CHUNK_SIZE,
+    ENTRY_IMPORT_MAX_ERRORS,
+    EntryImportJobStatus,
+    EntryStatus,
+    EntryType,
+)
+from .models import Entry, EntryImportJob, TeamLedgerBalance
+from .selectors import get_entry_count_version_key, get_team_entry_totals
 
 
 class EntryService:
@@ -34,17 +71,23 @@ class EntryService:
         status: EntryStatus = EntryStatus.PENDING,
         status_note="",
         status_last_modified_at=timezone.now(),
+        rate_resolver: RateResolver = None,
     ):
+        # Share one preloaded resolver across rows when building entries in bulk
+        if rate_resolver is None:
+            rate_resolver = RateResolver(
+                organization=organization,
+                workspace=workspace,
+                currency_codes=[currency_code],
+            )
         # Get Currency by code
-        currency = get_currency_by_code(currency_code)
+        currency = rate_resolver.get_currency(currency_code)
         if not currency:
             return None
         # Get the closest exchange rate
-        exchange_rate_used = get_closest_exchanged_rate(
+        exchange_rate_used = rate_resolver.get_closest_rate(
             currency=currency,
             occurred_at=occurred_at,
-            organization=organization,
-            workspace=workspace,
         )
         if not exchange_rate_used:
             return None
@@ -81,7 +124,85 @@ class EntryService:
     @staticmethod
     @handle_service_errors(EntryServiceError)
     def bulk_create_entry(*, entries: list[Entry]):
-        return Entry.objects.bulk_create(entries)
+        with transaction.atomic():
+            created_entries = Entry.objects.bulk_create(entries)
+            TeamLedgerService.apply_entry_changes(entries=created_entries, created=True)
+            EntryService.invalidate_entry_counts(
+                organization_ids={entry.organization_id for entry in created_entries}
+            )
+        return created_entries
+
+    @staticmethod
+    @handle_service_errors(EntryServiceError)
+    def bulk_import_entries(
+        *, entries: list[Entry], user=None, source="csv_import"
+    ) -> list[Entry]:
+        """
+        Import many entries without per-row signals: the entries are inserted
+        in chunks and added to the team ledger, audited with one bulk insert
+        (a summary record plus one record per entry) and the remittances of
+        every affected workspace team are resynced in one set-based pass.
+        """
+        if not entries:
+            return []
+
+        with transaction.atomic():
+            created_entries = Entry.objects.bulk_create(
+                entries, batch_size=ENTRY_IMPORT_BATCH_SIZE
+            )
+            TeamLedgerService.apply_entry_changes(entries=created_entries, created=True)
+
+            audit_create_bulk(
+                user=user,
+                action_type=AuditActionType.ENTRY_CREATED,
+                target_entities=created_entries,
+                metadata_for=lambda entry: {
+                    "operation_type": "create",
+                    "source": source,
+                    "entry_type": entry.entry_type,
+                    "amount": str(entry.amount),
+                    "currency": entry.currency.code,
+                    "status": entry.status,
+                },
+                summary_metadata={
+                    "operation_type": "bulk_entry_import",
+                    "source": source,
+                    "entry_types": sorted(
+                        {entry.entry_type for entry in created_entries}
+                    ),
+                },
+            )
+
+            workspace_team_ids = {
+                entry.workspace_team_id
+                for entry in created_entries
+                if entry.workspace_team_id
+            }
+            if workspace_team_ids:
+                RemittanceService.bulk_sync_remittance(
+                    workspace_teams=WorkspaceTeam.objects.filter(
+                        pk__in=workspace_team_ids
+                    )
+                )
+
+            EntryService.invalidate_entry_counts(
+                organization_ids={entry.organization_id for entry in created_entries}
+            )
+        return created_entries
+
+    @staticmethod
+    def invalidate_entry_counts(*, organization_ids):
+        """
+        Bump the entry count version of each organization once the current
+        transaction commits, so cached entry list totals are recounted.
+        """
+
+        def bump_versions():
+            version = time.time_ns()
+            for organization_id in set(organization_ids):
+                cache.set(get_entry_count_version_key(organization_id), version, None)
+
+        transaction.on_commit(bump_versions)
 
     @staticmethod
     @handle_service_errors(EntryServiceError)
@@ -108,11 +229,13 @@ class EntryService:
         is_attachment_provided = True if attachments else False
 
         # Get the closest exchange rate
-        exchange_rate_used = get_closest_exchanged_rate(
-            currency=currency,
-            occurred_at=occurred_at if occurred_at else date.today(),
+        exchange_rate_used = RateResolver(
             organization=organization,
             workspace=workspace,
+            currency_codes=[currency.code],
+        ).get_closest_rate(
+            currency=currency,
+            occurred_at=occurred_at if occurred_at else date.today(),
         )
         if not exchange_rate_used:
             raise ValueError(
@@ -189,11 +312,13 @@ class EntryService:
         # If changed, update exchange_rate_used, org_exchange_rate_ref, workspace_exchange_rate_ref
         new_exchange_rate_used = None
         if is_currency_changed or is_occurred_at_changed:
-            new_exchange_rate_used = get_closest_exchanged_rate(
-                currency=currency,
-                occurred_at=occurred_at,
+            new_exchange_rate_used = RateResolver(
                 organization=organization,
                 workspace=workspace,
+                currency_codes=[currency.code],
+            ).get_closest_rate(
+                currency=currency,
+                occurred_at=occurred_at,
             )
             if not new_exchange_rate_used:
                 raise ValueError(
@@ -268,7 +393,8 @@ class EntryService:
         entry.status_note = status_note
         entry.last_status_modified_by = last_status_modified_by
         entry.status_last_updated_at = timezone.now()
-        entry.save()
+        with transaction.atomic():
+            entry.save()
 
         # Log status change with rich context
         BusinessAuditLogger.log_status_change(
@@ -286,15 +412,20 @@ class EntryService:
     @staticmethod
     @handle_service_errors(EntryServiceError)
     def bulk_update_entry_status(*, entries: list[Entry], request=None):
-        Entry.objects.bulk_update(
-            entries,
-            [
-                "status",
-                "status_note",
-                "last_status_modified_by",
-                "status_last_updated_at",
-            ],
-        )
+        with transaction.atomic():
+            Entry.objects.bulk_update(
+                entries,
+                [
+                    "status",
+                    "status_note",
+                    "last_status_modified_by",
+                    "status_last_updated_at",
+                ],
+            )
+            TeamLedgerService.apply_entry_changes(entries=entries)
+            EntryService.invalidate_entry_counts(
+                organization_ids={entry.organization_id for entry in entries}
+            )
         return entries
 
     @staticmethod
@@ -330,5 +461,601 @@ class EntryService:
     @staticmethod
     @handle_service_errors(EntryServiceError)
     def bulk_delete_entries(*, entries: list[Entry], user=None, request=None):
-        entries.delete()
+        with transaction.atomic():
+            TeamLedgerService.remove_entries(queryset=entries)
+            EntryService.invalidate_entry_counts(
+                organization_ids=set(
+                    entries.values_list("organization_id", flat=True).distinct()
+                )
+            )
+            entries.delete()
         return entries
+
+
+class TeamLedgerService:
+    """
+    Keeps TeamLedgerBalance in step with entry writes by applying the
+    difference between an entry's previous and current ledger contribution,
+    so a write costs the same regardless of how many entries a team has.
+    """
+
+    @staticmethod
+    def _add_delta(deltas: dict, state, sign: int):
+        if state is None:
+            return
+        workspace_team_id, entry_type, status, converted_amount = state
+        key = (workspace_team_id, entry_type, status)
+        amount, count = deltas.get(key, (Decimal("0.00"), 0))
+        deltas[key] = (amount + sign * converted_amount, count + sign)
+
+    @staticmethod
+    @handle_service_errors(EntryServiceError)
+    def apply_deltas(*, deltas: dict, create_missing: bool = True):
+        """
+        Add ``{(workspace_team_id, entry_type, status): (amount, count)}``
+        deltas to their ledger rows.
+
+        Rows that do not exist yet are created unless ``create_missing`` is
+        False, which removals pass: a missing row there means the team's
+        ledger is already gone (e.g. a delete cascading from the team), and
+        creating one would point a negative balance at the team being deleted.
+        """
+        with transaction.atomic():
+            TeamLedgerService._apply_deltas(deltas, create_missing)
+
+    @staticmethod
+    def _apply_deltas(deltas: dict, create_missing: bool):
+        for (workspace_team_id, entry_type, status), (amount, count) in deltas.items():
+            if not amount and not count:
+                continue
+            lookup = {
+                "workspace_team_id": workspace_team_id,
+                "entry_type": entry_type,
+                "status": status,
+            }
+            updated = TeamLedgerBalance.objects.filter(**lookup).update(
+                total_amount=F("total_amount") + amount,
+                entry_count=F("entry_count") + count,
+                updated_at=timezone.now(),
+            )
+            if updated or not create_missing:
+                continue
+            try:
+                with transaction.atomic():
+                    TeamLedgerBalance.objects.create(
+                        **lookup, total_amount=amount, entry_count=count
+                    )
+            except IntegrityError:
+                # A concurrent writer created the row first
+                TeamLedgerBalance.objects.filter(**lookup).update(
+                    total_amount=F("total_amount") + amount,
+                    entry_count=F("entry_count") + count,
+                    updated_at=timezone.now(),
+                )
+
+    @staticmethod
+    @handle_service_errors(EntryServiceError)
+    def apply_entry_changes(*, entries: list[Entry], created: bool = False):
+        """
+        Apply saved entries to the ledger; ``created`` marks entries that were
+        just inserted and so had no previous contribution.
+
+        The previous contribution of an updated entry is computed from the
+        values it was loaded with (see ``TrackedFieldsMixin``). Teams of
+        entries whose previous state is unknown (deferred fields, or no
+        snapshot at all) are rebuilt.
+        """
+        deltas = {}
+        teams_to_rebuild = set()
+        with transaction.atomic():
+            for entry in entries:
+                if created:
+                    TeamLedgerService._add_delta(deltas, entry.get_ledger_state(), 1)
+                    entry.snapshot_loaded_values()
+                    continue
+
+                loaded = entry.get_loaded_values(Entry.LEDGER_FIELDS)
+                if loaded is None:
+                    if entry.workspace_team_id:
+                        teams_to_rebuild.add(entry.workspace_team_id)
+                else:
+                    TeamLedgerService._add_delta(
+                        deltas, entry.get_ledger_state(loaded), -1
+                    )
+                    TeamLedgerService._add_delta(deltas, entry.get_ledger_state(), 1)
+                # Bulk writes skip ``save()``, so record the applied state here
+                # to keep a later change from being counted twice
+                entry.snapshot_loaded_values(update_fields=Entry.LEDGER_FIELDS)
+
+            TeamLedgerService.apply_deltas(deltas=deltas)
+            if teams_to_rebuild:
+                TeamLedgerService.rebuild(workspace_team_ids=teams_to_rebuild)
+
+    @staticmethod
+    @handle_service_errors(EntryServiceError)
+    def apply_entry_removal(*, entries: list[Entry]):
+        """
+        Remove hard-deleted entries from the ledger.
+        """
+        deltas = {}
+        for entry in entries:
+            loaded = entry.get_loaded_values(Entry.LEDGER_FIELDS)
+            TeamLedgerService._add_delta(deltas, entry.get_ledger_state(loaded), -1)
+
+        TeamLedgerService.apply_deltas(deltas=deltas, create_missing=False)
+
+    @staticmethod
+    @handle_service_errors(EntryServiceError)
+    def remove_entries(*, queryset):
+        """
+        Remove the entries of a queryset from the ledger before it is
+        (soft) deleted in bulk, which bypasses model signals.
+        """
+        totals = get_team_entry_totals(entries=queryset)
+        deltas = {key: (-total, -count) for key, (total, count) in totals.items()}
+        TeamLedgerService.apply_deltas(deltas=deltas, create_missing=False)
+
+    @staticmethod
+    @handle_service_errors(EntryServiceError)
+    def rebuild(*, workspace_team_ids=None) -> int:
+        """
+        Rebuild ledger rows from the entry table, for the given workspace
+        teams or for every team when none are given.
+        """
+        totals = get_team_entry_totals(workspace_team_ids=workspace_team_ids)
+        with transaction.atomic():
+            stale_rows = TeamLedgerBalance.objects.all()
+            if workspace_team_ids is not None:
+                stale_rows = stale_rows.filter(workspace_team_id__in=workspace_team_ids)
+            stale_rows.delete()
+            TeamLedgerBalance.objects.bulk_create(
+                [
+                    TeamLedgerBalance(
+                        workspace_team_id=workspace_team_id,
+                        entry_type=entry_type,
+                        status=status,
+                        total_amount=total,
+                        entry_count=count,
+                    )
+                    for (workspace_team_id, entry_type, status), (
+                        total,
+                        count,
+                    ) in totals.items()
+                ]
+            )
+        return len(totals)
+
+    @staticmethod
+    def find_drift(*, workspace_team_ids=None) -> list[dict]:
+        """
+        Compare ledger rows against the entry table and return every
+        (workspace team, entry type, status) whose totals disagree.
+        """
+        expected = get_team_entry_totals(workspace_team_ids=workspace_team_ids)
+        ledger_rows = TeamLedgerBalance.objects.all()
+        if workspace_team_ids is not None:
+            ledger_rows = ledger_rows.filter(workspace_team_id__in=workspace_team_ids)
+        actual = {
+            (row.workspace_team_id, row.entry_type, row.status): (
+                row.total_amount,
+                row.entry_count,
+            )
+            for row in ledger_rows
+        }
+
+        drift = []
+        for key in expected.keys() | actual.keys():
+            expected_total, expected_count = expected.get(key, (Decimal("0.00"), 0))
+            actual_total, actual_count = actual.get(key, (Decimal("0.00"), 0))
+            if expected_total != actual_total or expected_count != actual_count:
+                workspace_team_id, entry_type, status = key
+                drift.append(
+                    {
+                        "workspace_team_id": workspace_team_id,
+                        "entry_type": entry_type,
+                        "status": status,
+                        "expected_total": expected_total,
+                        "actual_total": actual_total,
+                        "expected_count": expected_count,
+                        "actual_count": actual_count,
+                    }
+                )
+        return drift
+
+
+class EntryRerateService:
+    """
+    Re-rate pending entries after an exchange rate is created, approved or
+    deleted, so their ``exchange_rate_used`` and rate refs follow the rate
+    ``get_closest_exchanged_rate`` would pick today.
+
+    The closest workspace and organization rates are correlated subqueries
+    on the entry row, so finding the stale entries is one query and fixing
+    them is one UPDATE.
+    """
+
+    @staticmethod
+    def _closest_rates():
+        workspace_rates = WorkspaceExchangeRate.objects.filter(
+            workspace_id=OuterRef("workspace_id"),
+            currency_id=OuterRef("currency_id"),
+            effective_date__lte=OuterRef("occurred_at"),
+            is_approved=True,
+        ).order_by("-effective_date")
+        organization_rates = OrganizationExchangeRate.objects.filter(
+            organization_id=OuterRef("organization_id"),
+            currency_id=OuterRef("currency_id"),
+            effective_date__lte=OuterRef("occurred_at"),
+        ).order_by("-effective_date")
+        return workspace_rates, organization_rates
+
+    @staticmethod
+    def _rerate_values() -> dict:
+        """
+        Expressions for the new rate columns of an entry, with workspace rates
+        taking precedence over organization rates.
+        """
+        workspace_rates, organization_rates = EntryRerateService._closest_rates()
+        return {
+            "exchange_rate_used": Coalesce(
+                Subquery(workspace_rates.values("rate")[:1]),
+                Subquery(organization_rates.values("rate")[:1]),
+                output_field=DecimalField(max_digits=10, decimal_places=2),
+            ),
+            "workspace_exchange_rate_ref": Subquery(workspace_rates.values("pk")[:1]),
+            "org_exchange_rate_ref": Case(
+                When(Exists(workspace_rates), then=Value(None)),
+                default=Subquery(organization_rates.values("pk")[:1]),
+                output_field=UUIDField(),
+            ),
+        }
+
+    @staticmethod
+    def get_stale_entries(
+        *, organization_id, currency_id, workspace_id=None, occurred_from=None
+    ) -> QuerySet:
+        """
+        Pending entries whose closest rate differs from the one they were
+        stored with, annotated with ``new_rate``, ``new_workspace_rate_id``
+        and ``new_org_rate_id``. Entries without any rate are left alone.
+        """
+        values = EntryRerateService._rerate_values()
+        queryset = Entry.objects.filter(
+            organization_id=organization_id,
+            currency_id=currency_id,
+            status=EntryStatus.PENDING,
+        )
+        if workspace_id is not None:
+            queryset = queryset.filter(workspace_id=workspace_id)
+        if occurred_from is not None:
+            queryset = queryset.filter(occurred_at__gte=occurred_from)
+
+        unchanged = (
+            Q(exchange_rate_used=F("new_rate"))
+            & (
+                Q(workspace_exchange_rate_ref=F("new_workspace_rate_id"))
+                | Q(
+                    workspace_exchange_rate_ref__isnull=True,
+                    new_workspace_rate_id__isnull=True,
+                )
+            )
+            & (
+                Q(org_exchange_rate_ref=F("new_org_rate_id"))
+                | Q(org_exchange_rate_ref__isnull=True, new_org_rate_id__isnull=True)
+            )
+        )
+        return (
+            queryset.annotate(
+                new_rate=values["exchange_rate_used"],
+                new_workspace_rate_id=values["workspace_exchange_rate_ref"],
+                new_org_rate_id=values["org_exchange_rate_ref"],
+            )
+            .annotate(
+                is_unchanged=Case(
+                    When(unchanged, then=Value(True)),
+                    default=Value(False),
+                    output_field=BooleanField(),
+                )
+            )
+            .filter(new_rate__isnull=False, is_unchanged=False)
+        )
+
+    @staticmethod
+    def _get_deltas(stale_entries: QuerySet) -> dict:
+        """
+        Converted amount change of the stale entries, keyed by
+        (workspace_team_id, entry_type, status) -> (before, after, count).
+        """
+        converted_field = DecimalField(max_digits=24, decimal_places=4)
+        rows = (
+            stale_entries.values("workspace_team_id", "entry_type", "status")
+            .annotate(
+                before=Sum(
+                    ExpressionWrapper(
+                        F("amount") * F("exchange_rate_used"),
+                        output_field=converted_field,
+                    )
+                ),
+                after=Sum(
+                    ExpressionWrapper(
+                        F("amount") * F("new_rate"), output_field=converted_field
+                    )
+                ),
+                count=Count("pk"),
+            )
+            .order_by()
+        )
+        return {
+            (row["workspace_team_id"], row["entry_type"], row["status"]): (
+                row["before"] or Decimal("0.00"),
+                row["after"] or Decimal("0.00"),
+                row["count"],
+            )
+            for row in rows
+        }
+
+    @staticmethod
+    @handle_service_errors(EntryServiceError)
+    def rerate_entries(
+        *,
+        organization_id,
+        currency_id,
+        workspace_id=None,
+        occurred_from=None,
+        user=None,
+        dry_run=False,
+    ) -> dict:
+        """
+        Re-rate the stale pending entries of an organization (or of one
+        workspace) in one currency, then update the ledger and resync the
+        affected remittances.
+
+        Returns the number of re-rated entries with their converted totals
+        before and after. With ``dry_run`` nothing is written.
+        """
+        with transaction.atomic():
+            stale_entries = EntryRerateService.get_stale_entries(
+                organization_id=organization_id,
+                currency_id=currency_id,
+                workspace_id=workspace_id,
+                occurred_from=occurred_from,
+            )
+            deltas = EntryRerateService._get_deltas(stale_entries)
+            before = sum((before for before, _, _ in deltas.values()), Decimal("0"))
+            after = sum((after for _, after, _ in deltas.values()), Decimal("0"))
+            report = {
+                "dry_run": dry_run,
+                "entry_count": sum(count for _, _, count in deltas.values()),
+                "converted_total_before": before,
+                "converted_total_after": after,
+                "converted_total_delta": after - before,
+            }
+            if dry_run or not deltas:
+                return report
+
+            sample_ids = list(
+                stale_entries.values_list("pk", flat=True)[
+                    : AuditConfig.BULK_OPERATION_THRESHOLD
+                ]
+            )
+            updated = Entry.objects.filter(pk__in=stale_entries.values("pk")).update(
+                **EntryRerateService._rerate_values(), updated_at=timezone.now()
+            )
+
+            # The UPDATE skips entry signals, so apply the ledger change here
+            TeamLedgerService.apply_deltas(
+                deltas={
+                    key: (after - before, 0)
+                    for key, (before, after, _) in deltas.items()
+                    if key[0] is not None
+                }
+            )
+            workspace_team_ids = {key[0] for key in deltas if key[0] is not None}
+            if workspace_team_ids:
+                RemittanceService.bulk_sync_remittance(
+                    workspace_teams=WorkspaceTeam.objects.filter(
+                        pk__in=workspace_team_ids
+                    )
+                )
+
+            audit_create_bulk_summary(
+                user=user,
+                model_class=Entry,
+                affected_count=updated,
+                affected_ids=sample_ids,
+                organization_id=organization_id,
+                workspace_id=workspace_id,
+                metadata={
+                    "operation_type": "entry_rerate",
+                    "currency_id": str(currency_id),
+                    "converted_total_delta": str(report["converted_total_delta"]),
+                },
+            )
+        report["entry_count"] = updated
+        return report
+
+    @staticmethod
+    def schedule_rerate(*, exchange_rate, user=None):
+        """
+        Queue a re-rate of the entries an exchange rate can apply to once the
+        current transaction commits.
+        """
+        from apps.entries.tasks import rerate_entries_task
+
+        if isinstance(exchange_rate, WorkspaceExchangeRate):
+            organization_id = exchange_rate.workspace.organization_id
+            workspace_id = str(exchange_rate.workspace_id)
+        else:
+            organization_id = exchange_rate.organization_id
+            workspace_id = None
+        occurred_from = exchange_rate.effective_date
+        if isinstance(occurred_from, datetime):
+            occurred_from = occurred_from.date()
+        kwargs = {
+            "organization_id": str(organization_id),
+            "currency_id": str(exchange_rate.currency_id),
+            "workspace_id": workspace_id,
+            "occurred_from": occurred_from.isoformat(),
+            "user_id": str(user.pk) if user else None,
+        }
+        transaction.on_commit(lambda: rerate_entries_task.delay(**kwargs))
+
+
+class EntryImportService:
+    """
+    Imports a CSV of entries in the background. The file is streamed in
+    chunks of ``ENTRY_IMPORT_CHUNK_SIZE`` rows and each chunk is inserted
+    with ``EntryService.bulk_import_entries`` in its own transaction, along
+    with the job's progress and row errors.
+    """
+
+    @staticmethod
+    @handle_service_errors(EntryServiceError)
+    def start_import(
+        *,
+        file,
+        organization: Organization,
+        workspace: Workspace = None,
+        workspace_team: WorkspaceTeam = None,
+        submitted_by_org_member=None,
+        submitted_by_team_member=None,
+        user=None,
+        entry_type: EntryType = None,
+        entry_status: EntryStatus = EntryStatus.PENDING,
+        status_note="",
+        backup_description="",
+    ) -> EntryImportJob:
+        """
+        Store the uploaded file on a new import job and queue the job once
+        the current transaction commits.
+        """
+        from apps.entries.tasks import import_entries_task
+
+        job = EntryImportJob.objects.create(
+            file=file,
+            organization=organization,
+            workspace=workspace,
+            workspace_team=workspace_team,
+            created_by=user,
+            submitted_by_org_member=submitted_by_org_member,
+            submitted_by_team_member=submitted_by_team_member,
+            entry_type=entry_type,
+            entry_status=entry_status,
+            status_note=status_note or "",
+            backup_description=backup_description or "",
+        )
+        transaction.on_commit(lambda: import_entries_task.delay(str(job.pk)))
+        return job
+
+    @staticmethod
+    def _count_rows(job: EntryImportJob) -> int:
+        with job.file.open("rb"):
+            data = io.TextIOWrapper(job.file.file, encoding="utf-8", newline="")
+            return sum(1 for _ in csv.DictReader(data))
+
+    @staticmethod
+    def _build_entries(job: EntryImportJob, rows, rate_resolver: RateResolver):
+        entries, errors = [], []
+        for row_number, row, error in rows:
+            description = row.get("Description") or job.backup_description
+            if error is None and not description:
+                error = "Missing Description"
+            if error is None:
+                entry = EntryService.build_entry(
+                    currency_code=row["Currency"],
+                    amount=row["Amount"],
+                    occurred_at=row["Occurred At"],
+                    description=description,
+                    entry_type=job.entry_type or row["Type"],
+                    organization=job.organization,
+                    workspace=job.workspace,
+                    workspace_team=job.workspace_team,
+                    submitted_by_org_member=job.submitted_by_org_member,
+                    submitted_by_team_member=job.submitted_by_team_member,
+                    status=job.entry_status,
+                    status_note=job.status_note,
+                    status_last_modified_at=timezone.now(),
+                    rate_resolver=rate_resolver,
+                )
+                if entry is not None:
+                    entries.append(entry)
+                    continue
+                error = (
+                    f"Unknown currency or no exchange rate for {row['Currency']} "
+                    f"on {row['Occurred At']}"
+                )
+            errors.append({"row": row_number, "error": error})
+        return entries, errors
+
+    @staticmethod
+    def run_import(*, job_id) -> EntryImportJob:
+        """
+        Import the remaining rows of a job, resuming after the last committed
+        chunk. A failed chunk is rolled back and fails the job; running it
+        again picks up at the same row.
+        """
+        job = (
+            EntryImportJob.objects.select_related(
+                "organization",
+                "workspace",
+                "workspace_team",
+                "created_by",
+                "submitted_by_org_member",
+                "submitted_by_team_member",
+            )
+            .filter(pk=job_id)
+            .first()
+        )
+        if job is None or job.status == EntryImportJobStatus.COMPLETED:
+            return job
+
+        job.status = EntryImportJobStatus.RUNNING
+        job.failure_reason = ""
+        if job.total_rows is None:
+            job.total_rows = EntryImportService._count_rows(job)
+        job.save(update_fields=["status", "failure_reason", "total_rows", "updated_at"])
+
+        # One resolver for the whole file; it loads each currency's rates once
+        rate_resolver = RateResolver(
+            organization=job.organization, workspace=job.workspace
+        )
+        try:
+            with job.file.open("rb"):
+                rows = EntryCSVValidator(job.file).iter_rows(
+                    verify_team_level_type=not job.entry_type,
+                    start=job.processed_rows,
+                )
+                while chunk := list(islice(rows, ENTRY_IMPORT_CHUNK_SIZE)):
+                    entries, errors = EntryImportService._build_entries(
+                        job, chunk, rate_resolver
+                    )
+                    with transaction.atomic():
+                        EntryService.bulk_import_entries(
+                            entries=entries, user=job.created_by
+                        )
+                        job.processed_rows += len(chunk)
+                        job.imported_count += len(entries)
+                        job.error_count += len(errors)
+                        job.errors = (job.errors + errors)[:ENTRY_IMPORT_MAX_ERRORS]
+                        job.save(
+                            update_fields=[
+                                "processed_rows",
+                                "imported_count",
+                                "error_count",
+                                "errors",
+                                "updated_at",
+                            ]
+                        )
+        except Exception as e:
+            job.status = EntryImportJobStatus.FAILED
+            job.failure_reason = str(e)
+            job.finished_at = timezone.now()
+            job.save(
+                update_fields=["status", "failure_reason", "finished_at", "updated_at"]
+            )
+            raise
+
+        job.status = EntryImportJobStatus.COMPLETED
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "finished_at", "updated_at"])
+        return job
@@ -2,11 +2,38 @@ from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from .models import Entry
 from .constants import EntryType, EntryStatus
+from .services import EntryService, TeamLedgerService
 from apps.remittance.services import (
     RemittanceService,
 )
 
 
+# NOTE: Ledger receivers are registered before the remittance ones so that
+# remittance syncing reads the already updated TeamLedgerBalance rows.
+@receiver(post_save, sender=Entry)
+def keep_team_ledger_updated_with_entry(
+    sender, instance: Entry, created, update_fields=None, **kwargs
+):
+    # Saves that write none of the ledger fields leave the ledger as it is
+    if update_fields is not None and not any(
+        Entry._meta.get_field(name).attname in Entry.LEDGER_FIELDS
+        for name in update_fields
+    ):
+        return
+    TeamLedgerService.apply_entry_changes(entries=[instance], created=created)
+
+
+@receiver(post_delete, sender=Entry)
+def revert_team_ledger_on_entry_delete(sender, instance: Entry, **kwargs):
+    TeamLedgerService.apply_entry_removal(entries=[instance])
+
+
+@receiver(post_save, sender=Entry)
+@receiver(post_delete, sender=Entry)
+def invalidate_entry_counts_on_entry_write(sender, instance: Entry, **kwargs):
+    EntryService.invalidate_entry_counts(organization_ids=[instance.organization_id])
+
+
 @receiver(post_save, sender=Entry)
 def keep_remittance_updated_with_entry(sender, instance: Entry, created, **kwargs):
     # Prevent Remittance Process on Expense entry types
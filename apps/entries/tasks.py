@@ -0,0 +1,61 @@
+import logging
+from datetime import date
+from typing import Optional
+
+from celery import shared_task
+from django.contrib.auth import get_user_model
+
+from apps.entries.services import EntryImportService, EntryRerateService
+
+logger = logging.getLogger(__name__)
+User = get_user_model()
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(ConnectionError, TimeoutError),
+    retry_kwargs={"max_retries": 2},
+)
+def rerate_entries_task(
+    self,
+    organization_id: str,
+    currency_id: str,
+    workspace_id: Optional[str] = None,
+    occurred_from: Optional[str] = None,
+    user_id: Optional[str] = None,
+    dry_run: bool = False,
+) -> dict:
+    """Re-rate stale pending entries after an exchange rate change."""
+    user = User.objects.filter(pk=user_id).first() if user_id else None
+    report = EntryRerateService.rerate_entries(
+        organization_id=organization_id,
+        currency_id=currency_id,
+        workspace_id=workspace_id,
+        occurred_from=date.fromisoformat(occurred_from) if occurred_from else None,
+        user=user,
+        dry_run=dry_run,
+    )
+    logger.info(
+        f"Re-rated {report['entry_count']} entries of organization "
+        f"{organization_id} (delta {report['converted_total_delta']})"
+    )
+    # Decimals are not JSON serializable for the result backend
+    return {key: str(value) for key, value in report.items()}
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(ConnectionError, TimeoutError),
+    retry_kwargs={"max_retries": 2},
+)
+def import_entries_task(self, job_id: str) -> Optional[str]:
+    """Import a CSV entry import job, resuming after its last committed chunk."""
+    job = EntryImportService.run_import(job_id=job_id)
+    if job is None:
+        logger.warning(f"Entry import job {job_id} not found")
+        return None
+    logger.info(
+        f"Entry import job {job_id} {job.status}: {job.imported_count} imported, "
+        f"{job.error_count} rows with errors"
+    )
+    return job.status
@@ -1,3 +1,4 @@
+from apps.core.object_permissions import has_object_perm
 from apps.core.permissions import (
     OrganizationPermissions,
     WorkspacePermissions,
@@ -11,64 +12,66 @@ def can_view_org_expense(user, organization):
     """
     Returns True if the user has the permission to view the organization expense.
     """
-    return user.has_perm(OrganizationPermissions.VIEW_ORG_ENTRY, organization)
+    return has_object_perm(user, OrganizationPermissions.VIEW_ORG_ENTRY, organization)
 
 
 def can_add_org_expense(user, organization):
     """
     Returns True if the user has the permission to add the organization expense.
     """
-    return user.has_perm(OrganizationPermissions.ADD_ORG_ENTRY, organization)
+    return has_object_perm(user, OrganizationPermissions.ADD_ORG_ENTRY, organization)
 
 
 def can_update_org_expense(user, organization):
     """
     Returns True if the user has the permission to update the organization expense.
     """
-    return user.has_perm(OrganizationPermissions.CHANGE_ORG_ENTRY, organization)
+    return has_object_perm(user, OrganizationPermissions.CHANGE_ORG_ENTRY, organization)
 
 
 def can_delete_org_expense(user, organization):
     """
     Returns True if the user has the permission to delete the organization expense.
     """
-    return user.has_perm(OrganizationPermissions.DELETE_ORG_ENTRY, organization)
+    return has_object_perm(user, OrganizationPermissions.DELETE_ORG_ENTRY, organization)
 
 
 def can_add_workspace_expense(user, workspace):
     """
     Returns True if the user has the permission to add the workspace expense.
     """
-    return user.has_perm(WorkspacePermissions.ADD_WORKSPACE_ENTRY, workspace)
+    return has_object_perm(user, WorkspacePermissions.ADD_WORKSPACE_ENTRY, workspace)
 
 
 def can_update_workspace_expense(user, workspace):
     """
     Returns True if the user has the permission to update the workspace expense.
     """
-    return user.has_perm(WorkspacePermissions.CHANGE_WORKSPACE_ENTRY, workspace)
+    return has_object_perm(user, WorkspacePermissions.CHANGE_WORKSPACE_ENTRY, workspace)
 
 
 def can_delete_workspace_expense(user, workspace):
     """
     Returns True if the user has the permission to delete the workspace expense.
     """
-    return user.has_perm(WorkspacePermissions.DELETE_WORKSPACE_ENTRY, workspace)
+    return has_object_perm(user, WorkspacePermissions.DELETE_WORKSPACE_ENTRY, workspace)
 
 
 def can_view_workspace_team_entry(user, workspace_team):
     """
     Returns True if the user has the permission to view the workspace team entry.
     """
-    return user.has_perm(WorkspaceTeamPermissions.VIEW_WORKSPACE_TEAM, workspace_team)
+    return has_object_perm(
+        user, WorkspaceTeamPermissions.VIEW_WORKSPACE_TEAM, workspace_team
+    )
 
 
 def can_add_workspace_team_entry(user, workspace_team):
     """
     Returns True if the user has the permission to add the workspace team entry.
     """
-    return user.has_perm(
-        WorkspaceTeamPermissions.ADD_WORKSPACE_TEAM_ENTRY, workspace_team
+    return has_object_perm(
+        user, WorkspaceTeamPermissions.ADD_WORKSPACE_TEAM_ENTRY, workspace_team
     )
 
 
@@ -76,8 +79,8 @@ def can_update_workspace_team_entry(user, workspace_team):
     """
     Returns True if the user has the permission to update the workspace team entry.
     """
-    return user.has_perm(
-        WorkspaceTeamPermissions.CHANGE_WORKSPACE_TEAM_ENTRY, workspace_team
+    return has_object_perm(
+        user, WorkspaceTeamPermissions.CHANGE_WORKSPACE_TEAM_ENTRY, workspace_team
     )
 
 
@@ -86,8 +89,8 @@ def can_update_other_submitters_entry(user, org_member, entry, workspace_team):
     Returns True if the user has the permission to update other submitters entry.
 
     """
-    if not user.has_perm(
-        EntryPermissions.CHANGE_OTHER_SUBMITTERS_ENTRY, entry
+    if not has_object_perm(
+        user, EntryPermissions.CHANGE_OTHER_SUBMITTERS_ENTRY, entry
     ) and not own_higher_admin_role(org_member, workspace_team):
         return False
     return True
@@ -97,8 +100,8 @@ def can_delete_workspace_team_entry(user, workspace_team):
     """
     Returns True if the user has the permission to delete the workspace team entry.
     """
-    return user.has_perm(
-        WorkspaceTeamPermissions.DELETE_WORKSPACE_TEAM_ENTRY, workspace_team
+    return has_object_perm(
+        user, WorkspaceTeamPermissions.DELETE_WORKSPACE_TEAM_ENTRY, workspace_team
     )
 
 
@@ -149,8 +152,8 @@ def can_view_total_workspace_teams_entries(user, workspace):
     """
     Returns True if the user has the permission to view the total workspace teams entries.
     """
-    return user.has_perm(
-        WorkspacePermissions.VIEW_TOTAL_WORKSPACE_TEAMS_ENTRIES, workspace
+    return has_object_perm(
+        user, WorkspacePermissions.VIEW_TOTAL_WORKSPACE_TEAMS_ENTRIES, workspace
     )
 
 
@@ -158,4 +161,4 @@ def can_view_workspace_level_entries(user, workspace):
     """
     Returns True if the user has the permission to view the workspace level entries.
     """
-    return user.has_perm(WorkspacePermissions.VIEW_WORKSPACE_ENTRY, workspace)
+    return has_object_perm(user, WorkspacePermissions.VIEW_WORKSPACE_ENTRY, workspace)
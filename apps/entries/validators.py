@@ -1,7 +1,8 @@
 import csv
-from decimal import Decimal
 import io
+from itertools import islice
 from django.core.exceptions import ValidationError
+from django.utils.dateparse import parse_date
 
 from apps.teams.constants import TeamMemberRole
 from .constants import EntryStatus, EntryType
@@ -11,32 +12,75 @@ from datetime import date
 
 class EntryCSVValidator:
     required_fields = ["Description", "Amount", "Occurred At", "Currency"]
+    team_level_types = {
+        EntryType.INCOME.value,
+        EntryType.DISBURSEMENT.value,
+        EntryType.REMITTANCE.value,
+    }
 
     def __init__(self, file):
         self.file = file
 
-    def validate(self, verify_team_level_type: bool = False):
-        data = io.TextIOWrapper(self.file.file, encoding="utf-8")
+    def validate_row(self, row, verify_team_level_type: bool = False):
+        """
+        Normalize a CSV row in place, raising ValidationError when it cannot
+        become an entry.
+        """
+        # A blank description falls back to the import's backup description
+        missing = [
+            field
+            for field in self.required_fields
+            if field != "Description" and not (row.get(field) or "").strip()
+        ]
+        if verify_team_level_type and not row.get("Type"):
+            missing.append("Type")
+        if missing:
+            raise ValidationError(f"Missing {', '.join(missing)}")
+
+        # Apply the model field's rules (digits, decimal places, minimum) so
+        # a bad amount fails this row rather than the chunk's bulk insert
+        try:
+            row["Amount"] = Entry._meta.get_field("amount").clean(
+                row["Amount"].strip(), None
+            )
+        except ValidationError as e:
+            raise ValidationError(f"Invalid amount {row['Amount']!r}: {e.messages[0]}")
+        occurred_at = parse_date(row["Occurred At"].strip())
+        if occurred_at is None:
+            raise ValidationError(f"Invalid date {row['Occurred At']!r}")
+        row["Occurred At"] = occurred_at
+        row["Currency"] = row["Currency"].strip().upper()
+        row["Description"] = (row.get("Description") or "").strip()
+
+        # Validate Entry Type
+        if verify_team_level_type:
+            row["Type"] = row["Type"].strip().lower()
+            if row["Type"] not in self.team_level_types:
+                raise ValidationError(f"Invalid entry type {row['Type']!r}")
+        return row
+
+    def iter_rows(self, verify_team_level_type: bool = False, start: int = 0):
+        """
+        Stream the file as ``(row number, row, error)`` tuples without
+        loading it into memory, skipping the first ``start`` rows. ``error``
+        is None for valid rows.
+        """
+        data = io.TextIOWrapper(self.file.file, encoding="utf-8", newline="")
         reader = csv.DictReader(data)
-
-        valid_rows, errors = [], []
-        for i, row in enumerate(reader, start=1):
+        for i, row in enumerate(islice(reader, start, None), start=start + 1):
             try:
-                # Normalize
-                row["Amount"] = Decimal(row["Amount"])
-                # Validate Entry Type
-                if verify_team_level_type:
-                    row["Type"] = row["Type"].strip().lower()
-                    if row["Type"] not in {
-                        EntryType.INCOME.value,
-                        EntryType.DISBURSEMENT.value,
-                        EntryType.REMITTANCE.value,
-                    }:
-                        continue
+                yield i, self.validate_row(row, verify_team_level_type), None
+            except (ValidationError, ValueError) as e:
+                message = e.messages[0] if isinstance(e, ValidationError) else str(e)
+                yield i, row, message
 
+    def validate(self, verify_team_level_type: bool = False):
+        valid_rows, errors = [], []
+        for i, row, error in self.iter_rows(verify_team_level_type):
+            if error:
+                errors.append((i, error))
+            else:
                 valid_rows.append(row)
-            except Exception as e:
-                errors.append((i, str(e)))
         return valid_rows, errors
 
 
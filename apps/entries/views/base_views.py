@@ -3,19 +3,20 @@ from typing import Any
 import traceback
 
 from django.db.models import QuerySet
-from django.http import HttpResponse
+from django.http import Http404, HttpResponse
 from django.contrib import messages
 from django.views.generic import TemplateView
 from django.template.loader import render_to_string
 from django.utils import timezone
 from django.db import transaction
 
-from apps.entries.validators import EntryCSVValidator
+from apps.entries.selectors import get_entry_import_job
 from apps.workspaces.models import WorkspaceTeam
 
 from ..models import Entry
 from ..constants import CONTEXT_OBJECT_NAME, DETAIL_CONTEXT_OBJECT_NAME, EntryStatus
 from .mixins import (
+    EntryKeysetPaginationMixin,
     EntryRequiredMixin,
     EntryUrlIdentifierMixin,
 )
@@ -27,6 +28,7 @@ from apps.core.views.mixins import (
     HtmxInvalidResponseMixin,
 )
 from apps.entries.services import (
+    EntryImportService,
     EntryService,
 )
 from apps.remittance.services import (
@@ -59,7 +61,10 @@ class EntryDetailView(OrganizationRequiredMixin, EntryRequiredMixin, BaseDetailV
 
 
 class BaseEntryBulkActionView(
-    HtmxInvalidResponseMixin, HtmxOobResponseMixin, TemplateView
+    HtmxInvalidResponseMixin,
+    HtmxOobResponseMixin,
+    EntryKeysetPaginationMixin,
+    TemplateView,
 ):
     table_template_name = "entries/layouts/base_entry_content_layout.html"
     context_object_name = CONTEXT_OBJECT_NAME
@@ -149,14 +154,8 @@ class BaseEntryBulkActionView(
     def _render_htmx_success_response(self) -> HttpResponse:
         base_context = self.get_context_data()
 
-        from apps.core.utils import get_paginated_context
-
         queryset = self.get_response_queryset()
-        table_context = get_paginated_context(
-            queryset=queryset,
-            context=base_context,
-            object_name=self.context_object_name,
-        )
+        table_context = self.get_table_context(queryset=queryset, context=base_context)
 
         table_html = render_to_string(
             self.table_template_name, context=table_context, request=self.request
@@ -302,6 +301,13 @@ class BaseEntryBulkCreateView(BaseEntryBulkActionView):
         )
         return kwargs
 
+    def dispatch(self, request, *args, **kwargs):
+        # Polled by the progress panel of the import modal
+        import_job_id = request.GET.get("import_job")
+        if request.method == "GET" and import_job_id:
+            return self._render_import_progress(import_job_id)
+        return super().dispatch(request, *args, **kwargs)
+
     def post(self, request, *args, **kwargs):
         try:
             self.form = self.form_class(
@@ -310,58 +316,63 @@ class BaseEntryBulkCreateView(BaseEntryBulkActionView):
             if not self.form.is_valid():
                 return self._render_htmx_error_response(form=self.form)
 
-            validator = EntryCSVValidator(request.FILES["file"])
-            valid_rows, errors = validator.validate(
-                verify_team_level_type=False if self.entry_type_to_create else True
+            # The file is imported in the background; the modal polls the job
+            import_job = EntryImportService.start_import(
+                file=self.form.cleaned_data["file"],
+                organization=self.organization,
+                workspace=getattr(self, "workspace", None),
+                workspace_team=getattr(self, "workspace_team", None),
+                submitted_by_org_member=self.org_member,
+                submitted_by_team_member=getattr(self, "workspace_team_member", None),
+                user=request.user,
+                entry_type=self.entry_type_to_create,
+                entry_status=self.form.cleaned_data.get("status"),
+                status_note=self.form.cleaned_data.get("status_note", "").strip(),
+                backup_description=self.form.cleaned_data.get(
+                    "backup_description", ""
+                ).strip(),
             )
 
-            valid_entries = []
-            for row in valid_rows:
-                entry = EntryService.build_entry(
-                    currency_code=row["Currency"],
-                    amount=row["Amount"],
-                    occurred_at=row["Occurred At"],
-                    description=row["Description"].strip()
-                    or self.form.cleaned_data.get("description").strip(),
-                    entry_type=self.entry_type_to_create or row["Type"],
-                    organization=self.organization,
-                    workspace=getattr(self, "workspace", None),
-                    workspace_team=getattr(self, "workspace_team", None),
-                    submitted_by_org_member=self.org_member,
-                    submitted_by_team_member=getattr(
-                        self, "workspace_team_member", None
-                    ),
-                    status=self.form.cleaned_data.get("status"),
-                    status_note=self.form.cleaned_data.get("status_note").strip(),
-                )
-                if entry:
-                    valid_entries.append(entry)
-
-            # Validate each entry
-            success, message = self.perform_action(request, valid_entries)
-
-            if not success:
-                messages.error(self.request, message)
-                return self._render_htmx_error_response(form=self.form)
-
-            messages.success(request, f"{message}")
-            return self._render_htmx_success_response()
+            messages.success(request, "Import started.")
+            context = {**self.get_context_data(), "import_job": import_job}
+            message_html = render_to_string(
+                "includes/message.html", context=context, request=request
+            )
+            progress_html = render_to_string(
+                "entries/components/import_progress.html",
+                context=context,
+                request=request,
+            )
+            return HttpResponse(f"{message_html}{progress_html}")
 
         except Exception as e:
             traceback.print_exc()
             messages.error(request, str(e))
             return self._render_htmx_error_response(form=self.form)
 
-    def perform_action(self, request, entries: list[Entry]) -> tuple[bool, str | None]:
-        try:
-            if not entries:
-                return False, "No valid entry found"
-
-            with transaction.atomic():
-                EntryService.bulk_create_entry(entries=entries)
-                self.perform_post_action(entries=entries)
-
-            return True, f"Successfully imported {len(entries)} entry/ies"
+    def _render_import_progress(self, import_job_id) -> HttpResponse:
+        import_job = get_entry_import_job(
+            import_job_id=import_job_id,
+            organization=self.organization,
+            user=self.request.user,
+        )
+        if import_job is None:
+            raise Http404("Import not found")
+
+        context = {**self.get_context_data(), "import_job": import_job}
+        progress_html = render_to_string(
+            "entries/components/import_progress.html",
+            context=context,
+            request=self.request,
+        )
+        if not import_job.is_finished:
+            return HttpResponse(progress_html)
 
-        except Exception as e:
-            return False, f"An Error occurred during bulk create: {e}"
+        # Refresh the entry table behind the modal with the imported entries
+        table_context = self.get_table_context(
+            queryset=self.get_response_queryset(), context={**context, "is_oob": True}
+        )
+        table_html = render_to_string(
+            self.table_template_name, context=table_context, request=self.request
+        )
+        return HttpResponse(f"{progress_html}{table_html}")
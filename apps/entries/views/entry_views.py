@@ -19,9 +19,6 @@ from apps.core.views.service_layer_mixins import (
     HtmxRowResponseMixin,
     HtmxTableServiceMixin,
 )
-from apps.remittance.services import (
-    RemittanceService,
-)
 from apps.teams.constants import TeamMemberRole
 
 from ..constants import CONTEXT_OBJECT_NAME, EntryStatus, EntryType
@@ -47,6 +44,7 @@ from .base_views import (
 )
 from .mixins import (
     EntryFormMixin,
+    EntryKeysetPaginationMixin,
     EntryRequiredMixin,
     WorkspaceLevelEntryFiltering,
     TeamLevelEntryFiltering,
@@ -62,6 +60,7 @@ class WorkspaceEntryListView(
     WorkspaceRequiredMixin,
     TeamLevelEntryView,
     WorkspaceLevelEntryFiltering,
+    EntryKeysetPaginationMixin,
     BaseListView,
 ):
     model = Entry
@@ -105,6 +104,7 @@ class WorkspaceTeamEntryListView(
     WorkspaceTeamRequiredMixin,
     TeamLevelEntryView,
     TeamLevelEntryFiltering,
+    EntryKeysetPaginationMixin,
     BaseListView,
 ):
     model = Entry
@@ -144,6 +144,7 @@ class WorkspaceTeamEntryCreateView(
     BaseGetModalFormView,
     EntryFormMixin,
     TeamLevelEntryFiltering,
+    EntryKeysetPaginationMixin,
     HtmxTableServiceMixin,
     BaseCreateView,
 ):
@@ -295,6 +296,7 @@ class WorkspaceTeamEntryDeleteView(
     EntryRequiredMixin,
     TeamLevelEntryView,
     TeamLevelEntryFiltering,
+    EntryKeysetPaginationMixin,
     HtmxTableServiceMixin,
     BaseDeleteView,
 ):
@@ -632,6 +634,3 @@ class WorkspaceTeamEntryBulkCreateView(
                 "workspace_team_id": self.workspace_team.pk,
             },
         )
-
-    def perform_post_action(self, *args, **kwargs):
-        RemittanceService.sync_remittance(workspace_team=self.workspace_team)
@@ -1,9 +1,10 @@
 from typing import Any
 
 
-from apps.entries.selectors import get_entry
+from apps.core.views.mixins import KeysetPaginationMixin
+from apps.entries.selectors import get_cached_entry_count, get_entry
 
-from ..constants import EntryStatus, EntryType
+from ..constants import ENTRY_LIST_ORDERING, EntryStatus, EntryType
 
 
 class EntryRequiredMixin:
@@ -69,6 +70,17 @@ class EntryUrlIdentifierMixin:
         return context
 
 
+class EntryKeysetPaginationMixin(KeysetPaginationMixin):
+    """Keyset-paginate entry tables and show a cached total count."""
+
+    keyset_ordering = ENTRY_LIST_ORDERING
+
+    def get_keyset_count(self, queryset):
+        return get_cached_entry_count(
+            queryset=queryset, organization_id=self.organization.pk
+        )
+
+
 class StatusFilteringMixin:
     def get_context_data(self, **kwargs) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
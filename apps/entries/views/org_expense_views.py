@@ -41,13 +41,19 @@ from .base_views import (
     BaseEntryBulkDeleteView,
     BaseEntryBulkUpdateView,
 )
-from .mixins import EntryFormMixin, EntryRequiredMixin, StatusFilteringMixin
+from .mixins import (
+    EntryFormMixin,
+    EntryKeysetPaginationMixin,
+    EntryRequiredMixin,
+    StatusFilteringMixin,
+)
 
 
 class OrganizationExpenseListView(
     OrganizationRequiredMixin,
     OrganizationLevelEntryView,
     StatusFilteringMixin,
+    EntryKeysetPaginationMixin,
     BaseListView,
 ):
     model = Entry
@@ -91,6 +97,7 @@ class OrganizationExpenseCreateView(
     BaseGetModalFormView,
     EntryFormMixin,
     StatusFilteringMixin,
+    EntryKeysetPaginationMixin,
     HtmxTableServiceMixin,
     BaseCreateView,
 ):
@@ -211,6 +218,7 @@ class OrganizationExpenseDeleteView(
     EntryRequiredMixin,
     OrganizationLevelEntryView,
     StatusFilteringMixin,
+    EntryKeysetPaginationMixin,
     HtmxTableServiceMixin,
     BaseDeleteView,
 ):
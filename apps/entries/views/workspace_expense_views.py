@@ -13,6 +13,7 @@ from apps.core.views.mixins import (
 )
 from .mixins import (
     EntryFormMixin,
+    EntryKeysetPaginationMixin,
     EntryRequiredMixin,
     StatusFilteringMixin,
 )
@@ -53,6 +54,7 @@ class WorkspaceExpenseListView(
     WorkspaceRequiredMixin,
     WorkspaceLevelEntryView,
     StatusFilteringMixin,
+    EntryKeysetPaginationMixin,
     BaseListView,
 ):
     model = Entry
@@ -97,6 +99,7 @@ class WorkspaceExpenseCreateView(
     BaseGetModalFormView,
     EntryFormMixin,
     StatusFilteringMixin,
+    EntryKeysetPaginationMixin,
     HtmxTableServiceMixin,
     BaseCreateView,
 ):
@@ -227,6 +230,7 @@ class WorkspaceExpenseDeleteView(
     EntryRequiredMixin,
     WorkspaceLevelEntryView,
     StatusFilteringMixin,
+    EntryKeysetPaginationMixin,
     HtmxTableServiceMixin,
     BaseDeleteView,
 ):
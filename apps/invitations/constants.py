@@ -0,0 +1,8 @@
+from django.db import models
+
+
+class BulkInvitationStatus(models.TextChoices):
+    INVITED = "invited", "Invited"
+    ALREADY_MEMBER = "already_member", "Already a member"
+    ALREADY_INVITED = "already_invited", "Already invited"
+    INVALID_EMAIL = "invalid_email", "Invalid email"
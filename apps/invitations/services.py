@@ -1,5 +1,13 @@
 from django.db import transaction
 from django.contrib.auth import get_user_model
+from django.contrib.auth.base_user import BaseUserManager
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db.models.functions import Lower
+from django.utils import timezone
+from apps.auditlog.business_logger import BusinessAuditLogger
+from apps.emails.services import send_invitation_emails
+from .constants import BulkInvitationStatus
 from .models import Invitation
 from apps.organizations.models import OrganizationMember, Organization
 from .selectors import (
@@ -39,6 +47,107 @@ def create_invitation(
     return invitation
 
 
+@transaction.atomic
+def bulk_create_invitations(
+    emails, expired_at, organization: Organization, invited_by: OrganizationMember
+) -> dict[str, str]:
+    """
+    Invite many email addresses to an organization at once.
+
+    Addresses are matched case-insensitively against the organization's members
+    and pending invitations with one query each, new invitations are inserted
+    with a single ``bulk_create`` and their emails are queued in batches once
+    the transaction commits. Returns the ``BulkInvitationStatus`` of every
+    submitted address, keyed by the normalized address; repeated addresses are
+    reported once.
+    """
+    if not expired_at:
+        raise ValueError("Expired at is required")
+    if not invited_by:
+        raise ValueError("Invited by is required")
+    if not organization:
+        raise ValueError("Organization is required")
+
+    results = {}
+    candidates = {}
+    for raw_email in emails:
+        email = BaseUserManager.normalize_email((raw_email or "").strip())
+        if email in results:
+            continue
+        try:
+            validate_email(email)
+        except ValidationError:
+            results[email] = BulkInvitationStatus.INVALID_EMAIL
+            continue
+        if email.lower() in candidates:
+            continue
+        results[email] = BulkInvitationStatus.INVITED
+        candidates[email.lower()] = email
+
+    member_emails = set(
+        OrganizationMember.objects.filter(organization=organization)
+        .annotate(email_lower=Lower("user__email"))
+        .filter(email_lower__in=candidates)
+        .order_by()
+        .values_list("email_lower", flat=True)
+    )
+    pending_invitations = (
+        Invitation.objects.filter(
+            organization=organization, is_used=False, is_active=True
+        )
+        .annotate(email_lower=Lower("email"))
+        .filter(email_lower__in=candidates)
+        .order_by()
+        .values_list("pk", "email_lower", "expired_at")
+    )
+
+    now = timezone.now()
+    invited_emails = set()
+    expired_invitation_ids = []
+    for invitation_id, email_lower, invitation_expired_at in pending_invitations:
+        if invitation_expired_at < now:
+            expired_invitation_ids.append(invitation_id)
+        else:
+            invited_emails.add(email_lower)
+
+    new_invitations = []
+    for email_lower, email in candidates.items():
+        if email_lower in member_emails:
+            results[email] = BulkInvitationStatus.ALREADY_MEMBER
+        elif email_lower in invited_emails:
+            results[email] = BulkInvitationStatus.ALREADY_INVITED
+        else:
+            new_invitations.append(
+                Invitation(
+                    email=email,
+                    expired_at=expired_at,
+                    organization=organization,
+                    invited_by=invited_by,
+                )
+            )
+
+    if not new_invitations:
+        return results
+
+    # bulk_create skips the pre_save handler that retires stale invitations
+    if expired_invitation_ids:
+        Invitation.objects.filter(pk__in=expired_invitation_ids).update(is_active=False)
+    Invitation.objects.bulk_create(new_invitations)
+
+    # ...and the post_save handlers that log and email each invitation
+    if invited_by.user:
+        BusinessAuditLogger.log_bulk_operation(
+            user=invited_by.user,
+            operation_type="bulk_invitation",
+            affected_entities=new_invitations,
+            organization_id=str(organization.pk),
+            invited_count=len(new_invitations),
+        )
+    transaction.on_commit(lambda: send_invitation_emails(new_invitations))
+
+    return results
+
+
 @transaction.atomic
 def accept_invitation(user: User, invitation: Invitation):
     """Accept an invitation and add user to organization"""
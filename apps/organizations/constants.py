@@ -5,3 +5,8 @@ class StatusChoices(models.TextChoices):
     ACTIVE = "active", "Active"
     ARCHIVED = "archived", "Archived"
     CLOSED = "closed", "Closed"
+
+
+# Dashboard metrics are invalidated by version bumps, so the timeout only
+# bounds how long unused entries linger in the cache.
+ORGANIZATION_METRICS_CACHE_TIMEOUT = 60 * 60
@@ -1,3 +1,4 @@
+from apps.core.object_permissions import has_object_perm
 from apps.core.permissions import OrganizationPermissions
 
 
@@ -11,4 +12,6 @@ def can_remove_org_member(user, organization):
     # for edge case purpose in test cases
     if organization is None:
         return False
-    return user.has_perm(OrganizationPermissions.REMOVE_ORG_MEMBER, organization)
+    return has_object_perm(
+        user, OrganizationPermissions.REMOVE_ORG_MEMBER, organization
+    )
@@ -1,11 +1,16 @@
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 
+from apps.organizations.constants import ORGANIZATION_METRICS_CACHE_TIMEOUT
 from apps.organizations.models import (
     Organization,
     OrganizationExchangeRate,
     OrganizationMember,
 )
 from apps.teams.models import Team
+from apps.workspaces.models import Workspace
 from apps.accounts.models import CustomUser
 from django.db.models import QuerySet
 from uuid import UUID
@@ -20,7 +25,7 @@ def get_user_organizations(user: CustomUser) -> QuerySet[Organization]:
         members__user=user,
         members__is_active=True,
         members__deleted_at__isnull=True,
-    ).select_related("owner")
+    ).select_related("owner__user")
 
 
 def get_organization_by_id(organization_id: UUID) -> Organization:
@@ -87,6 +92,81 @@ def get_teams_count(organization: Organization) -> int:
         return 0
 
 
+def get_organization_metrics_version_key(organization_id) -> str:
+    return f"organizations:metrics_version:{organization_id}"
+
+
+def _count_subquery(queryset, group_by):
+    return Coalesce(
+        Subquery(
+            queryset.order_by()
+            .values(group_by)
+            .annotate(count=Count("pk", distinct=True))
+            .values("count")
+        ),
+        0,
+    )
+
+
+def _load_organization_dashboard_metrics(organization_id) -> dict:
+    counts = (
+        Organization.all_objects.filter(pk=organization_id)
+        .annotate(
+            members_count=_count_subquery(
+                OrganizationMember.objects.filter(
+                    organization=OuterRef("pk"), is_active=True
+                ),
+                "organization",
+            ),
+            workspaces_count=_count_subquery(
+                Workspace.objects.filter(organization=OuterRef("pk")),
+                "organization",
+            ),
+            teams_count=_count_subquery(
+                Team.objects.filter(
+                    joined_workspaces__workspace__organization=OuterRef("pk")
+                ),
+                "joined_workspaces__workspace__organization",
+            ),
+        )
+        .values("members_count", "workspaces_count", "teams_count")
+        .first()
+    ) or {"members_count": 0, "workspaces_count": 0, "teams_count": 0}
+
+    allowed_currencies = (
+        OrganizationExchangeRate.objects.filter(organization_id=organization_id)
+        .order_by("currency__code")
+        .values("currency__code", "currency__name")
+        .distinct()
+    )
+    return {
+        **counts,
+        "allowed_currencies": [
+            {"code": currency["currency__code"], "name": currency["currency__name"]}
+            for currency in allowed_currencies
+        ],
+    }
+
+
+def get_organization_dashboard_metrics(organization: Organization) -> dict:
+    """
+    Returns the member, workspace and team counts and the currencies with an
+    exchange rate for the organization dashboard.
+
+    The counts are computed in a single query and cached under the
+    organization's metrics version, which writes to the counted models bump
+    (see ``apps.core.signals``), so a cached value is never stale.
+    """
+    version = cache.get(get_organization_metrics_version_key(organization.pk), 0)
+    cache_key = f"organizations:metrics:{organization.pk}:{version}"
+
+    metrics = cache.get(cache_key)
+    if metrics is None:
+        metrics = _load_organization_dashboard_metrics(organization.pk)
+        cache.set(cache_key, metrics, ORGANIZATION_METRICS_CACHE_TIMEOUT)
+    return metrics
+
+
 def get_user_org_membership(
     user: CustomUser, organization: Organization, prefetch_user=False
 ) -> OrganizationMember:
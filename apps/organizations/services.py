@@ -1,6 +1,8 @@
 import logging
+import time
 
 from django.contrib.auth.models import Group
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.db.utils import IntegrityError
@@ -10,6 +12,7 @@ from apps.auditlog.business_logger import BusinessAuditLogger
 from apps.core.roles import get_permissions_for_role
 from apps.core.utils import model_update
 from apps.currencies.selectors import get_or_create_currency_by_code
+from apps.entries.services import EntryRerateService
 from apps.organizations.exceptions import (
     OrganizationCreationError,
     OrganizationUpdateError,
@@ -17,6 +20,7 @@ from apps.organizations.exceptions import (
 from apps.organizations.models import Organization, OrganizationMember
 
 from .models import OrganizationExchangeRate
+from .selectors import get_organization_metrics_version_key
 from .utils import (
     extract_organization_context,
     extract_organization_member_context,
@@ -26,6 +30,22 @@ from .utils import (
 logger = logging.getLogger(__name__)
 
 
+def invalidate_organization_metrics(*, organization_ids) -> None:
+    """
+    Bump the dashboard metrics version of each organization once the current
+    transaction commits, so cached dashboard counts are recomputed.
+    """
+
+    def bump_versions():
+        version = time.time_ns()
+        for organization_id in set(organization_ids):
+            cache.set(
+                get_organization_metrics_version_key(organization_id), version, None
+            )
+
+    transaction.on_commit(bump_versions)
+
+
 @transaction.atomic
 def create_organization_with_owner(*, form, user) -> Organization:
     """
@@ -159,6 +179,7 @@ def create_organization_exchange_rate(
         if user:
             exchange_rate._audit_user = user
         exchange_rate.save()
+        EntryRerateService.schedule_rerate(exchange_rate=exchange_rate, user=user)
 
         # Note: CRUD logging removed - handled by signal handlers
         # return the exchange rate (THA)
@@ -274,6 +295,7 @@ def delete_organization_exchange_rate(
         if user:
             org_exchange_rate._audit_user = user
         org_exchange_rate.delete()
+        EntryRerateService.schedule_rerate(exchange_rate=org_exchange_rate, user=user)
 
         # Note: CRUD logging removed - handled by signal handlers
 
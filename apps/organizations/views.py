@@ -9,9 +9,7 @@ from apps.organizations.models import (
 )
 from apps.organizations.selectors import (
     get_user_organizations,
-    get_organization_members_count,
-    get_workspaces_count,
-    get_teams_count,
+    get_organization_dashboard_metrics,
     get_org_exchange_rates,
 )
 from apps.organizations.forms import (
@@ -55,10 +53,13 @@ from apps.core.permissions import OrganizationPermissions
 from apps.core.utils import permission_denied_view
 from apps.organizations.selectors import get_organization_by_id
 from apps.core.utils import can_manage_organization
+from apps.core.object_permissions import prefetch_object_permissions
 from apps.core.utils import check_if_member_is_owner
 from apps.organizations.utils import remove_permissions_from_member
 from apps.organizations.selectors import get_organization_member_by_id
 from apps.organizations.permissions import can_remove_org_member
+from apps.core.services.deletion import start_organization_archive
+from django.db import transaction
 
 
 # Create your views here.
@@ -71,20 +72,15 @@ def dashboard_view(request, organization_id):
                 request,
                 "You do not have permission to access this organization.",
             )
-        members_count = get_organization_members_count(organization)
-        workspaces_count = get_workspaces_count(organization)
-        teams_count = get_teams_count(organization)
-        allowed_currencies = OrganizationExchangeRate.objects.filter(
-            organization=organization
-        ).distinct("currency")
+        metrics = get_organization_dashboard_metrics(organization)
         owner = organization.owner.user if organization.owner else None
         context = {
             "organization": organization,
-            "members_count": members_count,
-            "workspaces_count": workspaces_count,
-            "teams_count": teams_count,
+            "members_count": metrics["members_count"],
+            "workspaces_count": metrics["workspaces_count"],
+            "teams_count": metrics["teams_count"],
             "owner": owner,
-            "allowed_currencies": allowed_currencies,
+            "allowed_currencies": metrics["allowed_currencies"],
         }
         return render(request, "organizations/dashboard.html", context)
     except Exception:
@@ -96,6 +92,7 @@ def dashboard_view(request, organization_id):
 def home_view(request):
     try:
         organizations = get_user_organizations(request.user)
+        prefetch_object_permissions(request.user, organizations)
         for organization in organizations:
             organization.permissions = {
                 "can_manage_organization": can_manage_organization(
@@ -202,14 +199,12 @@ def create_organization_view(request):
 def organization_overview_view(request, organization_id):
     organization = get_object_or_404(Organization, pk=organization_id)
     owner = organization.owner.user if organization.owner else None
-    members = get_organization_members_count(organization)
-    workspaces = get_workspaces_count(organization)
-    teams = get_teams_count(organization)
+    metrics = get_organization_dashboard_metrics(organization)
     context = {
         "organization": organization,
-        "members": members,
-        "workspaces": workspaces,
-        "teams": teams,
+        "members": metrics["members_count"],
+        "workspaces": metrics["workspaces_count"],
+        "teams": metrics["teams_count"],
         "owner": owner,
     }
     return render(request, "organizations/organization_overview.html", context)
@@ -387,7 +382,11 @@ def delete_organization_view(request, organization_id):
             return HttpResponseClientRedirect("/403")
 
         if request.method == "POST":
-            organization.delete()
+            with transaction.atomic():
+                organization.delete()
+                # Its teams, entries and exchange rates are archived in the
+                # background once the organization is gone
+                start_organization_archive(organization=organization, user=request.user)
             messages.success(request, "Organization deleted successfully.")
             response = HttpResponse()
             # Client-side redirect
@@ -8,3 +8,30 @@ class RemittanceStatus(models.TextChoices):
     OVERPAID = "overpaid", "Overpaid"
     OVERDUE = "overdue", "Overdue"
     CANCELED = "canceled", "Canceled"
+
+
+class RemittanceSortOption(models.TextChoices):
+    NEWEST = "newest", "Newest"
+    REMAINING = "remaining", "Highest Remaining"
+    DUE_DATE = "due_date", "Due Date"
+    DUE_AMOUNT = "due_amount", "Highest Due"
+    STATUS = "status", "Status"
+
+
+# Order-by clauses per sort option; each ends with the primary key so that
+# LIMIT/OFFSET pages are stable.
+REMITTANCE_SORT_ORDERING = {
+    RemittanceSortOption.NEWEST: ("-created_at", "remittance_id"),
+    RemittanceSortOption.REMAINING: (
+        "-remaining_amount",
+        "-created_at",
+        "remittance_id",
+    ),
+    RemittanceSortOption.DUE_DATE: (
+        "workspace_team__workspace__end_date",
+        "-created_at",
+        "remittance_id",
+    ),
+    RemittanceSortOption.DUE_AMOUNT: ("-due_amount", "-created_at", "remittance_id"),
+    RemittanceSortOption.STATUS: ("status", "-created_at", "remittance_id"),
+}
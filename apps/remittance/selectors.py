@@ -1,12 +1,40 @@
-from django.db.models import Q
+from django.db.models import Case, DecimalField, F, Q, Value, When
+
+from apps.remittance.constants import REMITTANCE_SORT_ORDERING, RemittanceSortOption
 from apps.remittance.models import Remittance
 
+AMOUNT_FIELD = DecimalField(max_digits=10, decimal_places=2)
+
+
+def with_remaining_amounts(queryset):
+    """
+    Annotate ``remaining_amount`` (what is left to pay, or the overpaid amount
+    for overpaid remittances, as Remittance.remaining_amount()) and
+    ``overpaid_amount`` on a remittance queryset.
+    """
+    return queryset.annotate(
+        remaining_amount=Case(
+            When(is_overpaid=True, then=F("paid_amount") - F("due_amount")),
+            default=F("due_amount") - F("paid_amount"),
+            output_field=AMOUNT_FIELD,
+        ),
+        overpaid_amount=Case(
+            When(is_overpaid=True, then=F("paid_amount") - F("due_amount")),
+            default=Value(0),
+            output_field=AMOUNT_FIELD,
+        ),
+    )
+
 
 def get_remittances_under_organization(
-    organization_id, workspace_id=None, status=None, search_query=None
+    organization_id, workspace_id=None, status=None, search_query=None, sort=None
 ):
     """
     Return remittances under organization with Q object filtering.
+
+    The result is a lazy queryset with remaining/overpaid amounts annotated
+    in SQL, so paginating it only fetches one page. ``sort`` is one of
+    RemittanceSortOption (newest first by default).
     """
     try:
         # Build base Q object for organization filtering
@@ -28,17 +56,16 @@ def get_remittances_under_organization(
             )
             base_q &= search_q
 
-        remittances = (
-            Remittance.objects.filter(base_q)
-            .select_related("workspace_team__workspace", "workspace_team__team")
-            .order_by("-created_at")
+        ordering = REMITTANCE_SORT_ORDERING.get(
+            sort, REMITTANCE_SORT_ORDERING[RemittanceSortOption.NEWEST]
         )
 
-        # Add remaining amount calculation
-        # to show overpaid amount in the table but not in -minus
-        for remittance in remittances:
-            remittance.remaining_amount = remittance.remaining_amount()
-
-        return remittances
+        # Remaining amount is annotated to show the overpaid amount
+        # in the table but not in -minus
+        return with_remaining_amounts(
+            Remittance.objects.filter(base_q).select_related(
+                "workspace_team__workspace", "workspace_team__team"
+            )
+        ).order_by(*ordering)
     except Exception:
         return None
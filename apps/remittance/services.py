@@ -1,12 +1,13 @@
 from decimal import Decimal
 
+from django.db.models import QuerySet
 from django.utils import timezone
 
 from apps.core.utils import handle_service_errors, model_update
 from apps.auditlog.constants import AuditActionType
 from apps.auditlog.services import audit_create
 from apps.entries.constants import EntryStatus, EntryType
-from apps.entries.selectors import get_total_amount_of_entries
+from apps.entries.selectors import get_team_ledger_total, get_team_ledger_totals
 from apps.organizations.selectors import get_orgMember_by_user_id_and_organization_id
 from apps.remittance.exceptions import RemittanceServiceError
 from apps.remittance.models import Remittance
@@ -50,72 +51,111 @@ class RemittanceService:
         calc_due_amt: bool = True,
         calc_paid_amt: bool = True,
     ) -> list[Remittance]:
-        remittances = []
-        required_to_update = False
+        """
+        Sync the remittances of many workspace teams with a constant number of
+        queries: one to load the remittances (with their workspace team and
+        workspace), one for the teams' ledger totals and one bulk update.
+        """
+        if not calc_due_amt and not calc_paid_amt:
+            return []
+
+        if not isinstance(workspace_teams, QuerySet):
+            workspace_teams = [wt for wt in workspace_teams if wt is not None]
+        remittances = list(
+            Remittance.objects.filter(workspace_team__in=workspace_teams)
+            .select_related("workspace_team__workspace")
+            .order_by()
+        )
+        if not remittances:
+            return []
 
-        # TODO: Hidden N + 1 problem here
-        for workspace_team in workspace_teams:
-            required_to_update = False
-            remittance = workspace_team.remittance
+        totals = get_team_ledger_totals(
+            entry_status=EntryStatus.APPROVED,
+            entry_types=[
+                EntryType.INCOME,
+                EntryType.DISBURSEMENT,
+                EntryType.REMITTANCE,
+            ],
+            workspace_team_ids=[r.workspace_team_id for r in remittances],
+        )
 
+        for remittance in remittances:
+            workspace_team_id = remittance.workspace_team_id
             if calc_due_amt:
-                remittance.due_amount = RemittanceService._calculate_due_amount(
-                    workspace_team=remittance.workspace_team
+                remittance.due_amount = RemittanceService._apply_remittance_rate(
+                    income_total=totals.get(
+                        (workspace_team_id, EntryType.INCOME), Decimal("0.00")
+                    ),
+                    disbursement_total=totals.get(
+                        (workspace_team_id, EntryType.DISBURSEMENT), Decimal("0.00")
+                    ),
+                    workspace_team=remittance.workspace_team,
                 )
-                required_to_update = True
-
             if calc_paid_amt:
-                remittance.paid_amount = RemittanceService._calculate_paid_amount(
-                    workspace_team=remittance.workspace_team
+                remittance.paid_amount = totals.get(
+                    (workspace_team_id, EntryType.REMITTANCE), Decimal("0.00")
                 )
-                required_to_update = True
 
-            if required_to_update:
-                remittances.append(remittance)
+            remittance.update_status()
+            remittance.check_if_overdue()
+            remittance.check_if_overpaid()
 
         return RemittanceService.bulk_update_remittance(remittances=remittances)
 
     @staticmethod
-    @handle_service_errors(RemittanceServiceError)
-    def _calculate_due_amount(*, workspace_team: WorkspaceTeam):
+    def _apply_remittance_rate(
+        *, income_total, disbursement_total, workspace_team: WorkspaceTeam
+    ):
         """
-        Calculate the due amount for a workspace team.
+        Apply the team (or workspace default) remittance rate to net income.
         """
-        # 1. Sum all APPROVED INCOME entries for this team
-        income_total = get_total_amount_of_entries(
-            entry_type=EntryType.INCOME,
-            entry_status=EntryStatus.APPROVED,
-            workspace_team=workspace_team,
-        )
-        # 2. Sum all APPROVED DISBURSEMENT entries for this team
-        disbursement_total = get_total_amount_of_entries(
-            entry_type=EntryType.DISBURSEMENT,
-            entry_status=EntryStatus.APPROVED,
-            workspace_team=workspace_team,
-        )
-        # 3. Calculate final total: income - disbursements
+        # Calculate final total: income - disbursements
         final_total = Decimal(income_total) - Decimal(disbursement_total)
-        # 4. Get remittance rate from team
+        # Get remittance rate from team, falling back to the workspace rate
         team_lvl_remittance_rate = workspace_team.custom_remittance_rate
         remittance_rate = (
             team_lvl_remittance_rate
             if team_lvl_remittance_rate
             else workspace_team.workspace.remittance_rate
         )
-        # 5. Apply rate to get due amount
+        # Apply rate to get due amount
         due_amount = (
             0 if final_total <= 0 else final_total * (remittance_rate * Decimal("0.01"))
         )
 
         return due_amount
 
+    @staticmethod
+    @handle_service_errors(RemittanceServiceError)
+    def _calculate_due_amount(*, workspace_team: WorkspaceTeam):
+        """
+        Calculate the due amount for a workspace team.
+        """
+        # 1. Read the materialized total of APPROVED INCOME entries for this team
+        income_total = get_team_ledger_total(
+            entry_type=EntryType.INCOME,
+            entry_status=EntryStatus.APPROVED,
+            workspace_team=workspace_team,
+        )
+        # 2. Read the materialized total of APPROVED DISBURSEMENT entries for this team
+        disbursement_total = get_team_ledger_total(
+            entry_type=EntryType.DISBURSEMENT,
+            entry_status=EntryStatus.APPROVED,
+            workspace_team=workspace_team,
+        )
+        return RemittanceService._apply_remittance_rate(
+            income_total=income_total,
+            disbursement_total=disbursement_total,
+            workspace_team=workspace_team,
+        )
+
     @staticmethod
     @handle_service_errors(RemittanceServiceError)
     def _calculate_paid_amount(*, workspace_team: WorkspaceTeam):
         """
         Calculate the paid amount for a workspace team.
         """
-        return get_total_amount_of_entries(
+        return get_team_ledger_total(
             entry_type=EntryType.REMITTANCE,
             entry_status=EntryStatus.APPROVED,
             workspace_team=workspace_team,
@@ -1,7 +1,8 @@
+from apps.core.object_permissions import has_object_perm
 from apps.core.permissions import OrganizationPermissions
 
 
 def can_confirm_remittance_payment(user, organization):
-    return user.has_perm(
-        OrganizationPermissions.CONFIRM_REMITTANCE_PAYMENT, organization
+    return has_object_perm(
+        user, OrganizationPermissions.CONFIRM_REMITTANCE_PAYMENT, organization
     )
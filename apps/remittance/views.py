@@ -2,7 +2,7 @@ from django.shortcuts import render
 
 from apps.core.constants import PAGINATION_SIZE
 
-from .constants import RemittanceStatus
+from .constants import RemittanceSortOption, RemittanceStatus
 from apps.core.selectors import (
     get_organization_by_id,
     get_workspaces_under_organization,
@@ -30,6 +30,7 @@ def remittance_list_view(request, organization_id):
         filtered_workspace_id = request.GET.get("workspace_id")
         filtered_status = request.GET.get("status")
         search_query = request.GET.get("q")  # Add search functionality
+        sort = request.GET.get("sort") or RemittanceSortOption.NEWEST
 
         # Convert empty string to None for proper filtering
         if filtered_workspace_id == "":
@@ -45,6 +46,7 @@ def remittance_list_view(request, organization_id):
             workspace_id=filtered_workspace_id,
             status=filtered_status,
             search_query=search_query,
+            sort=sort,
         )
 
         organization = get_organization_by_id(organization_id)  # for context
@@ -54,8 +56,10 @@ def remittance_list_view(request, organization_id):
 
         # Handle case where remittances is None
         if remittances is None:
-            remittances = []
+            remittances = Remittance.objects.none()
 
+        # The queryset is still lazy here: the paginator runs one COUNT and
+        # fetches only the requested page
         paginator = Paginator(remittances, PAGINATION_SIZE)
         page_number = request.GET.get("page")
         page_obj = paginator.get_page(page_number)
@@ -69,7 +73,9 @@ def remittance_list_view(request, organization_id):
             "selected_workspace_id": filtered_workspace_id,  # to maintain selected state
             "selected_status": filtered_status,  # to maintain selected status
             "search_query": search_query,  # to maintain search state
+            "selected_sort": sort,  # to maintain selected sort
             "remittance_status": RemittanceStatus.choices,  # for dropdown filter
+            "remittance_sort_options": RemittanceSortOption.choices,  # for sort dropdown
         }
         # if hx-request is true, return the partial template and for the full template, return the full template
         if request.headers.get("HX-Request"):
@@ -118,9 +124,12 @@ def remittance_confirm_payment_view(request, organization_id, remittance_id):
                     messages.success(request, "Remittance Payment Updated successfully")
                 context = {
                     "organization": organization,
-                    "remittances": get_remittances_under_organization(
-                        organization_id=organization_id
-                    ),
+                    "remittances": Paginator(
+                        get_remittances_under_organization(
+                            organization_id=organization_id
+                        ),
+                        PAGINATION_SIZE,
+                    ).get_page(1),
                     "is_oob": True,
                 }
                 message_html = render_to_string(
@@ -139,9 +148,12 @@ def remittance_confirm_payment_view(request, organization_id, remittance_id):
                 messages.error(request, str(e))
                 context = {
                     "organization": organization,
-                    "remittances": get_remittances_under_organization(
-                        organization_id=organization_id
-                    ),
+                    "remittances": Paginator(
+                        get_remittances_under_organization(
+                            organization_id=organization_id
+                        ),
+                        PAGINATION_SIZE,
+                    ).get_page(1),
                     "is_oob": True,
                 }
                 message_html = render_to_string(
@@ -1,7 +1,8 @@
+from apps.core.object_permissions import has_object_perm
 from apps.core.permissions import OrganizationPermissions
 
 
 def can_view_report_page(user, organization):
-    if user.has_perm(OrganizationPermissions.VIEW_REPORT_PAGE, organization):
+    if has_object_perm(user, OrganizationPermissions.VIEW_REPORT_PAGE, organization):
         return True
     return False
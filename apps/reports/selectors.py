@@ -1,12 +1,14 @@
 from decimal import Decimal
 
-from django.db.models import Case, DecimalField, F, Sum, When
+from django.db.models import Case, DecimalField, ExpressionWrapper, F, Sum, When
 from django.utils import timezone
 
 from apps.remittance.models import Remittance
 from apps.remittance.constants import RemittanceStatus
 from apps.entries.models import Entry
-from apps.entries.constants import EntryStatus
+from apps.entries.constants import EntryStatus, EntryType
+from apps.entries.selectors import get_team_ledger_totals
+from apps.workspaces.models import Workspace, WorkspaceTeam
 
 
 class RemittanceSelectors:
@@ -189,3 +191,205 @@ class EntrySelectors:
             "approved_entries": cls.get_approved_count(organization_id, workspace_id),
             "rejected_entries": cls.get_rejected_count(organization_id, workspace_id),
         }
+
+    @staticmethod
+    def get_export_rows(organization_id, workspace_id=None):
+        """
+        Iterate over the entries of an organization as flat dicts for export,
+        reading them from the database in chunks.
+        """
+        queryset = Entry.objects.filter(organization_id=organization_id)
+
+        if workspace_id:
+            queryset = queryset.filter(workspace_id=workspace_id)
+
+        return (
+            queryset.order_by("-occurred_at", "entry_id")
+            .values(
+                "occurred_at",
+                "entry_type",
+                "description",
+                "amount",
+                "currency__code",
+                "exchange_rate_used",
+                "status",
+                "workspace__title",
+                "workspace_team__team__title",
+            )
+            .iterator(chunk_size=2000)
+        )
+
+
+class OverviewFinanceReportSelectors:
+    """
+    Selectors that build the org -> workspace -> team finance report tree.
+
+    All amounts come from a fixed number of queries (team ledger balances,
+    grouped expense totals, workspace teams with their remittance,
+    workspaces) and the nested dict
+    is assembled in Python, so the cost does not grow with the number of
+    workspaces or teams.
+    """
+
+    @staticmethod
+    def get_approved_entry_totals(organization_id, workspace_id=None):
+        """
+        Return approved converted totals keyed by (scope_id, entry_type).
+
+        Team entry types (income, disbursement) are read from the materialized
+        TeamLedgerBalance rows and keyed by workspace team id. Workspace
+        expenses are keyed by workspace id and org expenses by organization id.
+        """
+        totals = get_team_ledger_totals(
+            entry_status=EntryStatus.APPROVED,
+            entry_types=[EntryType.INCOME, EntryType.DISBURSEMENT],
+            organization_id=organization_id,
+            workspace_id=workspace_id,
+        )
+
+        queryset = Entry.objects.filter(
+            organization_id=organization_id,
+            status=EntryStatus.APPROVED,
+            entry_type__in=[EntryType.WORKSPACE_EXP, EntryType.ORG_EXP],
+        )
+        if workspace_id:
+            queryset = queryset.filter(workspace_id=workspace_id)
+
+        rows = (
+            queryset.values("workspace_id", "entry_type")
+            .annotate(
+                total=Sum(
+                    ExpressionWrapper(
+                        F("amount") * F("exchange_rate_used"),
+                        output_field=DecimalField(max_digits=20, decimal_places=2),
+                    )
+                )
+            )
+            .order_by()
+        )
+
+        for row in rows:
+            entry_type = row["entry_type"]
+            scope_id = (
+                row["workspace_id"]
+                if entry_type == EntryType.WORKSPACE_EXP
+                else organization_id
+            )
+            key = (scope_id, entry_type)
+            totals[key] = totals.get(key, Decimal("0.00")) + (
+                row["total"] or Decimal("0.00")
+            )
+        return totals
+
+    @staticmethod
+    def _build_team_node(team_row, totals):
+        workspace_team_id = team_row["workspace_team_id"]
+        income = totals.get((workspace_team_id, EntryType.INCOME), Decimal("0.00"))
+        expense = totals.get(
+            (workspace_team_id, EntryType.DISBURSEMENT), Decimal("0.00")
+        )
+        due_amount = team_row["remittance__due_amount"] or Decimal("0.00")
+
+        return {
+            "title": team_row["team__title"],
+            "total_income": round(income, 2),
+            "total_expense": round(expense, 2),
+            "net_income": round(income - expense, 2),
+            "remittance_rate": team_row["custom_remittance_rate"],
+            "org_share": round(due_amount, 2),  # contribution to org
+        }
+
+    @staticmethod
+    def _build_workspace_node(workspace_row, team_nodes, totals):
+        total_income = sum((t["total_income"] for t in team_nodes), Decimal("0.00"))
+        total_expense = sum((t["total_expense"] for t in team_nodes), Decimal("0.00"))
+        total_org_share = sum((t["org_share"] for t in team_nodes), Decimal("0.00"))
+        workspace_expenses = totals.get(
+            (workspace_row["workspace_id"], EntryType.WORKSPACE_EXP), Decimal("0.00")
+        )
+
+        return {
+            "title": workspace_row["title"],
+            "total_income": round(total_income, 2),
+            "total_expense": round(total_expense, 2),
+            "net_income": round(total_income - total_expense, 2),
+            "org_share": round(total_org_share, 2),  # before workspace expenses
+            "parent_lvl_total_expense": round(workspace_expenses, 2),
+            "final_net_profit": round(total_org_share - workspace_expenses, 2),
+            "children": team_nodes,  # nested teams
+        }
+
+    @classmethod
+    def _build_workspace_nodes(cls, organization_id, workspace_id=None):
+        totals = cls.get_approved_entry_totals(organization_id, workspace_id)
+
+        workspaces = Workspace.objects.filter(organization_id=organization_id)
+        workspace_teams = WorkspaceTeam.objects.filter(
+            workspace__organization_id=organization_id
+        )
+        if workspace_id:
+            workspaces = workspaces.filter(pk=workspace_id)
+            workspace_teams = workspace_teams.filter(workspace_id=workspace_id)
+
+        teams_by_workspace = {}
+        for team_row in workspace_teams.values(
+            "workspace_team_id",
+            "workspace_id",
+            "team__title",
+            "custom_remittance_rate",
+            "remittance__due_amount",
+        ):
+            teams_by_workspace.setdefault(team_row["workspace_id"], []).append(
+                cls._build_team_node(team_row, totals)
+            )
+
+        workspace_nodes = [
+            cls._build_workspace_node(
+                workspace_row,
+                teams_by_workspace.get(workspace_row["workspace_id"], []),
+                totals,
+            )
+            for workspace_row in workspaces.values("workspace_id", "title")
+        ]
+        return workspace_nodes, totals
+
+    @classmethod
+    def get_workspace_report(cls, workspace):
+        """
+        Build the finance report node of a single workspace with its teams.
+        """
+        workspace_nodes, _ = cls._build_workspace_nodes(
+            workspace.organization_id, workspace.pk
+        )
+        return workspace_nodes[0]
+
+    @classmethod
+    def get_organization_report(cls, organization):
+        """
+        Build the full org -> workspace -> team finance report tree.
+        """
+        organization_id = organization.pk
+        workspace_nodes, totals = cls._build_workspace_nodes(organization_id)
+
+        total_income = sum(
+            (w["total_income"] for w in workspace_nodes), Decimal("0.00")
+        )
+        total_expense = sum(
+            (w["total_expense"] for w in workspace_nodes), Decimal("0.00")
+        )
+        # after workspace expenses
+        total_org_share = sum(
+            (w["final_net_profit"] for w in workspace_nodes), Decimal("0.00")
+        )
+        org_expenses = totals.get((organization_id, EntryType.ORG_EXP), Decimal("0.00"))
+
+        return {
+            "title": organization.title,
+            "total_income": round(total_income, 2),
+            "total_expense": round(total_expense, 2),
+            "net_income": round(total_income - total_expense, 2),
+            "org_share": round(total_org_share, 2),  # sum of workspace profits
+            "parent_lvl_total_expense": round(org_expenses, 2),
+            "final_net_profit": round(total_org_share - org_expenses, 2),
+            "children": workspace_nodes,
+        }
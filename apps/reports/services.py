@@ -1,7 +1,12 @@
 from apps.core.services.base_services import BaseFileExporter
+from apps.reports.selectors import EntrySelectors
 
 
 def export_overview_finance_report(context, exporter_class: type[BaseFileExporter]):
+    """
+    Flatten the precomputed report tree in ``context["report_data"]``
+    (see ``OverviewFinanceReportSelectors``) into an exportable table.
+    """
     org = context["report_data"]
     rows = []
 
@@ -83,3 +88,33 @@ def export_overview_finance_report(context, exporter_class: type[BaseFileExporte
 
     exporter = exporter_class("overview-finance-report", blocks)
     return exporter.export()
+
+
+def export_entry_report(
+    organization_id,
+    workspace_id,
+    exporter_class: type[BaseFileExporter],
+    streaming: bool = False,
+):
+    """
+    Export the entries of an organization (optionally one workspace) as a
+    single table. Rows are read lazily, so a streaming exporter never holds
+    the whole entry list in memory.
+    """
+    table_block = {
+        "type": "table",
+        "columns": [
+            ("occurred_at", "Date"),
+            ("entry_type", "Type"),
+            ("description", "Description"),
+            ("amount", "Amount"),
+            ("currency__code", "Currency"),
+            ("exchange_rate_used", "Exchange Rate"),
+            ("status", "Status"),
+            ("workspace__title", "Workspace"),
+            ("workspace_team__team__title", "Team"),
+        ],
+        "rows": EntrySelectors.get_export_rows(organization_id, workspace_id),
+    }
+    exporter = exporter_class("entry-report", [table_block], streaming=streaming)
+    return exporter.export()
@@ -1,4 +1,3 @@
-from decimal import Decimal
 from typing import Any
 
 from django.shortcuts import render
@@ -9,18 +8,18 @@ from apps.core.views.mixins import (
     OrganizationRequiredMixin,
 )
 from apps.workspaces.mixins.workspaces.mixins import WorkspaceFilteringMixin
-from apps.workspaces.models import Workspace, WorkspaceTeam
+from apps.workspaces.models import Workspace
 
 from apps.reports.permissions import can_view_report_page
 from apps.core.utils import permission_denied_view
 
-
-from apps.organizations.models import Organization
-from apps.entries.constants import EntryType, EntryStatus
-from apps.entries.selectors import get_total_amount_of_entries
 from apps.core.services.file_export_services import CsvExporter, PdfExporter
-from .services import export_overview_finance_report
-from apps.reports.selectors import EntrySelectors, RemittanceSelectors
+from .services import export_entry_report, export_overview_finance_report
+from apps.reports.selectors import (
+    EntrySelectors,
+    OverviewFinanceReportSelectors,
+    RemittanceSelectors,
+)
 
 from django.http import Http404
 
@@ -42,94 +41,6 @@ class OverviewFinanceReportView(
             )
         return super().dispatch(request, *args, **kwargs)
 
-    def _get_team_context(self, workspace_team: WorkspaceTeam):
-        income = get_total_amount_of_entries(
-            entry_type=EntryType.INCOME,
-            entry_status=EntryStatus.APPROVED,
-            workspace_team=workspace_team,
-        )
-        expense = get_total_amount_of_entries(
-            entry_type=EntryType.DISBURSEMENT,
-            entry_status=EntryStatus.APPROVED,
-            workspace_team=workspace_team,
-        )
-        net_income = income - expense
-        due_amount = workspace_team.remittance.due_amount or Decimal("0.00")
-
-        return {
-            "title": workspace_team.team.title,
-            "total_income": round(income, 2),
-            "total_expense": round(expense, 2),
-            "net_income": round(net_income, 2),
-            "remittance_rate": workspace_team.custom_remittance_rate,
-            "org_share": round(due_amount, 2),  # contribution to org
-        }
-
-    def _get_workspace_context(self, workspace: Workspace):
-        teams = workspace.joined_teams.select_related("team").all()
-        team_contexts = []
-        total_income = Decimal("0.00")
-        total_expense = Decimal("0.00")
-        total_org_share = Decimal("0.00")
-
-        for team in teams:
-            team_ctx = self._get_team_context(team)
-            team_contexts.append(team_ctx)
-            total_income += team_ctx["total_income"]
-            total_expense += team_ctx["total_expense"]
-            total_org_share += team_ctx["org_share"]
-
-        workspace_expenses = get_total_amount_of_entries(
-            entry_type=EntryType.WORKSPACE_EXP,
-            entry_status=EntryStatus.APPROVED,
-            workspace=workspace,
-        )
-
-        final_net_profit = total_org_share - workspace_expenses
-
-        return {
-            "title": workspace.title,
-            "total_income": round(total_income, 2),
-            "total_expense": round(total_expense, 2),
-            "net_income": round(total_income - total_expense, 2),
-            "org_share": round(total_org_share, 2),  # before workspace expenses
-            "parent_lvl_total_expense": round(workspace_expenses, 2),
-            "final_net_profit": round(final_net_profit, 2),
-            "children": team_contexts,  # nested teams
-        }
-
-    def _get_organization_context(self, org: Organization):
-        workspaces = org.workspaces.all()
-        workspace_contexts = []
-        total_income = Decimal("0.00")
-        total_expense = Decimal("0.00")
-        total_org_share = Decimal("0.00")
-
-        for ws in workspaces:
-            ws_ctx = self._get_workspace_context(ws)
-            workspace_contexts.append(ws_ctx)
-            total_income += ws_ctx["total_income"]
-            total_expense += ws_ctx["total_expense"]
-            total_org_share += ws_ctx["final_net_profit"]  # after workspace expenses
-
-        org_expenses = get_total_amount_of_entries(
-            entry_type=EntryType.ORG_EXP,
-            entry_status=EntryStatus.APPROVED,
-            org=org,
-        )
-        final_net_profit = total_org_share - org_expenses
-
-        return {
-            "title": org.title,
-            "total_income": round(total_income, 2),
-            "total_expense": round(total_expense, 2),
-            "net_income": round(total_income - total_expense, 2),
-            "org_share": round(total_org_share, 2),  # sum of workspace profits
-            "parent_lvl_total_expense": round(org_expenses, 2),
-            "final_net_profit": round(final_net_profit, 2),
-            "children": workspace_contexts,
-        }
-
     def get_context_data(self, **kwargs) -> dict[str, any]:
         workspace_filter = self.request.GET.get("workspace") or None
         base_context = super().get_context_data(**kwargs)
@@ -142,11 +53,15 @@ class OverviewFinanceReportView(
                     pk=workspace_filter, organization=self.organization
                 )
                 # workspace context uses workspace_* keys
-                org_data = self._get_workspace_context(workspace)
+                org_data = OverviewFinanceReportSelectors.get_workspace_report(
+                    workspace
+                )
                 org_data["level"] = "workspace"
             else:
                 # org context uses org_* keys
-                org_data = self._get_organization_context(self.organization)
+                org_data = OverviewFinanceReportSelectors.get_organization_report(
+                    self.organization
+                )
                 org_data["level"] = "org"
         except Exception as e:
             print(f"Error fetching report data: {e}")
@@ -252,6 +167,25 @@ class EntryReportView(
 
         return base_context
 
+    def post(self, request, *args, **kwargs):
+        if not can_view_report_page(request.user, self.organization):
+            return permission_denied_view(
+                request,
+                "You do not have permission to export the entry report.",
+            )
+        export_format = (
+            request.POST.get("format") or request.GET.get("format", "csv")
+        ).lower()
+        if export_format != "csv":
+            raise Http404(f"Unsupported export format: {export_format}")
+        # Entry exports can be large; stream the rows instead of buffering them
+        return export_entry_report(
+            self.organization.pk,
+            request.GET.get("workspace") or None,
+            CsvExporter,
+            streaming=True,
+        )
+
     def render_to_response(self, context, **response_kwargs):
         if self.request.htmx:
             return render(self.request, self.content_template_name, context)
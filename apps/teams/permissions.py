@@ -1,4 +1,5 @@
 from guardian.shortcuts import assign_perm
+from apps.core.object_permissions import has_object_perm
 from apps.core.permissions import TeamPermissions, OrganizationPermissions
 from django.contrib.auth.models import Group
 from apps.core.roles import get_permissions_for_role
@@ -88,7 +89,9 @@ def update_team_coordinator_group(team, previous_coordinator, new_coordinator):
 
 
 def check_add_team_permission(request, organization):
-    if not request.user.has_perm(OrganizationPermissions.ADD_TEAM, organization):
+    if not has_object_perm(
+        request.user, OrganizationPermissions.ADD_TEAM, organization
+    ):
         return permission_denied_view(
             request,
             "You do not have permission to create a team in this organization.",
@@ -96,7 +99,7 @@ def check_add_team_permission(request, organization):
 
 
 def check_change_team_permission(request, team):
-    if not request.user.has_perm(TeamPermissions.CHANGE_TEAM, team):
+    if not has_object_perm(request.user, TeamPermissions.CHANGE_TEAM, team):
         return permission_denied_view(
             request,
             "You do not have permission to change the team in this organization.",
@@ -104,7 +107,7 @@ def check_change_team_permission(request, team):
 
 
 def check_delete_team_permission(request, team):
-    if not request.user.has_perm(TeamPermissions.DELETE_TEAM, team):
+    if not has_object_perm(request.user, TeamPermissions.DELETE_TEAM, team):
         return permission_denied_view(
             request,
             "You do not have permission to delete the team in this organization.",
@@ -112,7 +115,7 @@ def check_delete_team_permission(request, team):
 
 
 def check_add_team_member_permission(request, team):
-    if not request.user.has_perm(TeamPermissions.ADD_TEAM_MEMBER, team):
+    if not has_object_perm(request.user, TeamPermissions.ADD_TEAM_MEMBER, team):
         return permission_denied_view(
             request,
             "You do not have permission to add a team member to this team.",
@@ -120,7 +123,7 @@ def check_add_team_member_permission(request, team):
 
 
 def check_view_team_permission(request, team):
-    if not request.user.has_perm(TeamPermissions.VIEW_TEAM, team):
+    if not has_object_perm(request.user, TeamPermissions.VIEW_TEAM, team):
         return permission_denied_view(
             request,
             "You do not have permission to view the team in this organization.",
@@ -1,4 +1,7 @@
+from django.db.models import Count, Prefetch, Q
+
 from apps.teams.models import TeamMember, Team
+from apps.workspaces.models import WorkspaceTeam
 
 
 def get_team_members(team=None, prefetch_user=False):
@@ -30,6 +33,37 @@ def get_teams_by_organization_id(organization_id):
         return Team.objects.none()
 
 
+def get_team_directory(organization_id, search=None):
+    """
+    Get the teams of an organization for the teams page.
+
+    Each team comes with its coordinator, its workspace teams (and their
+    workspaces) prefetched into ``attached_workspaces`` and its active
+    members counted into ``members_count``, so rendering a page of teams
+    runs a fixed number of queries.
+    """
+    queryset = (
+        Team.objects.filter(organization_id=organization_id)
+        .select_related("team_coordinator__user")
+        .prefetch_related(
+            Prefetch(
+                "joined_workspaces",
+                queryset=WorkspaceTeam.objects.select_related("workspace"),
+                to_attr="attached_workspaces",
+            )
+        )
+        .annotate(
+            members_count=Count("members", filter=Q(members__deleted_at__isnull=True))
+        )
+        .order_by("-created_at", "-team_id")
+    )
+    if search:
+        queryset = queryset.filter(
+            Q(title__icontains=search) | Q(description__icontains=search)
+        )
+    return queryset
+
+
 def get_team_by_id(team_id):
     """
     Get a team by its ID.
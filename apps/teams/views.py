@@ -5,7 +5,7 @@ from django.contrib import messages
 from django_htmx.http import HttpResponseClientRedirect
 from apps.workspaces.models import WorkspaceTeam
 from apps.teams.forms import TeamForm
-from apps.teams.selectors import get_teams_by_organization_id, get_team_by_id
+from apps.teams.selectors import get_team_directory, get_team_by_id
 from apps.teams.services import create_team_from_form
 from django.template.loader import render_to_string
 from django.http import HttpResponse
@@ -16,7 +16,7 @@ from apps.teams.exceptions import TeamMemberCreationError, TeamMemberDeletionErr
 from apps.teams.selectors import get_team_member_by_id
 from apps.teams.forms import EditTeamMemberRoleForm
 from apps.teams.services import update_team_member_role
-from apps.teams.selectors import get_team_members_by_team_id
+from apps.teams.selectors import get_team_members
 from apps.organizations.selectors import get_orgMember_by_user_id_and_organization_id
 from apps.teams.services import update_team_from_form, remove_team_member
 from apps.core.permissions import OrganizationPermissions
@@ -28,7 +28,12 @@ from apps.teams.permissions import (
     check_add_team_member_permission,
     check_view_team_permission,
 )
-from apps.core.utils import can_manage_organization, permission_denied_view
+from apps.core.utils import (
+    can_manage_organization,
+    get_paginated_context,
+    permission_denied_view,
+)
+from apps.core.constants import PAGINATION_SIZE_GRID
 from django.contrib.auth.decorators import login_required
 from apps.teams.utils import (
     add_user_to_workspace_team_group,
@@ -36,6 +41,22 @@ from apps.teams.utils import (
 )
 
 
+def get_teams_grid_context(request, organization_id, context):
+    """
+    Add the current page of the organization's teams, filtered by the
+    ``search`` query parameter, to ``context``.
+    """
+    search = request.GET.get("search", "").strip()
+    context["search"] = search
+    return get_paginated_context(
+        queryset=get_team_directory(organization_id, search=search),
+        context=context,
+        object_name="teams",
+        page_size=PAGINATION_SIZE_GRID,
+        page_no=request.GET.get("page", 1),
+    )
+
+
 # Create your views here.
 @login_required
 def teams_view(request, organization_id):
@@ -46,13 +67,6 @@ def teams_view(request, organization_id):
                 request,
                 "You do not have permission to access this organization.",
             )
-        teams = get_teams_by_organization_id(organization_id)
-        attached_workspaces = []  # Initialize the variable
-        # to display the workspaces attached to the team
-        for team in teams:
-            attached_workspaces = WorkspaceTeam.objects.filter(team_id=team.team_id)
-            team.attached_workspaces = attached_workspaces
-        organization = get_organization_by_id(organization_id)
         # sending true or false to the template to display the new team button
         can_add_team = request.user.has_perm(
             OrganizationPermissions.ADD_TEAM, organization
@@ -60,11 +74,13 @@ def teams_view(request, organization_id):
         permissions = {
             "can_add_team": can_add_team,  # false
         }
-        context = {
-            "teams": teams,
-            "organization": organization,
-            "permissions": permissions,
-        }
+        context = get_teams_grid_context(
+            request,
+            organization_id,
+            {"organization": organization, "permissions": permissions},
+        )
+        if request.headers.get("HX-Request"):
+            return render(request, "teams/partials/teams_grid.html", context)
         return render(request, "teams/index.html", context)
     except Exception as e:
         messages.error(request, f"An unexpected error occurred: {str(e)}")
@@ -89,18 +105,11 @@ def create_team_view(request, organization_id):
                 )
                 messages.success(request, "Team created successfully.")
                 if request.headers.get("HX-Request"):
-                    teams = get_teams_by_organization_id(organization_id)
-                    attached_workspaces = []  # Initialize the variable
-                    for team in teams:
-                        attached_workspaces = WorkspaceTeam.objects.filter(
-                            team_id=team.team_id
-                        )
-                        team.attached_workspaces = attached_workspaces
-                    context = {
-                        "teams": teams,
-                        "organization": organization,
-                        "is_oob": True,
-                    }
+                    context = get_teams_grid_context(
+                        request,
+                        organization_id,
+                        {"organization": organization, "is_oob": True},
+                    )
                     teams_grid_html = render_to_string(
                         "teams/partials/teams_grid.html",
                         context=context,
@@ -192,29 +201,22 @@ def edit_team_view(request, organization_id, team_id):
                 )
 
                 messages.success(request, "Team updated successfully.")
-                teams = get_teams_by_organization_id(organization_id)
-                attached_workspaces = []  # Initialize the variable
-                for team in teams:
-                    attached_workspaces = WorkspaceTeam.objects.filter(
-                        team_id=team.team_id
-                    )
-                    team.attached_workspaces = attached_workspaces
-                    context = {
-                        "teams": teams,
-                        "organization": organization,
-                        "is_oob": True,
-                    }
-                    teams_grid_html = render_to_string(
-                        "teams/partials/teams_grid.html",
-                        context=context,
-                        request=request,
-                    )
-                    message_html = render_to_string(
-                        "includes/message.html", context=context, request=request
-                    )
-                    response = HttpResponse(f"{message_html} {teams_grid_html}")
-                    response["HX-trigger"] = "success"
-                    return response
+                context = get_teams_grid_context(
+                    request,
+                    organization_id,
+                    {"organization": organization, "is_oob": True},
+                )
+                teams_grid_html = render_to_string(
+                    "teams/partials/teams_grid.html",
+                    context=context,
+                    request=request,
+                )
+                message_html = render_to_string(
+                    "includes/message.html", context=context, request=request
+                )
+                response = HttpResponse(f"{message_html} {teams_grid_html}")
+                response["HX-trigger"] = "success"
+                return response
             else:
                 messages.error(request, "Invalid form data.")
                 context = {
@@ -266,18 +268,11 @@ def delete_team_view(request, organization_id, team_id):
                 workspace_teams.delete()
                 team.delete()
                 messages.success(request, "Team deleted successfully.")
-                teams = get_teams_by_organization_id(organization_id)
-                attached_workspaces = []  # Initialize the variable
-                for team in teams:
-                    attached_workspaces = WorkspaceTeam.objects.filter(
-                        team_id=team.team_id
-                    )
-                    team.attached_workspaces = attached_workspaces
-                context = {
-                    "teams": teams,
-                    "organization": organization,
-                    "is_oob": True,
-                }
+                context = get_teams_grid_context(
+                    request,
+                    organization_id,
+                    {"organization": organization, "is_oob": True},
+                )
                 teams_grid_html = render_to_string(
                     "teams/partials/teams_grid.html",
                     context=context,
@@ -313,7 +308,7 @@ def get_team_members_view(request, organization_id, team_id):
             return permission_check
 
         organization = get_organization_by_id(organization_id)
-        team_members = get_team_members_by_team_id(team_id)
+        team_members = get_team_members(team=team, prefetch_user=True)
 
         permissions = {
             "can_change_team_coordinator": request.user.has_perm(
@@ -367,7 +362,7 @@ def add_team_member_view(request, organization_id, team_id):
                             organization,
                         ),
                     }
-                    team_members = get_team_members_by_team_id(team_id)
+                    team_members = get_team_members(team=team, prefetch_user=True)
                     context = {
                         "team": team,
                         "organization": organization,
@@ -530,7 +525,7 @@ def edit_team_member_role_view(request, organization_id, team_id, team_member_id
                     ),
                 }
                 # Get the updated team member
-                team_members = get_team_members_by_team_id(team_id)
+                team_members = get_team_members(team=team, prefetch_user=True)
                 context = {
                     "team": team,
                     "organization": organization,
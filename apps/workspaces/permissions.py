@@ -4,6 +4,7 @@ from django.contrib.auth.models import Group
 from guardian.shortcuts import assign_perm
 
 from apps.auditlog.business_logger import BusinessAuditLogger
+from apps.core.object_permissions import has_object_perm
 from apps.core.permissions import (
     OrganizationPermissions,
     WorkspacePermissions,
@@ -238,7 +239,9 @@ def check_create_workspace_permission(request, organization):
     """
     Checks if the user is the organization owner. If not, returns an error response.
     """
-    if not request.user.has_perm(OrganizationPermissions.ADD_WORKSPACE, organization):
+    if not has_object_perm(
+        request.user, OrganizationPermissions.ADD_WORKSPACE, organization
+    ):
         # that will route to the permission denied view
         return permission_denied_view(
             request,
@@ -251,8 +254,8 @@ def check_change_workspace_admin_permission(request, organization):
     """
     Checks if the user is the organization owner. If not, returns an error response.
     """
-    if not request.user.has_perm(
-        OrganizationPermissions.CHANGE_WORKSPACE_ADMIN, organization
+    if not has_object_perm(
+        request.user, OrganizationPermissions.CHANGE_WORKSPACE_ADMIN, organization
     ):
         return permission_denied_view(
             request,
@@ -262,7 +265,9 @@ def check_change_workspace_admin_permission(request, organization):
 
 # check if the user has permission to edit the workspace
 def check_change_workspace_permission(request, workspace):
-    if not request.user.has_perm(WorkspacePermissions.CHANGE_WORKSPACE, workspace):
+    if not has_object_perm(
+        request.user, WorkspacePermissions.CHANGE_WORKSPACE, workspace
+    ):
         return permission_denied_view(
             request,
             "You do not have permission to change the workspace in this organization.",
@@ -1,4 +1,4 @@
-from django.db.models import Q
+from django.db.models import Count, Exists, OuterRef, Q
 from apps.workspaces.models import Workspace, WorkspaceExchangeRate
 from apps.organizations.models import Organization
 from apps.organizations.models import OrganizationMember
@@ -184,47 +184,35 @@ def get_team_by_id(team_id):
 
 
 def get_workspaces_with_team_counts(organization_id, user):
+    """
+    Return the workspaces of the organization visible to the user, annotated
+    with their ``teams_count``.
+
+    The organization owner sees every workspace; other members see the
+    workspaces they administer, review or coordinate a team in. The result
+    is a lazy queryset, so paginating it runs a single query per page.
+    """
     try:
         organization = get_organization_by_id(organization_id)
         # edge case for test cases
         if organization is None:
             return None
 
-        workspaces = get_user_workspaces_under_organization(organization_id)
-        # add teams count to each workspace for display purposes
-        for workspace in workspaces:
-            workspace.teams_count = get_workspace_teams_by_workspace_id(
-                workspace.workspace_id
-            ).count()
-
-        if organization.owner and user == organization.owner.user:
-            # for owner, return all workspaces
-            return workspaces
-        else:
-            # for other roles , filter the relevant workspaces based on the user's role
-            workspaces_filtered = []
-            for workspace in workspaces:
-                if workspace.workspace_admin and user == workspace.workspace_admin.user:
-                    # return workspaces where user is workspace admin
-                    workspaces_filtered.append(workspace)
-                elif (
-                    workspace.operations_reviewer
-                    and user == workspace.operations_reviewer.user
-                ):
-                    # return workspaces where user is operations reviewer
-                    workspaces_filtered.append(workspace)
-                else:
-                    # return workspaces where user is team coordinator
-                    workspace_teams = get_workspace_teams_by_workspace_id(
-                        workspace.workspace_id
-                    )
-                    for workspace_team in workspace_teams:
-                        if (
-                            workspace_team.team.team_coordinator
-                            and user == workspace_team.team.team_coordinator.user
-                        ):
-                            workspaces_filtered.append(workspace)
-            return workspaces_filtered
+        coordinated_workspace_teams = WorkspaceTeam.objects.filter(
+            workspace=OuterRef("pk"), team__team_coordinator__user=user
+        )
+        return (
+            Workspace.objects.filter(organization=organization)
+            .filter(
+                Q(organization__owner__user=user)
+                | Q(workspace_admin__user=user)
+                | Q(operations_reviewer__user=user)
+                | Exists(coordinated_workspace_teams)
+            )
+            .select_related("workspace_admin__user", "operations_reviewer__user")
+            .annotate(teams_count=Count("joined_teams"))
+            .order_by("-created_at", "-workspace_id")
+        )
 
     except Exception as e:
         print(f"Error in get_workspaces_with_team_counts: {str(e)}")
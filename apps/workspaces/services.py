@@ -8,6 +8,7 @@ from django.utils import timezone
 from apps.auditlog.business_logger import BusinessAuditLogger
 from apps.core.utils import model_update
 from apps.currencies.selectors import get_or_create_currency_by_code
+from apps.entries.services import EntryRerateService
 from apps.workspaces.exceptions import WorkspaceCreationError, WorkspaceUpdateError
 from apps.workspaces.models import Workspace, WorkspaceExchangeRate, WorkspaceTeam
 from apps.workspaces.permissions import (
@@ -342,6 +343,11 @@ def create_workspace_exchange_rate(
             added_by=organization_member,
             note=note,
         )
+        if exchange_rate.is_approved:
+            EntryRerateService.schedule_rerate(
+                exchange_rate=exchange_rate,
+                user=organization_member.user if organization_member else None,
+            )
 
         # Log successful exchange rate creation
         try:
@@ -428,6 +434,11 @@ def update_workspace_exchange_rate(
                 "approved_by": org_member if is_approved else None,
             },
         )
+        if previous_approval_status != is_approved:
+            EntryRerateService.schedule_rerate(
+                exchange_rate=workspace_exchange_rate,
+                user=org_member.user if org_member else None,
+            )
 
         # Log successful exchange rate update
         try:
@@ -491,6 +502,10 @@ def delete_workspace_exchange_rate(*, workspace_exchange_rate, user=None):
         rate_value = workspace_exchange_rate.rate
 
         workspace_exchange_rate.delete()
+        if workspace_exchange_rate.is_approved:
+            EntryRerateService.schedule_rerate(
+                exchange_rate=workspace_exchange_rate, user=user
+            )
 
         # Log successful exchange rate deletion
         try:
@@ -36,7 +36,6 @@ from apps.workspaces.exceptions import AddTeamToWorkspaceError
 from apps.workspaces.selectors import get_workspace_teams_by_workspace_id
 from apps.workspaces.selectors import get_workspaces_with_team_counts
 from apps.workspaces.services import remove_team_from_workspace, add_team_to_workspace
-from django.contrib.auth.models import Group
 from apps.workspaces.forms import ChangeWorkspaceTeamRemittanceRateForm
 from apps.workspaces.selectors import (
     get_workspace_team_by_workspace_team_id,
@@ -64,6 +63,8 @@ from apps.currencies.constants import (
 from apps.currencies.views.mixins import ExchangeRateUrlIdentifierMixin
 from apps.core.views.mixins import WorkspaceRequiredMixin
 from apps.core.utils import get_paginated_context
+from apps.core.services.deletion import start_workspace_deletion
+from apps.core.constants import PAGINATION_SIZE_GRID
 from .mixins.workspace_exchange_rate.required_mixins import (
     WorkspaceExchangeRateRequiredMixin,
 )
@@ -81,6 +82,20 @@ from apps.workspaces.utils import (
 )
 
 
+def get_workspaces_grid_context(request, organization_id, context):
+    """
+    Add the current page of the user's workspaces to ``context``.
+    """
+    workspaces = get_workspaces_with_team_counts(organization_id, request.user)
+    return get_paginated_context(
+        queryset=workspaces if workspaces is not None else [],
+        context=context,
+        object_name="workspaces",
+        page_size=PAGINATION_SIZE_GRID,
+        page_no=request.GET.get("page", 1),
+    )
+
+
 @login_required
 def get_workspaces_view(request, organization_id):
     try:
@@ -92,16 +107,13 @@ def get_workspaces_view(request, organization_id):
             )
         # already filtered in the selector
         # for owners, show all workspaces
-        # for
-        workspaces = get_workspaces_with_team_counts(organization_id, request.user)
-        return render(
-            request,
-            "workspaces/index.html",
-            {
-                "workspaces": workspaces,
-                "organization": organization,
-            },
+        # for other roles, only the workspaces they take part in
+        context = get_workspaces_grid_context(
+            request, organization_id, {"organization": organization}
         )
+        if request.headers.get("HX-Request"):
+            return render(request, "workspaces/partials/workspaces_grid.html", context)
+        return render(request, "workspaces/index.html", context)
     except Exception as e:
         print(f"Error: {e}")
         messages.error(request, f"An unexpected error occurred: {str(e)}")
@@ -129,15 +141,11 @@ def create_workspace_view(request, organization_id):
                     )
                     messages.success(request, "Workspace created successfully.")
                     if request.headers.get("HX-Request"):
-                        organization = get_organization_by_id(organization_id)
-                        workspaces = get_workspaces_with_team_counts(
-                            organization_id, request.user
+                        context = get_workspaces_grid_context(
+                            request,
+                            organization_id,
+                            {"organization": organization, "is_oob": True},
                         )
-                        context = {
-                            "workspaces": workspaces,
-                            "organization": organization,
-                            "is_oob": True,
-                        }
                         message_html = render_to_string(
                             "includes/message.html", context=context, request=request
                         )
@@ -304,31 +312,21 @@ def delete_workspace_view(request, organization_id, workspace_id):
             )
 
         if request.method == "POST":
-            # Set audit user for automatic signal-based logging
-            workspace._audit_user = request.user
-
-            group_name = f"Workspace Admins - {workspace_id}"
-            group = Group.objects.filter(name=group_name).first()
-            group.delete()
-            workspace.delete()
-            messages.success(request, "Workspace deleted successfully.")
-            organization = get_organization_by_id(organization_id)
-            workspaces = get_workspaces_with_team_counts(organization_id, request.user)
-            context = {
-                "workspaces": workspaces,
-                "organization": organization,
-                "is_oob": True,
-            }
+            # The workspace and everything under it are deleted in the
+            # background; its card shows the progress until then
+            job = start_workspace_deletion(workspace=workspace, user=request.user)
+            messages.success(request, "Workspace deletion started.")
+            context = {"job": job, "is_oob": True}
             message_html = render_to_string(
                 "includes/message.html", context=context, request=request
             )
-            workspaces_grid_html = render_to_string(
-                "workspaces/partials/workspaces_grid.html",
+            progress_html = render_to_string(
+                "components/deletion_progress.html",
                 context=context,
                 request=request,
             )
 
-            response = HttpResponse(f"{message_html} {workspaces_grid_html}")
+            response = HttpResponse(f"{message_html} {progress_html}")
             response["HX-trigger"] = "success"
             return response
 
@@ -90,6 +90,8 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "django_htmx.middleware.HtmxMiddleware",
+    "apps.core.middleware.ObjectPermissionMiddleware",
+    "apps.auditlog.middleware.AuditBufferMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
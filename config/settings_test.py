@@ -50,6 +50,8 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "apps.core.middleware.ObjectPermissionMiddleware",
+    "apps.auditlog.middleware.AuditBufferMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
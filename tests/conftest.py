@@ -21,3 +21,32 @@ def test_case():
     Provide a TestCase instance for use in tests that need it.
     """
     return TestCase()
+
+
+@pytest.fixture(autouse=True)
+def reset_email_connection_pool():
+    """
+    Drop pooled SMTP connections between tests so every test talks to the
+    yagmail client it patched in.
+    """
+    from apps.emails.transport import connection_pool
+
+    connection_pool.close_all()
+    yield
+    connection_pool.close_all()
+
+
+@pytest.fixture
+def locmem_cache(settings):
+    """
+    Swap the test DummyCache for an empty local-memory cache, for tests of
+    code whose behaviour depends on values actually being cached.
+    """
+    from django.core.cache import cache
+
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    cache.clear()
+    yield
+    cache.clear()
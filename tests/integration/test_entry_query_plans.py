@@ -0,0 +1,97 @@
+"""
+Query plan regression tests for the entry selectors.
+
+Seeds a few workspaces with entries, refreshes the planner statistics and
+asserts via ``EXPLAIN`` that the hot selectors are served by the composite
+``entry_*_feed_idx`` indexes instead of a scan of the whole entry table.
+"""
+
+import pytest
+from django.db import connection
+
+from apps.entries.constants import EntryStatus, EntryType
+from apps.entries.models import Entry
+from apps.entries.selectors import get_entries
+from tests.factories import (
+    DisbursementEntryFactory,
+    IncomeEntryFactory,
+    OrganizationWithOwnerFactory,
+    WorkspaceFactory,
+    WorkspaceTeamFactory,
+)
+
+ENTRY_TABLE = Entry._meta.db_table
+
+
+def assert_uses_index(queryset, index_name):
+    """Fail unless the plan for ``queryset`` reads the entry table via ``index_name``."""
+    plan = queryset.explain()
+    assert index_name in plan, plan
+    if connection.vendor == "sqlite":
+        assert f"SCAN {ENTRY_TABLE}" not in plan, plan
+    elif connection.vendor == "postgresql":
+        assert f"Seq Scan on {ENTRY_TABLE}" not in plan, plan
+
+
+@pytest.fixture
+def seeded_entries():
+    """Three workspaces with two teams each and a mix of entry types/statuses."""
+    organization = OrganizationWithOwnerFactory()
+    teams = []
+    for _ in range(3):
+        workspace = WorkspaceFactory(organization=organization)
+        for _ in range(2):
+            workspace_team = WorkspaceTeamFactory(workspace=workspace)
+            teams.append(workspace_team)
+            for status in (EntryStatus.PENDING, EntryStatus.APPROVED):
+                for factory in (IncomeEntryFactory, DisbursementEntryFactory):
+                    factory.create_batch(
+                        3,
+                        organization=organization,
+                        workspace=workspace,
+                        workspace_team=workspace_team,
+                        status=status,
+                    )
+
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+    return {"organization": organization, "workspace_team": teams[0]}
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+class TestEntryQueryPlans:
+    def test_get_entries_for_workspace_team_uses_team_index(self, seeded_entries):
+        queryset = get_entries(
+            workspace_team=seeded_entries["workspace_team"],
+            entry_types=[EntryType.INCOME, EntryType.DISBURSEMENT],
+            statuses=[EntryStatus.APPROVED],
+        )
+
+        assert_uses_index(queryset, "entry_team_feed_idx")
+
+    def test_get_entries_for_workspace_uses_workspace_index(self, seeded_entries):
+        queryset = get_entries(
+            workspace=seeded_entries["workspace_team"].workspace,
+            entry_types=[EntryType.INCOME, EntryType.DISBURSEMENT],
+            statuses=[EntryStatus.PENDING],
+        )
+
+        assert_uses_index(queryset, "entry_workspace_feed_idx")
+
+    def test_get_entries_for_organization_uses_org_index(self, seeded_entries):
+        queryset = get_entries(
+            organization=seeded_entries["organization"],
+            entry_types=[EntryType.INCOME],
+            statuses=[EntryStatus.APPROVED],
+        )
+
+        assert_uses_index(queryset, "entry_org_feed_idx")
+
+    def test_team_total_aggregate_uses_team_index(self, seeded_entries):
+        queryset = seeded_entries["workspace_team"].entries.filter(
+            entry_type=EntryType.INCOME, status=EntryStatus.APPROVED
+        )
+
+        assert_uses_index(queryset, "entry_team_feed_idx")
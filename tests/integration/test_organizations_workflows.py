@@ -9,14 +9,18 @@ Following the test plan: Organizations App (apps.organizations)
 """
 
 import pytest
-from django.test import TestCase
+from django.test import Client, TestCase
 from django.db import IntegrityError
+from django.urls import reverse
 
 from apps.organizations.models import Organization
 from tests.factories import (
     CustomUserFactory,
     OrganizationFactory,
     OrganizationMemberFactory,
+    TeamFactory,
+    WorkspaceFactory,
+    WorkspaceTeamFactory,
 )
 
 
@@ -206,3 +210,33 @@ class TestOrganizationMembershipQueries(TestCase):
         self.assertEqual(active_members.count(), 1)
         self.assertIn(active_member, active_members)
         self.assertNotIn(inactive_member, active_members)
+
+
+@pytest.mark.integration
+class TestOrganizationOverviewView(TestCase):
+    """Test the organization overview page."""
+
+    @pytest.mark.django_db
+    def test_overview_renders_organization_counts(self):
+        """Test that the overview page renders with member, workspace and team counts."""
+        organization = OrganizationFactory()
+        member = OrganizationMemberFactory(organization=organization)
+        OrganizationMemberFactory(organization=organization)
+        workspace = WorkspaceFactory(organization=organization)
+        WorkspaceTeamFactory(
+            workspace=workspace, team=TeamFactory(organization=organization)
+        )
+
+        client = Client()
+        client.force_login(member.user)
+        response = client.get(
+            reverse(
+                "organization_overview",
+                kwargs={"organization_id": organization.organization_id},
+            )
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["members"], 2)
+        self.assertEqual(response.context["workspaces"], 1)
+        self.assertEqual(response.context["teams"], 1)
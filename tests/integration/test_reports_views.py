@@ -0,0 +1,59 @@
+"""
+Integration tests for the report views.
+"""
+
+import pytest
+from django.http import StreamingHttpResponse
+from django.test import Client, TestCase
+from django.urls import reverse
+from guardian.shortcuts import assign_perm
+
+from apps.core.permissions import OrganizationPermissions
+from tests.factories import (
+    EntryFactory,
+    OrganizationMemberFactory,
+    WorkspaceFactory,
+)
+
+
+@pytest.mark.integration
+class TestEntryReportExport(TestCase):
+    """Test exporting the entries of an organization from the entry report."""
+
+    def setUp(self):
+        self.member = OrganizationMemberFactory()
+        self.organization = self.member.organization
+        self.workspace = WorkspaceFactory(organization=self.organization)
+        self.url = reverse(
+            "entry_report",
+            kwargs={"organization_id": self.organization.organization_id},
+        )
+        self.client = Client()
+        self.client.force_login(self.member.user)
+
+    def test_export_streams_entries_as_csv(self):
+        assign_perm(
+            OrganizationPermissions.VIEW_REPORT_PAGE,
+            self.member.user,
+            self.organization,
+        )
+        entry = EntryFactory(organization=self.organization, workspace=self.workspace)
+
+        response = self.client.post(self.url, {"format": "csv"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertTrue(lines[0].startswith("Date,Type,Description,Amount"))
+        self.assertEqual(len(lines), 2)
+        self.assertIn(entry.description, lines[1])
+
+    def test_export_requires_report_permission(self):
+        EntryFactory(organization=self.organization, workspace=self.workspace)
+
+        response = self.client.post(self.url, {"format": "csv"})
+
+        self.assertRedirects(
+            response, reverse("permission_denied"), fetch_redirect_response=False
+        )
@@ -9,7 +9,9 @@ from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from guardian.shortcuts import assign_perm
 
@@ -22,6 +24,7 @@ from tests.factories.organization_factories import (
     OrganizationWithOwnerFactory,
 )
 from tests.factories.team_factories import TeamFactory, TeamMemberFactory
+from tests.factories.workspace_factories import WorkspaceFactory, WorkspaceTeamFactory
 from tests.factories.user_factories import CustomUserFactory
 
 User = get_user_model()
@@ -79,6 +82,75 @@ class TeamViewsIntegrationTest(TestCase):
         self.assertIn("teams", response.context)
         self.assertIn("organization", response.context)
 
+    def _count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def _create_team_with_workspaces_and_members(self):
+        team = self.create_team_with_permissions()
+        for _ in range(2):
+            WorkspaceTeamFactory(
+                workspace=WorkspaceFactory(organization=self.organization), team=team
+            )
+            TeamMemberFactory(
+                team=team,
+                organization_member=OrganizationMemberFactory(
+                    organization=self.organization
+                ),
+            )
+        return team
+
+    def test_teams_view_query_budget(self):
+        """Test the teams page runs the same queries however many teams it shows."""
+        url = reverse(
+            "teams", kwargs={"organization_id": self.organization.organization_id}
+        )
+        self._create_team_with_workspaces_and_members()
+        budget = self._count_queries(url)
+
+        for _ in range(5):
+            self._create_team_with_workspaces_and_members()
+
+        self.assertEqual(self._count_queries(url), budget)
+
+    def test_teams_view_search_integration(self):
+        """Test the teams page filters teams by the search term."""
+        self.create_team_with_permissions(title="Logistics")
+        self.create_team_with_permissions(title="Fundraising")
+
+        url = reverse(
+            "teams", kwargs={"organization_id": self.organization.organization_id}
+        )
+        response = self.client.get(url, {"search": "logis"}, HTTP_HX_REQUEST="true")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Logistics")
+        self.assertNotContains(response, "Fundraising")
+
+    def test_get_team_members_view_query_budget(self):
+        """Test the team members page does not query once per member."""
+        team = self._create_team_with_workspaces_and_members()
+        url = reverse(
+            "team_members",
+            kwargs={
+                "organization_id": self.organization.organization_id,
+                "team_id": team.team_id,
+            },
+        )
+        budget = self._count_queries(url)
+
+        for _ in range(5):
+            TeamMemberFactory(
+                team=team,
+                organization_member=OrganizationMemberFactory(
+                    organization=self.organization
+                ),
+            )
+
+        self.assertEqual(self._count_queries(url), budget)
+
     def test_create_team_view_get_integration(self):
         """Test create team view GET request integration."""
         url = reverse(
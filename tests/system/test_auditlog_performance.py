@@ -15,15 +15,22 @@ import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 import pytest
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import connection, models
 from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 
 from apps.auditlog.business_logger import BusinessAuditLogger
 from apps.auditlog.constants import AuditActionType
 from apps.auditlog.models import AuditTrail
+from apps.auditlog.search import (
+    SEARCH_INDEX_NAME,
+    create_search_index,
+    is_indexed_search_supported,
+)
 from apps.auditlog.selectors import (
     AuditLogSelector,
 )
@@ -35,7 +42,9 @@ from tests.factories import (
     CustomUserFactory,
     EntryFactory,
     OrganizationFactory,
+    TeamMemberFactory,
     WorkspaceFactory,
+    WorkspaceTeamFactory,
 )
 
 User = get_user_model()
@@ -679,6 +688,69 @@ class TestAuditLogScalability(TestCase):
             self.assertLess(query_time, 0.5)  # 0.5 seconds max
 
 
+@pytest.mark.system
+class TestAuditLogSearchScalability(TestCase):
+    """Check that audit search is served by the trigram index."""
+
+    def setUp(self):
+        """Clear existing audit logs before each test."""
+        AuditTrail.objects.all().delete()
+        self.user = CustomUserFactory()
+
+    def _seed_audits(self, count, needle_every=50):
+        audits = []
+        for i in range(count):
+            description = (
+                "needle expense" if i % needle_every == 0 else f"routine expense {i}"
+            )
+            audit = AuditTrail(
+                user=self.user,
+                action_type=AuditActionType.ENTRY_CREATED,
+                metadata={"description": description},
+            )
+            audit.search_text = audit.build_search_text()
+            audits.append(audit)
+        AuditTrail.objects.bulk_create(audits, batch_size=500)
+
+    @pytest.mark.skipif(
+        not is_indexed_search_supported(),
+        reason="The trigram search index only exists on PostgreSQL",
+    )
+    @pytest.mark.django_db
+    def test_search_plan_uses_trigram_index(self):
+        """Search queries should read audits through the trigram index."""
+        # Test databases are built without migrations, which create the index
+        create_search_index()
+        self._seed_audits(10000, needle_every=500)
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE "{AuditTrail._meta.db_table}"')
+
+        for order_by in ["-timestamp", "relevance"]:
+            queryset = AuditLogSelector.get_audit_logs_with_filters(
+                search_query="Needle", order_by=order_by
+            )[:20]
+            plan = queryset.explain()
+            self.assertIn(SEARCH_INDEX_NAME, plan, plan)
+
+    @pytest.mark.django_db
+    def test_search_matches_metadata_action_and_user(self):
+        """The search text covers metadata, action display names and users."""
+        self._seed_audits(100)
+
+        for search_query in ["needle", "Entry Created", self.user.email.upper()]:
+            result = AuditLogSelector.get_audit_logs_with_filters(
+                search_query=search_query
+            )
+            self.assertGreater(result.count(), 0, search_query)
+
+        self.assertEqual(
+            AuditLogSelector.get_audit_logs_with_filters(
+                search_query="haystack"
+            ).count(),
+            0,
+        )
+
+
 @pytest.mark.system
 class TestAuditLogConcurrency(TransactionTestCase):
     """Test audit log system under concurrent access."""
@@ -1125,3 +1197,54 @@ class TestAuditLogPerformanceWorkflows(TestCase):
 
         # Complex query should complete reasonably quickly
         self.assertLess(query_time, 2.0)  # 2 seconds max
+
+
+@pytest.mark.performance
+@pytest.mark.django_db
+class TestAuditChangeCaptureQueryCounts:
+    """
+    Benchmark the queries of an audited update: diffing against the values
+    the instance was loaded with versus re-fetching the row before the save,
+    which the pre_save handler used to do for every save.
+    """
+
+    def _save_queries(self, instance, refetch):
+        if refetch:
+            # Without a snapshot the handler falls back to the row lookup
+            instance._loaded_pk = None
+        # The entry ledger rebuilds a team whose entry has no snapshot; keep
+        # its queries out of the audit comparison
+        with (
+            patch("apps.entries.signals.TeamLedgerService.apply_entry_changes"),
+            CaptureQueriesContext(connection) as queries,
+        ):
+            instance.save()
+        return len(queries)
+
+    @pytest.mark.parametrize(
+        "create, field, values",
+        [
+            (EntryFactory, "status", ("approved", "rejected")),
+            (WorkspaceFactory, "title", ("Renamed", "Renamed again")),
+            (TeamMemberFactory, "role", ("team_coordinator", "submitter")),
+            (
+                lambda: WorkspaceTeamFactory().remittance,
+                "status",
+                ("overdue", "canceled"),
+            ),
+        ],
+    )
+    def test_update_skips_the_row_refetch(self, create, field, values):
+        created = create()
+        instance = type(created).objects.get(pk=created.pk)
+        # Visit both values once so both saves do the same remaining work
+        for value in values:
+            setattr(instance, field, value)
+            instance.save()
+
+        setattr(instance, field, values[0])
+        refetching = self._save_queries(instance, refetch=True)
+        setattr(instance, field, values[1])
+        in_memory = self._save_queries(instance, refetch=False)
+
+        assert in_memory == refetching - 1
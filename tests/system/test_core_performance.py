@@ -0,0 +1,81 @@
+"""
+Performance tests for request-scoped object permission checks.
+
+Permission checks made while rendering a page are answered from a single
+prefetched guardian checker, so the number of queries a page runs must not
+grow with the number of objects it checks permissions on.
+"""
+
+import pytest
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from guardian.shortcuts import assign_perm
+
+from apps.core.permissions import OrganizationPermissions
+from tests.factories import CustomUserFactory, OrganizationWithOwnerFactory
+
+
+def _create_owned_organizations(user, count):
+    group, _ = Group.objects.get_or_create(name=f"Org Owners - {user.pk}")
+    group.user_set.add(user)
+    organizations = OrganizationWithOwnerFactory.create_batch(count, owner=user)
+    for organization in organizations:
+        assign_perm(OrganizationPermissions.MANAGE_ORGANIZATION, group, organization)
+    return organizations
+
+
+@pytest.mark.performance
+@pytest.mark.django_db
+class TestObjectPermissionQueryCounts:
+    def setup_method(self):
+        self.user = CustomUserFactory()
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def _home_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("home"))
+        assert response.status_code == 200
+        return len(queries)
+
+    def test_home_queries_stay_flat_as_organizations_grow(self):
+        _create_owned_organizations(self.user, 2)
+        few = self._home_queries()
+
+        _create_owned_organizations(self.user, 6)
+        many = self._home_queries()
+
+        assert many == few
+
+    def test_home_reports_manage_permission_for_each_organization(self):
+        owned = _create_owned_organizations(self.user, 3)
+        others = OrganizationWithOwnerFactory.create_batch(2)
+        for organization in others:
+            organization.members.create(user=self.user)
+
+        response = self.client.get(reverse("home"))
+
+        permissions = {
+            organization.pk: organization.permissions["can_manage_organization"]
+            for organization in response.context["organizations"]
+        }
+        assert permissions == {
+            **{organization.pk: True for organization in owned},
+            **{organization.pk: False for organization in others},
+        }
+
+    @override_settings(DEBUG=True)
+    def test_query_count_is_reported_in_debug(self):
+        _create_owned_organizations(self.user, 1)
+
+        response = self.client.get(reverse("home"))
+
+        assert int(response["X-Query-Count"]) > 0
+
+    def test_query_count_is_not_reported_outside_debug(self):
+        response = self.client.get(reverse("home"))
+
+        assert "X-Query-Count" not in response
@@ -8,6 +8,7 @@ Following the test plan: Email Services (apps.emails)
 - Concurrent email processing tests
 """
 
+import socket
 import threading
 import time
 from unittest.mock import Mock, patch
@@ -20,7 +21,7 @@ from apps.emails.services import (
     send_signup_confirmation_email,
     send_password_reset_email,
 )
-from apps.emails.tasks import send_email_task
+from apps.emails.tasks import send_email_batch_task, send_email_task
 from tests.factories.user_factories import CustomUserFactory
 
 
@@ -412,3 +413,96 @@ class TestEmailSystemWorkflows(TransactionTestCase):
         self.assertEqual(mock_task.call_count, 4)
         self.assertGreater(successful_sends, 0)  # At least some should succeed
         self.assertLess(failed_sends, 4)  # Not all should fail
+
+
+class _CountingSmtpHandler:
+    """aiosmtpd handler recording the SMTP session of every delivered message."""
+
+    def __init__(self):
+        self.sessions = []
+
+    async def handle_DATA(self, server, session, envelope):
+        self.sessions.append(id(session))
+        return "250 Message accepted for delivery"
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.performance
+class TestPooledSmtpThroughput(TestCase):
+    """
+    Benchmark pooled delivery against one SMTP session per email, using a
+    local aiosmtpd server as a stand-in for Gmail.
+    """
+
+    message_count = 200
+
+    def setUp(self):
+        controller_module = pytest.importorskip("aiosmtpd.controller")
+        self.handler = _CountingSmtpHandler()
+        self.port = _free_port()
+        self.controller = controller_module.Controller(
+            self.handler, hostname="127.0.0.1", port=self.port
+        )
+        self.controller.start()
+        self.account = {
+            "user": "benchmark@example.com",
+            "host": "127.0.0.1",
+            "port": self.port,
+            "smtp_ssl": False,
+            "smtp_starttls": False,
+            "smtp_skip_login": True,
+        }
+        self.messages = [
+            {
+                "to": f"recipient{i}@example.com",
+                "subject": f"Benchmark {i}",
+                "contents": "Benchmark message body.",
+            }
+            for i in range(self.message_count)
+        ]
+
+    def tearDown(self):
+        self.controller.stop()
+
+    def _send_with_a_session_per_email(self):
+        import yagmail
+
+        for message in self.messages:
+            client = yagmail.SMTP(
+                self.account["user"],
+                host="127.0.0.1",
+                port=self.port,
+                smtp_ssl=False,
+                smtp_starttls=False,
+                smtp_skip_login=True,
+            )
+            client.send(**message)
+            client.close()
+
+    def test_pooled_batch_outperforms_a_session_per_email(self):
+        start_time = time.perf_counter()
+        self._send_with_a_session_per_email()
+        unpooled_time = time.perf_counter() - start_time
+        unpooled_sessions = set(self.handler.sessions)
+        self.handler.sessions.clear()
+
+        with override_settings(GMAIL_ACCOUNTS=[self.account]):
+            start_time = time.perf_counter()
+            sent = send_email_batch_task(self.messages)
+            pooled_time = time.perf_counter() - start_time
+
+        print(
+            f"\n{self.message_count} emails: "
+            f"{self.message_count / unpooled_time:.0f}/s with a session per email, "
+            f"{self.message_count / pooled_time:.0f}/s pooled"
+        )
+        self.assertEqual(sent, self.message_count)
+        self.assertEqual(len(self.handler.sessions), self.message_count)
+        self.assertEqual(len(unpooled_sessions), self.message_count)
+        self.assertEqual(len(set(self.handler.sessions)), 1)
+        self.assertLess(pooled_time, unpooled_time)
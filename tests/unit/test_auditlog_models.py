@@ -1447,3 +1447,57 @@ class TestAuditTrailCoverageGaps(TestCase):
         self.assertIn("Entity: Entry", details)
         self.assertIn("Workspace: 123e4567-e89b-12d3-a456-426614174000", details)
         self.assertIn("Changed fields: title, amount", details)
+
+
+@pytest.mark.unit
+class TestAuditTrailSearchText(TestCase):
+    """Test the denormalized search text kept on AuditTrail."""
+
+    @pytest.mark.django_db
+    def test_save_builds_search_text(self):
+        """Test saving fills search_text from action, user and metadata."""
+        user = CustomUserFactory(username="Searchable", email="Find.Me@example.com")
+        audit = AuditTrail.objects.create(
+            user=user,
+            action_type=AuditActionType.ENTRY_CREATED,
+            metadata={"description": "Office Chairs", "amount": "150.00"},
+        )
+
+        audit.refresh_from_db()
+        self.assertIn("entry created", audit.search_text)
+        self.assertIn("searchable", audit.search_text)
+        self.assertIn("find.me@example.com", audit.search_text)
+        self.assertIn("office chairs", audit.search_text)
+        self.assertIn("150.00", audit.search_text)
+
+    @pytest.mark.django_db
+    def test_save_with_update_fields_refreshes_search_text(self):
+        """Test partial saves still persist the rebuilt search text."""
+        audit = AuditTrailFactory(metadata={"description": "before"})
+
+        audit.metadata = {"description": "after"}
+        audit.save(update_fields=["metadata"])
+
+        audit.refresh_from_db()
+        self.assertIn("after", audit.search_text)
+        self.assertNotIn("before", audit.search_text)
+
+    @pytest.mark.django_db
+    def test_backfill_command_fills_missing_search_text(self):
+        """Test backfill_audit_search_text rebuilds rows without search text."""
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        audits = [
+            AuditTrailFactory(metadata={"description": f"legacy {i}"}) for i in range(3)
+        ]
+        AuditTrail.objects.filter(
+            audit_id__in=[audit.audit_id for audit in audits]
+        ).update(search_text="")
+
+        call_command("backfill_audit_search_text", batch_size=2, stdout=StringIO())
+
+        for audit in audits:
+            audit.refresh_from_db()
+            self.assertIn(audit.metadata["description"], audit.search_text)
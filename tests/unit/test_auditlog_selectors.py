@@ -378,6 +378,41 @@ class TestAuditLogSelectors(TestCase):
                 + summary["default_logs"],
             )
 
+    @pytest.mark.django_db
+    def test_get_retention_summary_single_grouped_query(self):
+        """Test get_retention_summary counts expiry per category in one query."""
+        from apps.auditlog.selectors import get_retention_summary
+
+        AuditTrail.objects.all().delete()
+
+        with disable_automatic_audit_logging():
+            user = CustomUserFactory()
+            now = timezone.now()
+            for action_type, age_days in [
+                (AuditActionType.ENTRY_CREATED, 100),  # default, expired
+                (AuditActionType.ENTRY_CREATED, 10),  # default, kept
+                (AuditActionType.LOGIN_SUCCESS, 40),  # authentication, expired
+                (AuditActionType.ENTRY_DELETED, 100),  # critical, kept
+            ]:
+                audit = AuditTrail.objects.create(user=user, action_type=action_type)
+                AuditTrail.objects.filter(pk=audit.pk).update(
+                    timestamp=now - timedelta(days=age_days)
+                )
+
+            with self.assertNumQueries(1):
+                summary = get_retention_summary()
+
+        self.assertEqual(
+            summary,
+            {
+                "total_logs": 4,
+                "authentication_logs": 1,
+                "critical_logs": 1,
+                "default_logs": 2,
+                "expired_logs": 2,
+            },
+        )
+
     @pytest.mark.django_db
     def test_get_expired_logs_queryset_no_action_type(self):
         """Test get_expired_logs_queryset without specific action type."""
@@ -16,11 +16,17 @@ from unittest.mock import patch
 
 from apps.auditlog.constants import AuditActionType
 from apps.auditlog.models import AuditTrail
-from apps.auditlog.services import audit_create
+from apps.auditlog.services import (
+    audit_create,
+    audit_create_bulk_summary,
+    clear_audit_context_cache,
+    resolve_audit_context,
+)
 from tests.factories import (
     CustomUserFactory,
     EntryFactory,
     WorkspaceFactory,
+    WorkspaceTeamFactory,
 )
 from tests.factories.auditlog_factories import AuditTrailFactory
 
@@ -312,6 +318,121 @@ class TestAuditCreateService(TestCase):
             self.assertIsNone(result)
 
 
+@pytest.mark.unit
+class TestResolveAuditContext(TestCase):
+    """Test how audit_create resolves the workspace and organization."""
+
+    def setUp(self):
+        clear_audit_context_cache()
+        self.user = CustomUserFactory()
+
+    def test_entry_context_is_read_from_foreign_key_ids(self):
+        """Entries carry both ids, so no query is needed."""
+        entry = EntryFactory()
+
+        with self.assertNumQueries(0):
+            context = resolve_audit_context(user=self.user, target_entity=entry)
+
+        self.assertEqual(context, (entry.workspace_id, entry.organization_id))
+
+    def test_workspace_team_lookup_is_memoized(self):
+        """Targets reached through a workspace team hit the database once."""
+        remittance = WorkspaceTeamFactory().remittance
+        workspace = remittance.workspace_team.workspace
+        # Creating the remittance already audited it through the cache
+        clear_audit_context_cache()
+
+        with self.assertNumQueries(1):
+            first = resolve_audit_context(user=self.user, target_entity=remittance)
+        with self.assertNumQueries(0):
+            second = resolve_audit_context(user=self.user, target_entity=remittance)
+
+        self.assertEqual(first, (workspace.pk, workspace.organization_id))
+        self.assertEqual(second, first)
+
+    def test_workspace_false_keeps_only_the_organization(self):
+        entry = EntryFactory()
+
+        context = resolve_audit_context(
+            user=self.user, target_entity=entry, workspace=False
+        )
+
+        self.assertEqual(context, (None, entry.organization_id))
+
+    def test_audit_create_without_validation_is_a_single_insert(self):
+        entry = EntryFactory()
+        # Warm the content type cache
+        audit_create(
+            user=self.user,
+            action_type=AuditActionType.ENTRY_UPDATED,
+            target_entity=entry,
+        )
+
+        with self.assertNumQueries(1):
+            audit = audit_create(
+                user=self.user,
+                action_type=AuditActionType.ENTRY_UPDATED,
+                target_entity=entry,
+                metadata={"amount": 10},
+                validate=False,
+            )
+
+        audit.refresh_from_db()
+        self.assertEqual(audit.workspace_id, entry.workspace_id)
+        self.assertEqual(audit.organization_id, entry.organization_id)
+        self.assertEqual(audit.metadata, {"amount": 10})
+
+
+@pytest.mark.unit
+class TestAuditCreateBulkSummary(TestCase):
+    """Test the audit_create_bulk_summary service function."""
+
+    def setUp(self):
+        self.user = CustomUserFactory()
+        self.workspace = WorkspaceFactory()
+
+    @pytest.mark.django_db
+    def test_records_all_ids_below_the_threshold(self):
+        workspace_ids = [self.workspace.pk]
+
+        with self.assertNumQueries(1):
+            audit = audit_create_bulk_summary(
+                user=self.user,
+                model_class=type(self.workspace),
+                affected_count=1,
+                affected_ids=workspace_ids,
+                organization_id=self.workspace.organization_id,
+                metadata={"operation_type": "workspace_cascade_delete"},
+            )
+
+        audit.refresh_from_db()
+        self.assertEqual(audit.action_type, AuditActionType.BULK_OPERATION)
+        self.assertEqual(audit.organization_id, self.workspace.organization_id)
+        self.assertEqual(audit.metadata["target_entity_type"], "workspace")
+        self.assertEqual(audit.metadata["total_affected_count"], 1)
+        self.assertEqual(audit.metadata["affected_ids"], [str(self.workspace.pk)])
+        self.assertEqual(audit.metadata["operation_type"], "workspace_cascade_delete")
+
+    @pytest.mark.django_db
+    def test_samples_ids_past_the_threshold(self):
+        from apps.auditlog.config import AuditConfig
+
+        count = AuditConfig.BULK_OPERATION_THRESHOLD
+        audit = audit_create_bulk_summary(
+            user=self.user,
+            model_class=type(self.workspace),
+            affected_count=count,
+            affected_ids=[f"id-{i}" for i in range(count)],
+        )
+
+        self.assertNotIn("affected_ids", audit.metadata)
+        self.assertEqual(
+            audit.metadata["sampled_ids"],
+            [f"id-{i}" for i in range(AuditConfig.BULK_SAMPLE_SIZE)],
+        )
+        self.assertIn("sampling_note", audit.metadata)
+
+
 @pytest.mark.unit
 class TestAuditCreateAuthenticationEvent(TestCase):
     """Test audit_create_authentication_event service function."""
@@ -658,6 +779,103 @@ class TestAuditCleanupExpiredLogs(TestCase):
         self.assertEqual(cleanup_stats["total_deleted"], 1)
         self.assertFalse(cleanup_stats["dry_run"])
 
+    def _create_old_logs(self, count, action_type=AuditActionType.ENTRY_CREATED):
+        from django.utils import timezone
+        from datetime import timedelta
+
+        old_date = timezone.now() - timedelta(days=400)
+        audits = []
+        for index in range(count):
+            audit = AuditTrailFactory(action_type=action_type)
+            AuditTrail.objects.filter(audit_id=audit.audit_id).update(
+                timestamp=old_date + timedelta(minutes=index)
+            )
+            audit.refresh_from_db()
+            audits.append(audit)
+        return audits
+
+    @pytest.mark.django_db
+    def test_cleanup_deletes_in_timestamp_chunks_and_reports_progress(self):
+        """Test cleanup walks expired logs in timestamp order, batch by batch."""
+        from apps.auditlog.services import audit_cleanup_expired_logs
+
+        audits = self._create_old_logs(5)
+        progress = []
+
+        cleanup_stats = audit_cleanup_expired_logs(
+            batch_size=2, progress_callback=progress.append
+        )
+
+        self.assertFalse(
+            AuditTrail.objects.filter(
+                audit_id__in=[audit.audit_id for audit in audits]
+            ).exists()
+        )
+        self.assertEqual(cleanup_stats["total_deleted"], 5)
+        self.assertEqual(cleanup_stats["default_deleted"], 5)
+        self.assertGreaterEqual(cleanup_stats["rows_per_second"], 0)
+
+        default_batches = [
+            update["batch_deleted"]
+            for update in progress
+            if update["category"] == "default_deleted"
+        ]
+        self.assertEqual(default_batches, [2, 2, 1])
+        self.assertEqual(progress[-1]["checkpoint"], audits[3].timestamp.isoformat())
+
+    @pytest.mark.django_db
+    @pytest.mark.usefixtures("locmem_cache")
+    def test_cleanup_resumes_from_checkpoint(self):
+        """Test a resumed cleanup skips the range covered before the checkpoint."""
+        from django.core.cache import cache
+
+        from apps.auditlog.config import AuditConfig
+        from apps.auditlog.services import audit_cleanup_expired_logs
+
+        audits = self._create_old_logs(4)
+        cache.set(
+            AuditConfig.CLEANUP_CHECKPOINT_CACHE_KEY,
+            {
+                "action_type": None,
+                "override_days": None,
+                "categories": {"default_deleted": audits[1].timestamp.isoformat()},
+            },
+        )
+
+        cleanup_stats = audit_cleanup_expired_logs(resume=True)
+
+        remaining = set(
+            AuditTrail.objects.filter(
+                audit_id__in=[audit.audit_id for audit in audits]
+            ).values_list("audit_id", flat=True)
+        )
+        self.assertEqual(remaining, {audits[0].audit_id, audits[1].audit_id})
+        self.assertEqual(cleanup_stats["total_deleted"], 2)
+        self.assertIsNone(cache.get(AuditConfig.CLEANUP_CHECKPOINT_CACHE_KEY))
+
+    @pytest.mark.django_db
+    @pytest.mark.usefixtures("locmem_cache")
+    def test_cleanup_ignores_checkpoint_of_other_parameters(self):
+        """Test a checkpoint saved for another action type is not resumed."""
+        from django.core.cache import cache
+
+        from apps.auditlog.config import AuditConfig
+        from apps.auditlog.services import audit_cleanup_expired_logs
+
+        audits = self._create_old_logs(2)
+        cache.set(
+            AuditConfig.CLEANUP_CHECKPOINT_CACHE_KEY,
+            {
+                "action_type": AuditActionType.ENTRY_UPDATED,
+                "override_days": None,
+                "categories": {"default_deleted": audits[1].timestamp.isoformat()},
+            },
+        )
+
+        cleanup_stats = audit_cleanup_expired_logs(resume=True)
+
+        self.assertEqual(cleanup_stats["total_deleted"], 2)
+
 
 @pytest.mark.unit
 class TestMakeJsonSerializable(TestCase):
@@ -1,7 +1,9 @@
 from unittest.mock import patch
 
 import pytest
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from apps.auditlog.constants import AuditActionType
 from tests.factories.auditlog_factories import AuditTrailFactory
@@ -1009,185 +1011,299 @@ class TestAuditTasksIntegration(TestCase):
 class TestAuditCreateBulkAsync(TestCase):
     """Test audit_create_bulk_async Celery task."""
 
+    def _entry(self, user=None, action_type=AuditActionType.ENTRY_CREATED, **kwargs):
+        return {
+            "user_id": str(user.user_id) if user else None,
+            "action_type": action_type,
+            "target_entity": kwargs.get("target_entity"),
+            "workspace": kwargs.get("workspace"),
+            "metadata": kwargs.get("metadata", {}),
+        }
+
     @pytest.mark.django_db
-    @patch("apps.auditlog.tasks.audit_create_async.apply_async")
-    def test_bulk_audit_creation_success(self, mock_apply_async):
+    def test_bulk_audit_creation_success(self):
         """Test successful bulk audit creation."""
+        from apps.auditlog.models import AuditTrail
         from apps.auditlog.tasks import audit_create_bulk_async
 
-        # Mock successful audit creation
-        mock_apply_async.return_value.get.return_value = "audit-id-123"
-
+        user = CustomUserFactory()
+        entry = EntryFactory()
         audit_entries = [
-            {
-                "user_id": "user-1",
-                "action_type": AuditActionType.ENTRY_CREATED,
-                "target_entity": None,
-                "metadata": {"test": "entry1"},
-            },
-            {
-                "user_id": "user-2",
-                "action_type": AuditActionType.ENTRY_UPDATED,
-                "target_entity": None,
-                "metadata": {"test": "entry2"},
-            },
+            self._entry(
+                user,
+                target_entity={
+                    "model": "apps.entries.models.Entry",
+                    "pk": str(entry.pk),
+                },
+                metadata={"test": "entry1"},
+            ),
+            self._entry(
+                user,
+                action_type=AuditActionType.ENTRY_UPDATED,
+                metadata={"test": "entry2"},
+            ),
         ]
 
         result = audit_create_bulk_async(audit_entries)
 
-        # Verify result structure
         self.assertEqual(result["success_count"], 2)
         self.assertEqual(result["failed_count"], 0)
         self.assertEqual(len(result["audit_ids"]), 2)
         self.assertEqual(result["total_processed"], 2)
-        self.assertIn("audit-id-123", result["audit_ids"])
 
-        # Verify apply_async was called for each entry
-        self.assertEqual(mock_apply_async.call_count, 2)
+        audit = AuditTrail.objects.get(audit_id=result["audit_ids"][0])
+        self.assertEqual(audit.user, user)
+        self.assertEqual(audit.target_entity, entry)
+        self.assertEqual(audit.workspace, entry.workspace)
+        self.assertEqual(audit.organization, entry.workspace.organization)
+        self.assertEqual(audit.metadata, {"test": "entry1"})
 
     @pytest.mark.django_db
-    @patch("apps.auditlog.tasks.audit_create_async.apply_async")
-    def test_bulk_audit_creation_mixed_results(self, mock_apply_async):
-        """Test bulk audit creation with mixed success and failure."""
+    def test_bulk_audit_creation_mixed_results(self):
+        """Records with unknown action types are dropped, the rest are written."""
         from apps.auditlog.tasks import audit_create_bulk_async
 
-        # Mock mixed results - first call succeeds, second fails
-        mock_result1 = type(
-            "MockResult", (), {"get": lambda *args, **kwargs: "audit-id-1"}
-        )()
-        mock_result2 = type("MockResult", (), {"get": lambda *args, **kwargs: None})()
-
-        mock_apply_async.side_effect = [mock_result1, mock_result2]
-
+        user = CustomUserFactory()
         audit_entries = [
-            {
-                "user_id": "user-1",
-                "action_type": AuditActionType.ENTRY_CREATED,
-                "target_entity": None,
-                "metadata": {"test": "entry1"},
-            },
-            {
-                "user_id": "user-2",
-                "action_type": AuditActionType.ENTRY_UPDATED,
-                "target_entity": None,
-                "metadata": {"test": "entry2"},
-            },
+            self._entry(user),
+            self._entry(user, action_type="not_an_action"),
         ]
 
         result = audit_create_bulk_async(audit_entries)
 
-        # Verify mixed results
         self.assertEqual(result["success_count"], 1)
         self.assertEqual(result["failed_count"], 1)
         self.assertEqual(len(result["audit_ids"]), 1)
         self.assertEqual(result["total_processed"], 2)
 
     @pytest.mark.django_db
-    @patch("apps.auditlog.tasks.audit_create_async.apply_async")
-    def test_bulk_audit_creation_exception_handling(self, mock_apply_async):
+    @patch("apps.auditlog.tasks.AuditTrail.objects.bulk_create")
+    def test_bulk_audit_creation_exception_handling(self, mock_bulk_create):
         """Test bulk audit creation with exception handling."""
         from apps.auditlog.tasks import audit_create_bulk_async
 
-        # Mock exception during processing
-        mock_apply_async.side_effect = Exception("Task processing error")
-
-        audit_entries = [
-            {
-                "user_id": "user-1",
-                "action_type": AuditActionType.ENTRY_CREATED,
-                "target_entity": None,
-                "metadata": {"test": "entry1"},
-            },
-        ]
+        mock_bulk_create.side_effect = Exception("Database unavailable")
 
         with self.assertLogs("apps.auditlog.tasks", level="ERROR") as log:
-            result = audit_create_bulk_async(audit_entries)
+            result = audit_create_bulk_async([self._entry()])
 
-        # Verify error handling
         self.assertEqual(result["success_count"], 0)
         self.assertEqual(result["failed_count"], 1)
         self.assertEqual(len(result["audit_ids"]), 0)
         self.assertEqual(result["total_processed"], 1)
-
-        # Verify error was logged
-        self.assertIn("ERROR", log.output[0])
-        self.assertIn("Task processing error", log.output[0])
+        self.assertIn("Database unavailable", log.output[0])
 
     @pytest.mark.django_db
-    @patch("apps.auditlog.tasks.audit_create_async.apply_async")
-    def test_bulk_audit_creation_timeout_handling(self, mock_apply_async):
-        """Test bulk audit creation with timeout handling."""
+    def test_bulk_audit_creation_unknown_references(self):
+        """Unknown users, workspaces and target models do not fail the batch."""
+        from apps.auditlog.models import AuditTrail
         from apps.auditlog.tasks import audit_create_bulk_async
 
-        # Mock timeout exception
-        mock_apply_async.return_value.get.side_effect = Exception("Task timeout")
-
         audit_entries = [
             {
                 "user_id": "user-1",
                 "action_type": AuditActionType.ENTRY_CREATED,
-                "target_entity": None,
-                "metadata": {"test": "entry1"},
-            },
+                "target_entity": {"model": "apps.missing.models.Thing", "pk": "1"},
+                "workspace": {"pk": "not-a-uuid"},
+                "metadata": {},
+            }
         ]
 
-        with self.assertLogs("apps.auditlog.tasks", level="ERROR") as log:
-            result = audit_create_bulk_async(audit_entries)
-
-        # Verify timeout handling
-        self.assertEqual(result["success_count"], 0)
-        self.assertEqual(result["failed_count"], 1)
-        self.assertEqual(len(result["audit_ids"]), 0)
+        result = audit_create_bulk_async(audit_entries)
 
-        # Verify timeout was logged
-        self.assertIn("ERROR", log.output[0])
-        self.assertIn("Task timeout", log.output[0])
+        self.assertEqual(result["success_count"], 1)
+        audit = AuditTrail.objects.get(audit_id=result["audit_ids"][0])
+        self.assertIsNone(audit.user)
+        self.assertIsNone(audit.target_entity_type)
+        self.assertIsNone(audit.workspace)
 
     @pytest.mark.django_db
-    @patch("apps.auditlog.tasks.audit_create_async.apply_async")
-    def test_bulk_audit_creation_empty_entries(self, mock_apply_async):
+    def test_bulk_audit_creation_empty_entries(self):
         """Test bulk audit creation with empty entries list."""
         from apps.auditlog.tasks import audit_create_bulk_async
 
-        result = audit_create_bulk_async([])
+        with self.assertNumQueries(0):
+            result = audit_create_bulk_async([])
 
-        # Verify empty result
         self.assertEqual(result["success_count"], 0)
         self.assertEqual(result["failed_count"], 0)
         self.assertEqual(len(result["audit_ids"]), 0)
         self.assertEqual(result["total_processed"], 0)
 
-        # Verify no async calls were made
-        mock_apply_async.assert_not_called()
-
     @pytest.mark.django_db
-    @patch("apps.auditlog.tasks.audit_create_async.apply_async")
-    def test_bulk_audit_creation_large_batch(self, mock_apply_async):
-        """Test bulk audit creation with large batch."""
+    def test_bulk_audit_creation_large_batch(self):
+        """Query count does not grow with the number of records."""
+        from apps.auditlog.models import AuditTrail
         from apps.auditlog.tasks import audit_create_bulk_async
 
-        # Mock successful audit creation
-        mock_apply_async.return_value.get.return_value = "audit-id-123"
-
-        # Create large batch of audit entries
-        audit_entries = []
-        for i in range(100):
-            audit_entries.append(
-                {
-                    "user_id": f"user-{i}",
-                    "action_type": AuditActionType.ENTRY_CREATED,
-                    "target_entity": None,
-                    "metadata": {"batch_index": i},
-                }
-            )
+        workspace = WorkspaceFactory()
+        user = CustomUserFactory()
+        entries = [EntryFactory(workspace=workspace) for _ in range(5)]
+
+        def build(targets):
+            return [
+                self._entry(
+                    user,
+                    target_entity={
+                        "model": "apps.entries.models.Entry",
+                        "pk": str(entry.pk),
+                    },
+                    workspace={"pk": str(workspace.pk)},
+                    metadata={"batch_index": i},
+                )
+                for i, entry in enumerate(targets)
+            ]
 
-        result = audit_create_bulk_async(audit_entries)
+        existing = AuditTrail.objects.filter(workspace=workspace).count()
 
-        # Verify large batch processing
-        self.assertEqual(result["success_count"], 100)
-        self.assertEqual(result["failed_count"], 0)
-        self.assertEqual(len(result["audit_ids"]), 100)
-        self.assertEqual(result["total_processed"], 100)
+        with CaptureQueriesContext(connection) as small:
+            audit_create_bulk_async(build(entries[:1]))
+        with CaptureQueriesContext(connection) as large:
+            # Kept under SQLite's 999 parameter cap, which would split the INSERT
+            result = audit_create_bulk_async(build(entries * 15))
+
+        self.assertEqual(result["success_count"], 75)
+        self.assertEqual(result["total_processed"], 75)
+        self.assertEqual(len(large.captured_queries), len(small.captured_queries))
+        self.assertEqual(
+            AuditTrail.objects.filter(workspace=workspace).count(), existing + 76
+        )
+
+
+@pytest.mark.unit
+class TestAuditBuffer(TestCase):
+    """Test the buffered audit sink."""
+
+    def setUp(self):
+        from apps.auditlog.buffer import AuditBuffer
+
+        self.buffer = AuditBuffer()
+
+    def _record(self, index=0):
+        return {
+            "user_id": None,
+            "action_type": AuditActionType.ENTRY_CREATED,
+            "target_entity": None,
+            "workspace": None,
+            "metadata": {"index": index},
+        }
+
+    @patch("apps.auditlog.tasks.audit_create_batch_async.delay")
+    def test_records_wait_for_commit(self, mock_delay):
+        """Records are only collected once the transaction commits."""
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.buffer.add(self._record())
+
+        mock_delay.assert_not_called()
+        self.assertEqual(len(callbacks), 1)
+
+    @patch("apps.auditlog.tasks.audit_create_batch_async.delay")
+    def test_flushes_immediately_outside_a_scope(self, mock_delay):
+        """Without a request scope every committed record is flushed."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.buffer.add(self._record())
+
+        mock_delay.assert_called_once_with([self._record()])
+
+    @patch("apps.auditlog.tasks.audit_create_batch_async.delay")
+    def test_scope_flushes_single_batch(self, mock_delay):
+        """All records collected within a scope are sent as one task."""
+        self.buffer.begin()
+        with self.captureOnCommitCallbacks(execute=True):
+            for index in range(3):
+                self.buffer.add(self._record(index))
+        mock_delay.assert_not_called()
+
+        self.buffer.end()
+
+        mock_delay.assert_called_once_with([self._record(i) for i in range(3)])
+        stats = self.buffer.get_stats()
+        self.assertEqual(stats["flush_count"], 1)
+        self.assertEqual(stats["flushed_records"], 3)
+        self.assertGreaterEqual(stats["max_flush_latency_ms"], 0)
+
+    @patch("apps.auditlog.buffer.AuditConfig.BUFFER_MAX_RECORDS", 2)
+    @patch("apps.auditlog.tasks.audit_create_batch_async.delay")
+    def test_scope_flushes_early_when_full(self, mock_delay):
+        """A full buffer is flushed without waiting for the scope to end."""
+        self.buffer.begin()
+        with self.captureOnCommitCallbacks(execute=True):
+            for index in range(3):
+                self.buffer.add(self._record(index))
+
+        mock_delay.assert_called_once_with([self._record(0), self._record(1)])
+        self.buffer.end()
+        self.assertEqual(mock_delay.call_count, 2)
+
+    @patch("apps.auditlog.tasks.audit_create_batch_async.delay")
+    def test_dispatch_failure_counts_dropped_records(self, mock_delay):
+        """Records that cannot be handed to the broker are counted as dropped."""
+        mock_delay.side_effect = ConnectionError("broker down")
+
+        self.buffer.begin()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.buffer.add(self._record(0))
+            self.buffer.add(self._record(1))
+        with self.assertLogs("apps.auditlog.buffer", level="ERROR"):
+            self.buffer.end()
+
+        stats = self.buffer.get_stats()
+        self.assertEqual(stats["dropped_records"], 2)
+        self.assertEqual(stats["flush_count"], 0)
+
+
+@pytest.mark.unit
+class TestAuditCreateBatchAsync(TestCase):
+    """Test retries and dropped records of the buffered batch task."""
+
+    def setUp(self):
+        from apps.auditlog.buffer import audit_buffer
+
+        self.buffer = audit_buffer
+        self.buffer.reset_stats()
+        self.records = [
+            {
+                "user_id": None,
+                "action_type": AuditActionType.ENTRY_CREATED,
+                "target_entity": None,
+                "workspace": None,
+                "metadata": {"index": index},
+            }
+            for index in range(2)
+        ]
+
+    def tearDown(self):
+        self.buffer.reset_stats()
+
+    @patch("apps.auditlog.tasks.AuditTrail.objects.bulk_create")
+    def test_database_errors_are_retried_then_counted_as_dropped(
+        self, mock_bulk_create
+    ):
+        """A failing insert is retried and only counted once retries run out."""
+        from django.db import OperationalError
+
+        from apps.auditlog.tasks import audit_create_batch_async
+
+        mock_bulk_create.side_effect = OperationalError("database is locked")
+
+        with self.assertLogs("apps.auditlog.tasks", level="ERROR"):
+            result = audit_create_batch_async.apply(args=[self.records])
+
+        self.assertIsInstance(result.result, OperationalError)
+        self.assertEqual(mock_bulk_create.call_count, 3)
+        self.assertEqual(self.buffer.get_stats()["dropped_records"], 2)
+
+    @patch("apps.auditlog.tasks.AuditTrail.objects.bulk_create")
+    def test_recovered_batch_is_not_counted_as_dropped(self, mock_bulk_create):
+        """A batch written on retry leaves the dropped count untouched."""
+        from django.db import OperationalError
+
+        from apps.auditlog.tasks import audit_create_batch_async
+
+        mock_bulk_create.side_effect = [OperationalError("database is locked"), None]
+
+        result = audit_create_batch_async.apply(args=[self.records])
 
-        # Verify apply_async was called for each entry
-        self.assertEqual(mock_apply_async.call_count, 100)
+        self.assertEqual(result.result["success_count"], 2)
+        self.assertEqual(mock_bulk_create.call_count, 2)
+        self.assertEqual(self.buffer.get_stats()["dropped_records"], 0)
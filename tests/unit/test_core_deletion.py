@@ -0,0 +1,178 @@
+"""
+Unit tests for apps.core.services.deletion
+"""
+
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.models import Group
+
+from apps.attachments.models import Attachment
+from apps.auditlog.constants import AuditActionType
+from apps.auditlog.models import AuditTrail
+from apps.core.services.deletion import (
+    DeletionJobStatus,
+    archive_organization_cascade,
+    delete_workspace_cascade,
+    get_deletion_job,
+    run_workspace_deletion,
+    start_workspace_deletion,
+)
+from apps.entries.models import Entry
+from apps.remittance.models import Remittance
+from apps.teams.models import Team
+from apps.workspaces.constants import StatusChoices
+from apps.workspaces.models import Workspace, WorkspaceExchangeRate, WorkspaceTeam
+from tests.factories import (
+    AttachmentFactory,
+    AuditTrailFactory,
+    CustomUserFactory,
+    EntryFactory,
+    OrganizationFactory,
+    TeamFactory,
+    WorkspaceFactory,
+    WorkspaceTeamFactory,
+)
+
+
+def _summary_audits(model_name):
+    return AuditTrail.objects.filter(
+        action_type=AuditActionType.BULK_OPERATION,
+        metadata__target_entity_type=model_name,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestDeleteWorkspaceCascade:
+    def setup_method(self):
+        self.user = CustomUserFactory()
+        self.organization = OrganizationFactory()
+        self.workspace = WorkspaceFactory(organization=self.organization)
+        self.workspace_team = WorkspaceTeamFactory(workspace=self.workspace)
+        self.entries = EntryFactory.create_batch(
+            3,
+            organization=self.organization,
+            workspace=self.workspace,
+            workspace_team=self.workspace_team,
+        )
+        self.attachment = AttachmentFactory(entry=self.entries[0])
+        Remittance.objects.get_or_create(workspace_team=self.workspace_team)
+        Group.objects.get_or_create(name=f"Workspace Admins - {self.workspace.pk}")
+
+    def test_deletes_the_workspace_and_its_rows(self):
+        other_entry = EntryFactory(organization=self.organization)
+
+        counts = delete_workspace_cascade(self.workspace.pk, user=self.user)
+
+        assert not Workspace.objects.filter(pk=self.workspace.pk).exists()
+        assert not WorkspaceTeam.objects.filter(workspace_id=self.workspace.pk).exists()
+        assert not Entry.all_objects.filter(workspace_id=self.workspace.pk).exists()
+        assert not Attachment.all_objects.filter(pk=self.attachment.pk).exists()
+        assert not Remittance.objects.filter(
+            workspace_team_id=self.workspace_team.pk
+        ).exists()
+        assert not WorkspaceExchangeRate.all_objects.filter(
+            workspace_id=self.workspace.pk
+        ).exists()
+        assert not Group.objects.filter(
+            name=f"Workspace Admins - {self.workspace.pk}"
+        ).exists()
+        assert Entry.objects.filter(pk=other_entry.pk).exists()
+        assert counts[Entry._meta.label] == 3
+
+    def test_writes_one_summary_audit_per_model(self):
+        AuditTrail.objects.all().delete()
+
+        delete_workspace_cascade(self.workspace.pk, user=self.user)
+
+        entry_audit = _summary_audits("entry").get()
+        assert entry_audit.user == self.user
+        assert entry_audit.organization_id == self.organization.pk
+        assert entry_audit.metadata["total_affected_count"] == 3
+        assert sorted(entry_audit.metadata["affected_ids"]) == sorted(
+            str(entry.pk) for entry in self.entries
+        )
+        assert _summary_audits("workspace").count() == 1
+        assert not AuditTrail.objects.exclude(
+            action_type=AuditActionType.BULK_OPERATION
+        ).exists()
+
+    def test_keeps_the_workspace_audit_history(self):
+        audit = AuditTrailFactory(workspace=self.workspace)
+
+        delete_workspace_cascade(self.workspace.pk, user=self.user)
+
+        audit.refresh_from_db()
+        assert audit.workspace_id is None
+
+    def test_deletes_in_chunks(self):
+        with patch("apps.core.services.deletion.DELETION_CHUNK_SIZE", 2):
+            counts = delete_workspace_cascade(self.workspace.pk, user=self.user)
+
+        assert counts[Entry._meta.label] == 3
+        assert not Entry.all_objects.filter(workspace_id=self.workspace.pk).exists()
+
+    def test_missing_workspace_is_a_noop(self):
+        self.workspace.delete()
+
+        assert delete_workspace_cascade(self.workspace.pk) == {}
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestArchiveOrganizationCascade:
+    def test_archives_rows_under_the_organization(self):
+        organization = OrganizationFactory()
+        workspace = WorkspaceFactory(
+            organization=organization, status=StatusChoices.ACTIVE
+        )
+        team = TeamFactory(organization=organization)
+        entry = EntryFactory(organization=organization, workspace=workspace)
+
+        counts = archive_organization_cascade(organization.pk)
+
+        workspace.refresh_from_db()
+        assert workspace.status == StatusChoices.ARCHIVED
+        assert not Team.objects.filter(pk=team.pk).exists()
+        assert Team.all_objects.filter(pk=team.pk).exists()
+        assert not Entry.objects.filter(pk=entry.pk).exists()
+        assert Entry.all_objects.filter(pk=entry.pk).exists()
+        assert counts[Entry._meta.label] == 1
+        assert _summary_audits("entry").get().metadata["operation_type"] == (
+            "organization_cascade_archive"
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestDeletionJobs:
+    def test_job_runs_and_reports_progress(
+        self, locmem_cache, django_capture_on_commit_callbacks
+    ):
+        user = CustomUserFactory()
+        workspace = WorkspaceFactory()
+        EntryFactory(organization=workspace.organization, workspace=workspace)
+
+        with patch("apps.core.tasks.delete_workspace_task.delay") as delay:
+            with django_capture_on_commit_callbacks(execute=True):
+                job = start_workspace_deletion(workspace=workspace, user=user)
+
+        delay.assert_called_once_with(job["job_id"])
+        assert get_deletion_job(job["job_id"])["status"] == DeletionJobStatus.PENDING
+
+        run_workspace_deletion(job["job_id"])
+
+        job = get_deletion_job(job["job_id"])
+        assert job["status"] == DeletionJobStatus.COMPLETED
+        assert job["done"] == job["total"]
+        assert not Workspace.objects.filter(pk=workspace.pk).exists()
+
+    def test_running_job_is_not_started_twice(self, locmem_cache):
+        workspace = WorkspaceFactory()
+
+        with patch("apps.core.tasks.delete_workspace_task.delay"):
+            first = start_workspace_deletion(workspace=workspace)
+            second = start_workspace_deletion(workspace=workspace)
+
+        assert first["job_id"] == second["job_id"]
@@ -0,0 +1,118 @@
+"""
+Unit tests for apps.core.object_permissions
+"""
+
+import pytest
+from django.contrib.auth.models import Group
+from guardian.shortcuts import assign_perm, remove_perm
+
+from apps.core.object_permissions import (
+    has_object_perm,
+    permission_scope,
+    prefetch_object_permissions,
+)
+from apps.core.permissions import OrganizationPermissions
+from tests.factories import CustomUserFactory, OrganizationFactory
+
+
+@pytest.fixture
+def scope():
+    permission_scope.begin()
+    yield permission_scope
+    permission_scope.end()
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestHasObjectPerm:
+    def test_falls_back_to_user_has_perm_outside_a_request(self, monkeypatch):
+        user = CustomUserFactory()
+        organization = OrganizationFactory()
+        calls = []
+
+        def fake_has_perm(perm, obj=None):
+            calls.append((perm, obj))
+            return True
+
+        monkeypatch.setattr(user, "has_perm", fake_has_perm)
+
+        assert has_object_perm(
+            user, OrganizationPermissions.MANAGE_ORGANIZATION, organization
+        )
+        assert calls == [(OrganizationPermissions.MANAGE_ORGANIZATION, organization)]
+
+    def test_matches_user_has_perm_within_a_request(self, scope):
+        user = CustomUserFactory()
+        organization = OrganizationFactory()
+        group = Group.objects.create(name="Org Owner - test")
+        assign_perm(OrganizationPermissions.MANAGE_ORGANIZATION, group, organization)
+        assign_perm(OrganizationPermissions.ADD_TEAM, user, organization)
+        group.user_set.add(user)
+
+        for perm in (
+            OrganizationPermissions.MANAGE_ORGANIZATION,
+            OrganizationPermissions.ADD_TEAM,
+            OrganizationPermissions.ADD_WORKSPACE,
+        ):
+            assert has_object_perm(user, perm, organization) == user.has_perm(
+                perm, organization
+            )
+
+    def test_prefetched_checks_run_no_queries(self, scope, django_assert_num_queries):
+        user = CustomUserFactory()
+        organizations = OrganizationFactory.create_batch(5)
+        for organization in organizations[:3]:
+            assign_perm(OrganizationPermissions.MANAGE_ORGANIZATION, user, organization)
+
+        with django_assert_num_queries(2):
+            prefetch_object_permissions(user, *organizations)
+
+        with django_assert_num_queries(0):
+            results = [
+                has_object_perm(
+                    user, OrganizationPermissions.MANAGE_ORGANIZATION, organization
+                )
+                for organization in organizations
+            ]
+        assert results == [True, True, True, False, False]
+
+    def test_prefetch_skips_objects_already_loaded(
+        self, scope, django_assert_num_queries
+    ):
+        user = CustomUserFactory()
+        organization = OrganizationFactory()
+        prefetch_object_permissions(user, organization)
+
+        with django_assert_num_queries(0):
+            prefetch_object_permissions(user, organization)
+
+    def test_permission_changes_clear_the_cache(self, scope):
+        user = CustomUserFactory()
+        organization = OrganizationFactory()
+        perm = OrganizationPermissions.MANAGE_ORGANIZATION
+        prefetch_object_permissions(user, organization)
+        assert not has_object_perm(user, perm, organization)
+
+        assign_perm(perm, user, organization)
+        assert has_object_perm(user, perm, organization)
+
+        remove_perm(perm, user, organization)
+        assert not has_object_perm(user, perm, organization)
+
+    def test_group_membership_changes_clear_the_cache(self, scope):
+        user = CustomUserFactory()
+        organization = OrganizationFactory()
+        perm = OrganizationPermissions.MANAGE_ORGANIZATION
+        group = Group.objects.create(name="Org Owner - membership")
+        assign_perm(perm, group, organization)
+        assert not has_object_perm(user, perm, organization)
+
+        group.user_set.add(user)
+        assert has_object_perm(user, perm, organization)
+
+    def test_prefetch_is_a_no_op_outside_a_request(self, django_assert_num_queries):
+        user = CustomUserFactory()
+        organization = OrganizationFactory()
+
+        with django_assert_num_queries(0):
+            prefetch_object_permissions(user, organization)
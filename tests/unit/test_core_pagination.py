@@ -0,0 +1,113 @@
+"""
+Unit tests for apps.core.pagination
+"""
+
+from datetime import date, timedelta
+
+import pytest
+from django.db import connection
+from django.http import QueryDict
+from django.test.utils import CaptureQueriesContext
+
+from apps.core.pagination import KeysetPaginator, get_cursor_query_string
+from apps.core.utils import get_keyset_paginated_context
+from apps.entries.constants import ENTRY_LIST_ORDERING
+from apps.entries.models import Entry
+from tests.factories import EntryFactory, OrganizationFactory
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestKeysetPaginator:
+    """Test keyset pagination over entries ordered by (occurred_at, entry_id)."""
+
+    def setup_method(self):
+        self.organization = OrganizationFactory()
+        today = date.today()
+        # Several entries share a date so the primary key has to break ties
+        for offset in (0, 0, 0, 1, 1, 2, 3, 3, 3, 3, 4):
+            EntryFactory(
+                organization=self.organization,
+                occurred_at=today - timedelta(days=offset),
+            )
+        self.queryset = Entry.objects.filter(organization=self.organization)
+        self.expected = list(self.queryset.order_by(*ENTRY_LIST_ORDERING))
+
+    def _paginator(self, per_page=3):
+        return KeysetPaginator(self.queryset, per_page, ENTRY_LIST_ORDERING)
+
+    def test_first_page(self):
+        page = self._paginator().get_page()
+
+        assert page.object_list == self.expected[:3]
+        assert page.has_next is True
+        assert page.has_previous is False
+
+    def test_walks_forward_through_every_row_once(self):
+        paginator = self._paginator()
+        seen = []
+        page = paginator.get_page()
+        while True:
+            seen.extend(page.object_list)
+            if not page.has_next:
+                break
+            page = paginator.get_page(after=page.next_cursor)
+
+        assert seen == self.expected
+        assert page.has_previous is True
+
+    def test_walks_backward_from_the_last_page(self):
+        paginator = self._paginator()
+        page = paginator.get_page()
+        while page.has_next:
+            page = paginator.get_page(after=page.next_cursor)
+
+        seen = list(page.object_list)
+        while page.has_previous:
+            page = paginator.get_page(before=page.previous_cursor)
+            seen = list(page.object_list) + seen
+
+        assert seen == self.expected
+        assert page.object_list == self.expected[:3]
+
+    def test_deep_page_uses_a_single_query(self):
+        paginator = self._paginator()
+        cursor = paginator.encode_cursor(self.expected[8])
+
+        with CaptureQueriesContext(connection) as queries:
+            page = paginator.get_page(after=cursor)
+
+        assert page.object_list == self.expected[9:]
+        assert len(queries.captured_queries) == 1
+        assert "OFFSET" not in queries.captured_queries[0]["sql"].upper()
+        assert "COUNT(" not in queries.captured_queries[0]["sql"].upper()
+
+    def test_invalid_cursor_falls_back_to_first_page(self):
+        page = self._paginator().get_page(after="not-a-cursor")
+
+        assert page.object_list == self.expected[:3]
+        assert page.has_previous is False
+
+    def test_keyset_paginated_context(self):
+        params = QueryDict("status=pending&page=4&search=rent")
+
+        context = get_keyset_paginated_context(
+            queryset=self.queryset,
+            object_name="entries",
+            ordering=ENTRY_LIST_ORDERING,
+            page_size=5,
+            query_params=params,
+            count=11,
+        )
+
+        assert context["entries"] == self.expected[:5]
+        assert context["is_paginated"] is True
+        assert context["paginator"].count == 11
+        assert context["pagination_query_string"] == "status=pending&search=rent"
+
+
+@pytest.mark.unit
+def test_get_cursor_query_string_strips_pagination_params():
+    params = QueryDict("after=abc&before=def&page=2&type=income")
+
+    assert get_cursor_query_string(params) == "type=income"
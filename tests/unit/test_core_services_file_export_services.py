@@ -5,7 +5,7 @@ Unit tests for apps.core.services.file_export_services
 from unittest.mock import Mock, patch
 
 import pytest
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 
 from apps.core.services.file_export_services import CsvExporter, PdfExporter
 
@@ -81,6 +81,56 @@ class TestCsvExporter:
 
             assert isinstance(response, HttpResponse)
 
+    def test_streaming_export_consumes_generators_lazily(self):
+        consumed = []
+
+        def rows():
+            for i in range(3):
+                consumed.append(i)
+                yield {"name": f"Row {i}", "amount": i}
+
+        def blocks():
+            yield {"type": "paragraph", "text": "Ledger"}
+            yield {
+                "type": "table",
+                "columns": [("name", "Name"), ("amount", "Amount")],
+                "rows": rows(),
+                "footer": [{"name": "Total", "amount": 3}],
+            }
+
+        exporter = CsvExporter("test", blocks(), streaming=True)
+
+        response = exporter.export()
+
+        assert isinstance(response, StreamingHttpResponse)
+        assert response["Content-Type"] == "text/csv"
+        assert consumed == []
+        content = b"".join(response.streaming_content).decode()
+        assert content.splitlines() == [
+            "Ledger",
+            "Name,Amount",
+            "Row 0,0",
+            "Row 1,1",
+            "Row 2,2",
+            "Total,3",
+        ]
+
+    def test_streaming_export_matches_buffered_export(self):
+        blocks = [
+            {
+                "type": "table",
+                "columns": [("name", "Name"), ("age", "Age")],
+                "rows": [{"name": "John", "age": 30}, {"name": "Jane"}],
+                "footer": [{"name": "Total"}],
+            },
+            {"type": "paragraph", "text": "Done"},
+        ]
+
+        buffered = CsvExporter("test", blocks).export()
+        streamed = CsvExporter("test", blocks, streaming=True).export()
+
+        assert b"".join(streamed.streaming_content) == buffered.content
+
 
 @pytest.mark.unit
 class TestPdfExporter:
@@ -188,3 +238,57 @@ class TestPdfExporter:
             response = exporter.export()
 
             assert isinstance(response, HttpResponse)
+
+    def test_export_accepts_single_pass_rows(self):
+        rows = ({"name": f"Row {i}", "amount": i} for i in range(300))
+        blocks = [
+            {
+                "type": "table",
+                "columns": [("name", "Name"), ("amount", "Amount")],
+                "rows": rows,
+                "footer": iter([{"name": "Total", "amount": 44850}]),
+            }
+        ]
+
+        response = PdfExporter("test", blocks).export()
+
+        assert isinstance(response, HttpResponse)
+        assert response["Content-Type"] == "application/pdf"
+        assert response.content.startswith(b"%PDF")
+
+    def test_calculate_col_widths_only_measures_the_sample(self):
+        exporter = PdfExporter("test", [])
+        exporter.COL_WIDTH_SAMPLE_SIZE = 2
+
+        mock_pdf = Mock()
+        mock_pdf.get_string_width.side_effect = lambda text: len(text)
+        mock_pdf.w = 1000
+        mock_pdf.l_margin = 10
+
+        columns = [("name", "Name")]
+        rows = [{"name": "ab"}, {"name": "abc"}, {"name": "a" * 50}]
+
+        widths = exporter._calculate_col_widths(mock_pdf, columns, rows, [])
+
+        assert widths == [len("Name") + 6]
+
+    def test_export_renders_rows_past_the_sample(self):
+        consumed = []
+
+        def rows():
+            for i in range(5):
+                consumed.append(i)
+                yield {"name": f"Row {i}"}
+
+        blocks = [{"type": "table", "columns": [("name", "Name")], "rows": rows()}]
+        exporter = PdfExporter("test", blocks)
+        exporter.COL_WIDTH_SAMPLE_SIZE = 2
+
+        with patch.object(
+            exporter, "_calculate_col_widths", return_value=[20]
+        ) as calculate:
+            exporter.export()
+
+        sampled_rows = calculate.call_args[0][2]
+        assert sampled_rows == [{"name": "Row 0"}, {"name": "Row 1"}]
+        assert consumed == [0, 1, 2, 3, 4]
@@ -0,0 +1,137 @@
+"""
+Unit tests for apps.core.tenancy
+"""
+
+import pytest
+from django.http import Http404
+
+from apps.core.tenancy import resolve_tenancy_context
+from apps.teams.constants import TeamMemberRole
+from tests.factories import (
+    CustomUserFactory,
+    OrganizationFactory,
+    OrganizationMemberFactory,
+    TeamFactory,
+    TeamMemberFactory,
+    WorkspaceFactory,
+    WorkspaceTeamFactory,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestResolveTenancyContext:
+    def setup_method(self):
+        self.user = CustomUserFactory()
+        self.organization = OrganizationFactory()
+        self.org_member = OrganizationMemberFactory(
+            user=self.user, organization=self.organization
+        )
+        self.organization.owner = self.org_member
+        self.organization.save()
+        self.workspace = WorkspaceFactory(
+            organization=self.organization, workspace_admin=self.org_member
+        )
+        self.team = TeamFactory(
+            organization=self.organization, team_coordinator=self.org_member
+        )
+        self.workspace_team = WorkspaceTeamFactory(
+            workspace=self.workspace, team=self.team
+        )
+        self.team_member = TeamMemberFactory(
+            organization_member=self.org_member, team=self.team
+        )
+
+    def _resolve(self, **kwargs):
+        lookup = {
+            "organization_id": self.organization.pk,
+            "workspace_id": self.workspace.pk,
+            "workspace_team_id": self.workspace_team.pk,
+        }
+        lookup.update(kwargs)
+        return resolve_tenancy_context(user=self.user, **lookup)
+
+    def test_resolves_the_whole_chain(self, django_assert_num_queries):
+        with django_assert_num_queries(3):
+            context = self._resolve()
+
+        with django_assert_num_queries(0):
+            assert context.organization == self.organization
+            assert context.organization.owner == self.org_member
+            assert context.org_member == self.org_member
+            assert context.workspace == self.workspace
+            assert context.workspace.workspace_admin == self.org_member
+            assert context.workspace_team == self.workspace_team
+            assert context.workspace_team.team.team_coordinator == self.org_member
+            assert context.workspace_team_member == self.team_member
+
+    def test_resolves_organization_only(self, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            context = self._resolve(workspace_id=None, workspace_team_id=None)
+
+        assert context.org_member == self.org_member
+        assert context.workspace is None
+        assert context.workspace_team is None
+
+    def test_raises_404_for_non_members(self):
+        outsider = CustomUserFactory()
+
+        with pytest.raises(Http404):
+            resolve_tenancy_context(user=outsider, organization_id=self.organization.pk)
+
+    def test_raises_404_for_a_workspace_of_another_organization(self):
+        other_workspace = WorkspaceFactory()
+
+        with pytest.raises(Http404):
+            self._resolve(workspace_id=other_workspace.pk, workspace_team_id=None)
+
+    def test_raises_404_for_a_soft_deleted_organization(self):
+        self.organization.delete()
+
+        with pytest.raises(Http404):
+            self._resolve()
+
+    def test_cached_context_runs_no_queries(
+        self, locmem_cache, django_assert_num_queries
+    ):
+        self._resolve()
+
+        with django_assert_num_queries(0):
+            context = self._resolve()
+        assert context.workspace_team_member == self.team_member
+
+    def test_role_change_invalidates_cached_context(
+        self, locmem_cache, django_capture_on_commit_callbacks
+    ):
+        assert self._resolve().workspace_team_member.role == TeamMemberRole.SUBMITTER
+
+        with django_capture_on_commit_callbacks(execute=True):
+            self.team_member.role = TeamMemberRole.AUDITOR
+            self.team_member.save()
+
+        assert self._resolve().workspace_team_member.role == TeamMemberRole.AUDITOR
+
+    def test_removed_membership_invalidates_cached_context(
+        self, locmem_cache, django_capture_on_commit_callbacks
+    ):
+        self._resolve()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            self.org_member.delete()
+
+        with pytest.raises(Http404):
+            self._resolve()
+
+    def test_other_organizations_keep_their_cache(
+        self,
+        locmem_cache,
+        django_capture_on_commit_callbacks,
+        django_assert_num_queries,
+    ):
+        self._resolve()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            WorkspaceFactory(organization=OrganizationFactory())
+
+        with django_assert_num_queries(0):
+            self._resolve()
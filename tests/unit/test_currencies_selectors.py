@@ -7,6 +7,8 @@ from decimal import Decimal
 
 import pytest
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from unittest.mock import patch
 
 from apps.currencies.models import Currency
@@ -15,6 +17,7 @@ from apps.currencies.selectors import (
     get_or_create_currency_by_code,
     get_org_defined_currencies,
     get_closest_exchanged_rate,
+    RateResolver,
 )
 from tests.factories import (
     CurrencyFactory,
@@ -421,3 +424,133 @@ class TestGetClosestExchangedRate:
 
         assert result == usd_org_rate
         assert result != eur_workspace_rate
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestRateResolver:
+    def setup_method(self):
+        """Set up test data."""
+        self.organization = OrganizationFactory()
+        self.workspace = WorkspaceFactory(organization=self.organization)
+        self.usd = CurrencyFactory(code="USD")
+        self.eur = CurrencyFactory(code="EUR")
+        self.today = date.today()
+
+    def _resolver(self, workspace=None, codes=("USD", "EUR")):
+        return RateResolver(
+            organization=self.organization,
+            workspace=workspace,
+            currency_codes=codes,
+        )
+
+    def test_matches_get_closest_exchanged_rate(self):
+        """Resolver answers agree with the single-lookup selector."""
+        for offset, rate in ((-10, "0.9"), (-1, "1.0"), (1, "1.1")):
+            WorkspaceExchangeRateFactory(
+                workspace=self.workspace,
+                currency=self.usd,
+                rate=Decimal(rate),
+                effective_date=self.today + timedelta(days=offset),
+                is_approved=True,
+            )
+        OrganizationExchangeRateFactory(
+            organization=self.organization,
+            currency=self.usd,
+            rate=Decimal("2.0"),
+            effective_date=self.today - timedelta(days=20),
+        )
+        resolver = self._resolver(workspace=self.workspace)
+
+        for offset in (-30, -15, -10, -5, -1, 0, 1, 5):
+            occurred_at = self.today + timedelta(days=offset)
+            assert resolver.get_closest_rate(
+                currency=self.usd, occurred_at=occurred_at
+            ) == get_closest_exchanged_rate(
+                currency=self.usd,
+                occurred_at=occurred_at,
+                organization=self.organization,
+                workspace=self.workspace,
+            )
+
+    def test_unapproved_workspace_rate_falls_back_to_org(self):
+        """Unapproved workspace rates are ignored."""
+        WorkspaceExchangeRateFactory(
+            workspace=self.workspace,
+            currency=self.usd,
+            effective_date=self.today,
+            is_approved=False,
+        )
+        org_rate = OrganizationExchangeRateFactory(
+            organization=self.organization,
+            currency=self.usd,
+            effective_date=self.today,
+        )
+
+        resolver = self._resolver(workspace=self.workspace)
+
+        assert (
+            resolver.get_closest_rate(currency=self.usd, occurred_at=self.today)
+            == org_rate
+        )
+
+    def test_accepts_iso_date_strings(self):
+        """CSV rows carry dates as strings."""
+        org_rate = OrganizationExchangeRateFactory(
+            organization=self.organization,
+            currency=self.eur,
+            effective_date=self.today - timedelta(days=1),
+        )
+
+        resolver = self._resolver()
+
+        assert (
+            resolver.get_closest_rate(
+                currency=self.eur, occurred_at=self.today.isoformat()
+            )
+            == org_rate
+        )
+        assert resolver.get_currency("EUR") == self.eur
+        assert resolver.get_currency("JPY") is None
+
+    def test_lookups_do_not_query_after_preload(self):
+        """Preloading makes per-row lookups free."""
+        OrganizationExchangeRateFactory(
+            organization=self.organization,
+            currency=self.usd,
+            effective_date=self.today - timedelta(days=5),
+        )
+        WorkspaceExchangeRateFactory(
+            workspace=self.workspace,
+            currency=self.eur,
+            effective_date=self.today - timedelta(days=5),
+            is_approved=True,
+        )
+
+        with CaptureQueriesContext(connection) as preload:
+            resolver = self._resolver(workspace=self.workspace)
+        assert len(preload.captured_queries) == 3
+
+        with CaptureQueriesContext(connection) as lookups:
+            for offset in range(100):
+                for code in ("USD", "EUR"):
+                    currency = resolver.get_currency(code)
+                    resolver.get_closest_rate(
+                        currency=currency,
+                        occurred_at=self.today - timedelta(days=offset),
+                    )
+        assert len(lookups.captured_queries) == 0
+
+    def test_loads_unknown_currency_on_demand(self):
+        """Currencies outside the preload set are loaded on first use."""
+        org_rate = OrganizationExchangeRateFactory(
+            organization=self.organization,
+            currency=self.eur,
+            effective_date=self.today,
+        )
+        resolver = self._resolver(codes=["USD"])
+
+        assert (
+            resolver.get_closest_rate(currency=self.eur, occurred_at=self.today)
+            == org_rate
+        )
@@ -4,6 +4,7 @@ Unit tests for Email services and background tasks.
 Tests email service functions, Celery tasks, and email adapters.
 """
 
+from datetime import timedelta
 from unittest.mock import Mock, patch
 
 import pytest
@@ -11,6 +12,7 @@ from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
 from django.template import TemplateDoesNotExist
 from django.test import TestCase, override_settings
+from django.utils import timezone
 
 from apps.emails.adapters import CustomAccountAdapter
 from apps.emails.services import (
@@ -149,37 +151,34 @@ class TestEmailTasks(TestCase):
     @patch("apps.emails.tasks.cache")
     def test_send_email_task_round_robin_selection(self, mock_cache, mock_yagmail_smtp):
         """Test round-robin account selection."""
-        mock_yag = Mock()
-        mock_yagmail_smtp.return_value = mock_yag
-
-        # Mock cache.incr() to return specific values for round-robin testing
-        mock_cache.incr.side_effect = [1, 2, 3, 4]  # Will be called 4 times
+        senders = []
 
-        # First call should use first account (index 0)
-        # cache.incr() returns 1, then (1-1) % 3 = 0
-        send_email_task(self.test_email, self.test_subject, self.test_contents)
-        first_call = mock_yagmail_smtp.call_args
+        def create_client(user, oauth2_file=None):
+            client = Mock()
+            client.send.side_effect = lambda **kwargs: senders.append(user)
+            return client
 
-        # Second call should use second account (index 1)
-        # cache.incr() returns 2, then (2-1) % 3 = 1
-        send_email_task(self.test_email, self.test_subject, self.test_contents)
-        second_call = mock_yagmail_smtp.call_args
+        mock_yagmail_smtp.side_effect = create_client
 
-        # Third call should use third account (index 2)
-        # cache.incr() returns 3, then (3-1) % 3 = 2
-        send_email_task(self.test_email, self.test_subject, self.test_contents)
-        third_call = mock_yagmail_smtp.call_args
+        # Mock cache.incr() to return specific values for round-robin testing
+        mock_cache.incr.side_effect = [1, 2, 3, 4]  # Will be called 4 times
 
-        # Fourth call should wrap around to first account (index 0)
-        # cache.incr() returns 4, then (4-1) % 3 = 0
-        send_email_task(self.test_email, self.test_subject, self.test_contents)
-        fourth_call = mock_yagmail_smtp.call_args
+        # cache.incr() returns 1..4, selecting accounts (n-1) % 3 = 0, 1, 2, 0
+        for _ in range(4):
+            send_email_task(self.test_email, self.test_subject, self.test_contents)
 
         # Verify round-robin behavior
-        self.assertEqual(first_call[0][0], "test1@gmail.com")
-        self.assertEqual(second_call[0][0], "test2@gmail.com")
-        self.assertEqual(third_call[0][0], "test3@gmail.com")
-        self.assertEqual(fourth_call[0][0], "test1@gmail.com")
+        self.assertEqual(
+            senders,
+            [
+                "test1@gmail.com",
+                "test2@gmail.com",
+                "test3@gmail.com",
+                "test1@gmail.com",
+            ],
+        )
+        # The wrapped around email reuses the pooled connection of the first account
+        self.assertEqual(mock_yagmail_smtp.call_count, 3)
 
     @override_settings(
         GMAIL_ACCOUNTS=[
@@ -549,6 +548,78 @@ class TestSendInvitationEmail(TestCase):
         )
 
 
+@pytest.mark.unit
+class TestSendInvitationEmails(TestCase):
+    """Test the batched send_invitation_emails service function."""
+
+    def setUp(self):
+        from tests.factories.organization_factories import (
+            OrganizationFactory,
+            OrganizationMemberFactory,
+        )
+
+        self.organization = OrganizationFactory(title="Relief Network")
+        self.org_member = OrganizationMemberFactory(organization=self.organization)
+        self.invitations = []
+        for index in range(5):
+            invitation = Mock()
+            invitation.organization = self.organization
+            invitation.invited_by = self.org_member
+            invitation.email = f"invitee{index}@example.com"
+            invitation.expired_at = timezone.now() + timedelta(days=7)
+            invitation.get_acceptance_url = Mock(
+                return_value=f"/invitations/accept/{index}/"
+            )
+            self.invitations.append(invitation)
+
+    @patch("apps.emails.services.INVITATION_EMAIL_BATCH_SIZE", 2)
+    @patch("apps.emails.services.send_email_batch_task.delay")
+    @patch("django.contrib.sites.models.Site.objects.get_current")
+    @override_settings(DEBUG=False)
+    def test_queues_rendered_emails_in_batches(
+        self, mock_get_current, mock_send_email_batch_task
+    ):
+        from apps.emails.services import send_invitation_emails
+
+        mock_get_current.return_value = Mock(domain="app.example.com")
+
+        queued = send_invitation_emails(self.invitations)
+
+        self.assertEqual(queued, 5)
+        mock_get_current.assert_called_once()
+        batches = [call[0][0] for call in mock_send_email_batch_task.call_args_list]
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        messages = [message for batch in batches for message in batch]
+        self.assertEqual(
+            [message["to"] for message in messages],
+            [invitation.email for invitation in self.invitations],
+        )
+        self.assertNotIn("\n", messages[0]["subject"])
+        self.assertIn("Relief Network", messages[0]["subject"])
+        self.assertIn(
+            "https://app.example.com/invitations/accept/3/", messages[3]["contents"]
+        )
+
+    @patch("apps.emails.services.send_email_batch_task.delay")
+    @patch("apps.emails.services.select_template")
+    def test_missing_templates_queue_nothing(
+        self, mock_select_template, mock_send_email_batch_task
+    ):
+        from apps.emails.services import send_invitation_emails
+
+        mock_select_template.side_effect = TemplateDoesNotExist("invitation_message")
+
+        self.assertEqual(send_invitation_emails(self.invitations), 0)
+        mock_send_email_batch_task.assert_not_called()
+
+    @patch("apps.emails.services.send_email_batch_task.delay")
+    def test_no_invitations(self, mock_send_email_batch_task):
+        from apps.emails.services import send_invitation_emails
+
+        self.assertEqual(send_invitation_emails([]), 0)
+        mock_send_email_batch_task.assert_not_called()
+
+
 @pytest.mark.unit
 class TestCustomAccountAdapter(TestCase):
     """Test custom account adapter for email sending."""
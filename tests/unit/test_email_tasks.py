@@ -4,14 +4,20 @@ Unit tests for Email background tasks and Celery integration.
 Tests advanced scenarios, error handling, and task behavior.
 """
 
+import json
+import smtplib
+import tempfile
+import time
 from unittest.mock import Mock, patch
 
 from django.conf import settings
 import pytest
+import yagmail
 from django.core.cache import cache
 from django.test import TestCase, override_settings
 
-from apps.emails.tasks import send_email_task
+from apps.emails.tasks import send_email_batch_task, send_email_task
+from apps.emails.transport import PooledConnection
 from tests.factories import CustomUserFactory
 
 
@@ -277,8 +283,14 @@ class TestEmailTasksConfiguration(TestCase):
     @patch("apps.emails.tasks.cache")
     def test_send_email_task_large_account_pool(self, mock_cache, mock_yagmail_smtp):
         """Test round-robin with larger pool of accounts."""
-        mock_yag = Mock()
-        mock_yagmail_smtp.return_value = mock_yag
+        senders = []
+
+        def create_client(user, oauth2_file=None):
+            client = Mock()
+            client.send.side_effect = lambda **kwargs: senders.append(user)
+            return client
+
+        mock_yagmail_smtp.side_effect = create_client
 
         # Mock cache.incr() to return specific values for round-robin testing
         mock_cache.incr.side_effect = [1, 2, 3, 4, 5, 6]  # Will be called 6 times
@@ -292,14 +304,14 @@ class TestEmailTasksConfiguration(TestCase):
             "test1@gmail.com",  # (6-1) % 5 = 0 (wraps around)
         ]
 
-        for i, expected_account in enumerate(expected_accounts):
+        for i in range(len(expected_accounts)):
             send_email_task(
                 f"test{i}@example.com", self.test_subject, self.test_contents
             )
 
-            # Get the last call
-            last_call = mock_yagmail_smtp.call_args_list[-1]
-            self.assertEqual(last_call[0][0], expected_account)
+        self.assertEqual(senders, expected_accounts)
+        # One pooled connection per account
+        self.assertEqual(mock_yagmail_smtp.call_count, 5)
 
     @override_settings(
         GMAIL_ACCOUNTS=[
@@ -402,3 +414,249 @@ class TestEmailTasksIntegration(TestCase):
         mock_logger.info.assert_called_once_with(
             f"Email sent successfully to {self.user.email} from test@gmail.com."
         )
+
+
+def _create_session_client():
+    """A yagmail stand-in whose ``send`` opens an SMTP session like the real one."""
+    client = Mock()
+    client.smtp = None
+    client.user = "sender@gmail.com"
+    client.prepare_send.return_value = (["to@example.com"], "message")
+
+    def open_session(**kwargs):
+        client.smtp = Mock()
+
+    client.send.side_effect = open_session
+    return client
+
+
+@pytest.mark.unit
+class TestPooledConnection(TestCase):
+    """Test reuse of the SMTP session of a pooled connection."""
+
+    def test_reuses_the_open_session(self):
+        client = _create_session_client()
+        connection = PooledConnection(client)
+
+        for i in range(3):
+            connection.send(to=f"to{i}@example.com", subject="Subject", contents="Body")
+
+        client.send.assert_called_once()
+        self.assertEqual(client.smtp.sendmail.call_count, 2)
+        client.smtp.sendmail.assert_called_with(
+            "sender@gmail.com", ["to@example.com"], "message"
+        )
+
+    @patch("apps.emails.transport.CONNECTION_MAX_IDLE_SECONDS", 0)
+    def test_logs_in_again_after_idling(self):
+        client = _create_session_client()
+        connection = PooledConnection(client)
+
+        connection.send(to="to@example.com", subject="Subject", contents="Body")
+        time.sleep(0.01)
+        connection.send(to="to@example.com", subject="Subject", contents="Body")
+
+        self.assertEqual(client.send.call_count, 2)
+        client.close.assert_called_once()
+
+    def test_logs_in_again_when_the_server_disconnects(self):
+        client = _create_session_client()
+        connection = PooledConnection(client)
+        connection.send(to="to@example.com", subject="Subject", contents="Body")
+        client.smtp.sendmail.side_effect = smtplib.SMTPServerDisconnected()
+
+        connection.send(to="to@example.com", subject="Subject", contents="Body")
+
+        self.assertEqual(client.send.call_count, 2)
+
+    def test_reuses_the_open_session_of_an_oauth2_account(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".json") as oauth2_file:
+            json.dump(
+                {
+                    "google_client_id": "client-id",
+                    "google_client_secret": "client-secret",
+                    "google_refresh_token": "refresh-token",
+                },
+                oauth2_file,
+            )
+            oauth2_file.flush()
+            client = yagmail.SMTP("sender@gmail.com", oauth2_file=oauth2_file.name)
+
+        connection = PooledConnection(client)
+        with (
+            patch("yagmail.sender.smtplib.SMTP_SSL") as mock_smtp,
+            patch.object(yagmail.SMTP, "get_oauth_string", return_value="token"),
+        ):
+            for i in range(3):
+                connection.send(
+                    to=f"to{i}@example.com", subject="Subject", contents="Body"
+                )
+            connection.close()
+
+        mock_smtp.assert_called_once()
+        session = mock_smtp.return_value
+        self.assertEqual(session.sendmail.call_count, 3)
+        session.quit.assert_called_once()
+
+    def test_rejected_recipient_keeps_the_session(self):
+        client = _create_session_client()
+        connection = PooledConnection(client)
+        connection.send(to="to@example.com", subject="Subject", contents="Body")
+        client.smtp.sendmail.side_effect = [
+            smtplib.SMTPRecipientsRefused({"bad@example.com": (550, b"No such user")}),
+            None,
+        ]
+
+        with self.assertRaises(smtplib.SMTPRecipientsRefused):
+            connection.send(to="bad@example.com", subject="Subject", contents="Body")
+        connection.send(to="to@example.com", subject="Subject", contents="Body")
+
+        client.send.assert_called_once()
+
+    def test_raises_when_yagmail_gives_up(self):
+        client = Mock()
+        client.send.return_value = False
+        connection = PooledConnection(client)
+
+        with self.assertRaises(smtplib.SMTPServerDisconnected):
+            connection.send(to="to@example.com", subject="Subject", contents="Body")
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("locmem_cache")
+@override_settings(
+    GMAIL_ACCOUNTS=[
+        {"user": "test1@gmail.com", "oauth2_file": "/path/to/oauth1.json"},
+        {"user": "test2@gmail.com", "oauth2_file": "/path/to/oauth2.json"},
+    ],
+)
+class TestEmailAccountPooling(TestCase):
+    """Test pooled connections, account health and batch delivery."""
+
+    def setUp(self):
+        self.senders = []
+        self.failing_users = set()
+        self.rejected_recipients = set()
+
+    def _create_client(self, user, oauth2_file=None):
+        def send(**kwargs):
+            if user in self.failing_users:
+                raise Exception("Authentication failed")
+            if kwargs["to"] in self.rejected_recipients:
+                raise smtplib.SMTPRecipientsRefused(
+                    {kwargs["to"]: (550, b"No such user")}
+                )
+            self.senders.append((user, kwargs["to"]))
+
+        client = Mock()
+        # No SMTP session is opened, so every message goes through ``send``
+        client.smtp = None
+        client.send.side_effect = send
+        return client
+
+    @patch("apps.emails.tasks.yagmail.SMTP")
+    def test_connections_are_reused_across_tasks(self, mock_yagmail_smtp):
+        mock_yagmail_smtp.side_effect = self._create_client
+
+        for i in range(6):
+            send_email_task(f"user{i}@example.com", "Subject", "Body")
+
+        self.assertEqual(len(self.senders), 6)
+        self.assertEqual(mock_yagmail_smtp.call_count, 2)
+
+    @patch("apps.emails.tasks.yagmail.SMTP")
+    def test_unhealthy_accounts_are_skipped(self, mock_yagmail_smtp):
+        mock_yagmail_smtp.side_effect = self._create_client
+        cache.set("gmail_account_healthy_0", False)
+
+        for i in range(3):
+            send_email_task(f"user{i}@example.com", "Subject", "Body")
+
+        self.assertEqual({user for user, _ in self.senders}, {"test2@gmail.com"})
+
+    @patch("apps.emails.tasks.yagmail.SMTP")
+    def test_failing_account_is_marked_unhealthy(self, mock_yagmail_smtp):
+        mock_yagmail_smtp.side_effect = self._create_client
+        self.failing_users.add("test1@gmail.com")
+
+        send_email_task("user@example.com", "Subject", "Body")
+
+        self.assertEqual(self.senders, [("test2@gmail.com", "user@example.com")])
+        self.assertIs(cache.get("gmail_account_healthy_0"), False)
+
+    @patch("apps.emails.tasks.yagmail.SMTP")
+    def test_batch_is_sent_over_one_connection(self, mock_yagmail_smtp):
+        mock_yagmail_smtp.side_effect = self._create_client
+        messages = [
+            {"to": f"user{i}@example.com", "subject": "Subject", "contents": "Body"}
+            for i in range(25)
+        ]
+
+        sent = send_email_batch_task(messages)
+
+        self.assertEqual(sent, 25)
+        mock_yagmail_smtp.assert_called_once_with(
+            "test1@gmail.com", oauth2_file="/path/to/oauth1.json"
+        )
+        self.assertEqual(
+            [to for _, to in self.senders], [message["to"] for message in messages]
+        )
+
+    @patch("apps.emails.tasks.yagmail.SMTP")
+    def test_batch_moves_to_the_next_account_on_failure(self, mock_yagmail_smtp):
+        mock_yagmail_smtp.side_effect = self._create_client
+        self.failing_users.add("test1@gmail.com")
+        messages = [
+            {"to": f"user{i}@example.com", "subject": "Subject", "contents": "Body"}
+            for i in range(3)
+        ]
+
+        sent = send_email_batch_task(messages)
+
+        self.assertEqual(sent, 3)
+        self.assertEqual({user for user, _ in self.senders}, {"test2@gmail.com"})
+
+    @patch("apps.emails.tasks.yagmail.SMTP")
+    def test_batch_skips_rejected_recipients(self, mock_yagmail_smtp):
+        mock_yagmail_smtp.side_effect = self._create_client
+        self.rejected_recipients.add("user1@example.com")
+        messages = [
+            {"to": f"user{i}@example.com", "subject": "Subject", "contents": "Body"}
+            for i in range(3)
+        ]
+
+        sent = send_email_batch_task(messages)
+
+        self.assertEqual(sent, 2)
+        self.assertEqual(
+            self.senders,
+            [
+                ("test1@gmail.com", "user0@example.com"),
+                ("test1@gmail.com", "user2@example.com"),
+            ],
+        )
+        self.assertIsNone(cache.get("gmail_account_healthy_0"))
+
+    @patch("apps.emails.tasks.yagmail.SMTP")
+    def test_rejected_recipient_does_not_rotate_accounts(self, mock_yagmail_smtp):
+        mock_yagmail_smtp.side_effect = self._create_client
+        self.rejected_recipients.add("user@example.com")
+
+        send_email_task("user@example.com", "Subject", "Body")
+
+        mock_yagmail_smtp.assert_called_once()
+        self.assertIsNone(cache.get("gmail_account_healthy_0"))
+
+    @patch("apps.emails.tasks.yagmail.SMTP")
+    @patch("apps.emails.tasks.logger")
+    def test_batch_reports_undelivered_messages(self, mock_logger, mock_yagmail_smtp):
+        mock_yagmail_smtp.side_effect = self._create_client
+        self.failing_users.update({"test1@gmail.com", "test2@gmail.com"})
+        messages = [
+            {"to": "user@example.com", "subject": "Subject", "contents": "Body"}
+        ]
+
+        sent = send_email_batch_task(messages)
+
+        self.assertEqual(sent, 0)
+        mock_logger.error.assert_called_once_with("Failed to send 1 of 1 emails.")
@@ -598,10 +598,13 @@ class TestUpdateWorkspaceTeamEntryForm(TestCase):
 
     def test_update_workspace_team_form_invalid_status_transition(self):
         """Test that UpdateWorkspaceTeamEntryForm validates status transitions."""
+        # Team coordinators cannot change the status of remittance entries at
+        # all, so pin a type whose status field stays editable
         entry = PendingEntryFactory(
             organization=self.organization,
             workspace=self.workspace,
             workspace_team=self.workspace_team,
+            entry_type=EntryType.INCOME,
             status=EntryStatus.PENDING,
         )
 
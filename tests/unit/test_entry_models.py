@@ -148,7 +148,7 @@ class TestEntryModel:
         assert "status" in index_fields
         assert "workspace" in index_fields
         assert "workspace_team" in index_fields
-        assert "occurred_at" in index_fields
+        assert "-occurred_at" in index_fields
 
     def test_entry_with_minimal_required_fields(self):
         """Test entry can be created with minimal required fields."""
@@ -10,7 +10,14 @@ import pytest
 
 from apps.currencies.models import Currency
 from apps.entries.constants import EntryStatus, EntryType
-from apps.entries.selectors import get_entries, get_total_amount_of_entries, get_entry
+from apps.entries.models import Entry
+from apps.entries.selectors import (
+    get_cached_entry_count,
+    get_entries,
+    get_entry,
+    get_total_amount_of_entries,
+)
+from apps.entries.services import EntryService
 from tests.factories import (
     EntryFactory,
     IncomeEntryFactory,
@@ -566,3 +573,74 @@ class TestGetEntry:
         retrieved_entry = get_entry(self.entry.entry_id)
 
         assert not hasattr(retrieved_entry, "attachment_count")
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestGetCachedEntryCount:
+    """Test the cached entry list total."""
+
+    @pytest.fixture(autouse=True)
+    def create_entries(self, locmem_cache):
+        self.organization = OrganizationWithOwnerFactory()
+        EntryFactory.create_batch(3, organization=self.organization)
+        self.queryset = Entry.objects.filter(organization=self.organization)
+
+    def test_count_is_cached_per_query(self, django_assert_num_queries):
+        assert (
+            get_cached_entry_count(
+                queryset=self.queryset, organization_id=self.organization.pk
+            )
+            == 3
+        )
+
+        with django_assert_num_queries(0):
+            assert (
+                get_cached_entry_count(
+                    queryset=self.queryset, organization_id=self.organization.pk
+                )
+                == 3
+            )
+
+        pending = self.queryset.filter(status=EntryStatus.APPROVED)
+        assert (
+            get_cached_entry_count(
+                queryset=pending, organization_id=self.organization.pk
+            )
+            == 0
+        )
+
+    def test_entry_writes_invalidate_the_count(
+        self, django_capture_on_commit_callbacks
+    ):
+        get_cached_entry_count(
+            queryset=self.queryset, organization_id=self.organization.pk
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            EntryFactory(organization=self.organization)
+
+        assert (
+            get_cached_entry_count(
+                queryset=self.queryset, organization_id=self.organization.pk
+            )
+            == 4
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            EntryService.bulk_delete_entries(entries=self.queryset.all())
+
+        assert (
+            get_cached_entry_count(
+                queryset=self.queryset, organization_id=self.organization.pk
+            )
+            == 0
+        )
+
+    def test_empty_queryset(self):
+        assert (
+            get_cached_entry_count(
+                queryset=Entry.objects.none(), organization_id=self.organization.pk
+            )
+            == 0
+        )
@@ -7,13 +7,24 @@ from decimal import Decimal
 from unittest.mock import patch, Mock
 
 import pytest
-from django.db import transaction
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
 
+from apps.auditlog.constants import AuditActionType
+from apps.auditlog.models import AuditTrail
 from apps.core.exceptions import BaseServiceError, BulkOperationError
 from apps.currencies.models import Currency
-from apps.entries.constants import EntryStatus, EntryType
-from apps.entries.models import Entry
-from apps.entries.services import EntryService, EntryServiceError
+from apps.entries.constants import EntryImportJobStatus, EntryStatus, EntryType
+from apps.entries.models import Entry, TeamLedgerBalance
+from apps.entries.services import (
+    EntryImportService,
+    EntryRerateService,
+    EntryService,
+    EntryServiceError,
+    TeamLedgerService,
+)
+from apps.remittance.models import Remittance
 
 # Import related models for setup (if needed for object creation in fixtures)
 from django.contrib.auth import get_user_model
@@ -109,11 +120,8 @@ def mock_external_dependencies():
     """
     with (
         patch(
-            "apps.entries.services.get_currency_by_code", autospec=True
-        ) as mock_get_currency,
-        patch(
-            "apps.entries.services.get_closest_exchanged_rate", autospec=True
-        ) as mock_get_exchange_rate,
+            "apps.entries.services.RateResolver", autospec=True
+        ) as mock_rate_resolver,
         patch(
             "apps.entries.services.create_attachments", autospec=True
         ) as mock_create_attachments,
@@ -130,8 +138,9 @@ def mock_external_dependencies():
         mock_transaction_atomic.return_value.__exit__.return_value = None
 
         yield {
-            "get_currency_by_code": mock_get_currency,
-            "get_closest_exchanged_rate": mock_get_exchange_rate,
+            "rate_resolver": mock_rate_resolver,
+            "get_currency": mock_rate_resolver.return_value.get_currency,
+            "get_closest_rate": mock_rate_resolver.return_value.get_closest_rate,
             "create_attachments": mock_create_attachments,
             "replace_or_append_attachments": mock_replace_or_append_attachments,
             "audit_logger": mock_audit_logger,
@@ -147,8 +156,8 @@ def test_build_entry_success(setup_common_models, mock_external_dependencies):
 
     # --- ARRANGE ---
     # Configure mocks to return real model instances from the fixture
-    mocks["get_currency_by_code"].return_value = models["currency_usd"]
-    mocks["get_closest_exchanged_rate"].return_value = models["org_exchange_rate_usd"]
+    mocks["get_currency"].return_value = models["currency_usd"]
+    mocks["get_closest_rate"].return_value = models["org_exchange_rate_usd"]
 
     # Define explicit input parameters
     test_amount = Decimal("100.00")
@@ -186,10 +195,10 @@ def test_build_entry_success(setup_common_models, mock_external_dependencies):
     assert entry.submitted_by_team_member == models["team_member"]
 
     # 3. Verify derived fields from service logic
-    assert entry.currency == models["currency_usd"]  # From get_currency_by_code
+    assert entry.currency == models["currency_usd"]  # From RateResolver.get_currency
     assert (
         entry.exchange_rate_used == models["org_exchange_rate_usd"].rate
-    )  # From get_closest_exchanged_rate
+    )  # From RateResolver.get_closest_rate
     assert (
         entry.org_exchange_rate_ref == models["org_exchange_rate_usd"]
     )  # Correct reference set
@@ -198,12 +207,15 @@ def test_build_entry_success(setup_common_models, mock_external_dependencies):
     assert entry.status == EntryStatus.PENDING  # Default status
 
     # 4. Verify external dependencies were called correctly
-    mocks["get_currency_by_code"].assert_called_once_with("USD")
-    mocks["get_closest_exchanged_rate"].assert_called_once_with(
-        currency=models["currency_usd"],
-        occurred_at=test_occurred_at,
+    mocks["rate_resolver"].assert_called_once_with(
         organization=models["organization"],
         workspace=models["workspace"],
+        currency_codes=["USD"],
+    )
+    mocks["get_currency"].assert_called_once_with("USD")
+    mocks["get_closest_rate"].assert_called_once_with(
+        currency=models["currency_usd"],
+        occurred_at=test_occurred_at,
     )
 
 
@@ -298,6 +310,84 @@ def test_bulk_create_entry_raises_entry_service_error_on_db_exception(
     assert Entry.objects.count() == 0
 
 
+@pytest.mark.django_db
+def test_bulk_import_entries_audits_and_syncs_remittance(setup_common_models):
+    """Test that bulk_import_entries audits the batch and resyncs remittances."""
+    models = setup_common_models
+    entries = [
+        Entry(
+            entry_type=EntryType.INCOME,
+            organization=models["organization"],
+            workspace=models["workspace"],
+            workspace_team=models["workspace_team"],
+            description=f"Imported entry {index}",
+            amount=Decimal("10.00"),
+            occurred_at=date.today(),
+            currency=models["currency_usd"],
+            exchange_rate_used=Decimal("1.00"),
+            org_exchange_rate_ref=models["org_exchange_rate_usd"],
+            submitted_by_org_member=models["org_member"],
+            status=EntryStatus.APPROVED,
+        )
+        for index in range(3)
+    ]
+
+    created_entries = EntryService.bulk_import_entries(
+        entries=entries, user=models["user"]
+    )
+
+    assert len(created_entries) == 3
+    summary = AuditTrail.objects.get(action_type=AuditActionType.BULK_OPERATION)
+    assert summary.metadata["total_affected_count"] == 3
+    assert summary.metadata["operation_type"] == "bulk_entry_import"
+    entry_audits = AuditTrail.objects.filter(action_type=AuditActionType.ENTRY_CREATED)
+    assert {audit.target_entity_id for audit in entry_audits} == {
+        entry.pk for entry in created_entries
+    }
+    assert all(
+        audit.metadata["bulk_audit_id"] == str(summary.audit_id)
+        and audit.workspace_id == models["workspace"].pk
+        and audit.search_text
+        for audit in entry_audits
+    )
+    assert _ledger_total(
+        models["workspace_team"], EntryType.INCOME, EntryStatus.APPROVED
+    ) == (Decimal("30.00"), 3)
+    remittance = Remittance.objects.get(workspace_team=models["workspace_team"])
+    assert remittance.due_amount == Decimal("27.00")
+
+
+@pytest.mark.django_db
+def test_bulk_import_entries_uses_constant_queries(setup_common_models):
+    """Test that the number of queries does not grow with the import size."""
+    models = setup_common_models
+
+    def import_entries(count):
+        entries = [
+            Entry(
+                entry_type=EntryType.INCOME,
+                organization=models["organization"],
+                workspace=models["workspace"],
+                workspace_team=models["workspace_team"],
+                description="Imported entry",
+                amount=Decimal("10.00"),
+                occurred_at=date.today(),
+                currency=models["currency_usd"],
+                exchange_rate_used=Decimal("1.00"),
+                org_exchange_rate_ref=models["org_exchange_rate_usd"],
+                submitted_by_org_member=models["org_member"],
+            )
+            for _ in range(count)
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            EntryService.bulk_import_entries(entries=entries, user=models["user"])
+        return len(queries)
+
+    # Warm up the content type cache and create the ledger row
+    import_entries(1)
+    assert import_entries(2) == import_entries(30)
+
+
 @pytest.mark.django_db
 def test_create_entry_without_attachments_success(
     setup_common_models, mock_external_dependencies
@@ -312,7 +402,7 @@ def test_create_entry_without_attachments_success(
     test_description = "Entry with attachments"
 
     # Mock exchange rate return
-    mocks["get_closest_exchanged_rate"].return_value = models["org_exchange_rate_usd"]
+    mocks["get_closest_rate"].return_value = models["org_exchange_rate_usd"]
 
     # --- ACT ---
     entry = EntryService.create_entry_with_attachments(
@@ -360,7 +450,7 @@ def test_create_entry_without_attachments_no_exchange_rate(
     mocks = mock_external_dependencies
 
     # Mock to return None
-    mocks["get_closest_exchanged_rate"].return_value = None
+    mocks["get_closest_rate"].return_value = None
 
     with pytest.raises(BaseServiceError):
         EntryService.create_entry_with_attachments(
@@ -408,7 +498,7 @@ def test_update_entry_user_inputs_success(
     new_currency = models["currency_eur"]
 
     # Make exchange rate lookup return the EUR rate
-    mocks["get_closest_exchanged_rate"].return_value = models["org_exchange_rate_eur"]
+    mocks["get_closest_rate"].return_value = models["org_exchange_rate_eur"]
 
     fake_attachments = [{"name": "new_file.pdf"}]
 
@@ -813,3 +903,437 @@ def test_bulk_delete_entries_success_without_user(
     )
 
     assert Entry.objects.count() == 0
+
+
+# --- TeamLedgerService ---
+
+
+def _ledger_total(workspace_team, entry_type, status):
+    balance = TeamLedgerBalance.objects.filter(
+        workspace_team=workspace_team, entry_type=entry_type, status=status
+    ).first()
+    return (balance.total_amount, balance.entry_count) if balance else (0, 0)
+
+
+def _team_entry(models, **kwargs):
+    defaults = {
+        "organization": models["organization"],
+        "workspace": models["workspace"],
+        "workspace_team": models["workspace_team"],
+        "currency": models["currency_usd"],
+        "entry_type": EntryType.INCOME,
+        "exchange_rate_used": Decimal("2.00"),
+        "amount": Decimal("10.00"),
+        "status": EntryStatus.PENDING,
+    }
+    defaults.update(kwargs)
+    return EntryFactory(**defaults)
+
+
+@pytest.mark.django_db
+def test_team_ledger_tracks_created_entries(setup_common_models):
+    """Test that saving new entries adds their converted amount to the ledger."""
+    models = setup_common_models
+    _team_entry(models)
+    _team_entry(models, amount=Decimal("5.00"))
+
+    assert _ledger_total(
+        models["workspace_team"], EntryType.INCOME, EntryStatus.PENDING
+    ) == (Decimal("30.00"), 2)
+
+
+@pytest.mark.django_db
+def test_team_ledger_moves_balance_on_status_change(setup_common_models):
+    """Test that a status change moves the amount between ledger rows."""
+    models = setup_common_models
+    entry = Entry.objects.get(pk=_team_entry(models).pk)
+
+    entry.status = EntryStatus.APPROVED
+    entry.save()
+
+    assert _ledger_total(
+        models["workspace_team"], EntryType.INCOME, EntryStatus.PENDING
+    ) == (Decimal("0.00"), 0)
+    assert _ledger_total(
+        models["workspace_team"], EntryType.INCOME, EntryStatus.APPROVED
+    ) == (Decimal("20.00"), 1)
+    remittance = Remittance.objects.get(workspace_team=models["workspace_team"])
+    assert remittance.due_amount == Decimal("18.00")
+
+
+@pytest.mark.django_db
+def test_team_ledger_removes_soft_deleted_entries(setup_common_models):
+    """Test that soft deleting an entry removes it from the ledger."""
+    models = setup_common_models
+    entry = _team_entry(models)
+
+    entry.delete()
+
+    assert _ledger_total(
+        models["workspace_team"], EntryType.INCOME, EntryStatus.PENDING
+    ) == (Decimal("0.00"), 0)
+
+
+@pytest.mark.django_db
+def test_team_ledger_tracks_bulk_status_update_and_delete(setup_common_models):
+    """Test that bulk writes that bypass signals keep the ledger in step."""
+    models = setup_common_models
+    for _ in range(3):
+        _team_entry(models)
+
+    entries = list(Entry.objects.filter(workspace_team=models["workspace_team"]))
+    for entry in entries:
+        entry.status = EntryStatus.APPROVED
+    EntryService.bulk_update_entry_status(entries=entries)
+
+    assert _ledger_total(
+        models["workspace_team"], EntryType.INCOME, EntryStatus.APPROVED
+    ) == (Decimal("60.00"), 3)
+
+    EntryService.bulk_delete_entries(
+        entries=Entry.objects.filter(pk__in=[entries[0].pk, entries[1].pk])
+    )
+
+    assert _ledger_total(
+        models["workspace_team"], EntryType.INCOME, EntryStatus.APPROVED
+    ) == (Decimal("20.00"), 1)
+    assert TeamLedgerService.find_drift() == []
+
+
+@pytest.mark.django_db
+def test_team_ledger_applies_later_saves_after_a_bulk_update(setup_common_models):
+    """Test that a save after a bulk status update is not counted twice."""
+    models = setup_common_models
+    entry = Entry.objects.get(pk=_team_entry(models).pk)
+
+    entry.status = EntryStatus.APPROVED
+    EntryService.bulk_update_entry_status(entries=[entry])
+    entry.amount = Decimal("15.00")
+    entry.save()
+
+    assert _ledger_total(
+        models["workspace_team"], EntryType.INCOME, EntryStatus.PENDING
+    ) == (Decimal("0.00"), 0)
+    assert _ledger_total(
+        models["workspace_team"], EntryType.INCOME, EntryStatus.APPROVED
+    ) == (Decimal("30.00"), 1)
+    assert TeamLedgerService.find_drift() == []
+
+
+@pytest.mark.django_db
+def test_team_ledger_rebuilds_teams_of_entries_loaded_with_deferred_fields(
+    setup_common_models,
+):
+    """Test that an entry without loaded ledger fields rebuilds its team."""
+    models = setup_common_models
+    entry = Entry.objects.defer("amount").get(pk=_team_entry(models).pk)
+
+    entry.status = EntryStatus.APPROVED
+    entry.save(update_fields=["status"])
+
+    assert _ledger_total(
+        models["workspace_team"], EntryType.INCOME, EntryStatus.APPROVED
+    ) == (Decimal("20.00"), 1)
+    assert TeamLedgerService.find_drift() == []
+
+
+@pytest.mark.django_db
+def test_team_ledger_rebuilds_teams_of_saved_entries_without_a_snapshot(
+    setup_common_models,
+):
+    """Test that an update without loaded values is not counted as new."""
+    models = setup_common_models
+    entry = Entry.objects.get(pk=_team_entry(models).pk)
+    entry._loaded_pk = None  # No snapshot, as for an unsaved copy
+
+    entry.status = EntryStatus.APPROVED
+    entry.save()
+
+    assert _ledger_total(
+        models["workspace_team"], EntryType.INCOME, EntryStatus.PENDING
+    ) == (Decimal("0.00"), 0)
+    assert TeamLedgerService.find_drift() == []
+
+
+@pytest.mark.django_db
+def test_team_ledger_rebuild_fixes_drift(setup_common_models):
+    """Test that drift is reported and corrected by the rebuild command."""
+    models = setup_common_models
+    _team_entry(models)
+    TeamLedgerBalance.objects.update(total_amount=Decimal("1.00"))
+
+    drift = TeamLedgerService.find_drift()
+    assert len(drift) == 1
+    assert drift[0]["expected_total"] == Decimal("20.00")
+
+    call_command("rebuild_team_ledger", "--check")
+    assert len(TeamLedgerService.find_drift()) == 1
+
+    call_command("rebuild_team_ledger")
+    assert TeamLedgerService.find_drift() == []
+
+
+@pytest.mark.django_db
+def test_team_ledger_apply_deltas_only_creates_rows_when_allowed(
+    setup_common_models,
+):
+    """Test that removal deltas never create missing ledger rows."""
+    models = setup_common_models
+    key = (models["workspace_team"].pk, EntryType.INCOME, EntryStatus.APPROVED)
+
+    TeamLedgerService.apply_deltas(
+        deltas={key: (Decimal("-5.00"), -1)}, create_missing=False
+    )
+    assert not TeamLedgerBalance.objects.exists()
+
+    TeamLedgerService.apply_deltas(deltas={key: (Decimal("5.00"), 1)})
+    assert _ledger_total(
+        models["workspace_team"], EntryType.INCOME, EntryStatus.APPROVED
+    ) == (Decimal("5.00"), 1)
+
+
+@pytest.mark.django_db
+def test_team_ledger_is_removed_with_its_workspace_team(setup_common_models):
+    """Test that hard deleting a team with entries leaves no ledger rows behind."""
+    models = setup_common_models
+    workspace_team_id = models["workspace_team"].pk
+    _team_entry(models, status=EntryStatus.APPROVED)
+    _team_entry(models)
+
+    models["workspace_team"].delete()
+
+    assert not TeamLedgerBalance.objects.filter(
+        workspace_team_id=workspace_team_id
+    ).exists()
+    connection.check_constraints()
+
+
+# --- EntryRerateService ---
+
+
+@pytest.mark.django_db
+def test_rerate_dry_run_reports_delta_without_writing(setup_common_models):
+    """Test that a dry run reports the converted total change only."""
+    models = setup_common_models
+    entry = _team_entry(models)
+
+    report = EntryRerateService.rerate_entries(
+        organization_id=models["organization"].pk,
+        currency_id=models["currency_usd"].pk,
+        dry_run=True,
+    )
+
+    assert report["entry_count"] == 1
+    assert report["converted_total_before"] == Decimal("20.00")
+    assert report["converted_total_after"] == Decimal("10.00")
+    assert report["converted_total_delta"] == Decimal("-10.00")
+    entry.refresh_from_db()
+    assert entry.exchange_rate_used == Decimal("2.00")
+
+
+@pytest.mark.django_db
+def test_rerate_updates_stale_pending_entries(setup_common_models):
+    """Test that stale pending entries are re-rated in one update and the ledger follows."""
+    models = setup_common_models
+    entry = _team_entry(models)
+    approved_entry = _team_entry(models, status=EntryStatus.APPROVED)
+
+    report = EntryRerateService.rerate_entries(
+        organization_id=models["organization"].pk,
+        currency_id=models["currency_usd"].pk,
+        user=models["user"],
+    )
+
+    assert report["entry_count"] == 1
+    entry.refresh_from_db()
+    assert entry.exchange_rate_used == Decimal("1.00")
+    assert entry.org_exchange_rate_ref == models["org_exchange_rate_usd"]
+    assert entry.workspace_exchange_rate_ref is None
+    approved_entry.refresh_from_db()
+    assert approved_entry.exchange_rate_used == Decimal("2.00")
+    assert _ledger_total(
+        models["workspace_team"], EntryType.INCOME, EntryStatus.PENDING
+    ) == (Decimal("10.00"), 1)
+    assert TeamLedgerService.find_drift() == []
+
+    audit = AuditTrail.objects.get(
+        action_type=AuditActionType.BULK_OPERATION,
+        metadata__operation_type="entry_rerate",
+    )
+    assert audit.metadata["affected_ids"] == [str(entry.pk)]
+
+
+@pytest.mark.django_db
+def test_rerate_prefers_approved_workspace_rates(setup_common_models):
+    """Test that an approved workspace rate wins over the organization rate."""
+    models = setup_common_models
+    entry = _team_entry(models)
+    workspace_rate = models["workspace_exchange_rate_usd"]
+    workspace_rate.is_approved = True
+    workspace_rate.save()
+
+    EntryRerateService.rerate_entries(
+        organization_id=models["organization"].pk,
+        currency_id=models["currency_usd"].pk,
+    )
+
+    entry.refresh_from_db()
+    assert entry.exchange_rate_used == Decimal("1.02")
+    assert entry.workspace_exchange_rate_ref == workspace_rate
+    assert entry.org_exchange_rate_ref is None
+
+    report = EntryRerateService.rerate_entries(
+        organization_id=models["organization"].pk,
+        currency_id=models["currency_usd"].pk,
+    )
+    assert report["entry_count"] == 0
+
+
+@pytest.mark.django_db
+def test_rerate_is_scheduled_when_an_organization_rate_is_added(
+    setup_common_models, django_capture_on_commit_callbacks
+):
+    """Test that adding an organization exchange rate queues a re-rate."""
+    from apps.organizations.services import create_organization_exchange_rate
+
+    models = setup_common_models
+    with patch("apps.entries.tasks.rerate_entries_task.delay") as delay:
+        with django_capture_on_commit_callbacks(execute=True):
+            create_organization_exchange_rate(
+                organization=models["organization"],
+                organization_member=models["org_member"],
+                currency_code="EUR",
+                rate=Decimal("0.90"),
+                note="",
+                effective_date=date.today() - timedelta(days=1),
+            )
+
+    delay.assert_called_once()
+    assert delay.call_args.kwargs["currency_id"] == str(models["currency_eur"].pk)
+    assert (
+        delay.call_args.kwargs["occurred_from"]
+        == (date.today() - timedelta(days=1)).isoformat()
+    )
+
+
+# --- EntryImportService ---
+
+
+def _import_job(models, rows, **kwargs):
+    from django.core.files.uploadedfile import SimpleUploadedFile
+
+    from apps.entries.models import EntryImportJob
+
+    content = "Description,Amount,Occurred At,Currency,Type\n" + "".join(
+        f"{row}\n" for row in rows
+    )
+    defaults = {
+        "organization": models["organization"],
+        "workspace": models["workspace"],
+        "workspace_team": models["workspace_team"],
+        "created_by": models["user"],
+        "submitted_by_org_member": models["org_member"],
+        "file": SimpleUploadedFile("entries.csv", content.encode("utf-8")),
+    }
+    defaults.update(kwargs)
+    return EntryImportJob.objects.create(**defaults)
+
+
+@pytest.mark.django_db
+def test_import_job_imports_rows_in_chunks_and_records_errors(setup_common_models):
+    """Test that a job streams the file in chunks and keeps per-row errors."""
+    models = setup_common_models
+    today = date.today().isoformat()
+    job = _import_job(
+        models,
+        [
+            f"Donation,10.00,{today},USD,income",
+            f"Bad amount,ten,{today},USD,income",
+            f"Unknown type,5.00,{today},USD,gift",
+            f"Spend,4.00,{today},USD,disbursement",
+            f"No rate,4.00,{today},JPY,income",
+        ],
+    )
+
+    with patch("apps.entries.services.ENTRY_IMPORT_CHUNK_SIZE", 2):
+        with patch.object(
+            EntryService, "bulk_import_entries", wraps=EntryService.bulk_import_entries
+        ) as bulk_import:
+            job = EntryImportService.run_import(job_id=job.pk)
+
+    assert bulk_import.call_count == 3
+    assert job.status == EntryImportJobStatus.COMPLETED
+    assert job.total_rows == 5
+    assert job.processed_rows == 5
+    assert job.imported_count == 2
+    assert job.error_count == 3
+    assert [error["row"] for error in job.errors] == [2, 3, 5]
+    assert Entry.objects.filter(workspace_team=models["workspace_team"]).count() == 2
+
+
+@pytest.mark.django_db
+def test_import_job_records_out_of_range_amounts_as_row_errors(setup_common_models):
+    """Test that amounts the entry field rejects fail their row, not the job."""
+    models = setup_common_models
+    today = date.today().isoformat()
+    job = _import_job(
+        models,
+        [
+            f"Negative,-50,{today},USD,income",
+            f"Zero,0,{today},USD,income",
+            f"Too large,123456789012.999,{today},USD,income",
+            f"Donation,10.00,{today},USD,income",
+        ],
+    )
+
+    job = EntryImportService.run_import(job_id=job.pk)
+
+    assert job.status == EntryImportJobStatus.COMPLETED
+    assert job.imported_count == 1
+    assert [error["row"] for error in job.errors] == [1, 2, 3]
+
+
+@pytest.mark.django_db
+def test_import_job_resumes_after_the_last_committed_chunk(setup_common_models):
+    """Test that a job with a saved offset skips the rows it already imported."""
+    models = setup_common_models
+    today = date.today().isoformat()
+    job = _import_job(
+        models,
+        [
+            f"Already imported,1.00,{today},USD,income",
+            f"Remaining,2.00,{today},USD,income",
+        ],
+        processed_rows=1,
+        status=EntryImportJobStatus.FAILED,
+    )
+
+    job = EntryImportService.run_import(job_id=job.pk)
+
+    assert job.status == EntryImportJobStatus.COMPLETED
+    assert job.processed_rows == 2
+    assert job.imported_count == 1
+    assert list(
+        Entry.objects.filter(workspace_team=models["workspace_team"]).values_list(
+            "description", flat=True
+        )
+    ) == ["Remaining"]
+
+
+@pytest.mark.django_db
+def test_import_job_uses_the_fixed_entry_type(setup_common_models):
+    """Test that a job with an entry type does not need a Type column."""
+    models = setup_common_models
+    job = _import_job(
+        models,
+        [f",3.00,{date.today().isoformat()},USD,"],
+        workspace_team=None,
+        entry_type=EntryType.WORKSPACE_EXP,
+        backup_description="Office supplies",
+    )
+
+    job = EntryImportService.run_import(job_id=job.pk)
+
+    entry = Entry.objects.get(entry_type=EntryType.WORKSPACE_EXP)
+    assert job.imported_count == 1
+    assert entry.description == "Office supplies"
@@ -4,9 +4,11 @@ Unit tests for apps.entries.validators
 
 import pytest
 from datetime import date, timedelta
+from decimal import Decimal
 from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
 
-from apps.entries.validators import TeamEntryValidator
+from apps.entries.validators import EntryCSVValidator, TeamEntryValidator
 from apps.entries.constants import EntryStatus, EntryType
 from apps.teams.constants import TeamMemberRole
 from tests.factories import (
@@ -751,3 +753,67 @@ class TestValidateEntryCreate:
             validator.validate_entry_create(
                 entry_type=EntryType.INCOME, occurred_at=date.today()
             )
+
+
+@pytest.mark.unit
+class TestEntryCSVValidator:
+    """Test EntryCSVValidator streaming."""
+
+    def _validator(self, *rows):
+        content = "Description,Amount,Occurred At,Currency,Type\n" + "".join(
+            f"{row}\n" for row in rows
+        )
+        return EntryCSVValidator(
+            SimpleUploadedFile("entries.csv", content.encode("utf-8"))
+        )
+
+    def test_iter_rows_normalizes_valid_rows(self):
+        validator = self._validator(" Donation ,10.50,2025-01-31, usd ,Income")
+
+        [(row_number, row, error)] = validator.iter_rows(verify_team_level_type=True)
+
+        assert (row_number, error) == (1, None)
+        assert row["Description"] == "Donation"
+        assert row["Amount"] == Decimal("10.50")
+        assert row["Occurred At"] == date(2025, 1, 31)
+        assert row["Currency"] == "USD"
+        assert row["Type"] == EntryType.INCOME
+
+    def test_iter_rows_reports_row_errors(self):
+        validator = self._validator(
+            "Ok,1,2025-01-31,USD,income",
+            "Bad amount,ten,2025-01-31,USD,income",
+            "Bad date,1,31/01/2025,USD,income",
+            "Bad type,1,2025-01-31,USD,gift",
+            "No currency,1,2025-01-31,,income",
+        )
+
+        errors = [
+            (row_number, error)
+            for row_number, _, error in validator.iter_rows(verify_team_level_type=True)
+            if error
+        ]
+
+        assert [row_number for row_number, _ in errors] == [2, 3, 4, 5]
+
+    def test_iter_rows_resumes_from_an_offset(self):
+        validator = self._validator(
+            "First,1,2025-01-31,USD,income",
+            "Second,2,2025-01-31,USD,income",
+        )
+
+        rows = list(validator.iter_rows(start=1))
+
+        assert [(row_number, row["Description"]) for row_number, row, _ in rows] == [
+            (2, "Second")
+        ]
+
+    @pytest.mark.parametrize(
+        "amount", ["-50", "0", "NaN", "Infinity", "1.005", "123456789012.999"]
+    )
+    def test_iter_rows_applies_the_amount_field_rules(self, amount):
+        validator = self._validator(f"Donation,{amount},2025-01-31,USD,income")
+
+        [(_, _, error)] = validator.iter_rows(verify_team_level_type=True)
+
+        assert error.startswith(f"Invalid amount '{amount}'")
@@ -7,11 +7,13 @@ from unittest.mock import patch
 import pytest
 from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
-from django.db import IntegrityError
+from django.db import IntegrityError, connection
 from django.db.models import signals
 
 from apps.invitations import services
+from apps.invitations.constants import BulkInvitationStatus
 from apps.invitations.models import Invitation
 from tests.factories import (
     CustomUserFactory,
@@ -582,3 +584,109 @@ class TestInvitationServices(TestCase):
         self.assertIsInstance(result, bool)
         self.assertIsInstance(message, str)
         self.assertIsNone(invitation_obj)
+
+
+@pytest.mark.unit
+class TestBulkCreateInvitations(TestCase):
+    """Test cases for the bulk invitation service."""
+
+    def setUp(self):
+        # Invitations created by factories send their email through the signal
+        self.celery_patcher = patch("apps.emails.services.send_email_task.delay")
+        self.celery_patcher.start()
+        self.emails_patcher = patch("apps.invitations.services.send_invitation_emails")
+        self.mock_send_emails = self.emails_patcher.start()
+
+        self.organization = OrganizationFactory()
+        self.inviter = OrganizationMemberFactory(organization=self.organization)
+        self.expired_at = timezone.now() + timedelta(days=7)
+
+    def tearDown(self):
+        self.emails_patcher.stop()
+        self.celery_patcher.stop()
+
+    def _bulk_create(self, emails):
+        return services.bulk_create_invitations(
+            emails=emails,
+            expired_at=self.expired_at,
+            organization=self.organization,
+            invited_by=self.inviter,
+        )
+
+    def test_reports_status_per_address(self):
+        member = OrganizationMemberFactory(
+            organization=self.organization,
+            user=CustomUserFactory(email="member@example.com"),
+        )
+        InvitationFactory(organization=self.organization, email="pending@example.com")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            results = self._bulk_create(
+                [
+                    "new@example.com",
+                    " Member@example.com ",
+                    "PENDING@example.com",
+                    "not-an-email",
+                    "new@example.com",
+                ]
+            )
+
+        self.assertEqual(
+            results,
+            {
+                "new@example.com": BulkInvitationStatus.INVITED,
+                "Member@example.com": BulkInvitationStatus.ALREADY_MEMBER,
+                "PENDING@example.com": BulkInvitationStatus.ALREADY_INVITED,
+                "not-an-email": BulkInvitationStatus.INVALID_EMAIL,
+            },
+        )
+        self.assertEqual(member.user.email, "member@example.com")
+        invitation = Invitation.objects.get(email="new@example.com")
+        self.assertEqual(invitation.invited_by, self.inviter)
+        self.assertEqual(invitation.expired_at, self.expired_at)
+        self.mock_send_emails.assert_called_once()
+        self.assertEqual(self.mock_send_emails.call_args[0][0], [invitation])
+
+    def test_uses_constant_number_of_queries(self):
+        with CaptureQueriesContext(connection) as small_batch:
+            self._bulk_create([f"small{index}@example.com" for index in range(2)])
+        with CaptureQueriesContext(connection) as large_batch:
+            results = self._bulk_create(
+                [f"large{index}@example.com" for index in range(50)]
+            )
+
+        self.assertEqual(len(large_batch), len(small_batch))
+        self.assertEqual(set(results.values()), {BulkInvitationStatus.INVITED})
+        self.assertEqual(
+            Invitation.objects.filter(organization=self.organization).count(), 52
+        )
+
+    def test_reinvites_addresses_with_expired_invitations(self):
+        expired = ExpiredInvitationFactory(
+            organization=self.organization, email="expired@example.com"
+        )
+
+        results = self._bulk_create(["expired@example.com"])
+
+        self.assertEqual(results, {"expired@example.com": BulkInvitationStatus.INVITED})
+        expired.refresh_from_db()
+        self.assertFalse(expired.is_active)
+        self.assertTrue(
+            Invitation.objects.get(email="expired@example.com", is_active=True).is_valid
+        )
+
+    def test_nothing_to_invite_skips_emails(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            results = self._bulk_create(["bad address"])
+
+        self.assertEqual(results, {"bad address": BulkInvitationStatus.INVALID_EMAIL})
+        self.mock_send_emails.assert_not_called()
+
+    def test_requires_inviter(self):
+        with self.assertRaises(ValueError):
+            services.bulk_create_invitations(
+                emails=["new@example.com"],
+                expired_at=self.expired_at,
+                organization=self.organization,
+                invited_by=None,
+            )
@@ -6,6 +6,7 @@ Tests data retrieval functions with various scenarios and edge cases.
 import uuid
 from unittest.mock import Mock, patch
 
+import pytest
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.db.models import QuerySet
@@ -15,6 +16,7 @@ from apps.organizations.constants import StatusChoices
 from apps.organizations.selectors import (
     get_org_members,
     get_organization_by_id,
+    get_organization_dashboard_metrics,
     get_organization_members_count,
     get_organization_member_by_id,
     get_orgMember_by_user_id_and_organization_id,
@@ -399,6 +401,109 @@ class TestGetTeamsCount(TestCase):
         self.assertEqual(count, 1)
 
 
+class TestGetOrganizationDashboardMetrics(TestCase):
+    """Test get_organization_dashboard_metrics selector."""
+
+    def setUp(self):
+        self.organization = OrganizationFactory()
+        self.workspace = WorkspaceFactory(organization=self.organization)
+        OrganizationMemberFactory(organization=self.organization)
+        InactiveOrganizationMemberFactory(organization=self.organization)
+        team = TeamFactory(organization=self.organization)
+        WorkspaceTeamFactory(workspace=self.workspace, team=team)
+        # The same team joining a second workspace is counted once
+        WorkspaceTeamFactory(
+            workspace=WorkspaceFactory(organization=self.organization), team=team
+        )
+
+    def test_counts_are_computed_in_one_query(self):
+        """Test the counters come from a single query."""
+        with self.assertNumQueries(2):
+            metrics = get_organization_dashboard_metrics(self.organization)
+
+        self.assertEqual(metrics["members_count"], 1)
+        self.assertEqual(metrics["workspaces_count"], 2)
+        self.assertEqual(metrics["teams_count"], 1)
+        self.assertEqual(metrics["allowed_currencies"], [])
+
+    def test_allowed_currencies_are_distinct(self):
+        """Test each currency with an exchange rate is listed once."""
+        from datetime import date, timedelta
+
+        currency = CurrencyFactory()
+        for days in range(2):
+            OrganizationExchangeRateFactory(
+                organization=self.organization,
+                currency=currency,
+                effective_date=date.today() + timedelta(days=days),
+            )
+
+        metrics = get_organization_dashboard_metrics(self.organization)
+
+        self.assertEqual(
+            metrics["allowed_currencies"],
+            [{"code": currency.code, "name": currency.name}],
+        )
+
+    def test_empty_organization(self):
+        """Test an organization without members, workspaces or teams."""
+        metrics = get_organization_dashboard_metrics(OrganizationFactory())
+
+        self.assertEqual(metrics["members_count"], 0)
+        self.assertEqual(metrics["workspaces_count"], 0)
+        self.assertEqual(metrics["teams_count"], 0)
+
+
+@pytest.mark.usefixtures("locmem_cache")
+class TestCachedOrganizationDashboardMetrics(TestCase):
+    """Test caching of get_organization_dashboard_metrics."""
+
+    def setUp(self):
+        self.organization = OrganizationFactory()
+        OrganizationMemberFactory(organization=self.organization)
+
+    def test_cached_metrics_run_no_queries(self):
+        """Test a warm cache serves the dashboard without queries."""
+        get_organization_dashboard_metrics(self.organization)
+
+        with self.assertNumQueries(0):
+            metrics = get_organization_dashboard_metrics(self.organization)
+        self.assertEqual(metrics["members_count"], 1)
+
+    def test_new_member_invalidates_cached_metrics(self):
+        """Test adding a member bumps the metrics version."""
+        get_organization_dashboard_metrics(self.organization)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            OrganizationMemberFactory(organization=self.organization)
+
+        metrics = get_organization_dashboard_metrics(self.organization)
+        self.assertEqual(metrics["members_count"], 2)
+
+    def test_new_workspace_team_invalidates_cached_metrics(self):
+        """Test attaching a team to a workspace bumps the metrics version."""
+        workspace = WorkspaceFactory(organization=self.organization)
+        get_organization_dashboard_metrics(self.organization)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            WorkspaceTeamFactory(
+                workspace=workspace, team=TeamFactory(organization=self.organization)
+            )
+
+        metrics = get_organization_dashboard_metrics(self.organization)
+        self.assertEqual(metrics["teams_count"], 1)
+
+    def test_other_organizations_keep_their_cache(self):
+        """Test writes to another organization leave the cache intact."""
+        get_organization_dashboard_metrics(self.organization)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            WorkspaceFactory(organization=OrganizationFactory())
+
+        with self.assertNumQueries(0):
+            get_organization_dashboard_metrics(self.organization)
+
+
 class TestGetUserOrgMembership(TestCase):
     """Test get_user_org_membership selector."""
 
@@ -565,7 +670,9 @@ class TestGetOrgExchangeRates(TestCase):
 
     def setUp(self):
         self.organization = OrganizationFactory()
-        self.currency = CurrencyFactory()
+        # A fixed code keeps the factory's code cycle from reaching the
+        # currencies the tests create themselves
+        self.currency = CurrencyFactory(code="CAD")
 
     def test_get_org_exchange_rates_with_rates(self):
         """Test getting exchange rates for organization."""
@@ -2,10 +2,13 @@
 Unit tests for Remittance selectors.
 """
 
+from decimal import Decimal
+
 import pytest
+from django.core.paginator import Paginator
 
 from apps.remittance.selectors import get_remittances_under_organization
-from apps.remittance.constants import RemittanceStatus
+from apps.remittance.constants import RemittanceSortOption, RemittanceStatus
 from apps.remittance.models import Remittance
 from tests.factories import (
     OrganizationFactory,
@@ -262,6 +265,99 @@ class TestGetRemittancesUnderOrganization:
         assert workspace_title is not None
         assert team_title is not None
 
+    def test_get_remittances_annotates_remaining_and_overpaid_amounts(self):
+        """Test remaining and overpaid amounts are computed in SQL."""
+        partial = self.workspace_team1.remittance
+        partial.due_amount = Decimal("1000.00")
+        partial.paid_amount = Decimal("400.00")
+        partial.is_overpaid = False
+        partial.save()
+
+        overpaid = self.workspace_team2.remittance
+        overpaid.due_amount = Decimal("500.00")
+        overpaid.paid_amount = Decimal("650.00")
+        overpaid.is_overpaid = True
+        overpaid.save()
+
+        result = {
+            remittance.pk: remittance
+            for remittance in get_remittances_under_organization(
+                organization_id=self.organization.organization_id
+            )
+        }
+
+        assert result[partial.pk].remaining_amount == Decimal("600.00")
+        assert result[partial.pk].overpaid_amount == Decimal("0")
+        assert result[overpaid.pk].remaining_amount == Decimal("150.00")
+        assert result[overpaid.pk].overpaid_amount == Decimal("150.00")
+
+    def test_get_remittances_is_lazy_and_paginates_in_sql(
+        self, django_assert_num_queries
+    ):
+        """Test only the requested page is fetched, with no per-row queries."""
+        with django_assert_num_queries(0):
+            result = get_remittances_under_organization(
+                organization_id=self.organization.organization_id
+            )
+
+        # One COUNT plus one LIMIT/OFFSET query for the page
+        with django_assert_num_queries(2):
+            page = Paginator(result, 2).get_page(1)
+            rows = list(page)
+
+        assert len(rows) == 2
+        assert page.paginator.count == 3
+
+    def test_get_remittances_sort_by_remaining(self):
+        """Test sorting by remaining amount puts the largest balance first."""
+        amounts = [
+            (self.workspace_team1, Decimal("100.00")),
+            (self.workspace_team2, Decimal("900.00")),
+            (self.workspace_team3, Decimal("500.00")),
+        ]
+        for workspace_team, due_amount in amounts:
+            remittance = workspace_team.remittance
+            remittance.due_amount = due_amount
+            remittance.paid_amount = Decimal("0.00")
+            remittance.save()
+
+        result = get_remittances_under_organization(
+            organization_id=self.organization.organization_id,
+            sort=RemittanceSortOption.REMAINING,
+        )
+
+        assert [remittance.remaining_amount for remittance in result] == [
+            Decimal("900.00"),
+            Decimal("500.00"),
+            Decimal("100.00"),
+        ]
+
+    def test_get_remittances_sort_by_status(self):
+        """Test sorting by status orders rows by status value."""
+        remittance = self.workspace_team2.remittance
+        remittance.status = RemittanceStatus.PAID
+        remittance.save()
+
+        result = get_remittances_under_organization(
+            organization_id=self.organization.organization_id,
+            sort=RemittanceSortOption.STATUS,
+        )
+
+        statuses = [remittance.status for remittance in result]
+        assert statuses == sorted(statuses)
+
+    def test_get_remittances_unknown_sort_falls_back_to_newest(self):
+        """Test an unknown sort key keeps the default newest-first order."""
+        result = list(
+            get_remittances_under_organization(
+                organization_id=self.organization.organization_id, sort="bogus"
+            )
+        )
+
+        assert [r.created_at for r in result] == sorted(
+            (r.created_at for r in result), reverse=True
+        )
+
 
 @pytest.mark.django_db
 class TestRemittanceSelectorsEdgeCases:
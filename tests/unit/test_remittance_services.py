@@ -2,9 +2,12 @@
 Unit tests for Remittance services.
 """
 
+from datetime import timedelta
 from decimal import Decimal
 from unittest.mock import patch
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from apps.remittance.services import RemittanceService
@@ -13,6 +16,8 @@ from apps.remittance.models import Remittance
 from apps.entries.constants import EntryStatus, EntryType
 from apps.auditlog.constants import AuditActionType
 from tests.factories import (
+    EntryFactory,
+    WorkspaceFactory,
     WorkspaceTeamFactory,
     OrganizationFactory,
     OrganizationMemberFactory,
@@ -24,7 +29,7 @@ from tests.factories import (
 class TestCalculateDueAmount:
     """Test _calculate_due_amount service method."""
 
-    @patch("apps.remittance.services.get_total_amount_of_entries")
+    @patch("apps.remittance.services.get_team_ledger_total")
     def test_calculate_due_amount_positive_income(self, mock_get_entries):
         """Test due amount calculation with positive income."""
         # Mock the entries selector
@@ -56,7 +61,7 @@ class TestCalculateDueAmount:
             workspace_team=workspace_team,
         )
 
-    @patch("apps.remittance.services.get_total_amount_of_entries")
+    @patch("apps.remittance.services.get_team_ledger_total")
     def test_calculate_due_amount_negative_income(self, mock_get_entries):
         """Test due amount calculation with negative income (no due amount)."""
         mock_get_entries.side_effect = [
@@ -73,7 +78,7 @@ class TestCalculateDueAmount:
         # When income < disbursements, due amount should be 0
         assert result == Decimal("0.00")
 
-    @patch("apps.remittance.services.get_total_amount_of_entries")
+    @patch("apps.remittance.services.get_team_ledger_total")
     def test_calculate_due_amount_zero_income(self, mock_get_entries):
         """Test due amount calculation with zero income."""
         mock_get_entries.side_effect = [
@@ -90,7 +95,7 @@ class TestCalculateDueAmount:
         # When income = disbursements, due amount should be 0
         assert result == Decimal("0.00")
 
-    @patch("apps.remittance.services.get_total_amount_of_entries")
+    @patch("apps.remittance.services.get_team_ledger_total")
     def test_calculate_due_amount_uses_workspace_rate_when_no_custom_rate(
         self, mock_get_entries
     ):
@@ -114,7 +119,7 @@ class TestCalculateDueAmount:
         expected_due = Decimal("144.00")
         assert result == expected_due
 
-    @patch("apps.remittance.services.get_total_amount_of_entries")
+    @patch("apps.remittance.services.get_team_ledger_total")
     def test_calculate_due_amount_custom_rate_priority(self, mock_get_entries):
         """Test that custom remittance rate takes priority over workspace rate."""
         mock_get_entries.side_effect = [
@@ -136,7 +141,7 @@ class TestCalculateDueAmount:
         expected_due = Decimal("225.00")
         assert result == expected_due
 
-    @patch("apps.remittance.services.get_total_amount_of_entries")
+    @patch("apps.remittance.services.get_team_ledger_total")
     def test_calculate_due_amount_decimal_precision(self, mock_get_entries):
         """Test due amount calculation maintains proper decimal precision."""
         mock_get_entries.side_effect = [
@@ -159,7 +164,7 @@ class TestCalculateDueAmount:
 class TestCalculatePaidAmount:
     """Test _calculate_paid_amount service method."""
 
-    @patch("apps.remittance.services.get_total_amount_of_entries")
+    @patch("apps.remittance.services.get_team_ledger_total")
     def test_calculate_paid_amount(self, mock_get_entries):
         """Test paid amount calculation."""
         mock_get_entries.return_value = Decimal("500.00")
@@ -175,7 +180,7 @@ class TestCalculatePaidAmount:
             workspace_team=workspace_team,
         )
 
-    @patch("apps.remittance.services.get_total_amount_of_entries")
+    @patch("apps.remittance.services.get_team_ledger_total")
     def test_calculate_paid_amount_zero(self, mock_get_entries):
         """Test paid amount calculation when no payments exist."""
         mock_get_entries.return_value = Decimal("0.00")
@@ -478,11 +483,86 @@ class TestSyncRemittance:
         assert result == remittance
 
 
+@pytest.mark.django_db
+class TestBulkSyncRemittance:
+    """Test bulk_sync_remittance service method."""
+
+    def _create_team_with_entries(self, workspace, income, remittance_paid):
+        workspace_team = WorkspaceTeamFactory(workspace=workspace)
+        for entry_type, amount in (
+            (EntryType.INCOME, income),
+            (EntryType.REMITTANCE, remittance_paid),
+        ):
+            EntryFactory(
+                organization=workspace.organization,
+                workspace=workspace,
+                workspace_team=workspace_team,
+                entry_type=entry_type,
+                amount=Decimal(amount),
+                status=EntryStatus.APPROVED,
+            )
+        # Reset so the bulk sync has something to recompute
+        Remittance.objects.filter(workspace_team=workspace_team).update(
+            due_amount=0, paid_amount=0, status=RemittanceStatus.PENDING
+        )
+        return workspace_team
+
+    def test_bulk_sync_remittance_applies_amounts_and_status(self):
+        """Test amounts, rates and status rules are applied for every team."""
+        workspace = WorkspaceFactory(remittance_rate=Decimal("50.00"))
+        partial_team = self._create_team_with_entries(workspace, "100.00", "10.00")
+        paid_team = self._create_team_with_entries(workspace, "100.00", "50.00")
+
+        RemittanceService.bulk_sync_remittance(
+            workspace_teams=[partial_team, paid_team]
+        )
+
+        partial = Remittance.objects.get(workspace_team=partial_team)
+        assert partial.due_amount == Decimal("50.00")
+        assert partial.paid_amount == Decimal("10.00")
+        assert partial.status == RemittanceStatus.PARTIAL
+
+        paid = Remittance.objects.get(workspace_team=paid_team)
+        assert paid.status == RemittanceStatus.PAID
+        assert paid.is_overpaid is False
+
+    def test_bulk_sync_remittance_marks_overdue(self):
+        """Test unpaid remittances of ended workspaces become overdue."""
+        workspace = WorkspaceFactory(
+            start_date=timezone.now().date() - timedelta(days=30),
+            end_date=timezone.now().date() - timedelta(days=1),
+        )
+        workspace_team = self._create_team_with_entries(workspace, "100.00", "1.00")
+
+        RemittanceService.bulk_sync_remittance(workspace_teams=[workspace_team])
+
+        remittance = Remittance.objects.get(workspace_team=workspace_team)
+        assert remittance.status == RemittanceStatus.OVERDUE
+        assert remittance.paid_within_deadlines is False
+
+    def test_bulk_sync_remittance_query_count_is_constant(self):
+        """Test the number of queries does not grow with the number of teams."""
+        workspace = WorkspaceFactory()
+        few_teams = [
+            self._create_team_with_entries(workspace, "10.00", "1.00") for _ in range(2)
+        ]
+        many_teams = [
+            self._create_team_with_entries(workspace, "10.00", "1.00") for _ in range(6)
+        ]
+
+        with CaptureQueriesContext(connection) as few_ctx:
+            RemittanceService.bulk_sync_remittance(workspace_teams=few_teams)
+        with CaptureQueriesContext(connection) as many_ctx:
+            RemittanceService.bulk_sync_remittance(workspace_teams=many_teams)
+
+        assert len(few_ctx.captured_queries) == len(many_ctx.captured_queries)
+
+
 @pytest.mark.django_db
 class TestRemittanceServicesIntegration:
     """Integration tests for remittance services."""
 
-    @patch("apps.remittance.services.get_total_amount_of_entries")
+    @patch("apps.remittance.services.get_team_ledger_total")
     def test_calculate_and_update_remittance_integration(self, mock_get_entries):
         """Test the full flow of calculating due amount and updating remittance."""
         # Setup
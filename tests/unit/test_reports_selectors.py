@@ -7,11 +7,19 @@ from datetime import timedelta
 from decimal import Decimal
 
 import pytest
-from django.utils import timezone
+from django.db import connection
 from django.db.models.signals import post_save
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 
 from apps.remittance.constants import RemittanceStatus
-from apps.reports.selectors import EntrySelectors, RemittanceSelectors
+from apps.entries.constants import EntryType
+from apps.entries.models import Entry
+from apps.reports.selectors import (
+    EntrySelectors,
+    OverviewFinanceReportSelectors,
+    RemittanceSelectors,
+)
 from apps.workspaces.models import WorkspaceTeam
 from apps.workspaces.signals import create_remittance
 from tests.factories import (
@@ -492,3 +500,135 @@ class TestEntrySelectors:
         assert stats["pending_entries"] == 1
         assert stats["approved_entries"] == 1
         assert stats["rejected_entries"] == 0
+
+    def test_get_export_rows_with_workspace_filter(self):
+        """Test get_export_rows yields flat rows for one workspace only."""
+        entry = EntryFactory(organization=self.organization, workspace=self.workspace1)
+        EntryFactory(organization=self.organization, workspace=self.workspace2)
+        EntryFactory(
+            organization=self.other_organization, workspace=self.other_workspace
+        )
+
+        rows = list(
+            EntrySelectors.get_export_rows(
+                self.organization.organization_id,
+                workspace_id=self.workspace1.workspace_id,
+            )
+        )
+
+        assert len(rows) == 1
+        assert rows[0]["description"] == entry.description
+        assert rows[0]["amount"] == entry.amount
+        assert rows[0]["currency__code"] == entry.currency.code
+        assert rows[0]["workspace__title"] == self.workspace1.title
+
+
+@pytest.mark.django_db
+class TestOverviewFinanceReportSelectors:
+    """Test OverviewFinanceReportSelectors report tree building."""
+
+    def setup_method(self):
+        self.organization = OrganizationFactory()
+        self.workspace = WorkspaceFactory(
+            organization=self.organization, remittance_rate=Decimal("50.00")
+        )
+        self.workspace_team = WorkspaceTeamFactory(
+            workspace=self.workspace, team=TeamFactory(organization=self.organization)
+        )
+
+    def _approved_entry(self, entry_type, amount, workspace_team=None, **kwargs):
+        workspace_team = workspace_team or self.workspace_team
+        return ApprovedEntryFactory(
+            organization=self.organization,
+            workspace=workspace_team.workspace,
+            workspace_team=workspace_team,
+            entry_type=entry_type,
+            amount=Decimal(amount),
+            **kwargs,
+        )
+
+    def test_get_organization_report_builds_nested_totals(self):
+        """Test the org tree carries team, workspace and org level totals."""
+        self._approved_entry(EntryType.INCOME, "1000.00")
+        self._approved_entry(EntryType.DISBURSEMENT, "200.00")
+        self._approved_entry(
+            EntryType.WORKSPACE_EXP, "100.00", exchange_rate_used=Decimal("2.00")
+        )
+        org_expense = self._approved_entry(EntryType.ORG_EXP, "50.00")
+        Entry.objects.filter(pk=org_expense.pk).update(
+            workspace=None, workspace_team=None
+        )
+        # Pending entries are ignored
+        EntryFactory(
+            organization=self.organization,
+            workspace=self.workspace,
+            workspace_team=self.workspace_team,
+            entry_type=EntryType.INCOME,
+            amount=Decimal("999.00"),
+        )
+
+        report = OverviewFinanceReportSelectors.get_organization_report(
+            self.organization
+        )
+
+        workspace_node = report["children"][0]
+        team_node = workspace_node["children"][0]
+        assert team_node["total_income"] == Decimal("1000.00")
+        assert team_node["total_expense"] == Decimal("200.00")
+        assert team_node["net_income"] == Decimal("800.00")
+        assert team_node["org_share"] == Decimal("400.00")
+        assert workspace_node["parent_lvl_total_expense"] == Decimal("200.00")
+        assert workspace_node["final_net_profit"] == Decimal("200.00")
+        assert report["total_income"] == Decimal("1000.00")
+        assert report["parent_lvl_total_expense"] == Decimal("50.00")
+        assert report["final_net_profit"] == Decimal("150.00")
+
+    def test_get_organization_report_includes_workspaces_without_teams(self):
+        """Test empty workspaces still appear with zero totals."""
+        WorkspaceFactory(organization=self.organization)
+
+        report = OverviewFinanceReportSelectors.get_organization_report(
+            self.organization
+        )
+
+        assert len(report["children"]) == 2
+        assert report["total_income"] == Decimal("0.00")
+
+    def test_get_workspace_report_only_includes_workspace(self):
+        """Test the workspace report ignores other workspaces' entries."""
+        other_workspace_team = WorkspaceTeamFactory(
+            workspace=WorkspaceFactory(organization=self.organization),
+            team=TeamFactory(organization=self.organization),
+        )
+        self._approved_entry(EntryType.INCOME, "300.00")
+        self._approved_entry(
+            EntryType.INCOME, "700.00", workspace_team=other_workspace_team
+        )
+
+        report = OverviewFinanceReportSelectors.get_workspace_report(self.workspace)
+
+        assert report["title"] == self.workspace.title
+        assert len(report["children"]) == 1
+        assert report["total_income"] == Decimal("300.00")
+
+    def test_get_organization_report_query_count_is_constant(self):
+        """Test the number of queries does not grow with workspaces and teams."""
+        for _ in range(3):
+            workspace = WorkspaceFactory(organization=self.organization)
+            for _ in range(3):
+                workspace_team = WorkspaceTeamFactory(
+                    workspace=workspace,
+                    team=TeamFactory(organization=self.organization),
+                )
+                self._approved_entry(
+                    EntryType.INCOME, "10.00", workspace_team=workspace_team
+                )
+
+        with CaptureQueriesContext(connection) as ctx:
+            report = OverviewFinanceReportSelectors.get_organization_report(
+                self.organization
+            )
+
+        assert len(report["children"]) == 4
+        assert report["total_income"] == Decimal("90.00")
+        assert len(ctx.captured_queries) == 4
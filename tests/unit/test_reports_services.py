@@ -3,10 +3,10 @@ Unit tests for apps.reports.services
 """
 
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from decimal import Decimal
 
-from apps.reports.services import export_overview_finance_report
+from apps.reports.services import export_entry_report, export_overview_finance_report
 
 
 @pytest.mark.unit
@@ -473,3 +473,27 @@ class TestExportOverviewFinanceReport:
 
         with pytest.raises(KeyError):
             export_overview_finance_report(context, Mock())
+
+
+@pytest.mark.unit
+class TestExportEntryReport:
+    @patch("apps.reports.services.EntrySelectors.get_export_rows")
+    def test_export_entry_report_passes_rows_lazily(self, mock_get_export_rows):
+        """Test the selector's row iterator is handed to the exporter as is."""
+        rows = iter([{"description": "Coffee", "amount": Decimal("3.50")}])
+        mock_get_export_rows.return_value = rows
+        mock_exporter_class = Mock()
+        mock_exporter_class.return_value.export.return_value = "exported_data"
+
+        result = export_entry_report(
+            "org-id", "workspace-id", mock_exporter_class, streaming=True
+        )
+
+        assert result == "exported_data"
+        mock_get_export_rows.assert_called_once_with("org-id", "workspace-id")
+        filename_prefix, blocks = mock_exporter_class.call_args[0]
+        assert filename_prefix == "entry-report"
+        assert mock_exporter_class.call_args[1] == {"streaming": True}
+        assert len(blocks) == 1
+        assert blocks[0]["type"] == "table"
+        assert blocks[0]["rows"] is rows
@@ -1416,3 +1416,109 @@ class SeedDataCommandIntegrationTest(TestCase):
         self.assertEqual(parsed_args.users_per_org, 20)
         self.assertEqual(parsed_args.entries_per_workspace, 100)
         self.assertFalse(parsed_args.clear_existing)
+
+
+class SeedDataScaleModeTest(TestCase):
+    """Test cases for the bulk --scale mode of the seed_data command."""
+
+    options = [
+        "--scale",
+        "--organizations",
+        "2",
+        "--users-per-org",
+        "8",
+        "--teams-per-org",
+        "2",
+        "--workspaces-per-org",
+        "2",
+        "--entries-per-workspace",
+        "12",
+        "--seed",
+        "7",
+        "--batch-size",
+        "10",
+    ]
+
+    def seed(self):
+        from django.core.management import call_command
+
+        call_command("seed_data", *self.options, stdout=StringIO())
+
+    def test_scale_mode_creates_dataset(self):
+        """Test that --scale creates every object and its derived rows."""
+        from apps.auditlog.models import AuditTrail
+        from apps.entries.models import Entry
+        from apps.entries.services import TeamLedgerService
+        from apps.organizations.models import Organization
+        from apps.remittance.models import Remittance
+        from apps.workspaces.models import Workspace, WorkspaceTeam
+
+        self.seed()
+
+        self.assertEqual(Organization.objects.count(), 2)
+        self.assertEqual(Workspace.objects.count(), 4)
+        self.assertEqual(Entry.objects.count(), 48)
+        self.assertFalse(
+            Entry.objects.filter(
+                org_exchange_rate_ref__isnull=True,
+                workspace_exchange_rate_ref__isnull=True,
+            ).exists()
+        )
+        self.assertEqual(Remittance.objects.count(), WorkspaceTeam.objects.count())
+        self.assertEqual(TeamLedgerService.find_drift(), [])
+        self.assertEqual(
+            AuditTrail.objects.filter(
+                target_entity_id__in=Entry.objects.values("entry_id")
+            ).count(),
+            48,
+        )
+
+    def test_scale_mode_assigns_role_permissions(self):
+        """Test that --scale grants the permissions of every role."""
+        from apps.organizations.models import Organization
+        from apps.workspaces.models import Workspace
+
+        self.seed()
+
+        for org in Organization.objects.select_related("owner__user"):
+            self.assertTrue(org.owner.user.has_perm("manage_organization", org))
+        for workspace in Workspace.objects.select_related(
+            "workspace_admin__user", "operations_reviewer__user"
+        ):
+            self.assertTrue(
+                workspace.workspace_admin.user.has_perm("change_workspace", workspace)
+            )
+            self.assertFalse(
+                workspace.operations_reviewer.user.has_perm(
+                    "change_workspace", workspace
+                )
+            )
+
+    def test_scale_mode_is_deterministic(self):
+        """Test that the same seed generates the same rows."""
+        from django.db import transaction
+        from apps.entries.models import Entry
+
+        def snapshot():
+            return list(
+                Entry.objects.order_by("entry_id").values_list(
+                    "entry_id", "entry_type", "amount", "occurred_at"
+                )
+            )
+
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self.seed()
+                first_run = snapshot()
+                raise RuntimeError("roll back the first run")
+
+        self.seed()
+        self.assertEqual(snapshot(), first_run)
+
+    def test_scale_mode_rejects_existing_seed(self):
+        """Test that seeding the same seed twice is refused."""
+        from django.core.management.base import CommandError
+
+        self.seed()
+        with self.assertRaises(CommandError):
+            self.seed()
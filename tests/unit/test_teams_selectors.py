@@ -9,6 +9,7 @@ from apps.teams.selectors import (
     get_team_members,
     get_all_team_members,
     get_teams_by_organization_id,
+    get_team_directory,
     get_team_by_id,
     get_team_member_by_id,
     get_team_members_by_team_id,
@@ -18,6 +19,9 @@ from tests.factories import (
     TeamFactory,
     TeamMemberFactory,
     OrganizationFactory,
+    OrganizationMemberFactory,
+    WorkspaceFactory,
+    WorkspaceTeamFactory,
 )
 
 
@@ -148,6 +152,51 @@ class TestGetTeamsByOrganizationId:
         assert result.count() == 0
 
 
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestGetTeamDirectory:
+    """Test get_team_directory selector function."""
+
+    def test_get_team_directory_loads_workspaces_and_counts(
+        self, django_assert_num_queries
+    ):
+        """Test teams come with their workspaces and member counts."""
+        organization = OrganizationFactory()
+        coordinator = OrganizationMemberFactory(organization=organization)
+        for _ in range(3):
+            team = TeamFactory(organization=organization, team_coordinator=coordinator)
+            WorkspaceTeamFactory(
+                workspace=WorkspaceFactory(organization=organization), team=team
+            )
+            TeamMemberFactory(team=team)
+            TeamMemberFactory(team=team).delete()
+        TeamFactory()  # Different organization
+
+        # One query for the teams, one for their workspace teams
+        with django_assert_num_queries(2):
+            teams = list(get_team_directory(organization.organization_id))
+            for team in teams:
+                [wt.workspace.title for wt in team.attached_workspaces]
+                team.team_coordinator.user.username
+
+        assert len(teams) == 3
+        assert all(team.members_count == 1 for team in teams)
+        assert all(len(team.attached_workspaces) == 1 for team in teams)
+
+    def test_get_team_directory_with_search(self):
+        """Test teams are filtered by title or description."""
+        organization = OrganizationFactory()
+        by_title = TeamFactory(organization=organization, title="Logistics")
+        by_description = TeamFactory(
+            organization=organization, description="Handles logistics abroad"
+        )
+        TeamFactory(organization=organization, title="Fundraising")
+
+        result = get_team_directory(organization.organization_id, search="logistic")
+
+        assert set(result) == {by_title, by_description}
+
+
 @pytest.mark.unit
 @pytest.mark.django_db
 class TestGetTeamById:
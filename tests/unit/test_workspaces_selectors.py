@@ -475,6 +475,57 @@ class TestAggregateSelectors(TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0].workspace_id, workspace1.workspace_id)
 
+    @pytest.mark.django_db
+    def test_get_workspaces_with_team_counts_coordinator_of_several_teams(self):
+        """Test a workspace is listed once with its full team count."""
+        user = CustomUserFactory()
+        org_member = OrganizationMemberFactory(
+            organization=self.organization, user=user
+        )
+        workspace = WorkspaceFactory(organization=self.organization)
+        for _ in range(2):
+            WorkspaceTeamFactory(
+                workspace=workspace,
+                team=TeamFactory(
+                    organization=self.organization, team_coordinator=org_member
+                ),
+            )
+        WorkspaceTeamFactory(
+            workspace=workspace, team=TeamFactory(organization=self.organization)
+        )
+
+        result = get_workspaces_with_team_counts(
+            self.organization.organization_id, user
+        )
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].teams_count, 3)
+
+    @pytest.mark.django_db
+    def test_get_workspaces_with_team_counts_query_budget(self):
+        """Test the grid is loaded with a fixed number of queries."""
+        owner = self.organization.owner.user
+        for _ in range(3):
+            workspace = WorkspaceFactory(organization=self.organization)
+            for _ in range(2):
+                WorkspaceTeamFactory(
+                    workspace=workspace,
+                    team=TeamFactory(organization=self.organization),
+                )
+
+        # One query for the organization, one for the annotated workspaces
+        with self.assertNumQueries(2):
+            result = get_workspaces_with_team_counts(
+                self.organization.organization_id, owner
+            )
+            workspaces = list(result)
+            for workspace in workspaces:
+                workspace.teams_count
+                workspace.workspace_admin
+
+        self.assertEqual(len(workspaces), 3)
+        self.assertTrue(all(w.teams_count == 2 for w in workspaces))
+
     @pytest.mark.django_db
     def test_get_workspaces_with_team_counts_error(self):
         """Test getting workspaces with team counts with invalid organization ID."""